@@ -67,6 +67,7 @@ enum output_format_t {
 	OUTPUT_FORMAT_INVALID = 0,
 	OUTPUT_FORMAT_TABLE = 1,
 	OUTPUT_FORMAT_CSV = 2,
+	OUTPUT_FORMAT_JSON = 3,
 	OUTPUT_FORMAT_DEFAULT = OUTPUT_FORMAT_TABLE
 };
 
@@ -77,6 +78,7 @@ enum output_format_t {
 #define STATS_FILTER_BLK (1 << 3)
 #define STATS_FILTER_ERR (1 << 4)
 #define STATS_FILTER_IOCLASS (1 << 5)
+#define STATS_FILTER_CORES (1 << 6)
 #define STATS_FILTER_ALL (STATS_FILTER_CONF |	\
 			  STATS_FILTER_USAGE |	\
 			  STATS_FILTER_REQ |	\
@@ -285,7 +287,8 @@ int partition_is_name_valid(const char *name);
 int cas_module_version(char *buff, int size);
 int list_caches(unsigned int list_format, bool by_id_path);
 int cache_status(unsigned int cache_id, unsigned int core_id, int io_class_id,
-		 unsigned int stats_filters, unsigned int stats_format, bool by_id_path);
+		 unsigned int stats_filters, unsigned int stats_format, bool by_id_path,
+		 unsigned int interval, unsigned int count);
 int get_inactive_core_count(const struct kcas_cache_info *cache_info);
 
 int open_ctrl_device_quiet();
@@ -307,6 +310,7 @@ int validate_str_cln_policy(const char *s);
 int validate_str_promotion_policy(const char *s);
 int validate_str_stats_filters(const char* s);
 int validate_str_output_format(const char* s);
+int get_output_view(unsigned int output_format, int csv_view);
 
 /**
  * @brief clear metadata
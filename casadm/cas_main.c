@@ -60,6 +60,8 @@ struct command_args{
 	const char* core_device;
 	uint32_t params_type;
 	uint32_t params_count;
+	uint32_t stats_interval;
+	uint32_t stats_count;
 	bool verbose;
 	bool by_id_path;
 };
@@ -89,6 +91,8 @@ static struct command_args command_args_values = {
 
 		.params_type = 0,
 		.params_count = 0,
+		.stats_interval = 0,
+		.stats_count = 0,
 		.verbose = false,
 };
 
@@ -466,7 +470,7 @@ int handle_start()
 }
 
 static cli_option list_options[] = {
-	{'o', "output-format", "Output format: {table|csv}", 1, "FORMAT", 0},
+	{'o', "output-format", "Output format: {table|csv|json}", 1, "FORMAT", 0},
 	{'b', "by-id-path", "Display by-id path to disks instead of short form /dev/sdx"},
 	{0}
 };
@@ -478,11 +482,13 @@ int handle_list()
 
 static cli_option stats_options[] = {
 	{'i', "cache-id", CACHE_ID_DESC, 1, "ID", CLI_OPTION_REQUIRED},
-	{'j', "core-id", "Limit display of core-specific statistics to only ones pertaining to a specific core. If this option is not given, casadm will display statistics pertaining to all cores assigned to given cache instance.", 1, "ID", 0},
+	{'j', "core-id", "Limit display of core-specific statistics to only ones pertaining to a specific core. If ID is not given, casadm will display statistics pertaining to all cores assigned to given cache instance.", 1, "ID", CLI_OPTION_OPTIONAL_ARG},
 	{'d', "io-class-id", "Display per IO class statistics", 1, "ID", CLI_OPTION_OPTIONAL_ARG},
 	{'f', "filter", "Apply filters from the following set: {all, conf, usage, req, blk, err}", 1, "FILTER-SPEC"},
-	{'o', "output-format", "Output format: {table|csv}", 1, "FORMAT"},
+	{'o', "output-format", "Output format: {table|csv|json}", 1, "FORMAT"},
 	{'b', "by-id-path", "Display by-id path to disks instead of short form /dev/sdx"},
+	{'I', "interval", "Print statistics every SECONDS seconds until interrupted", 1, "SECONDS"},
+	{'c', "count", "Number of statistics records printed with --interval", 1, "COUNT"},
 	{0}
 };
 
@@ -497,6 +503,11 @@ int stats_command_handle_option(char *opt, const char **arg)
 
 		command_args_values.cache_id = atoi(arg[0]);
 	} else if (!strcmp(opt, "core-id")) {
+		if (NULL == arg[0]) {
+			command_args_values.stats_filters |= STATS_FILTER_CORES;
+			return 0;
+		}
+
 		if (validate_str_num(arg[0], "core id", 0,
 				     OCF_CORE_ID_MAX) == FAILURE)
 			return FAILURE;
@@ -515,7 +526,8 @@ int stats_command_handle_option(char *opt, const char **arg)
 		stats_filters = validate_str_stats_filters(arg[0]);
 		if (STATS_FILTER_INVALID == stats_filters)
 			return FAILURE;
-		stats_filters |= (command_args_values.stats_filters & STATS_FILTER_IOCLASS);
+		stats_filters |= (command_args_values.stats_filters &
+				(STATS_FILTER_IOCLASS | STATS_FILTER_CORES));
 		command_args_values.stats_filters = stats_filters;
 	} else if (!strcmp(opt, "output-format")) {
 		command_args_values.output_format = validate_str_output_format(arg[0]);
@@ -525,6 +537,16 @@ int stats_command_handle_option(char *opt, const char **arg)
 		command_args_values.by_id_path = true;
 		if (command_args_values.by_id_path == false)
 			return FAILURE;
+	} else if (!strcmp(opt, "interval")) {
+		if (validate_str_num(arg[0], "interval", 1, 3600) == FAILURE)
+			return FAILURE;
+
+		command_args_values.stats_interval = atoi(arg[0]);
+	} else if (!strcmp(opt, "count")) {
+		if (validate_str_num(arg[0], "count", 1, INT_MAX) == FAILURE)
+			return FAILURE;
+
+		command_args_values.stats_count = atoi(arg[0]);
 	} else {
 		return FAILURE;
 	}
@@ -534,12 +556,19 @@ int stats_command_handle_option(char *opt, const char **arg)
 
 int handle_stats()
 {
+	if (command_args_values.stats_count && !command_args_values.stats_interval) {
+		cas_printf(LOG_ERR, "Option '--count' requires '--interval'\n");
+		return FAILURE;
+	}
+
 	return cache_status(command_args_values.cache_id,
 			    command_args_values.core_id,
 			    command_args_values.io_class_id,
 			    command_args_values.stats_filters,
 			    command_args_values.output_format,
-			    command_args_values.by_id_path);
+			    command_args_values.by_id_path,
+			    command_args_values.stats_interval,
+			    command_args_values.stats_count);
 }
 
 static cli_option stop_options[] = {
@@ -603,7 +632,7 @@ int handle_stop()
 	.options = { \
 		{'i', "cache-id", CACHE_ID_DESC, 1, "ID", CLI_OPTION_REQUIRED}, \
 		{'j', "core-id", CORE_ID_DESC, 1, "ID", CLI_OPTION_REQUIRED}, \
-		{'o', "output-format", "Output format: {table|csv}", 1, "FORMAT"}, \
+		{'o', "output-format", "Output format: {table|csv|json}", 1, "FORMAT"}, \
 	CORE_PARAMS_NS_END()
 
 #define CACHE_PARAMS_NS_BEGIN(_name, _desc) { \
@@ -619,7 +648,7 @@ int handle_stop()
 
 #define GET_CACHE_PARAMS_NS(_name, _desc) \
 	CACHE_PARAMS_NS_BEGIN(_name, _desc) \
-		{'o', "output-format", "Output format: {table|csv}", 1, "FORMAT"}, \
+		{'o', "output-format", "Output format: {table|csv|json}", 1, "FORMAT"}, \
 	CACHE_PARAMS_NS_END()
 
 
@@ -1148,13 +1177,9 @@ int get_param_namespace_handle_option(char *namespace, char *opt, const char **a
 
 int handle_get_param()
 {
-	int format = TEXT;
+	int format = get_output_view(command_args_values.output_format, RAW_CSV);
 	int err = 0;
 
-	if (OUTPUT_FORMAT_CSV == command_args_values.output_format) {
-		format = RAW_CSV;
-	}
-
 	switch (command_args_values.params_type) {
 	case PARAM_TYPE_CORE:
 		err = core_params_get(command_args_values.cache_id,
@@ -1372,7 +1397,7 @@ static cli_option io_class_params_options[] = {
 	[io_class_opt_output_format] = {
 		.short_name = 'o',
 		.long_name = "output-format",
-		.desc = "Output format: {table|csv}",
+		.desc = "Output format: {table|csv|json}",
 		.args_count = 1,
 		.arg = "FORMAT",
 		.priv = (1 << io_class_opt_subcmd_list)
@@ -1828,7 +1853,7 @@ static cli_option version_options[] = {
 	{
 		.short_name = 'o',
 		.long_name = "output-format",
-		.desc = "Output format: {table|csv}",
+		.desc = "Output format: {table|csv|json}",
 		.args_count = 1,
 		.arg = "FORMAT",
 	},
@@ -1870,10 +1895,7 @@ static int handle_version(void)
 	fprintf(intermediate_file[1], TAG(TABLE_ROW) OCF_LOGO " CLI Utility,");
 	fprintf(intermediate_file[1], "%s\n", CAS_VERSION);
 
-	int format = TEXT;
-	if (OUTPUT_FORMAT_CSV == command_args_values.output_format) {
-		format = RAW_CSV;
-	}
+	int format = get_output_view(command_args_values.output_format, RAW_CSV);
 
 	fclose(intermediate_file[1]);
 	stat_format_output(intermediate_file[0], stdout, format);
@@ -39,6 +39,9 @@
 #define UNIT_REQUESTS "Requests"
 #define UNIT_BLOCKS "4KiB Blocks"
 
+/* Time of statistics sample, printed in every record in interval mode */
+static struct timespec sample_time;
+
 static inline float fraction(uint64_t numerator, uint64_t denominator)
 {
 	float result;
@@ -122,6 +125,11 @@ static void print_kv_pair_time(FILE *outfile, const char *title, uint64_t time)
 static void begin_record(FILE *outfile)
 {
 	fprintf(outfile, TAG(RECORD) "\n");
+	if (sample_time.tv_sec) {
+		print_kv_pair(outfile, "Timestamp", "%lld.%03ld, [s]",
+			      (long long) sample_time.tv_sec,
+			      sample_time.tv_nsec / 1000000);
+	}
 }
 
 static void print_table_header(FILE *outfile, uint32_t ncols, ...)
@@ -387,13 +395,15 @@ static void print_err_stats(const struct ocf_stats_errors *stats,
 }
 
 void cache_stats_core_counters(const struct kcas_core_info *info,
-			struct kcas_get_stats *stats,
+			const struct kcas_stats_entry *stats,
 			unsigned int stats_filters, FILE *outfile)
 {
 	begin_record(outfile);
 
 	if (stats_filters & STATS_FILTER_CONF)
 		print_core_conf(info, outfile);
+	else if (stats_filters & STATS_FILTER_CORES)
+		print_kv_pair(outfile, "Core Id", "%i", stats->core_id);
 
 	if (stats_filters & STATS_FILTER_USAGE)
 		print_usage_stats(&stats->usage, outfile);
@@ -443,8 +453,8 @@ void cache_stats_inactive_usage(int ctrl_fd, const struct kcas_cache_info *cache
 /**
  * print statistics regarding single io class (partition)
  */
-void print_stats_ioclass(struct kcas_io_class *io_class,
-		struct kcas_get_stats *stats, bool cache_stats,
+void print_stats_ioclass(const struct kcas_io_class *io_class,
+		const struct kcas_stats_entry *stats, bool cache_stats,
 		FILE *outfile, unsigned int stats_filters)
 {
 	if (stats_filters & STATS_FILTER_CONF)
@@ -460,6 +470,62 @@ void print_stats_ioclass(struct kcas_io_class *io_class,
 		print_blk_stats(&stats->blocks, cache_stats, outfile);
 }
 
+/**
+ * @brief retrieve statistics selected by KCAS_STATS_BULK_* flags with single
+ *        KCAS_IOCTL_GET_STATS_BULK call
+ *
+ * @param entries buffer allocated for entries, to be freed by the caller
+ * @return number of entries or -1 on failure
+ */
+static int get_stats_entries(int ctrl_fd, const struct kcas_cache_info *cache_info,
+			     unsigned int core_id, uint32_t flags,
+			     struct kcas_stats_entry **entries)
+{
+	struct kcas_get_stats_bulk cmd_info = {};
+	uint32_t cores_count;
+	uint32_t max_entries = 0;
+
+	cores_count = (core_id == OCF_CORE_ID_INVALID) ?
+			cache_info->info.core_count : 1;
+
+	if (flags & KCAS_STATS_BULK_CACHE)
+		max_entries += 1;
+	if (flags & KCAS_STATS_BULK_CACHE_IO_CLASSES)
+		max_entries += OCF_USER_IO_CLASS_MAX;
+	if (flags & KCAS_STATS_BULK_CORES)
+		max_entries += cores_count;
+	if (flags & KCAS_STATS_BULK_CORE_IO_CLASSES)
+		max_entries += cores_count * OCF_USER_IO_CLASS_MAX;
+
+	while (true) {
+		*entries = calloc(max_entries ?: 1, sizeof(**entries));
+		if (!*entries) {
+			cas_printf(LOG_ERR, "Failed to allocate memory for statistics\n");
+			return -1;
+		}
+
+		cmd_info.cache_id = cache_info->cache_id;
+		cmd_info.core_id = core_id;
+		cmd_info.flags = flags;
+		cmd_info.entries = *entries;
+		cmd_info.max_entries = max_entries;
+
+		if (ioctl(ctrl_fd, KCAS_IOCTL_GET_STATS_BULK, &cmd_info) < 0) {
+			print_err(cmd_info.ext_err_code);
+			free(*entries);
+			*entries = NULL;
+			return -1;
+		}
+
+		if (cmd_info.num_entries <= max_entries)
+			return cmd_info.num_entries;
+
+		/* Cores were added after cache info was retrieved */
+		max_entries = cmd_info.num_entries;
+		free(*entries);
+	}
+}
+
 /**
  * @brief print per-io-class statistics for all configured io classes
  *
@@ -469,69 +535,81 @@ int cache_stats_ioclasses(int ctrl_fd, const struct kcas_cache_info *cache_info,
 			  int io_class_id, FILE *outfile,
 			  unsigned int stats_filters)
 {
-	struct kcas_io_class info = {};
-	struct kcas_get_stats stats = {};
-	int part_iter_id;
-	bool cache_stats = (core_id == OCF_CORE_ID_INVALID);
-	int ret;
+	struct kcas_io_class *io_classes;
+	struct kcas_stats_entry *entries;
+	bool cache_stats = (core_id == OCF_CORE_ID_INVALID) &&
+			!(stats_filters & STATS_FILTER_CORES);
+	uint32_t flags = cache_stats ? KCAS_STATS_BULK_CACHE_IO_CLASSES :
+			KCAS_STATS_BULK_CORE_IO_CLASSES;
+	struct kcas_io_class *info;
+	int entries_count;
+	int ret = SUCCESS;
+	int i;
+
+	/* IO class configuration is retrieved once for all cores */
+	io_classes = calloc(OCF_USER_IO_CLASS_MAX, sizeof(*io_classes));
+	if (!io_classes) {
+		cas_printf(LOG_ERR, "Failed to allocate memory for statistics\n");
+		return FAILURE;
+	}
 
 	if (io_class_id != OCF_IO_CLASS_INVALID) {
-		info.cache_id = cache_id;
-		info.class_id = io_class_id;
-		stats.cache_id = cache_id;
-		stats.core_id = core_id;
-		stats.part_id = io_class_id;
-
-		ret = ioctl(ctrl_fd, KCAS_IOCTL_PARTITION_INFO, &info);
-		if (info.ext_err_code  == OCF_ERR_IO_CLASS_NOT_EXIST) {
+		info = &io_classes[io_class_id];
+		info->cache_id = cache_id;
+		info->class_id = io_class_id;
+
+		ret = ioctl(ctrl_fd, KCAS_IOCTL_PARTITION_INFO, info);
+		if (info->ext_err_code == OCF_ERR_IO_CLASS_NOT_EXIST) {
 			cas_printf(LOG_ERR, "IO class %d is not configured.\n",
 					io_class_id);
+			free(io_classes);
 			return FAILURE;
 		} else if (ret) {
-			print_err(info.ext_err_code);
+			print_err(info->ext_err_code);
+			free(io_classes);
 			return FAILURE;
 		}
-
-		if (ioctl(ctrl_fd, KCAS_IOCTL_GET_STATS, &stats) < 0)
-			return FAILURE;
-
-		begin_record(outfile);
-
-		print_stats_ioclass(&info, &stats, cache_stats,
-				outfile, stats_filters);
-
-		return SUCCESS;
 	}
 
-	for (part_iter_id = 0; part_iter_id < OCF_USER_IO_CLASS_MAX; part_iter_id++) {
-		info.cache_id = cache_id;
-		info.class_id = part_iter_id;
-		stats.cache_id = cache_id;
-		stats.core_id = core_id;
-		stats.part_id = part_iter_id;
+	entries_count = get_stats_entries(ctrl_fd, cache_info, core_id, flags,
+			&entries);
+	if (entries_count < 0) {
+		free(io_classes);
+		return FAILURE;
+	}
 
-		ret = ioctl(ctrl_fd, KCAS_IOCTL_PARTITION_INFO, &info);
-		if (info.ext_err_code  == OCF_ERR_IO_CLASS_NOT_EXIST)
+	for (i = 0; i < entries_count; i++) {
+		if (io_class_id != OCF_IO_CLASS_INVALID &&
+				entries[i].part_id != io_class_id) {
 			continue;
-		else if (ret) {
-			print_err(info.ext_err_code);
-			return FAILURE;
 		}
 
-		ret = ioctl(ctrl_fd, KCAS_IOCTL_GET_STATS, &stats);
-		if (ret)
-			return FAILURE;
+		info = &io_classes[entries[i].part_id];
+		if ((stats_filters & STATS_FILTER_CONF) && !info->cache_id) {
+			info->cache_id = cache_id;
+			info->class_id = entries[i].part_id;
+			if (ioctl(ctrl_fd, KCAS_IOCTL_PARTITION_INFO, info)) {
+				print_err(info->ext_err_code);
+				ret = FAILURE;
+				break;
+			}
+		}
 
 		begin_record(outfile);
 
-		print_stats_ioclass(&info, &stats, cache_stats,
-				outfile, stats_filters);
+		if (stats_filters & STATS_FILTER_CORES) {
+			print_kv_pair(outfile, "Core Id", "%i",
+					entries[i].core_id);
+		}
 
-		memset(&stats, 0, sizeof(stats));
-		memset(&info, 0, sizeof(info));
+		print_stats_ioclass(info, &entries[i], cache_stats,
+				outfile, stats_filters);
 	}
 
-	return SUCCESS;
+	free(entries);
+	free(io_classes);
+
+	return ret;
 }
 
 int cache_stats_conf(int ctrl_fd, const struct kcas_cache_info *cache_info,
@@ -611,7 +689,7 @@ int cache_stats_conf(int ctrl_fd, const struct kcas_cache_info *cache_info,
 	return SUCCESS;
 }
 
-void cache_stats_counters(struct kcas_get_stats *cache_stats, FILE *outfile,
+void cache_stats_counters(const struct kcas_stats_entry *cache_stats, FILE *outfile,
 		unsigned int stats_filters)
 {
 	/* Totals for requests stats. */
@@ -631,18 +709,15 @@ static int cache_stats(int ctrl_fd, const struct kcas_cache_info *cache_info,
 		      unsigned int cache_id, FILE *outfile, unsigned int stats_filters,
 		      bool by_id_path)
 {
-	struct kcas_get_stats cache_stats = {};
+	struct kcas_stats_entry *cache_stats = NULL;
 	bool standby;
 
-	cache_stats.cache_id = cache_id;
-	cache_stats.core_id = OCF_CORE_ID_INVALID;
-	cache_stats.part_id = OCF_IO_CLASS_INVALID;
-
 	standby = !!(cache_info->info.state & (1 << ocf_cache_state_standby));
 
 	if (!standby) {
-		if (ioctl(ctrl_fd, KCAS_IOCTL_GET_STATS, &cache_stats)) {
-			print_err(cache_stats.ext_err_code);
+		if (get_stats_entries(ctrl_fd, cache_info, OCF_CORE_ID_INVALID,
+					KCAS_STATS_BULK_CACHE, &cache_stats) != 1) {
+			free(cache_stats);
 			return FAILURE;
 		}
 	}
@@ -657,7 +732,7 @@ static int cache_stats(int ctrl_fd, const struct kcas_cache_info *cache_info,
 		return SUCCESS;
 
 	if (stats_filters & STATS_FILTER_USAGE)
-		print_usage_stats(&cache_stats.usage, outfile);
+		print_usage_stats(&cache_stats->usage, outfile);
 
 	if ((cache_info->info.state & (1 << ocf_cache_state_incomplete))
 			&& (stats_filters & STATS_FILTER_USAGE)) {
@@ -665,37 +740,53 @@ static int cache_stats(int ctrl_fd, const struct kcas_cache_info *cache_info,
 	}
 
 	if (stats_filters & STATS_FILTER_COUNTERS)
-		cache_stats_counters(&cache_stats, outfile, stats_filters);
+		cache_stats_counters(cache_stats, outfile, stats_filters);
+
+	free(cache_stats);
 
 	return SUCCESS;
 }
 
+/**
+ * @brief print statistics of given core, or of all cores of a cache if
+ *        STATS_FILTER_CORES is set
+ */
 int cache_stats_cores(int ctrl_fd, const struct kcas_cache_info *cache_info,
 		      unsigned int cache_id, unsigned int core_id, int io_class_id,
 		      FILE *outfile, unsigned int stats_filters, bool by_id_path)
 {
-	struct kcas_core_info core_info;
-	struct kcas_get_stats stats;
+	struct kcas_core_info core_info = {};
+	struct kcas_stats_entry *entries;
+	int entries_count;
+	int ret = SUCCESS;
+	int i;
 
-	if (get_core_info(ctrl_fd, cache_id, core_id, &core_info, by_id_path)) {
-		cas_printf(LOG_ERR, "Error while retrieving stats for core %d\n", core_id);
-		print_err(core_info.ext_err_code);
+	entries_count = get_stats_entries(ctrl_fd, cache_info, core_id,
+			KCAS_STATS_BULK_CORES, &entries);
+	if (entries_count < 0) {
+		cas_printf(LOG_ERR, "Error while retrieving stats for cache %d\n",
+				cache_id);
 		return FAILURE;
 	}
 
-	stats.cache_id = cache_id;
-	stats.core_id = core_id;
-	stats.part_id = OCF_IO_CLASS_INVALID;
+	for (i = 0; i < entries_count; i++) {
+		if ((stats_filters & STATS_FILTER_CONF) &&
+				get_core_info(ctrl_fd, cache_id, entries[i].core_id,
+					&core_info, by_id_path)) {
+			cas_printf(LOG_ERR, "Error while retrieving stats for core %d\n",
+					entries[i].core_id);
+			print_err(core_info.ext_err_code);
+			ret = FAILURE;
+			break;
+		}
 
-	if (ioctl(ctrl_fd, KCAS_IOCTL_GET_STATS, &stats) < 0) {
-		cas_printf(LOG_ERR, "Error while retrieving stats for core %d\n", core_id);
-		print_err(core_info.ext_err_code);
-		return FAILURE;
+		cache_stats_core_counters(&core_info, &entries[i], stats_filters,
+				outfile);
 	}
 
-	cache_stats_core_counters(&core_info, &stats, stats_filters, outfile);
+	free(entries);
 
-	return SUCCESS;
+	return ret;
 }
 
 struct stats_printout_ctx
@@ -719,6 +810,59 @@ void *stats_printout(void *ctx)
 	return 0;
 }
 
+static int cache_status_sample(int ctrl_fd, unsigned int cache_id,
+		unsigned int core_id, int io_class_id, unsigned int stats_filters,
+		bool by_id_path, FILE *outfile)
+{
+	struct kcas_cache_info cache_info;
+	int i;
+
+	memset(&cache_info, 0, sizeof(cache_info));
+
+	cache_info.cache_id = cache_id;
+
+	if (ioctl(ctrl_fd, KCAS_IOCTL_CACHE_INFO, &cache_info) < 0) {
+		cas_printf(LOG_ERR, "Cache Id %d not running\n", cache_id);
+		return FAILURE;
+	}
+
+	if ((cache_info.info.state & (1 << ocf_cache_state_standby)) &&
+			(core_id != OCF_CORE_ID_INVALID ||
+			 (stats_filters & STATS_FILTER_CORES))) {
+		/* Explicitly fail due to standby mode rather than
+		 * bouncing off the fact that there are 0 cores in the
+		 * cache and saying "no such core device"
+		 */
+		print_err(OCF_ERR_CACHE_STANDBY);
+		return FAILURE;
+	}
+
+	/* Check if core exists in cache */
+	if (core_id != OCF_CORE_ID_INVALID) {
+		for (i = 0; i < cache_info.info.core_count; ++i) {
+			if (core_id == cache_info.core_id[i]) {
+				break;
+			}
+		}
+		if (i == cache_info.info.core_count) {
+			cas_printf(LOG_ERR, "No such core device in cache.\n");
+			return FAILURE;
+		}
+	}
+
+	if (stats_filters & STATS_FILTER_IOCLASS) {
+		return cache_stats_ioclasses(ctrl_fd, &cache_info, cache_id,
+				core_id, io_class_id, outfile, stats_filters);
+	} else if (core_id == OCF_CORE_ID_INVALID &&
+			!(stats_filters & STATS_FILTER_CORES)) {
+		return cache_stats(ctrl_fd, &cache_info, cache_id, outfile,
+				stats_filters, by_id_path);
+	} else {
+		return cache_stats_cores(ctrl_fd, &cache_info, cache_id, core_id,
+				io_class_id, outfile, stats_filters, by_id_path);
+	}
+}
+
 /**
  * @brief print cache statistics in various variants
  *
@@ -730,15 +874,20 @@ void *stats_printout(void *ctx)
  *        can be passed as a path, to generate CSV to stdout. Henceforth non-NULL value of
  *        fpath is a sign that stats shall be printed in CSV-format, and NULL value will]
  *        cause stats to be printed in pretty tables.
+ * @param interval if not 0, statistics are printed every interval seconds, with
+ *        timestamp in every record, using single control device descriptor
+ * @param count number of samples printed in interval mode, 0 means until interrupted
  *
  * @return SUCCESS upon successful printing of statistic. FAILURE if any error happens
  */
 int cache_status(unsigned int cache_id, unsigned int core_id, int io_class_id,
-		 unsigned int stats_filters, unsigned int output_format, bool by_id_path)
+		 unsigned int stats_filters, unsigned int output_format, bool by_id_path,
+		 unsigned int interval, unsigned int count)
 {
-	int ctrl_fd, i;
+	int ctrl_fd;
 	int ret = SUCCESS;
-	struct kcas_cache_info cache_info;
+	unsigned int sample;
+	struct timespec next_sample;
 
 	ctrl_fd = open_ctrl_device();
 
@@ -764,66 +913,36 @@ int cache_status(unsigned int cache_id, unsigned int core_id, int io_class_id,
 	struct stats_printout_ctx printout_ctx;
 	printout_ctx.intermediate = intermediate_file[0];
 	printout_ctx.out = stdout;
-	printout_ctx.type = (OUTPUT_FORMAT_CSV == output_format ? CSV : TEXT);
+	printout_ctx.type = get_output_view(output_format, CSV);
 	pthread_t thread;
 	pthread_create(&thread, 0, stats_printout, &printout_ctx);
 
-	memset(&cache_info, 0, sizeof(cache_info));
-
-	cache_info.cache_id = cache_id;
-
-	if (ioctl(ctrl_fd, KCAS_IOCTL_CACHE_INFO, &cache_info) < 0) {
-		cas_printf(LOG_ERR, "Cache Id %d not running\n", cache_id);
-		ret = FAILURE;
-		goto cleanup;
-	}
-
-	if ((cache_info.info.state & (1 << ocf_cache_state_standby)) &&
-			core_id != OCF_CORE_ID_INVALID) {
-		/* Explicitly fail due to standby mode rather than
-		 * bouncing off the fact that there are 0 cores in the
-		 * cache and saying "no such core device"
-		 */
-		print_err(OCF_ERR_CACHE_STANDBY);
-		ret = FAILURE;
-		goto cleanup;
-	}
+	clock_gettime(CLOCK_MONOTONIC, &next_sample);
 
-	/* Check if core exists in cache */
-	if (core_id != OCF_CORE_ID_INVALID) {
-		for (i = 0; i < cache_info.info.core_count; ++i) {
-			if (core_id == cache_info.core_id[i]) {
-				break;
-			}
+	for (sample = 0; !interval || !count || sample < count; ++sample) {
+		if (sample) {
+			next_sample.tv_sec += interval;
+			clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME,
+					&next_sample, NULL);
 		}
-		if (i == cache_info.info.core_count) {
-			cas_printf(LOG_ERR, "No such core device in cache.\n");
-			ret = FAILURE;
-			goto cleanup;
+		if (interval) {
+			clock_gettime(CLOCK_REALTIME, &sample_time);
 		}
-	}
 
-	if (stats_filters & STATS_FILTER_IOCLASS) {
-		if (cache_stats_ioclasses(ctrl_fd, &cache_info, cache_id,
-					core_id, io_class_id,
-					intermediate_file[1],
-					stats_filters)) {
+		if (cache_status_sample(ctrl_fd, cache_id, core_id, io_class_id,
+					stats_filters, by_id_path,
+					intermediate_file[1])) {
 			ret = FAILURE;
 			goto cleanup;
 		}
-	} else if (core_id == OCF_CORE_ID_INVALID) {
-		if (cache_stats(ctrl_fd, &cache_info, cache_id, intermediate_file[1],
-					stats_filters, by_id_path)) {
-			ret = FAILURE;
-			goto cleanup;
-		}
-	} else {
-		if (cache_stats_cores(ctrl_fd, &cache_info, cache_id, core_id,
-					io_class_id, intermediate_file[1],
-					stats_filters, by_id_path)) {
-			ret = FAILURE;
-			goto cleanup;
+
+		if (!interval) {
+			break;
 		}
+
+		/* Let formatting thread print sample without waiting for next one */
+		fprintf(intermediate_file[1], TAG(END_RECORD) "\n");
+		fflush(intermediate_file[1]);
 	}
 
 cleanup:
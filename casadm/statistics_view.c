@@ -13,6 +13,7 @@
 #include "statistics_view_text.h"
 #include "statistics_view_csv.h"
 #include "statistics_view_raw_csv.h"
+#include "statistics_view_json.h"
 
 static struct view_t *construct_view(int format, FILE *outfile)
 {
@@ -34,6 +35,12 @@ static struct view_t *construct_view(int format, FILE *outfile)
 		out->construct = raw_csv_construct;
 		out->destruct = raw_csv_destruct;
 		break;
+	case JSON:
+		out->process_row = json_process_row;
+		out->end_input = json_end_input;
+		out->construct = json_construct;
+		out->destruct = json_destruct;
+		break;
 	case TEXT:
 		out->process_row = text_process_row;
 		out->end_input = text_end_input;
@@ -97,6 +104,7 @@ int stat_format_output(FILE *infile, FILE *outfile, int format)
 		RECOGNIZE_TYPE(TREE_BRANCH);
 		RECOGNIZE_TYPE(TREE_LEAF);
 		RECOGNIZE_TYPE(RECORD);
+		RECOGNIZE_TYPE(END_RECORD);
 		RECOGNIZE_TYPE(DATA_SET);
 		if (type == UNDEFINED_TAG) {
 			cas_printf(LOG_ERR, "Unrecognized tag: %s\n", cols[0]);
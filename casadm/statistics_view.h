@@ -20,6 +20,8 @@ enum tag_type {
 	TABLE_SECTION, /**< first row of a table section */
 	DATA_SET, /**< set of records */
 	RECORD, /**< one record of data */
+	END_RECORD, /**< end of records which shall be printed immediately
+		       (statistics printed in intervals) */
 	TREE_HEADER,
 	TREE_BRANCH,
 	TREE_LEAF,
@@ -34,6 +36,7 @@ enum format {
 	TEXT, /**< output in text (formatted tables) form */
 	CSV, /**< output in csv form */
 	RAW_CSV, /**< csv form without transformations */
+	JSON, /**< output in json form */
 	PLAIN /**<debug setting: print intermediate format */
 };
 
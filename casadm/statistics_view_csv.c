@@ -19,6 +19,7 @@
 struct csv_out_prv {
 	int data_set; /* current data set number */
 	int record; /* current record number */
+	int record_finished; /* current record was already printed */
 	int column; /* current column number */
 	char **vals;
 	char **titles;
@@ -202,7 +203,7 @@ int csv_process_row(struct view_t *this, int type, int num_fields, char *fields[
 
 	switch (type) {
 	case DATA_SET:
-		if (prv->record) {
+		if (prv->record && !prv->record_finished) {
 			csv_finish_record(this);
 		}
 		csv_free_titles(this);
@@ -214,14 +215,22 @@ int csv_process_row(struct view_t *this, int type, int num_fields, char *fields[
 			fprintf(this->outfile, "%s\n", fields[0]);
 		}
 		prv->record = 0;
+		prv->record_finished = 0;
 		prv->data_set++;
 		break;
 	case RECORD:
-		if (prv->record) {
+		if (prv->record && !prv->record_finished) {
 			csv_finish_record(this);
 		}
 		prv->column = 0;
 		prv->record++;
+		prv->record_finished = 0;
+		break;
+	case END_RECORD:
+		if (prv->record && !prv->record_finished) {
+			csv_finish_record(this);
+			prv->record_finished = 1;
+		}
 		break;
 
 	/*
@@ -295,7 +304,9 @@ int csv_process_row(struct view_t *this, int type, int num_fields, char *fields[
 
 int csv_end_input(struct view_t *this)
 {
-	csv_finish_record(this);
+	if (!this->ctx.csv_prv->record_finished) {
+		csv_finish_record(this);
+	}
 	return 0;
 }
 int csv_construct(struct view_t *this)
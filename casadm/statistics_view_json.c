@@ -0,0 +1,521 @@
+/*
+* Copyright(c) 2026 Huawei Technologies Co., Ltd.
+* SPDX-License-Identifier: BSD-3-Clause
+*/
+
+#define _GNU_SOURCE
+#include <ctype.h>
+#include <stdbool.h>
+#include <stdio.h>
+#include <string.h>
+#include <stdlib.h>
+#include "statistics_view.h"
+#include "statistics_view_structs.h"
+#include "statistics_view_json.h"
+
+#define JSON_MAX_DEPTH 8
+
+/**
+ * private data of JSON output formatter
+ */
+struct json_out_prv {
+	int document; /* tag which started current document, UNDEFINED_TAG if none */
+	int depth; /* number of open containers */
+	char closing[JSON_MAX_DEPTH]; /* closing characters of open containers */
+	bool has_members[JSON_MAX_DEPTH]; /* container already has a member */
+	char **titles; /* column titles of current table or tree */
+	int num_titles;
+	char *branch_type; /* type of tree branches in open group */
+	char *leaf_type; /* type of tree leaves in open group */
+};
+
+static inline bool json_is_unit_string(const char *s)
+{
+	return NULL != s && '[' == s[0];
+}
+
+/* Returns unit part of title like "Wake up time [s]" or NULL */
+static const char *json_title_unit(const char *title)
+{
+	const char *unit = strrchr(title, '[');
+
+	return (unit && unit != title && strchr(unit, ']')) ? unit : NULL;
+}
+
+static void json_print_string(FILE *out, const char *s, size_t len)
+{
+	size_t i;
+
+	putc('"', out);
+	for (i = 0; i < len; i++) {
+		unsigned char c = s[i];
+
+		if ('"' == c || '\\' == c) {
+			fprintf(out, "\\%c", c);
+		} else if (c < 0x20) {
+			fprintf(out, "\\u%04x", c);
+		} else {
+			putc(c, out);
+		}
+	}
+	putc('"', out);
+}
+
+static size_t json_skip_digits(const char *s, size_t len, size_t *i)
+{
+	size_t start = *i;
+
+	while (*i < len && isdigit((unsigned char) s[*i])) {
+		(*i)++;
+	}
+	return *i - start;
+}
+
+/* Checks if string has syntax of JSON number, so it can be printed as is */
+static bool json_is_number(const char *s, size_t len)
+{
+	size_t i = 0;
+
+	if (i < len && '-' == s[i]) {
+		i++;
+	}
+	if (i < len && '0' == s[i]) {
+		i++;
+	} else if (!json_skip_digits(s, len, &i)) {
+		return false;
+	}
+	if (i < len && '.' == s[i]) {
+		i++;
+		if (!json_skip_digits(s, len, &i)) {
+			return false;
+		}
+	}
+	if (i < len && ('e' == s[i] || 'E' == s[i])) {
+		i++;
+		if (i < len && ('+' == s[i] || '-' == s[i])) {
+			i++;
+		}
+		if (!json_skip_digits(s, len, &i)) {
+			return false;
+		}
+	}
+	return i == len;
+}
+
+/**
+ * Prints numbers as JSON numbers, empty values and "-" as null
+ * and everything else as strings
+ */
+static void json_print_value(FILE *out, const char *s)
+{
+	size_t len;
+
+	while (isspace((unsigned char) *s)) {
+		s++;
+	}
+	len = strlen(s);
+	while (len && isspace((unsigned char) s[len - 1])) {
+		len--;
+	}
+
+	if (!len || (1 == len && '-' == s[0])) {
+		fprintf(out, "null");
+	} else if (json_is_number(s, len)) {
+		fwrite(s, 1, len, out);
+	} else {
+		json_print_string(out, s, len);
+	}
+}
+
+/**
+ * Prints title as a snake_case key, e.g. "Reads from core(s)" as "reads_from_core".
+ * Parts in parentheses and unit in brackets are skipped.
+ */
+static void json_print_key(FILE *out, const char *title, const char *suffix)
+{
+	bool separator = false, empty = true;
+	int parentheses = 0;
+
+	putc('"', out);
+	for (; *title && '[' != *title; title++) {
+		unsigned char c = *title;
+
+		if ('(' == c) {
+			parentheses++;
+		} else if (')' == c && parentheses) {
+			parentheses--;
+		} else if (parentheses) {
+			continue;
+		} else if (isalnum(c)) {
+			if (separator && !empty) {
+				putc('_', out);
+			}
+			putc(tolower(c), out);
+			separator = false;
+			empty = false;
+		} else {
+			separator = true;
+		}
+	}
+	fprintf(out, "%s\":", suffix);
+}
+
+/* Prints unit like "[4KiB Blocks]" as key "4KiB Blocks" */
+static void json_print_unit_key(FILE *out, const char *unit)
+{
+	const char *end = strchr(unit, ']');
+
+	unit++;
+	json_print_string(out, unit, end ? (size_t) (end - unit) : strlen(unit));
+	putc(':', out);
+}
+
+static void json_open(struct view_t *this, char opening, char closing)
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+
+	putc(opening, this->outfile);
+	prv->closing[prv->depth] = closing;
+	prv->has_members[prv->depth] = false;
+	prv->depth++;
+}
+
+static void json_close_to(struct view_t *this, int depth)
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+
+	while (prv->depth > depth) {
+		prv->depth--;
+		putc(prv->closing[prv->depth], this->outfile);
+	}
+}
+
+/* Starts next member or element of innermost open container */
+static void json_next(struct view_t *this)
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+
+	if (prv->has_members[prv->depth - 1]) {
+		putc(',', this->outfile);
+	}
+	prv->has_members[prv->depth - 1] = true;
+}
+
+static void json_member(struct view_t *this, const char *title, const char *suffix)
+{
+	json_next(this);
+	json_print_key(this->outfile, title, suffix);
+}
+
+static void json_end_document(struct view_t *this)
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+
+	if (UNDEFINED_TAG == prv->document) {
+		return;
+	}
+	json_close_to(this, 0);
+	putc('\n', this->outfile);
+	fflush(this->outfile);
+	prv->document = UNDEFINED_TAG;
+}
+
+static void json_begin_document(struct view_t *this, int type, char opening,
+				char closing)
+{
+	json_end_document(this);
+	this->ctx.json_prv->document = type;
+	json_open(this, opening, closing);
+}
+
+static void json_begin_record(struct view_t *this)
+{
+	if (RECORD != this->ctx.json_prv->document) {
+		json_begin_document(this, RECORD, '[', ']');
+	}
+	json_close_to(this, 1);
+	json_next(this);
+	json_open(this, '{', '}');
+}
+
+static void json_free_titles(struct view_t *this)
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+	int i;
+
+	if (prv->titles) {
+		for (i = 0; i < prv->num_titles; ++i) {
+			free(prv->titles[i]);
+		}
+		free(prv->titles);
+		prv->titles = NULL;
+		prv->num_titles = 0;
+	}
+}
+
+static int json_set_titles(struct view_t *this, int num_fields, char *fields[])
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+	int i;
+
+	json_free_titles(this);
+	prv->titles = calloc(sizeof(char *), num_fields);
+	if (!prv->titles) {
+		return 1;
+	}
+	for (i = 0; i < num_fields; i++) {
+		prv->titles[i] = strdup(fields[i]);
+		if (!prv->titles[i]) {
+			return 1;
+		}
+		prv->num_titles++;
+	}
+	return 0;
+}
+
+static int json_set_type(char **type, const char *s)
+{
+	free(*type);
+	*type = strdup(s);
+	return NULL == *type;
+}
+
+/**
+ * Prints values interleaved with units as object with units as keys, e.g.
+ * 10347970,[4KiB Blocks],39.47,[GiB] as {"4KiB Blocks":10347970,"GiB":39.47}.
+ * Values without unit (e.g. human readable form of time) are skipped.
+ * Single value without unit is printed as is.
+ */
+static void json_print_quantity(struct view_t *this, int num_fields, char *fields[])
+{
+	bool has_units = false;
+	int i;
+
+	for (i = 1; i < num_fields; i += 2) {
+		has_units |= json_is_unit_string(fields[i]);
+	}
+	if (!has_units) {
+		json_print_value(this->outfile, num_fields ? fields[0] : "");
+		return;
+	}
+
+	json_open(this, '{', '}');
+	for (i = 0; i + 1 < num_fields; i += 2) {
+		if (json_is_unit_string(fields[i + 1])) {
+			json_next(this);
+			json_print_unit_key(this->outfile, fields[i + 1]);
+			json_print_value(this->outfile, fields[i]);
+		}
+	}
+	json_close_to(this, this->ctx.json_prv->depth - 1);
+}
+
+/**
+ * Prints statistics table row, e.g. "Read hits",180,11.6,"[Requests]"
+ * under header "Request statistics","Count","%","[Units]" as
+ * "read_hits":{"Requests":180,"%":11.6}
+ */
+static void json_print_stats_row(struct view_t *this, int num_fields, char *fields[])
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+	const char *unit = NULL;
+	int i;
+
+	if (json_is_unit_string(fields[num_fields - 1])) {
+		unit = fields[num_fields - 1];
+		num_fields--;
+	}
+
+	json_member(this, fields[0], "");
+	json_open(this, '{', '}');
+	for (i = 1; i < num_fields && i < prv->num_titles; i++) {
+		if (json_is_unit_string(prv->titles[i])) {
+			continue;
+		}
+		json_next(this);
+		if (1 == i && unit) {
+			json_print_unit_key(this->outfile, unit);
+		} else {
+			json_print_string(this->outfile, prv->titles[i],
+					  strlen(prv->titles[i]));
+			putc(':', this->outfile);
+		}
+		json_print_value(this->outfile, fields[i]);
+	}
+	json_close_to(this, prv->depth - 1);
+}
+
+/**
+ * Table with two columns (e.g. parameter name and value) is printed as object
+ * with unit from name, e.g. "Wake up time [s]",20 as "wake_up_time":{"s":20}.
+ * Rows of other tables are printed as objects with column titles as keys.
+ */
+static void json_print_table_row(struct view_t *this, int num_fields, char *fields[])
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+	const char *unit;
+	int i;
+
+	if (2 == prv->num_titles) {
+		json_member(this, fields[0], "");
+		unit = json_title_unit(fields[0]);
+		if (unit) {
+			json_open(this, '{', '}');
+			json_next(this);
+			json_print_unit_key(this->outfile, unit);
+		}
+		json_print_value(this->outfile, num_fields > 1 ? fields[1] : "");
+		json_close_to(this, unit ? prv->depth - 1 : prv->depth);
+		return;
+	}
+
+	json_next(this);
+	json_open(this, '{', '}');
+	for (i = 0; i < num_fields && i < prv->num_titles; i++) {
+		json_member(this, prv->titles[i], "");
+		json_print_value(this->outfile, fields[i]);
+	}
+	json_close_to(this, prv->depth - 1);
+}
+
+/**
+ * First column of tree rows is type of a node. Nodes of the same type are
+ * grouped in arrays named after it, e.g. "caches", each branch with its leaves.
+ */
+static int json_print_tree_node(struct view_t *this, int type, int num_fields,
+				char *fields[])
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+	int group_depth = (TREE_BRANCH == type) ? 1 : 3;
+	char **group_type = (TREE_BRANCH == type) ? &prv->branch_type : &prv->leaf_type;
+	int i;
+
+	if (TREE_HEADER != prv->document || prv->depth < group_depth) {
+		return 1;
+	}
+
+	json_close_to(this, group_depth + 1);
+	if (group_depth + 1 == prv->depth && strcmp(*group_type, fields[0])) {
+		json_close_to(this, group_depth);
+	}
+	if (group_depth == prv->depth) {
+		if (json_set_type(group_type, fields[0])) {
+			return 1;
+		}
+		json_member(this, fields[0], "s");
+		json_open(this, '[', ']');
+	}
+
+	json_next(this);
+	json_open(this, '{', '}');
+	for (i = 1; i < num_fields && i < prv->num_titles; i++) {
+		json_member(this, prv->titles[i], "");
+		json_print_value(this->outfile, fields[i]);
+	}
+	if (TREE_LEAF == type) {
+		json_close_to(this, prv->depth - 1);
+	}
+	return 0;
+}
+
+int json_process_row(struct view_t *this, int type, int num_fields, char *fields[])
+{
+	struct json_out_prv *prv = this->ctx.json_prv;
+
+	switch (type) {
+	/*
+	 * Records are printed as array of objects, one document for all
+	 * records, or for each sample of statistics printed in intervals
+	 */
+	case DATA_SET:
+		json_end_document(this);
+		break;
+	case RECORD:
+		json_begin_record(this);
+		break;
+	case END_RECORD:
+		if (RECORD == prv->document) {
+			json_end_document(this);
+		}
+		break;
+	case KV_PAIR:
+		if (num_fields < 1) {
+			return 1;
+		}
+		if (RECORD != prv->document) {
+			json_begin_record(this);
+		}
+		json_close_to(this, 2);
+		json_member(this, fields[0], "");
+		json_print_quantity(this, num_fields - 1, fields + 1);
+		break;
+	case TABLE_HEADER:
+		if (num_fields < 1 || json_set_titles(this, num_fields, fields)) {
+			return 1;
+		}
+		if (RECORD == prv->document) {
+			json_close_to(this, 2);
+			json_member(this, fields[0], "");
+			json_open(this, '{', '}');
+		} else if (2 == num_fields) {
+			json_begin_document(this, TABLE_HEADER, '{', '}');
+		} else {
+			json_begin_document(this, TABLE_HEADER, '[', ']');
+		}
+		break;
+	case TABLE_SECTION:
+	case TABLE_ROW:
+		if (num_fields < 1) {
+			return 1;
+		}
+		if (RECORD == prv->document && 3 == prv->depth) {
+			json_print_stats_row(this, num_fields, fields);
+		} else if (TABLE_HEADER == prv->document) {
+			json_print_table_row(this, num_fields, fields);
+		} else {
+			return 1;
+		}
+		break;
+	case TREE_HEADER:
+		if (json_set_titles(this, num_fields, fields)) {
+			return 1;
+		}
+		json_begin_document(this, TREE_HEADER, '{', '}');
+		break;
+	case TREE_BRANCH:
+	case TREE_LEAF:
+		if (num_fields < 1) {
+			return 1;
+		}
+		return json_print_tree_node(this, type, num_fields, fields);
+	}
+	return 0;
+}
+
+int json_end_input(struct view_t *this)
+{
+	json_end_document(this);
+	return 0;
+}
+
+int json_construct(struct view_t *this)
+{
+	struct json_out_prv *prv = calloc(sizeof(struct json_out_prv), 1);
+
+	if (!prv) {
+		return 1;
+	}
+	prv->document = UNDEFINED_TAG;
+	this->ctx.json_prv = prv;
+
+	return 0;
+}
+
+int json_destruct(struct view_t *this)
+{
+	json_free_titles(this);
+	free(this->ctx.json_prv->branch_type);
+	free(this->ctx.json_prv->leaf_type);
+	free(this->ctx.json_prv);
+	return 0;
+}
@@ -16,7 +16,9 @@
 int raw_csv_process_row(struct view_t *this, int type, int num_fields, char *fields[])
 {
 	int i;
-	if (RECORD != type && DATA_SET != type) {
+	if (END_RECORD == type) {
+		fflush(this->outfile);
+	} else if (RECORD != type && DATA_SET != type) {
 		for (i = 0; i < num_fields; i++) {
 			if (i) {
 				fputc(',', this->outfile);
@@ -999,6 +999,13 @@ int text_process_row(struct view_t *this, int type, int num_fields, char *fields
 			table_h = 0;
 		}
 		break;
+	case END_RECORD:
+		if (table_h) {
+			finish_structured_data(this);
+			putc('\n', this->outfile);
+		}
+		fflush(this->outfile);
+		break;
 	default:
 		if (table_h && (TABLE_HEADER == type ||
 				(vector_get(&prv->row_types, 0) == KV_PAIR
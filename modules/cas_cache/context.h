@@ -19,6 +19,8 @@ struct bio_vec_iter {
 	struct bio_vec *ivec;
 };
 
+struct cas_lat_hist;
+
 struct blk_data {
 	/**
 	 * @brief Atomic counter for core device
@@ -45,6 +47,16 @@ struct blk_data {
 	 */
 	unsigned long long start_time;
 
+	/**
+	 * @brief Latency histogram of master request, NULL if not accounted
+	 */
+	struct cas_lat_hist *lat_hist;
+
+	/**
+	 * @brief Timestamp of master request submission in ns
+	 */
+	u64 lat_start_ns;
+
 	/**
 	 * @brief Request data siz
 	 */
@@ -514,6 +514,13 @@ int cas_exp_obj_create(struct cas_disk *dsk, const char *dev_name,
 	if (result)
 		goto error_sysfs;
 
+	if (exp_obj->ops->attr_group) {
+		result = sysfs_create_group(&disk_to_dev(gd)->kobj,
+				exp_obj->ops->attr_group);
+		if (result)
+			goto error_ops_sysfs;
+	}
+
 	result = bd_claim_by_disk(cas_disk_get_blkdev(dsk), dsk, gd);
 	if (result)
 		goto error_bd_claim;
@@ -521,6 +528,11 @@ int cas_exp_obj_create(struct cas_disk *dsk, const char *dev_name,
 	return 0;
 
 error_bd_claim:
+	if (exp_obj->ops->attr_group) {
+		sysfs_remove_group(&disk_to_dev(gd)->kobj,
+				exp_obj->ops->attr_group);
+	}
+error_ops_sysfs:
 	sysfs_remove_group(&disk_to_dev(gd)->kobj, &device_attr_group);
 error_sysfs:
 	del_gendisk(dsk->exp_obj->gd);
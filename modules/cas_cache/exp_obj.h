@@ -30,6 +30,12 @@ struct cas_exp_obj_ops {
 	 */
 	void (*submit_bio)(struct cas_disk *dsk,
 			       struct bio *bio, void *private);
+
+	/**
+	 * @brief Additional sysfs attributes of exported object (top) block
+	 *	device. Could be NULL.
+	 */
+	const struct attribute_group *attr_group;
 };
 
 struct cas_exp_obj {
@@ -3409,6 +3409,149 @@ put:
 	return result;
 }
 
+struct get_stats_bulk_ctx {
+	struct kcas_get_stats_bulk *cmd_info;
+	struct kcas_stats_entry entry;
+	ocf_cache_t cache;
+};
+
+static int _cache_mngt_stats_bulk_add(struct get_stats_bulk_ctx *ctx,
+		ocf_core_t core, uint16_t core_id, uint16_t part_id)
+{
+	struct kcas_get_stats_bulk *cmd_info = ctx->cmd_info;
+	struct kcas_stats_entry *entry = &ctx->entry;
+	int result;
+
+	memset(entry, 0, sizeof(*entry));
+	entry->core_id = core_id;
+	entry->part_id = part_id;
+
+	if (!core && part_id == OCF_IO_CLASS_INVALID) {
+		result = ocf_stats_collect_cache(ctx->cache, &entry->usage,
+				&entry->req, &entry->blocks, &entry->errors);
+	} else if (!core) {
+		result = ocf_stats_collect_part_cache(ctx->cache, part_id,
+				&entry->usage, &entry->req, &entry->blocks);
+	} else if (part_id == OCF_IO_CLASS_INVALID) {
+		result = ocf_stats_collect_core(core, &entry->usage,
+				&entry->req, &entry->blocks, &entry->errors);
+	} else {
+		result = ocf_stats_collect_part_core(core, part_id,
+				&entry->usage, &entry->req, &entry->blocks);
+	}
+
+	/* Only configured IO classes have entries */
+	if (result == -OCF_ERR_IO_CLASS_NOT_EXIST)
+		return 0;
+	if (result)
+		return result;
+
+	if (cmd_info->num_entries < cmd_info->max_entries &&
+			copy_to_user((void __user *)(cmd_info->entries +
+					cmd_info->num_entries),
+				entry, sizeof(*entry))) {
+		return -EFAULT;
+	}
+
+	cmd_info->num_entries++;
+
+	return 0;
+}
+
+static int _cache_mngt_stats_bulk_add_io_classes(struct get_stats_bulk_ctx *ctx,
+		ocf_core_t core, uint16_t core_id)
+{
+	uint16_t part_id;
+	int result;
+
+	for (part_id = 0; part_id < OCF_USER_IO_CLASS_MAX; part_id++) {
+		result = _cache_mngt_stats_bulk_add(ctx, core, core_id, part_id);
+		if (result)
+			return result;
+	}
+
+	return 0;
+}
+
+static int _cache_mngt_stats_bulk_core_visitor(ocf_core_t core, void *cntx)
+{
+	struct get_stats_bulk_ctx *ctx = cntx;
+	uint16_t core_id = OCF_CORE_ID_INVALID;
+	int result;
+
+	core_id_from_name(&core_id, ocf_core_get_name(core));
+
+	if (ctx->cmd_info->core_id != OCF_CORE_ID_INVALID &&
+			ctx->cmd_info->core_id != core_id) {
+		return 0;
+	}
+
+	if (ctx->cmd_info->flags & KCAS_STATS_BULK_CORES) {
+		result = _cache_mngt_stats_bulk_add(ctx, core, core_id,
+				OCF_IO_CLASS_INVALID);
+		if (result)
+			return result;
+	}
+
+	if (ctx->cmd_info->flags & KCAS_STATS_BULK_CORE_IO_CLASSES)
+		return _cache_mngt_stats_bulk_add_io_classes(ctx, core, core_id);
+
+	return 0;
+}
+
+int cache_mngt_get_stats_bulk(struct kcas_get_stats_bulk *cmd_info)
+{
+	struct get_stats_bulk_ctx *ctx;
+	int result;
+
+	if (cmd_info->entries == NULL && cmd_info->max_entries)
+		return -EINVAL;
+
+	ctx = kzalloc(sizeof(*ctx), GFP_KERNEL);
+	if (!ctx)
+		return -ENOMEM;
+
+	ctx->cmd_info = cmd_info;
+	cmd_info->num_entries = 0;
+
+	result = mngt_get_cache_by_id(cas_ctx, cmd_info->cache_id, &ctx->cache);
+	if (result)
+		goto free;
+
+	/* All entries are collected under single lock, so they are consistent */
+	result = _cache_mngt_read_lock_sync(ctx->cache);
+	if (result)
+		goto put;
+
+	if (cmd_info->flags & KCAS_STATS_BULK_CACHE) {
+		result = _cache_mngt_stats_bulk_add(ctx, NULL,
+				OCF_CORE_ID_INVALID, OCF_IO_CLASS_INVALID);
+		if (result)
+			goto unlock;
+	}
+
+	if (cmd_info->flags & KCAS_STATS_BULK_CACHE_IO_CLASSES) {
+		result = _cache_mngt_stats_bulk_add_io_classes(ctx, NULL,
+				OCF_CORE_ID_INVALID);
+		if (result)
+			goto unlock;
+	}
+
+	if (cmd_info->flags & (KCAS_STATS_BULK_CORES |
+				KCAS_STATS_BULK_CORE_IO_CLASSES)) {
+		result = ocf_core_visit(ctx->cache,
+				_cache_mngt_stats_bulk_core_visitor, ctx, false);
+	}
+
+unlock:
+	ocf_mngt_cache_read_unlock(ctx->cache);
+put:
+	ocf_mngt_cache_put(ctx->cache);
+free:
+	kfree(ctx);
+	return result;
+}
+
 int cache_mngt_get_info(struct kcas_cache_info *info)
 {
 	uint32_t i, j;
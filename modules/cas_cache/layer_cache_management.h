@@ -103,6 +103,8 @@ int cache_mngt_interrupt_flushing(const char *cache_name, size_t name_len);
 
 int cache_mngt_get_stats(struct kcas_get_stats *stats);
 
+int cache_mngt_get_stats_bulk(struct kcas_get_stats_bulk *cmd_info);
+
 int cache_mngt_get_info(struct kcas_cache_info *info);
 
 int cache_mngt_get_io_class_info(struct kcas_io_class *part);
@@ -39,6 +39,13 @@ module_param(seq_cut_off_mb, uint, (S_IRUSR | S_IRGRP));
 MODULE_PARM_DESC(seq_cut_off_mb,
 		"Sequential cut off threshold in MiB. 0 - disable");
 
+u32 latency_histograms = 0;
+module_param(latency_histograms, uint, (S_IRUSR | S_IWUSR | S_IRGRP));
+MODULE_PARM_DESC(latency_histograms,
+		"Account latencies of core exported objects requests in "
+		"histograms, which can be switched at runtime. "
+		"0 - disable, 1 - enable");
+
 /* globals */
 ocf_ctx_t cas_ctx;
 struct cas_module cas_module;
@@ -0,0 +1,68 @@
+/*
+* Copyright(c) 2026 Huawei Technologies Co., Ltd.
+* SPDX-License-Identifier: BSD-3-Clause
+*/
+
+#include "cas_cache.h"
+#include "utils_lat_hist.h"
+
+int cas_lat_hist_init(struct cas_lat_hist *hist)
+{
+	hist->cpu = alloc_percpu(struct cas_lat_hist_cpu);
+	if (!hist->cpu)
+		return -ENOMEM;
+
+	return 0;
+}
+
+void cas_lat_hist_deinit(struct cas_lat_hist *hist)
+{
+	free_percpu(hist->cpu);
+	hist->cpu = NULL;
+}
+
+void cas_lat_hist_reset(struct cas_lat_hist *hist)
+{
+	int cpu;
+
+	/* Requests completing meanwhile may be accounted or not */
+	for_each_possible_cpu(cpu)
+		memset(per_cpu_ptr(hist->cpu, cpu), 0, sizeof(*hist->cpu));
+}
+
+static u64 cas_lat_hist_lower_bound(unsigned int bucket)
+{
+	unsigned int order;
+
+	if (bucket < CAS_LAT_HIST_SUB_BUCKETS)
+		return bucket;
+
+	order = (bucket >> CAS_LAT_HIST_SUB_BITS) - 1;
+
+	return (u64)((bucket & (CAS_LAT_HIST_SUB_BUCKETS - 1)) +
+			CAS_LAT_HIST_SUB_BUCKETS) << order;
+}
+
+ssize_t cas_lat_hist_show(struct cas_lat_hist *hist,
+		enum cas_lat_hist_dir dir, char *buf)
+{
+	unsigned int bucket;
+	ssize_t len = 0;
+	u64 count;
+	int cpu;
+
+	for (bucket = 0; bucket < CAS_LAT_HIST_BUCKETS; bucket++) {
+		count = 0;
+		for_each_possible_cpu(cpu)
+			count += per_cpu_ptr(hist->cpu, cpu)->buckets[dir][bucket];
+
+		if (!count)
+			continue;
+
+		len += sysfs_emit_at(buf, len, "%llu %llu %llu\n",
+				cas_lat_hist_lower_bound(bucket),
+				cas_lat_hist_lower_bound(bucket + 1), count);
+	}
+
+	return len;
+}
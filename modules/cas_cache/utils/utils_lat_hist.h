@@ -0,0 +1,81 @@
+/*
+* Copyright(c) 2026 Huawei Technologies Co., Ltd.
+* SPDX-License-Identifier: BSD-3-Clause
+*/
+
+#ifndef UTILS_LAT_HIST_H_
+#define UTILS_LAT_HIST_H_
+
+#include <linux/bitops.h>
+#include <linux/percpu.h>
+
+/*
+ * Log-linear histogram of request latencies in microseconds. Every power of two
+ * range is split into CAS_LAT_HIST_SUB_BUCKETS linear buckets, so bucket width
+ * is at most 1/CAS_LAT_HIST_SUB_BUCKETS of its lower bound.
+ */
+#define CAS_LAT_HIST_SUB_BITS 2
+#define CAS_LAT_HIST_SUB_BUCKETS (1 << CAS_LAT_HIST_SUB_BITS)
+
+/* Latencies of 2^27 us (over two minutes) and more are in the last bucket */
+#define CAS_LAT_HIST_MAX_ORDER 26
+#define CAS_LAT_HIST_BUCKETS \
+	((CAS_LAT_HIST_MAX_ORDER - CAS_LAT_HIST_SUB_BITS + 2) << CAS_LAT_HIST_SUB_BITS)
+
+enum cas_lat_hist_dir {
+	CAS_LAT_HIST_READ,
+	CAS_LAT_HIST_WRITE,
+	CAS_LAT_HIST_DIR_MAX,
+};
+
+struct cas_lat_hist_cpu {
+	u64 buckets[CAS_LAT_HIST_DIR_MAX][CAS_LAT_HIST_BUCKETS];
+};
+
+struct cas_lat_hist {
+	struct cas_lat_hist_cpu __percpu *cpu;
+};
+
+static inline unsigned int cas_lat_hist_bucket(u64 latency_us)
+{
+	unsigned int order;
+	unsigned int bucket;
+
+	if (latency_us < CAS_LAT_HIST_SUB_BUCKETS)
+		return latency_us;
+
+	order = fls64(latency_us) - 1;
+	if (order > CAS_LAT_HIST_MAX_ORDER)
+		return CAS_LAT_HIST_BUCKETS - 1;
+
+	bucket = (order - CAS_LAT_HIST_SUB_BITS + 1) << CAS_LAT_HIST_SUB_BITS;
+	bucket += (latency_us >> (order - CAS_LAT_HIST_SUB_BITS)) &
+			(CAS_LAT_HIST_SUB_BUCKETS - 1);
+
+	return bucket;
+}
+
+/**
+ * @brief Account request completed after latency_us in per-CPU histogram,
+ *	safe to be called from any context
+ */
+static inline void cas_lat_hist_add(struct cas_lat_hist *hist,
+		enum cas_lat_hist_dir dir, u64 latency_us)
+{
+	this_cpu_inc(hist->cpu->buckets[dir][cas_lat_hist_bucket(latency_us)]);
+}
+
+int cas_lat_hist_init(struct cas_lat_hist *hist);
+
+void cas_lat_hist_deinit(struct cas_lat_hist *hist);
+
+void cas_lat_hist_reset(struct cas_lat_hist *hist);
+
+/**
+ * @brief Print non-empty buckets of histogram to sysfs buffer, one per line:
+ *	"<lower bound [us]> <upper bound [us]> <count>"
+ */
+ssize_t cas_lat_hist_show(struct cas_lat_hist *hist,
+		enum cas_lat_hist_dir dir, char *buf);
+
+#endif /* UTILS_LAT_HIST_H_ */
@@ -9,6 +9,7 @@
 
 #include "vol_block_dev_bottom.h"
 #include "vol_block_dev_top.h"
+#include "../utils/utils_lat_hist.h"
 
 struct cas_disk;
 
@@ -31,6 +32,9 @@ struct bd_object {
 
 	ocf_volume_t front_volume;
 		/*< Cache/core front volume */
+
+	struct cas_lat_hist lat_hist;
+		/*< Latency histograms of core exported object requests */
 };
 
 static inline struct bd_object *bd_object(ocf_volume_t vol)
@@ -7,6 +7,8 @@
 #include "cas_cache.h"
 #include "utils/cas_err.h"
 
+extern u32 latency_histograms;
+
 static void blkdev_set_bio_data(struct blk_data *data, struct bio *bio)
 {
 #if LINUX_VERSION_CODE < KERNEL_VERSION(3, 14, 0)
@@ -213,6 +215,14 @@ static void blkdev_complete_data_master(struct blk_data *master, int error)
 
 	cas_generic_end_io_acct(master->bio, master->start_time);
 
+	if (master->lat_hist) {
+		cas_lat_hist_add(master->lat_hist,
+				bio_data_dir(master->bio) == READ ?
+					CAS_LAT_HIST_READ : CAS_LAT_HIST_WRITE,
+				div_u64(ktime_get_ns() - master->lat_start_ns,
+					NSEC_PER_USEC));
+	}
+
 	result = map_cas_err_to_generic(master->error);
 	CAS_BIO_ENDIO(master->bio, master->master_size,
 			CAS_ERRNO_TO_BLK_STS(result));
@@ -241,6 +251,8 @@ struct blkdev_data_master_ctx {
 	struct bio *bio;
 	uint32_t master_size;
 	unsigned long long start_time;
+	struct cas_lat_hist *lat_hist;
+	u64 lat_start_ns;
 };
 
 static int blkdev_handle_data_single(struct bd_object *bvol, struct bio *bio,
@@ -290,6 +302,8 @@ static int blkdev_handle_data_single(struct bd_object *bvol, struct bio *bio,
 		data->bio = master_ctx->bio;
 		data->master_size = master_ctx->master_size;
 		data->start_time = master_ctx->start_time;
+		data->lat_hist = master_ctx->lat_hist;
+		data->lat_start_ns = master_ctx->lat_start_ns;
 		master_ctx->data = data;
 	}
 
@@ -324,6 +338,11 @@ static void blkdev_handle_data(struct bd_object *bvol, struct bio *bio)
 	}
 
 	master_ctx.start_time = cas_generic_start_io_acct(bio);
+	/* Histograms are allocated only for core exported objects */
+	if (latency_histograms && bvol->lat_hist.cpu) {
+		master_ctx.lat_hist = &bvol->lat_hist;
+		master_ctx.lat_start_ns = ktime_get_ns();
+	}
 	for (sectors = bio_sectors(bio); sectors > 0;) {
 		if (sectors <= max_io_sectors) {
 			split = bio;
@@ -469,10 +488,63 @@ static void blkdev_core_submit_bio(struct cas_disk *dsk,
 	blkdev_submit_bio(bvol, bio);
 }
 
+static struct cas_lat_hist *blkdev_core_lat_hist(struct device *dev)
+{
+	struct cas_disk *dsk = dev_to_disk(dev)->private_data;
+	ocf_core_t core = dsk->exp_obj->private;
+
+	return &bd_object(ocf_core_get_volume(core))->lat_hist;
+}
+
+static ssize_t latency_read_show(struct device *dev,
+		struct device_attribute *attr, char *buf)
+{
+	return cas_lat_hist_show(blkdev_core_lat_hist(dev), CAS_LAT_HIST_READ,
+			buf);
+}
+
+static ssize_t latency_write_show(struct device *dev,
+		struct device_attribute *attr, char *buf)
+{
+	return cas_lat_hist_show(blkdev_core_lat_hist(dev), CAS_LAT_HIST_WRITE,
+			buf);
+}
+
+static ssize_t latency_reset_store(struct device *dev,
+		struct device_attribute *attr, const char *buf, size_t count)
+{
+	cas_lat_hist_reset(blkdev_core_lat_hist(dev));
+
+	return count;
+}
+
+static struct device_attribute latency_attr_read =
+	__ATTR(read, 0444, latency_read_show, NULL);
+
+static struct device_attribute latency_attr_write =
+	__ATTR(write, 0444, latency_write_show, NULL);
+
+static struct device_attribute latency_attr_reset =
+	__ATTR(reset, 0200, NULL, latency_reset_store);
+
+static struct attribute *latency_attrs[] = {
+	&latency_attr_read.attr,
+	&latency_attr_write.attr,
+	&latency_attr_reset.attr,
+	NULL,
+};
+
+/* /sys/block/casX-Y/latency, filled when latency_histograms is enabled */
+static const struct attribute_group latency_attr_group = {
+	.attrs = latency_attrs,
+	.name = "latency",
+};
+
 static struct cas_exp_obj_ops kcas_core_exp_obj_ops = {
 	.set_geometry = blkdev_core_set_geometry,
 	.set_queue_limits = blkdev_core_set_queue_limits,
 	.submit_bio = blkdev_core_submit_bio,
+	.attr_group = &latency_attr_group,
 };
 
 static int blkdev_cache_set_geometry(struct cas_disk *dsk, void *private)
@@ -635,6 +707,7 @@ static int kcas_volume_destroy_exported_object(ocf_volume_t volume)
 
 	bvol->expobj_valid = false;
 	destroy_workqueue(bvol->expobj_wq);
+	cas_lat_hist_deinit(&bvol->lat_hist);
 
 	cas_exp_obj_unlock(bvol->dsk);
 	cas_exp_obj_cleanup(bvol->dsk);
@@ -656,6 +729,7 @@ int kcas_core_create_exported_object(ocf_core_t core)
 	ocf_volume_t volume = ocf_core_get_volume(core);
 	struct bd_object *bvol = bd_object(volume);
 	char dev_name[DISK_NAME_LEN];
+	int result;
 
 	snprintf(dev_name, DISK_NAME_LEN, "cas%s-%s",
 			get_cache_id_string(cache),
@@ -663,8 +737,16 @@ int kcas_core_create_exported_object(ocf_core_t core)
 
 	bvol->front_volume = ocf_core_get_front_volume(core);
 
-	return kcas_volume_create_exported_object(volume, dev_name, core,
+	result = cas_lat_hist_init(&bvol->lat_hist);
+	if (result)
+		return result;
+
+	result = kcas_volume_create_exported_object(volume, dev_name, core,
 			&kcas_core_exp_obj_ops);
+	if (result)
+		cas_lat_hist_deinit(&bvol->lat_hist);
+
+	return result;
 }
 
 int kcas_core_destroy_exported_object(ocf_core_t core)
@@ -751,6 +833,7 @@ static int kcas_core_stop_exported_object(ocf_core_t core, void *cntx)
 		if (!ret) {
 			bvol->expobj_valid = false;
 			destroy_workqueue(bvol->expobj_wq);
+			cas_lat_hist_deinit(&bvol->lat_hist);
 		}
 	}
 
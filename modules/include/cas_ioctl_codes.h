@@ -168,6 +168,62 @@ struct kcas_get_stats {
 	int ext_err_code;
 };
 
+/** Totals of whole cache */
+#define KCAS_STATS_BULK_CACHE			(1 << 0)
+/** Statistics of every configured IO class of cache */
+#define KCAS_STATS_BULK_CACHE_IO_CLASSES	(1 << 1)
+/** Statistics of every core */
+#define KCAS_STATS_BULK_CORES			(1 << 2)
+/** Statistics of every configured IO class of every core */
+#define KCAS_STATS_BULK_CORE_IO_CLASSES		(1 << 3)
+
+/**
+ * statistics of cache, core or IO class, an element of
+ * KCAS_IOCTL_GET_STATS_BULK buffer
+ */
+struct kcas_stats_entry {
+	/** id of a core or OCF_CORE_ID_INVALID for cache statistics */
+	uint16_t core_id;
+
+	/** id of an ioclass or OCF_IO_CLASS_INVALID for all IO classes */
+	uint16_t part_id;
+
+	struct ocf_stats_usage usage;
+
+	struct ocf_stats_requests req;
+
+	struct ocf_stats_blocks blocks;
+
+	/** filled only for cache and core entries */
+	struct ocf_stats_errors errors;
+};
+
+struct kcas_get_stats_bulk {
+	/** id of a cache */
+	uint16_t cache_id;
+
+	/** id of a core to limit core entries to, or OCF_CORE_ID_INVALID */
+	uint16_t core_id;
+
+	/** KCAS_STATS_BULK_* flags selecting entries to be filled */
+	uint32_t flags;
+
+	/** caller-provided buffer for entries */
+	struct kcas_stats_entry *entries;
+
+	/** number of entries which fit in the buffer */
+	uint32_t max_entries;
+
+	/**
+	 * number of selected entries, in order: cache, cache IO classes and then
+	 * every core followed by its IO classes. Entries past max_entries are
+	 * not filled.
+	 */
+	uint32_t num_entries;
+
+	int ext_err_code;
+};
+
 struct kcas_cache_info {
 	/** id of a cache */
 	uint16_t cache_id;
@@ -408,6 +464,7 @@ struct kcas_standby_activate
  *    41    *    KCAS_IOCTL_START_CACHE                     *    OK            *
  *    42    *    KCAS_IOCTL_DETACH_CACHE                    *    OK            *
  *    43    *    KCAS_IOCTL_ATTACH_CACHE                    *    OK            *
+ *    44    *    KCAS_IOCTL_GET_STATS_BULK                  *    OK            *
  *******************************************************************************
  */
 
@@ -512,6 +569,9 @@ struct kcas_standby_activate
 /** Attach cache device */
 #define KCAS_IOCTL_ATTACH_CACHE _IOWR(KCAS_IOCTL_MAGIC, 43, struct kcas_start_cache)
 
+/** Retrieve statistics of cache, its cores and IO classes in a single call */
+#define KCAS_IOCTL_GET_STATS_BULK _IOWR(KCAS_IOCTL_MAGIC, 44, struct kcas_get_stats_bulk)
+
 /**
  * Extended kernel CAS error codes
  */
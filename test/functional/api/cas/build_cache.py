@@ -0,0 +1,169 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import base64
+import posixpath
+
+from connection.utils.output import CmdException
+from core.test_run import TestRun
+
+build_cache_dir = "/var/cache/opencas-build"
+build_dir = posixpath.join(build_cache_dir, "build")
+# Number of builds for which installable artifacts are kept
+max_cached_builds = 20
+
+# Files used by 'make install', stored for every built key
+_artifacts = [
+    ".metadata/cas_version",
+    "modules/cas_cache/cas_cache.ko",
+    "casadm/casadm",
+    "casadm/casadm.8.gz",
+    "utils/casctl.8.gz",
+    "utils/opencas.conf.5.gz",
+]
+
+# Build outputs and sources generated by 'make sync', which are neither copied from sources
+# nor removed from build directory
+_build_outputs = [
+    "*.o",
+    "*.ko",
+    "*.a",
+    "*.d",
+    "*.mod",
+    "*.mod.c",
+    ".*.cmd",
+    "*.gz",
+    "Module.symvers",
+    "modules.order",
+    "/casadm/casadm",
+    "/config.out",
+    "/modules/generated_defines.h",
+    "/modules/cas_cache/src/",
+    "/modules/cas_cache/include/",
+    "/.metadata/",
+    ".git",
+]
+
+_build_script = r"""
+set -o pipefail
+log=$cache_dir/build.log
+mkdir -p "$build_dir" "$cache_dir/config" "$cache_dir/artifacts"
+
+fail() {
+    echo "$1" >&2
+    [ -f "$log" ] && tail -n 50 "$log" >&2
+    exit 1
+}
+
+# Hash of tree with uncommitted and untracked changes, index of repository stays untouched
+source_tree() {
+    local index
+    index=$(mktemp)
+    (
+        cd "$1" && cp "$(git rev-parse --git-path index)" "$index" 2>/dev/null
+        GIT_INDEX_FILE=$index git add -A && GIT_INDEX_FILE=$index git write-tree
+    )
+    rm -f "$index"
+}
+
+# Keeps modification time of file if configure generated the same content again
+keep_if_unchanged() {
+    [ -f "$1.prev" ] && cmp -s "$1" "$1.prev" && mv -f "$1.prev" "$1"
+    rm -f "$1.prev"
+}
+
+tree=$(source_tree "$sources_dir") && ocf_tree=$(source_tree "$sources_dir/ocf") ||
+    fail "Failed to get source tree hash"
+kernel=$(uname -r)
+
+# Build directory is persistent, only changed files are rewritten, so make rebuilds
+# only what depends on them
+rsync -rlpD --checksum --delete "${rsync_excludes[@]}" "$sources_dir/" "$build_dir/" \
+    > "$log" 2>&1 || fail "Failed to copy sources to build directory"
+cd "$build_dir"
+
+for file in modules/generated_defines.h .metadata/cas_version; do
+    [ -f "$file" ] && cp -p "$file" "$file.prev"
+done
+config_key=$(cat configure configure.d/* <(echo "$kernel") | sha256sum | cut -d' ' -f1)
+config=$cache_dir/config/$config_key
+if [ -f "$config" ]; then
+    ./configure "$config" >> "$log" 2>&1 || fail "Configure failed"
+else
+    ./configure >> "$log" 2>&1 && cp config.out "$config" || fail "Configure failed"
+fi
+keep_if_unchanged modules/generated_defines.h
+if [ -f .metadata/cas_version.prev ] && ! cmp -s .metadata/cas_version .metadata/cas_version.prev
+then
+    # casadm objects don't depend on version defines, rebuild them with the new version
+    make -C casadm clean >> "$log" 2>&1
+fi
+keep_if_unchanged .metadata/cas_version
+
+key=$(cat <(echo "$tree $ocf_tree $kernel") config.out modules/generated_defines.h \
+    .metadata/cas_version | sha256sum | cut -d' ' -f1)
+artifacts=$cache_dir/artifacts/$key
+echo "build_key=$key"
+
+if [ -d "$artifacts" ]; then
+    (cd "$artifacts" && cp -p --parents $artifacts_list "$build_dir/") ||
+        fail "Failed to restore cached build"
+    touch "$artifacts"
+    echo "cached=true"
+else
+    make_args=(-j"$(nproc)")
+    if [ "$use_ccache" = true ] && command -v ccache > /dev/null; then
+        make_args+=("CC=ccache gcc")
+    fi
+    make "${make_args[@]}" >> "$log" 2>&1 || fail "Make command executed with nonzero status"
+    rm -rf "$artifacts.tmp" && mkdir -p "$artifacts.tmp" &&
+        cp -p --parents $artifacts_list "$artifacts.tmp/" && mv "$artifacts.tmp" "$artifacts" ||
+            fail "Failed to store build artifacts"
+    echo "cached=false"
+fi
+
+ls -td "$cache_dir"/artifacts/* | tail -n +$((max_cached_builds + 1)) | xargs -r rm -rf
+"""
+
+
+def build_opencas_cached(use_ccache: bool = False) -> bool:
+    """
+    Builds Open CAS from sources in working directory in persistent build directory on DUT,
+    so only files changed since the previous build are recompiled. Build is identified
+    by git tree hash of sources (including uncommitted changes), kernel version and
+    configure output. If the same build was done before, its artifacts are restored from
+    cache instead. Returns True if build was taken from cache.
+    """
+    TestRun.LOGGER.info("Building Open CAS (cached)")
+    header = "\n".join(
+        [
+            f"cache_dir={build_cache_dir}",
+            f"build_dir={build_dir}",
+            f"sources_dir={TestRun.usr.working_dir}",
+            f"max_cached_builds={max_cached_builds}",
+            f"use_ccache={'true' if use_ccache else 'false'}",
+            f"artifacts_list='{' '.join(_artifacts)}'",
+            "rsync_excludes=("
+            + " ".join(f"--exclude='{pattern}'" for pattern in _build_outputs)
+            + ")",
+        ]
+    )
+    script = base64.b64encode((header + _build_script).encode("utf-8")).decode("ascii")
+    output = TestRun.executor.run(f"echo {script} | base64 --decode | bash")
+    if output.exit_code != 0:
+        raise CmdException("Failed to build Open CAS", output)
+
+    result = dict(line.split("=", 1) for line in output.stdout.splitlines() if "=" in line)
+    cached = result.get("cached") == "true"
+    TestRun.LOGGER.info(
+        f"Build {result.get('build_key')} {'restored from cache' if cached else 'built'}"
+    )
+    return cached
+
+
+def clear_build_cache():
+    output = TestRun.executor.run(f"rm -rf {build_cache_dir}")
+    if output.exit_code != 0:
+        raise CmdException("Failed to clear Open CAS build cache", output)
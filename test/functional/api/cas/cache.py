@@ -26,7 +26,7 @@ from api.cas.casadm_parser import (get_cas_devices_dict, get_cores, get_flush_pa
                                    get_flush_parameters_acp, get_io_class_list)
 from api.cas.core import Core
 from api.cas.dmesg import get_metadata_size_on_device
-from api.cas.statistics import CacheStats, CacheIoClassStats
+from api.cas.statistics import CacheStats, CacheIoClassStats, get_cores_statistics
 from connection.utils.output import Output
 from storage_devices.device import Device
 from test_tools.os_tools import sync
@@ -50,7 +50,7 @@ class Cache:
         if not cache:
             return None
 
-        if cache["device_path"] is "-":
+        if cache["device_path"] is None:
             return None
 
         return Device(path=cache["device_path"])
@@ -123,6 +123,17 @@ class Cache:
             percentage_val=percentage_val,
         )
 
+    def get_cores_statistics(
+        self,
+        stat_filter: List[StatsFilter] = None,
+        percentage_val: bool = False,
+    ) -> dict:
+        return get_cores_statistics(
+            cache_id=self.cache_id,
+            filter=stat_filter,
+            percentage_val=percentage_val,
+        )
+
     def get_io_class_statistics(
         self,
         io_class_id: int = None,
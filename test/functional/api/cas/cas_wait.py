@@ -0,0 +1,182 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import base64
+from collections import namedtuple
+from datetime import timedelta
+
+from api.cas.cache_config import CacheStatus
+from api.cas.cli import list_caches_cmd, print_statistics_cmd
+from api.cas.core_config import CoreStatus
+from connection.utils.output import CmdException
+from core.test_run import TestRun
+from type_def.size import Size, Unit
+
+WaitResult = namedtuple("WaitResult", ["description", "satisfied", "duration", "checks"])
+
+# Results of all waits done by test, e.g. to check how long measured phases waited for CAS
+wait_history = []
+
+_wait_script = r"""
+set -o pipefail
+
+# Prints lowercase status of cache or its core from casadm list, e.g. 'flushing (12.3 %)'
+device_status() {
+    LIST_CMD | awk -F, -v cache="$1" -v core="$2" '
+        $1 == "cache" { current = $2 }
+        $1 == "core pool" { current = "" }
+        current == cache && (core == "" ? $1 == "cache" : $1 == "core" && $2 == core) {
+            print tolower($4)
+            exit
+        }'
+}
+
+condition() {
+CONDITION
+}
+
+start=$(date +%s%N)
+deadline=$((start + timeout_ms * 1000000))
+interval=$min_interval_ms
+checks=0
+while true; do
+    checks=$((checks + 1))
+    condition
+    result=$?
+    now=$(date +%s%N)
+    if [ $result -eq 0 ]; then
+        state=satisfied
+    elif [ $result -eq 2 ]; then
+        state=aborted
+    elif [ "$now" -ge "$deadline" ]; then
+        state=timeout
+    else
+        remaining=$(((deadline - now) / 1000000 + 1))
+        sleep_ms=$((interval < remaining ? interval : remaining))
+        sleep "$(printf "%d.%03d" $((sleep_ms / 1000)) $((sleep_ms % 1000)))"
+        interval=$((interval * 2 < max_interval_ms ? interval * 2 : max_interval_ms))
+        continue
+    fi
+    break
+done
+echo "state=$state checks=$checks elapsed_ms=$(((now - start) / 1000000))"
+"""
+
+
+class WaitCondition:
+    """
+    Condition checked on DUT by a bash snippet, which returns 0 when condition is met,
+    1 when it isn't met yet and 2 when it can't be met anymore, so waiting is aborted.
+    """
+
+    def __init__(self, description: str, script: str):
+        self.description = description
+        self.script = script
+
+    def __str__(self):
+        return self.description
+
+
+def _device_name(cache_id: int, core_id: int = None):
+    return f"cache {cache_id}" + (f" core {core_id}" if core_id is not None else "")
+
+
+def _status_args(cache_id: int, core_id: int = None):
+    return f"{cache_id} {core_id}" if core_id is not None else f'{cache_id} ""'
+
+
+def cache_status(cache_id: int, status: CacheStatus) -> WaitCondition:
+    return WaitCondition(
+        f"{_device_name(cache_id)} status is '{status}'",
+        f'status=$(device_status {_status_args(cache_id)})\n'
+        f'[ "${{status%% (*}}" = "{status.value}" ]',
+    )
+
+
+def core_status(cache_id: int, core_id: int, status: CoreStatus) -> WaitCondition:
+    return WaitCondition(
+        f"{_device_name(cache_id, core_id)} status is '{status}'",
+        f'status=$(device_status {_status_args(cache_id, core_id)})\n'
+        f'[ "${{status%% (*}}" = "{status.value}" ]',
+    )
+
+
+def flushing_started(cache_id: int, core_id: int = None) -> WaitCondition:
+    return WaitCondition(
+        f"{_device_name(cache_id, core_id)} is flushing",
+        f'[[ "$(device_status {_status_args(cache_id, core_id)})" == flushing* ]]',
+    )
+
+
+def flushing_progress_at_least(cache_id: int, core_id: int, percentage: float) -> WaitCondition:
+    """Waiting is aborted when device isn't flushing anymore."""
+    return WaitCondition(
+        f"{_device_name(cache_id, core_id)} flushing progress is at least {percentage}%",
+        f'status=$(device_status {_status_args(cache_id, core_id)})\n'
+        f'[[ "$status" == flushing* ]] || return 2\n'
+        f'awk -v status="$status" \'BEGIN {{ sub(/.*\\(/, "", status); '
+        f'exit !(status + 0 >= {percentage}) }}\'',
+    )
+
+
+def dirty_at_most(cache_id: int, core_id: int = None, dirty: Size = Size.zero()) -> WaitCondition:
+    stats_cmd = print_statistics_cmd(
+        cache_id=str(cache_id),
+        core_id=str(core_id) if core_id is not None else None,
+        filter="usage",
+        output_format="csv",
+        by_id_path=False,
+    )
+    return WaitCondition(
+        f"{_device_name(cache_id, core_id)} dirty data is at most {dirty}",
+        f"{stats_cmd} | awk -F, -v max={int(dirty.get_value(Unit.Blocks4096))} '\n"
+        '    { gsub(/"/, "") }\n'
+        '    NR == 1 { for (i = 1; i <= NF; i++) if ($i == "Dirty [4KiB Blocks]") column = i }\n'
+        "    NR == 2 && column && $column + 0 <= max { met = 1 }\n"
+        "    END { exit !met }'",
+    )
+
+
+def wait_for(
+    condition: WaitCondition,
+    timeout: timedelta = timedelta(minutes=1),
+    min_interval: timedelta = timedelta(milliseconds=10),
+    max_interval: timedelta = timedelta(seconds=1),
+) -> WaitResult:
+    """
+    Waits on DUT until condition is met, with a single remote call. Condition is checked
+    with interval growing from min_interval to max_interval, so short waits end quickly
+    and long ones don't load DUT. Result is logged and stored in wait_history.
+    """
+    header = "\n".join(
+        [
+            f"timeout_ms={int(timeout.total_seconds() * 1000)}",
+            f"min_interval_ms={max(int(min_interval.total_seconds() * 1000), 1)}",
+            f"max_interval_ms={max(int(max_interval.total_seconds() * 1000), 1)}",
+        ]
+    )
+    script = _wait_script.replace(
+        "LIST_CMD", list_caches_cmd(output_format="csv", by_id_path=False)
+    ).replace("CONDITION", condition.script)
+    script = base64.b64encode((header + script).encode("utf-8")).decode("ascii")
+    output = TestRun.executor.run(
+        f"echo {script} | base64 --decode | bash", timeout + timedelta(minutes=1)
+    )
+    if output.exit_code != 0:
+        raise CmdException(f"Waiting until {condition} failed.", output)
+
+    params = dict(param.split("=", 1) for param in output.stdout.strip().split())
+    result = WaitResult(
+        condition.description,
+        params["state"] == "satisfied",
+        timedelta(milliseconds=int(params["elapsed_ms"])),
+        int(params["checks"]),
+    )
+    wait_history.append(result)
+    TestRun.LOGGER.info(
+        f"Waiting until {condition}: {params['state']} after "
+        f"{result.duration.total_seconds():.2f}s ({result.checks} checks)"
+    )
+    return result
@@ -4,6 +4,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 
+import base64
+from contextlib import contextmanager
 from typing import List
 
 from api.cas.cache import Cache
@@ -18,6 +20,7 @@ from api.cas.cache_config import (
 from api.cas.casadm_params import OutputFormat, StatsFilter
 from api.cas.cli import *
 from api.cas.core import Core
+from api.cas.ioclass_config import IoClassConfig
 from core.test_run import TestRun
 from storage_devices.device import Device
 from test_tools.os_tools import reload_kernel_module
@@ -439,10 +442,11 @@ def print_statistics(
     by_id_path: bool = True,
     io_class: bool = False,
     shortcut: bool = False,
+    all_cores: bool = False,
 ) -> Output:
     _output_format = output_format.name if output_format else None
     _io_class_id = str(io_class_id) if io_class_id is not None else "" if io_class else None
-    _core_id = str(core_id) if core_id is not None else None
+    _core_id = str(core_id) if core_id is not None else "" if all_cores else None
     if filter is None:
         _filter = filter
     else:
@@ -491,11 +495,17 @@ def flush_core(cache_id: int, core_id: int, shortcut: bool = False) -> Output:
 
 
 def load_io_classes(cache_id: int, file: str, shortcut: bool = False) -> Output:
-    output = TestRun.executor.run(
-        load_io_classes_cmd(cache_id=str(cache_id), file=file, shortcut=shortcut)
-    )
+    # Pending local edits of the config file are written together with the load command
+    config = IoClassConfig.get_pending_config(file)
+    if config:
+        command = config.load_cmd(cache_id=cache_id, shortcut=shortcut)
+    else:
+        command = load_io_classes_cmd(cache_id=str(cache_id), file=file, shortcut=shortcut)
+    output = TestRun.executor.run(command)
     if output.exit_code != 0:
         raise CmdException("Load IO class command failed.", output)
+    if config:
+        config.dirty = False
     return output
 
 
@@ -640,6 +650,89 @@ def remove_core_with_script_command(cache_id: int, core_id: int, no_flush: bool
     return output
 
 
+# batched commands
+
+
+class CommandBatch:
+    """
+    Queue of CLI commands sent to the DUT as a single script.
+    Each command output is collected separately and returned as an individual Output.
+    """
+
+    def __init__(self, stop_on_error: bool = True):
+        self.stop_on_error = stop_on_error
+        self.commands = []
+        self.outputs = []
+
+    def add(self, command: str) -> None:
+        self.commands.append(command)
+
+    def __len__(self):
+        return len(self.commands)
+
+    def _build_script(self) -> str:
+        lines = ['out_dir=$(mktemp -d)']
+        for index, command in enumerate(self.commands):
+            lines.append(f'{{ {command} ; }} >"$out_dir/{index}.out" 2>"$out_dir/{index}.err"')
+            lines.append("rc=$?")
+            lines.append(
+                f'echo "{index} $rc $(base64 -w0 "$out_dir/{index}.out")'
+                f' $(base64 -w0 "$out_dir/{index}.err")"'
+            )
+            if self.stop_on_error:
+                lines.append('[ $rc -ne 0 ] && { rm -rf "$out_dir"; exit 0; }')
+        lines.append('rm -rf "$out_dir"')
+        return "\n".join(lines)
+
+    def _parse_results(self, stdout: str) -> List[Output]:
+        outputs = []
+        for line in stdout.splitlines():
+            fields = line.split(" ")
+            if len(fields) != 4 or not fields[0].isdigit():
+                continue
+            outputs.append(
+                Output(
+                    base64.b64decode(fields[2]).decode("utf-8", errors="ignore").rstrip(),
+                    base64.b64decode(fields[3]).decode("utf-8", errors="ignore").rstrip(),
+                    int(fields[1]),
+                )
+            )
+        return outputs
+
+    def execute(self) -> List[Output]:
+        if not self.commands:
+            return []
+
+        encoded_script = base64.b64encode(self._build_script().encode("utf-8")).decode("ascii")
+        # Script is passed as argument, not piped, so commands don't read it from stdin
+        output = TestRun.executor.run(
+            f'bash -c "$(echo {encoded_script} | base64 --decode)" < /dev/null'
+        )
+        if output.exit_code != 0:
+            raise CmdException("Failed to execute batched commands.", output)
+
+        self.outputs = self._parse_results(output.stdout)
+        for command, command_output in zip(self.commands, self.outputs):
+            if command_output.exit_code != 0 and self.stop_on_error:
+                raise CmdException(f"Batched command failed: {command}", command_output)
+        if len(self.outputs) != len(self.commands) and not self.stop_on_error:
+            raise CmdException("Not all batched commands reported their results.", output)
+
+        return self.outputs
+
+
+@contextmanager
+def batch(stop_on_error: bool = True):
+    """
+    Collect commands added inside the context and run them in one executor call on exit.
+    With stop_on_error set, execution stops on the first failing command and CmdException
+    is raised; otherwise all commands run and their outputs are available in batch.outputs.
+    """
+    commands = CommandBatch(stop_on_error=stop_on_error)
+    yield commands
+    commands.execute()
+
+
 # casadm custom commands
 
 
@@ -650,13 +743,35 @@ def stop_all_caches() -> None:
     if not caches:
         return
     # Running "cache stop" on the reversed list to resolve the multilevel cache stop problem
-    for cache in reversed(caches):
-        stop_cache(cache_id=cache.cache_id, no_data_flush=True)
+    try:
+        with batch() as commands:
+            for cache in reversed(caches):
+                commands.add(stop_cmd(cache_id=str(cache.cache_id), no_data_flush=True))
+    except CmdException:
+        # Caches before the failing command are already stopped
+        running_cache_ids = [cache.cache_id for cache in get_caches()]
+        stopped_cache_ids = [
+            cache.cache_id for cache in caches if cache.cache_id not in running_cache_ids
+        ]
+        _remove_stopped_caches(stopped_cache_ids)
+        raise
+
+    _remove_stopped_caches([cache.cache_id for cache in caches])
+
+
+def _remove_stopped_caches(stopped_cache_ids: List[int]) -> None:
+    TestRun.dut.cache_list = [
+        cache for cache in TestRun.dut.cache_list if cache.cache_id not in stopped_cache_ids
+    ]
+    TestRun.dut.core_list = [
+        core for core in TestRun.dut.core_list if core.cache_id not in stopped_cache_ids
+    ]
 
 
 def remove_all_detached_cores() -> None:
     from api.cas.casadm_parser import get_cas_devices_dict
 
     devices = get_cas_devices_dict()
-    for dev in devices["core_pool"].values():
-        TestRun.executor.run(remove_detached_cmd(dev["device_path"]))
+    with batch(stop_on_error=False) as commands:
+        for dev in devices["core_pool"].values():
+            commands.add(remove_detached_cmd(dev["device_path"]))
@@ -4,16 +4,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 
-import csv
-import io
 import json
 
-from datetime import timedelta, datetime
+from datetime import timedelta
 from typing import List
 
 from api.cas import casadm
 from api.cas.cache_config import *
 from api.cas.casadm_params import *
+from api.cas.cas_wait import flushing_progress_at_least, flushing_started, wait_for
 from api.cas.core_config import CoreStatus
 from api.cas.ioclass_config import IoClass
 from api.cas.version import CasVersion
@@ -46,7 +45,7 @@ def get_caches() -> list:
     for cache in caches_dict.values():
         caches_list.append(
             Cache(
-                device=(Device(cache["device_path"]) if cache["device_path"] != "-" else None),
+                device=(Device(cache["device_path"]) if cache["device_path"] is not None else None),
                 cache_id=cache["id"],
             )
         )
@@ -100,62 +99,54 @@ def get_detached_cores(cache_id: int) -> list:
 
 
 def get_cas_devices_dict() -> dict:
-    device_list = list(csv.DictReader(casadm.list_caches(OutputFormat.csv).stdout.split("\n")))
+    device_tree = json.loads(casadm.list_caches(OutputFormat.json).stdout)
     devices = {"caches": {}, "cores": {}, "core_pool": {}}
-    cache_id = -1
-    core_pool = False
-    for device in device_list:
-        if device["type"] == "cache":
-            cache_id = int(device["id"])
-            core_pool = False
-            params = [
-                ("id", cache_id),
-                ("device_path", device["disk"]),
-                ("status", CacheStatus(device["status"].lower())),
-            ]
-            devices["caches"][cache_id] = dict([(key, value) for key, value in params])
-
-        elif device["type"] == "core":
-            params = [
-                ("cache_id", cache_id),
-                ("core_id", (int(device["id"]) if device["id"] != "-" else device["id"])),
-                ("device_path", device["disk"]),
-                ("status", CoreStatus(device["status"].lower())),
-                ("exp_obj", device["device"]),
-            ]
-            if core_pool:
-                params.append(("core_pool", device))
-                devices["core_pool"][device["disk"]] = dict([(key, value) for key, value in params])
-            else:
-                devices["cores"][(cache_id, int(device["id"]))] = dict(
-                    [(key, value) for key, value in params]
-                )
-
-        elif device["type"] == "core pool":
-            core_pool = True
+    for core_pool in device_tree.get("core_pools", []):
+        for core in core_pool.get("cores", []):
+            devices["core_pool"][core["disk"]] = dict(
+                _get_core_params(-1, core), core_pool=core
+            )
+
+    for cache in device_tree.get("caches", []):
+        devices["caches"][cache["id"]] = {
+            "id": cache["id"],
+            "device_path": cache["disk"],
+            "status": CacheStatus(cache["status"].lower()),
+        }
+        for core in cache.get("cores", []):
+            devices["cores"][(cache["id"], core["id"])] = _get_core_params(cache["id"], core)
 
     return devices
 
 
+def _get_core_params(cache_id: int, core: dict) -> dict:
+    return {
+        "cache_id": cache_id,
+        "core_id": core["id"],
+        "device_path": core["disk"],
+        "status": CoreStatus(core["status"].lower()),
+        "exp_obj": core["device"],
+    }
+
+
+def _get_device_status(device_tree: dict, cache_id: int, core_id: int = None) -> str | None:
+    for cache in device_tree.get("caches", []):
+        if cache["id"] != cache_id:
+            continue
+        if core_id is None:
+            return cache["status"]
+        for core in cache.get("cores", []):
+            if core["id"] == core_id:
+                return core["status"]
+    return None
+
+
 def get_flushing_progress(cache_id: int, core_id: int = None):
-    casadm_output = casadm.list_caches(OutputFormat.csv)
-    lines = casadm_output.stdout.splitlines()
-    for line in lines:
-        line_elements = line.split(",")
-        if (
-            core_id is not None
-            and line_elements[0] == "core"
-            and int(line_elements[1]) == core_id
-            or core_id is None
-            and line_elements[0] == "cache"
-            and int(line_elements[1]) == cache_id
-        ):
-            try:
-                flush_line_elements = line_elements[3].split()
-                flush_percent = flush_line_elements[1][1:]
-                return float(flush_percent)
-            except Exception:
-                break
+    casadm_output = casadm.list_caches(OutputFormat.json)
+    status = _get_device_status(json.loads(casadm_output.stdout), cache_id, core_id)
+    # Progress is a part of status, e.g. "Flushing (12.3 %)"
+    if status is not None and "(" in status:
+        return float(status.split("(", 1)[1].split()[0])
     raise CmdException(
         f"There is no flushing progress in casadm list output. (cache {cache_id}"
         f"{' core ' + str(core_id) if core_id is not None else ''})",
@@ -164,91 +155,86 @@ def get_flushing_progress(cache_id: int, core_id: int = None):
 
 
 def wait_for_flushing(cache, core, timeout: timedelta = timedelta(seconds=30)):
-    start_time = datetime.now()
-    while datetime.now() - start_time < timeout:
-        try:
-            get_flushing_progress(cache.cache_id, core.core_id)
-            return
-        except CmdException:
-            continue
-    TestRun.fail("Flush not started!")
+    if not wait_for(flushing_started(cache.cache_id, core.core_id), timeout).satisfied:
+        TestRun.fail("Flush not started!")
+
+
+def wait_for_flushing_progress(
+    cache, core, percentage: float, timeout: timedelta = timedelta(minutes=10)
+):
+    condition = flushing_progress_at_least(cache.cache_id, core.core_id, percentage)
+    if not wait_for(condition, timeout, max_interval=timedelta(milliseconds=100)).satisfied:
+        TestRun.fail(f"Flushing progress did not reach {percentage}%!")
 
 
 def get_flush_parameters_alru(cache_id: int):
-    casadm_output = casadm.get_param_cleaning_alru(
-        cache_id, casadm.OutputFormat.csv
-    ).stdout.splitlines()
+    params = json.loads(
+        casadm.get_param_cleaning_alru(cache_id, casadm.OutputFormat.json).stdout
+    )
     flush_parameters = FlushParametersAlru()
-    for line in casadm_output:
-        if "max buffers" in line:
-            flush_parameters.flush_max_buffers = int(line.split(",")[1])
-        if "Activity threshold" in line:
-            flush_parameters.activity_threshold = Time(milliseconds=int(line.split(",")[1]))
-        if "Stale buffer time" in line:
-            flush_parameters.staleness_time = Time(seconds=int(line.split(",")[1]))
-        if "Wake up time" in line:
-            flush_parameters.wake_up_time = Time(seconds=int(line.split(",")[1]))
+    flush_parameters.flush_max_buffers = params["flush_max_buffers"]
+    flush_parameters.activity_threshold = Time(milliseconds=params["activity_threshold"]["ms"])
+    flush_parameters.staleness_time = Time(seconds=params["stale_buffer_time"]["s"])
+    flush_parameters.wake_up_time = Time(seconds=params["wake_up_time"]["s"])
     return flush_parameters
 
 
 def get_flush_parameters_acp(cache_id: int):
-    casadm_output = casadm.get_param_cleaning_acp(
-        cache_id, casadm.OutputFormat.csv
-    ).stdout.splitlines()
+    params = json.loads(
+        casadm.get_param_cleaning_acp(cache_id, casadm.OutputFormat.json).stdout
+    )
     flush_parameters = FlushParametersAcp()
-    for line in casadm_output:
-        if "max buffers" in line:
-            flush_parameters.flush_max_buffers = int(line.split(",")[1])
-        if "Wake up time" in line:
-            flush_parameters.wake_up_time = Time(milliseconds=int(line.split(",")[1]))
+    flush_parameters.flush_max_buffers = params["flush_max_buffers"]
+    flush_parameters.wake_up_time = Time(milliseconds=params["wake_up_time"]["ms"])
     return flush_parameters
 
 
 def get_seq_cut_off_parameters(cache_id: int, core_id: int):
-    casadm_output = casadm.get_param_cutoff(
-        cache_id, core_id, casadm.OutputFormat.csv
-    ).stdout.splitlines()
+    params = json.loads(
+        casadm.get_param_cutoff(cache_id, core_id, casadm.OutputFormat.json).stdout
+    )
     seq_cut_off_params = SeqCutOffParameters()
-    for line in casadm_output:
-        if "Sequential cutoff threshold" in line:
-            seq_cut_off_params.threshold = Size(int(line.split(",")[1]), Unit.KibiByte)
-        if "Sequential cutoff policy" in line:
-            seq_cut_off_params.policy = SeqCutOffPolicy.from_name(line.split(",")[1])
-        if "Sequential cutoff promotion request count threshold" in line:
-            seq_cut_off_params.promotion_count = int(line.split(",")[1])
+    seq_cut_off_params.threshold = Size(
+        params["sequential_cutoff_threshold"]["KiB"], Unit.KibiByte
+    )
+    seq_cut_off_params.policy = SeqCutOffPolicy.from_name(params["sequential_cutoff_policy"])
+    seq_cut_off_params.promotion_count = params[
+        "sequential_cutoff_promotion_request_count_threshold"
+    ]
     return seq_cut_off_params
 
 
 def get_casadm_version():
-    casadm_output = casadm.print_version(OutputFormat.csv).stdout.split("\n")
-    version_str = casadm_output[1].split(",")[-1]
-    return CasVersion.from_version_string(version_str)
+    versions = json.loads(casadm.print_version(OutputFormat.json).stdout)
+    # Keys are derived from component names, e.g. "cas_cache_kernel_module"
+    return CasVersion.from_version_string(next(iter(versions.values())))
 
 
 def get_io_class_list(cache_id: int) -> list:
-    ret = []
-    casadm_output = casadm.list_io_classes(cache_id, OutputFormat.csv).stdout.splitlines()
-    casadm_output.pop(0)  # Remove header
-    for line in casadm_output:
-        values = line.split(",")
-        ioclass = IoClass(int(values[0]), values[1], int(values[2]), values[3])
-        ret.append(ioclass)
-    return ret
+    io_classes = json.loads(casadm.list_io_classes(cache_id, OutputFormat.json).stdout)
+    return [
+        IoClass(
+            io_class["io_class_id"],
+            io_class["io_class_name"],
+            io_class["eviction_priority"],
+            f"{io_class['allocation']:.2f}",
+        )
+        for io_class in io_classes
+    ]
 
 
 def get_core_info_for_cache_by_path(core_disk_path: str, target_cache_id: int) -> dict | None:
-    output = casadm.list_caches(OutputFormat.csv, by_id_path=True)
-    reader = csv.DictReader(io.StringIO(output.stdout))
-    cache_id = -1
-    for row in reader:
-        if row["type"] == "cache":
-            cache_id = int(row["id"])
-        if row["type"] == "core" and row["disk"] == core_disk_path and target_cache_id == cache_id:
-            return {
-                "core_id": row["id"],
-                "core_device": row["disk"],
-                "status": row["status"],
-                "exp_obj": row["device"],
-            }
+    output = casadm.list_caches(OutputFormat.json, by_id_path=True)
+    for cache in json.loads(output.stdout).get("caches", []):
+        if cache["id"] != target_cache_id:
+            continue
+        for core in cache.get("cores", []):
+            if core["disk"] == core_disk_path:
+                return {
+                    "core_id": core["id"],
+                    "core_device": core["disk"],
+                    "status": core["status"],
+                    "exp_obj": core["device"],
+                }
 
     return None
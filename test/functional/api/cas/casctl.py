@@ -3,8 +3,16 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 
+import csv
+
 from .cli import *
+from .cache_config import CacheLineSize
+from .cas_module import CasModule
+from .dmesg import get_md_section_size, get_metadata_size_on_device
+from connection.utils.output import CmdException
 from core.test_run import TestRun
+from test_tools.memory import get_module_mem_footprint
+from type_def.size import Size, Unit
 
 
 def help(shortcut: bool = False):
@@ -21,3 +29,60 @@ def stop(flush: bool = False):
 
 def init(force: bool = False):
     return TestRun.executor.run(ctl_init(force))
+
+
+def plan(
+    cache_dev=None,
+    cache_size: Size = None,
+    cache_line_size: CacheLineSize = None,
+    cores: int = None,
+) -> dict:
+    """Returns metadata size estimates in bytes (or cache lines) by name."""
+    output = TestRun.executor.run(
+        ctl_plan(
+            cache_dev=cache_dev.path if cache_dev else None,
+            cache_size=str(int(cache_size.get_value(Unit.Byte))) if cache_size else None,
+            cache_line_size=(
+                str(int(cache_line_size.value.get_value(Unit.KibiByte)))
+                if cache_line_size
+                else None
+            ),
+            cores=str(cores) if cores is not None else None,
+            output_format="csv",
+        )
+    )
+    if output.exit_code != 0:
+        raise CmdException("Failed to estimate metadata footprint.", output)
+    return {row["name"]: int(row["value"]) for row in csv.DictReader(output.stdout.splitlines())}
+
+
+def compare_metadata_plan(cache) -> dict:
+    """
+    Returns {name: (estimated size, reported size)} for metadata memory footprint from cache
+    statistics, metadata size on device and metadata sections sizes from kernel log and
+    memory footprint of cas_cache module. Sections missing in kernel log are skipped.
+    """
+    estimate = plan(
+        cache_dev=cache.cache_device,
+        cache_line_size=cache.get_cache_line_size(),
+        cores=len(cache.get_cores()),
+    )
+    config_stats = cache.get_statistics().config_stats
+    comparison = {
+        "metadata memory footprint": config_stats.metadata_memory_footprint,
+        "metadata size on device": get_metadata_size_on_device(cache.cache_id),
+        "memory footprint": get_module_mem_footprint(CasModule.cache.value),
+    }
+    for name in estimate:
+        if not name.endswith(" size"):
+            continue
+        try:
+            comparison[name] = get_md_section_size(
+                name[: -len(" size")], cache_id=cache.cache_id
+            )
+        except ValueError:
+            continue
+    return {
+        name: (Size(estimate[name], Unit.Byte), reported)
+        for name, reported in comparison.items()
+    }
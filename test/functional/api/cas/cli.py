@@ -301,10 +301,12 @@ def print_statistics_cmd(
     output_format: str = None,
     by_id_path: bool = True,
     shortcut: bool = False,
+    interval: str = None,
+    count: str = None,
 ) -> str:
     command = " -P" if shortcut else " --stats"
     command += (" -i " if shortcut else " --cache-id ") + cache_id
-    if core_id:
+    if core_id is not None:  # might be empty string when printing all cores
         command += (" -j " if shortcut else " --core-id ") + core_id
     if io_class_id is not None:  # might be empty string when printing all io classes
         command += (" -d " if shortcut else " --io-class-id ") + io_class_id
@@ -314,6 +316,10 @@ def print_statistics_cmd(
         command += (" -o " if shortcut else " --output-format ") + output_format
     if by_id_path:
         command += " -b " if shortcut else " --by-id-path "
+    if interval:
+        command += (" -I " if shortcut else " --interval ") + interval
+    if count:
+        command += (" -c " if shortcut else " --count ") + count
     return casadm_bin + command
 
 
@@ -434,6 +440,27 @@ def ctl_init(force: bool = False) -> str:
     return casctl + command
 
 
+def ctl_plan(
+    cache_dev: str = None,
+    cache_size: str = None,
+    cache_line_size: str = None,
+    cores: str = None,
+    output_format: str = None,
+) -> str:
+    command = " plan"
+    if cache_dev:
+        command += " --cache-device " + cache_dev
+    if cache_size:
+        command += " --cache-size " + cache_size
+    if cache_line_size:
+        command += " --cache-line-size " + cache_line_size
+    if cores:
+        command += " --cores " + cores
+    if output_format:
+        command += " --output-format " + output_format
+    return casctl + command
+
+
 # casadm script
 
 
@@ -140,22 +140,22 @@ get_params_help = [
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
     r"-j  --core-id \<ID\>                  Identifier of core \<0-4095\> within given cache "
     r"instance",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
     r"Options that are valid with --get-param \(-G\) --name \(-n\) cleaning are:",
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
     r"Options that are valid with --get-param \(-G\) --name \(-n\) cleaning-alru are:",
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
     r"Options that are valid with --get-param \(-G\) --name \(-n\) cleaning-acp are:",
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
     r"Options that are valid with --get-param \(-G\) --name \(-n\) promotion are:",
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
     r"Options that are valid with --get-param \(-G\) --name \(-n\) promotion-nhit are:",
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
 ]
 
 
@@ -214,7 +214,7 @@ list_caches_help = [
     r"Usage: casadm --list-caches \[option\.\.\.\]",
     r"List all cache instances and core devices",
     r"Options that are valid with --list-caches \(-L\) are:",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
 ]
 
 stats_help = [
@@ -222,13 +222,16 @@ stats_help = [
     r"Print statistics for cache instance",
     r"Options that are valid with --stats \(-P\) are:",
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
-    r"-j  --core-id \<ID\>                  Limit display of core-specific statistics to only ones "
-    r"pertaining to a specific core\. If this option is not given, casadm will display statistics "
+    r"-j  --core-id \[\<ID\>\]                Limit display of core-specific statistics to only "
+    r"ones pertaining to a specific core\. If ID is not given, casadm will display statistics "
     r"pertaining to all cores assigned to given cache instance\.",
     r"-d  --io-class-id \[\<ID\>\]            Display per IO class statistics",
     r"-f  --filter \<FILTER-SPEC\>          Apply filters from the following set: "
     r"\{all, conf, usage, req, blk, err\}",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
+    r"-I  --interval \<SECONDS\>            Print statistics every SECONDS seconds until "
+    r"interrupted",
+    r"-c  --count \<COUNT\>                 Number of statistics records printed with --interval",
 ]
 
 
@@ -263,7 +266,7 @@ ioclass_help = [
     r"Usage: casadm --io-class --list --cache-id \<ID\> \[option\.\.\.\]",
     r"Options that are valid with --list \(-L\) are:",
     r"-i  --cache-id \<ID\>                 Identifier of cache instance \<1-16384\>",
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
 ]
 
 
@@ -271,7 +274,7 @@ version_help = [
     r"Usage: casadm --version \[option\.\.\.\]",
     r"Print CAS version",
     r"Options that are valid with --version \(-V\) are:"
-    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv\}",
+    r"-o  --output-format \<FORMAT\>        Output format: \{table|csv|json\}",
 ]
 
 help_help = [
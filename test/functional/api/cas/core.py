@@ -9,15 +9,20 @@ from typing import List
 
 from api.cas import casadm
 from api.cas.cache_config import SeqCutOffParameters, SeqCutOffPolicy
+from api.cas.cas_wait import core_status, wait_for
 from api.cas.casadm_params import StatsFilter
 from api.cas.casadm_parser import get_seq_cut_off_parameters, get_cas_devices_dict
 from api.cas.core_config import CoreStatus
-from api.cas.statistics import CoreStats, CoreIoClassStats
+from api.cas.statistics import (
+    CoreStats,
+    CoreIoClassStats,
+    get_latency_histograms,
+    reset_latency_histograms,
+)
 from core.test_run_utils import TestRun
 from storage_devices.device import Device
 from test_tools.fs_tools import Filesystem, ls_item
 from test_tools.os_tools import sync
-from test_tools.common.wait import wait
 from type_def.size import Unit, Size
 
 
@@ -31,10 +36,10 @@ class Core(Device):
         self.path = None
         self.cache_id = cache_id
         core_info = self.__get_core_info()
-        # "-" is special case for cores in core pool
-        if core_info["core_id"] != "-":
-            self.core_id = int(core_info["core_id"])
-        if core_info["exp_obj"] != "-":
+        # Cores in core pool have neither id nor exported object
+        if core_info["core_id"] is not None:
+            self.core_id = core_info["core_id"]
+        if core_info["exp_obj"] is not None:
             Device.__init__(self, core_info["exp_obj"])
         self.partitions = []
         self.block_size = None
@@ -117,6 +122,12 @@ class Core(Device):
     def reset_counters(self):
         return casadm.reset_counters(self.cache_id, self.core_id)
 
+    def get_latency_histograms(self) -> dict:
+        return get_latency_histograms(self.cache_id, self.core_id)
+
+    def reset_latency_histograms(self):
+        reset_latency_histograms(self.cache_id, self.core_id)
+
     def flush_core(self):
         casadm.flush_core(self.cache_id, self.core_id)
         sync()
@@ -160,5 +171,8 @@ class Core(Device):
 
     def wait_for_status_change(self, expected_status: CoreStatus):
         timeout = timedelta(minutes=1)
-        if not wait(lambda: self.get_status() == expected_status, timeout, timedelta(seconds=1)):
+        status_changed = wait_for(
+            core_status(self.cache_id, self.core_id, expected_status), timeout
+        ).satisfied
+        if not status_changed:
             TestRun.fail(f"Core status did not change after {timeout.total_seconds()}s.")
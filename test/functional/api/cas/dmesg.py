@@ -5,38 +5,152 @@
 #
 
 import re
+from collections import namedtuple
 
-from test_tools.dmesg import get_dmesg
+from connection.utils.output import CmdException
+from core.test_run import TestRun
 from type_def.size import Size, Unit
 
+CasMessage = namedtuple("CasMessage", ["seq", "timestamp", "cache_name", "msg_type", "value"])
+
+# Records in /dev/kmsg have "<prio>,<seq>,<timestamp_us>,<flags>;<message>" format.
+# Only CAS cache records newer than the given sequence number are sent back from DUT,
+# preceded by boot id and followed by the highest sequence number read.
+_kmsg_read_cmd = (
+    "echo boot_id $(cat /proc/sys/kernel/random/boot_id); "
+    "dd if=/dev/kmsg iflag=nonblock bs=8192 status=none 2>/dev/null | "
+    "awk -v seq={seq} "
+    "'BEGIN {{ last = -1 }} "
+    "/^[^ ]/ {{ split(substr($0, 1, index($0, \";\") - 1), hdr, \",\"); "
+    "if (hdr[2] + 0 > last) last = hdr[2] + 0; "
+    "if (hdr[2] + 0 <= seq) next; "
+    "if ($0 ~ /cache[0-9]+: /) print }} "
+    "END {{ print \"last_seq \" last }}'"
+)
+_record_regex = re.compile(
+    r"^\d+,(?P<seq>\d+),(?P<timestamp>\d+),[^;]*;.*?(?P<cache_name>cache\d+): (?P<text>.*)$"
+)
+
+
+class DmesgReader:
+    """
+    Incremental kernel log reader. Keeps the sequence number of the last seen record and
+    fetches only newer records. Parsed CAS messages are indexed by cache name and message type.
+    """
+
+    def __init__(self):
+        self.boot_id = None
+        self.last_seq = -1
+        self.index = {}
+
+    def refresh(self):
+        output = TestRun.executor.run(_kmsg_read_cmd.format(seq=self.last_seq))
+        lines = output.stdout.splitlines()
+        if (
+            output.exit_code != 0
+            or len(lines) < 2
+            or not lines[0].startswith("boot_id")
+            or not lines[-1].startswith("last_seq")
+        ):
+            raise CmdException("Failed to read kernel log records.", output)
+
+        boot_id = lines[0].split()[-1]
+        last_seq = int(lines[-1].split()[1])
+        if self.last_seq >= 0 and (boot_id != self.boot_id or last_seq < self.last_seq):
+            # Sequence numbers restarted (DUT rebooted) - rebuild whole index
+            self.boot_id = None
+            self.last_seq = -1
+            self.index = {}
+            return self.refresh()
+
+        for line in lines[1:-1]:
+            self._add_record(line)
+        self.boot_id = boot_id
+        self.last_seq = last_seq
+
+    def _add_record(self, line: str):
+        record = _record_regex.match(line)
+        if not record:
+            return
+        msg_type, _, value = record["text"].rpartition(":")
+        if not msg_type:
+            msg_type, value = value, ""
+        message = CasMessage(
+            seq=int(record["seq"]),
+            timestamp=int(record["timestamp"]),
+            cache_name=record["cache_name"],
+            msg_type=msg_type.strip(),
+            value=value.strip(),
+        )
+        self.index.setdefault((message.cache_name, message.msg_type), []).append(message)
+
+    def get_messages(self, cache_name: str, msg_type: str, refresh: bool = True) -> list:
+        if refresh:
+            self.refresh()
+        return self.index.get((cache_name, msg_type), [])
+
+    def get_last_message(self, msg_type: str, cache_name: str = None, refresh: bool = True):
+        if refresh:
+            self.refresh()
+        messages = [
+            message
+            for (name, message_type), messages in self.index.items()
+            if message_type == msg_type and (cache_name is None or name == cache_name)
+            for message in messages
+        ]
+        return max(messages, key=lambda message: message.seq) if messages else None
+
+
+def get_dmesg_reader() -> DmesgReader:
+    # DUT objects are recreated for every test, so the cursor is kept per test and per DUT
+    if not hasattr(TestRun.dut, "dmesg_reader"):
+        TestRun.dut.dmesg_reader = DmesgReader()
+    return TestRun.dut.dmesg_reader
+
 
 def get_metadata_size_on_device(cache_id: int) -> Size:
-    dmesg_reversed = list(reversed(get_dmesg().split("\n")))
-    cache_name = "cache" + str(cache_id)
-    cache_dmesg = "\n".join(line for line in dmesg_reversed if re.search(f"{cache_name}:", line))
     try:
-        return _get_metadata_info(dmesg=cache_dmesg, section_name="Metadata size on device")
+        return _get_metadata_info_from_index(
+            section_name="Metadata size on device", cache_name=f"cache{cache_id}"
+        )
     except ValueError:
         raise ValueError("Can't find the metadata size in dmesg output")
 
 
+def _get_metadata_info_from_index(section_name, cache_name: str = None) -> Size:
+    message = get_dmesg_reader().get_last_message(section_name, cache_name)
+    if message is None:
+        raise ValueError(f'"{section_name}" entry doesn\'t exist in the dmesg output')
+    return _parse_size(message.value)
+
+
 def _get_metadata_info(dmesg, section_name) -> Size:
     for s in dmesg.split("\n"):
         if section_name in s:
-            size, unit = re.search("\\d+ (B|kiB)", s).group().split()
-            unit = Unit.KibiByte if unit == "kiB" else Unit.Byte
-            return Size(int(re.search("\\d+", size).group()), unit)
+            return _parse_size(s)
 
     raise ValueError(f'"{section_name}" entry doesn\'t exist in the given dmesg output')
 
 
-def get_md_section_size(section_name, dmesg) -> Size:
+def _parse_size(text: str) -> Size:
+    size, unit = re.search("\\d+ (B|kiB)", text).group().split()
+    unit = Unit.KibiByte if unit == "kiB" else Unit.Byte
+    return Size(int(re.search("\\d+", size).group()), unit)
+
+
+def get_md_section_size(section_name, dmesg: str = None, cache_id: int = None) -> Size:
     section_name = section_name.strip()
     section_name += " size"
-    return _get_metadata_info(dmesg, section_name)
+    if dmesg is not None:
+        return _get_metadata_info(dmesg, section_name)
+    cache_name = f"cache{cache_id}" if cache_id is not None else None
+    return _get_metadata_info_from_index(section_name, cache_name)
 
 
-def get_md_section_offset(section_name, dmesg) -> Size:
+def get_md_section_offset(section_name, dmesg: str = None, cache_id: int = None) -> Size:
     section_name = section_name.strip()
     section_name += " offset"
-    return _get_metadata_info(dmesg, section_name)
+    if dmesg is not None:
+        return _get_metadata_info(dmesg, section_name)
+    cache_name = f"cache{cache_id}" if cache_id is not None else None
+    return _get_metadata_info_from_index(section_name, cache_name)
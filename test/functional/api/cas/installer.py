@@ -8,6 +8,7 @@ import os
 
 from core.test_run import TestRun
 from api.cas import cas_module
+from api.cas.build_cache import build_dir, build_opencas_cached
 from api.cas.version import get_installed_cas_version
 from test_tools import git
 from connection.utils.output import CmdException
@@ -42,14 +43,15 @@ def build_opencas():
         raise CmdException("Make command executed with nonzero status", output)
 
 
-def install_opencas(destdir: str = ""):
+def install_opencas(destdir: str = "", source_dir: str = ""):
     TestRun.LOGGER.info("Installing Open CAS")
 
     if destdir:
         destdir = os.path.join(TestRun.usr.working_dir, destdir)
 
     output = TestRun.executor.run(
-        f"cd {TestRun.usr.working_dir} && make {'DESTDIR='+destdir if destdir else ''} install"
+        f"cd {source_dir or TestRun.usr.working_dir} && "
+        f"make {'DESTDIR='+destdir if destdir else ''} install"
     )
     if output.exit_code != 0:
         raise CmdException("Failed to install Open CAS", output)
@@ -69,31 +71,38 @@ def install_opencas(destdir: str = ""):
     TestRun.LOGGER.info(output.stdout)
 
 
-def set_up_opencas(version: str = ""):
-    clean_opencas_repo()
+def set_up_opencas(version: str = "", use_build_cache: bool = True, use_ccache: bool = False):
+    if not use_build_cache:
+        clean_opencas_repo()
 
     if version:
         git.checkout_version(version)
 
-    build_opencas()
-    install_opencas()
+    if use_build_cache:
+        build_opencas_cached(use_ccache)
+        install_opencas(source_dir=build_dir)
+    else:
+        build_opencas()
+        install_opencas()
 
 
-def uninstall_opencas():
+def uninstall_opencas(use_build_cache: bool = True):
     TestRun.LOGGER.info("Uninstalling Open CAS")
     output = TestRun.executor.run("casadm -V")
     if output.exit_code != 0:
         raise CmdException("Open CAS is not properly installed", output)
     else:
-        TestRun.executor.run(f"cd {TestRun.usr.working_dir} && make uninstall")
+        # Open CAS is uninstalled from the same directory it was installed from
+        source_dir = build_dir if use_build_cache else TestRun.usr.working_dir
+        output = TestRun.executor.run(f"cd {source_dir} && make uninstall")
         if output.exit_code != 0:
             raise CmdException("There was an error during uninstall process", output)
 
 
-def reinstall_opencas(version: str = ""):
+def reinstall_opencas(version: str = "", use_build_cache: bool = True):
     if check_if_installed():
-        uninstall_opencas()
-    set_up_opencas(version)
+        uninstall_opencas(use_build_cache)
+    set_up_opencas(version, use_build_cache)
 
 
 def check_if_installed(version: str = ""):
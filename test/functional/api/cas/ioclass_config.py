@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 
+import base64
 import enum
 import functools
 import random
@@ -13,6 +14,8 @@ import string
 from datetime import timedelta
 from packaging import version
 
+from api.cas.cli import load_io_classes_cmd
+from connection.utils.output import CmdException
 from core.test_run import TestRun
 from test_tools.fs_tools import write_file
 from test_tools.os_tools import get_kernel_version
@@ -80,7 +83,7 @@ class IoClass:
         return IoClass(
             class_id=int(parts[0]),
             rule=parts[1],
-            priority=int(parts[2]),
+            priority=int(parts[2]) if parts[2] else None,
             allocation="%.2f" % float(parts[3]),
         )
 
@@ -96,7 +99,7 @@ class IoClass:
     def csv_to_list(csv: str):
         ioclass_list = []
         for line in csv.splitlines():
-            if line.strip() == IO_CLASS_CONFIG_HEADER:
+            if not line.strip() or line.strip() == IO_CLASS_CONFIG_HEADER:
                 continue
             ioclass_list.append(IoClass.from_string(line))
         return ioclass_list
@@ -111,6 +114,10 @@ class IoClass:
         write_file(
             ioclass_config_path, IoClass.list_to_csv(ioclass_list, add_default_rule)
         )
+        # File on DUT is up to date, keep local document in sync with it
+        config = IoClassConfig(ioclass_list, ioclass_config_path, add_default_rule)
+        config.dirty = False
+        IoClassConfig.register(config)
 
     @staticmethod
     def default(priority=DEFAULT_IO_CLASS_PRIORITY, allocation="1.00"):
@@ -201,32 +208,143 @@ class Operator(enum.Enum):
     le = 4
 
 
-# TODO: replace below methods with methods using IoClass
+class IoClassConfig:
+    """
+    IO class configuration file kept as a local document.
+    All edits are done on the host side and the file is written to DUT at once.
+    Module level helpers below write the file through after every change, so it is never
+    stale for readers other than casadm (e.g. cat, cp or CAS service).
+    """
+
+    def __init__(
+        self,
+        ioclass_list: [] = None,
+        path: str = default_config_file_path,
+        add_default_rule: bool = True,
+    ):
+        self.path = path
+        self.ioclasses = list(ioclass_list) if ioclass_list else []
+        if add_default_rule and not self.get(DEFAULT_IO_CLASS_ID):
+            self.ioclasses.insert(0, IoClass.default())
+        self.dirty = True
+
+    @staticmethod
+    def _get_registry() -> dict:
+        # DUT objects are recreated for every test, so documents don't leak between tests
+        if not hasattr(TestRun.dut, "ioclass_configs"):
+            TestRun.dut.ioclass_configs = {}
+        return TestRun.dut.ioclass_configs
+
+    @staticmethod
+    def register(config):
+        IoClassConfig._get_registry()[config.path] = config
+        return config
+
+    @staticmethod
+    def unregister(path: str):
+        IoClassConfig._get_registry().pop(path, None)
+
+    @staticmethod
+    def get_config(path: str = default_config_file_path):
+        """Returns local document for given path. File is read from DUT only once per test."""
+        registry = IoClassConfig._get_registry()
+        if path not in registry:
+            output = TestRun.executor.run(f"cat {path}")
+            if output.exit_code != 0:
+                raise CmdException("Failed to read ioclass config file.", output)
+            config = IoClassConfig(IoClass.csv_to_list(output.stdout), path, False)
+            config.dirty = False
+            registry[path] = config
+        return registry[path]
+
+    @staticmethod
+    def get_pending_config(path: str):
+        config = IoClassConfig._get_registry().get(path)
+        return config if config and config.dirty else None
+
+    def get(self, ioclass_id: int):
+        return next((c for c in self.ioclasses if c.id == ioclass_id), None)
+
+    def add(self, ioclass: IoClass):
+        self.ioclasses.append(ioclass)
+        self.dirty = True
+        return self
+
+    def remove(self, ioclass_id: int):
+        ioclass_count = len(self.ioclasses)
+        self.ioclasses = [c for c in self.ioclasses if c.id != ioclass_id]
+        if len(self.ioclasses) == ioclass_count:
+            raise Exception(f"Failed to remove ioclass {ioclass_id} from config file {self.path}")
+        self.dirty = True
+        return self
+
+    def validate(self):
+        ids = [c.id for c in self.ioclasses]
+        duplicated_ids = {i for i in ids if ids.count(i) > 1}
+        if duplicated_ids:
+            raise ValueError(f"Duplicated IO class ids: {sorted(duplicated_ids)}")
+        for ioclass in self.ioclasses:
+            if not 0 <= ioclass.id <= MAX_IO_CLASS_ID:
+                raise ValueError(f"IO class id out of range [0, {MAX_IO_CLASS_ID}]: {ioclass}")
+            if ioclass.priority is not None and not (
+                0 <= ioclass.priority <= MAX_IO_CLASS_PRIORITY
+            ):
+                raise ValueError(
+                    f"IO class priority out of range [0, {MAX_IO_CLASS_PRIORITY}]: {ioclass}"
+                )
+            if not 0 <= float(ioclass.allocation) <= 1:
+                raise ValueError(f"IO class allocation out of range [0.00, 1.00]: {ioclass}")
+
+    def to_csv(self) -> str:
+        return IoClass.list_to_csv(self.ioclasses, add_default_rule=False) + "\n"
+
+    def write_cmd(self) -> str:
+        self.validate()
+        content = base64.b64encode(self.to_csv().encode("utf-8")).decode("ascii")
+        tmp_path = f"{self.path}.tmp"
+        # Write to temporary file and rename it so the config file is replaced atomically
+        return f"echo {content} | base64 --decode > {tmp_path} && mv -f {tmp_path} {self.path}"
+
+    def write(self):
+        TestRun.LOGGER.info(f"Writing config file {self.path}")
+        output = TestRun.executor.run(self.write_cmd())
+        if output.exit_code != 0:
+            raise CmdException("Failed to write ioclass config file.", output)
+        self.dirty = False
+        IoClassConfig.register(self)
+
+    def load(self, cache_id: int, shortcut: bool = False):
+        """Writes config file and loads it to the cache with single executor call."""
+        output = TestRun.executor.run(self.load_cmd(cache_id, shortcut))
+        if output.exit_code != 0:
+            raise CmdException("Load IO class command failed.", output)
+        self.dirty = False
+        IoClassConfig.register(self)
+        return output
+
+    def load_cmd(self, cache_id: int, shortcut: bool = False) -> str:
+        command = load_io_classes_cmd(cache_id=str(cache_id), file=self.path, shortcut=shortcut)
+        if self.dirty:
+            command = f"{self.write_cmd()} && {command}"
+        return command
+
+
 def create_ioclass_config(
     add_default_rule: bool = True, ioclass_config_path: str = default_config_file_path
 ):
     TestRun.LOGGER.info(f"Creating config file {ioclass_config_path}")
-    output = TestRun.executor.run(f"echo {IO_CLASS_CONFIG_HEADER} > {ioclass_config_path}")
-    if output.exit_code != 0:
-        raise Exception(
-            "Failed to create ioclass config file. "
-            + f"stdout: {output.stdout} \n stderr :{output.stderr}"
-        )
+    IoClassConfig([], ioclass_config_path, add_default_rule).write()
 
-    if add_default_rule:
-        output = TestRun.executor.run(
-            f'echo "{DEFAULT_IO_CLASS_ID},{DEFAULT_IO_CLASS_RULE},{DEFAULT_IO_CLASS_PRIORITY},"'
-            + f'"1.00" >> {ioclass_config_path}'
-        )
-        if output.exit_code != 0:
-            raise Exception(
-                "Failed to create ioclass config file. "
-                + f"stdout: {output.stdout} \n stderr :{output.stderr}"
-            )
+
+def write_ioclass_config(ioclass_config_path: str = default_config_file_path):
+    config = IoClassConfig.get_pending_config(ioclass_config_path)
+    if config:
+        config.write()
 
 
 def remove_ioclass_config(ioclass_config_path: str = default_config_file_path):
     TestRun.LOGGER.info(f"Removing config file {ioclass_config_path}")
+    IoClassConfig.unregister(ioclass_config_path)
     output = TestRun.executor.run(f"rm -f {ioclass_config_path}")
     if output.exit_code != 0:
         raise Exception(
@@ -241,60 +359,22 @@ def add_ioclass(
     allocation,
     ioclass_config_path: str = default_config_file_path,
 ):
-    new_ioclass = f"{ioclass_id},{rule},{eviction_priority},{allocation}"
+    new_ioclass = IoClass(
+        class_id=int(ioclass_id),
+        rule=rule,
+        priority=int(eviction_priority) if eviction_priority not in [None, ""] else None,
+        allocation=str(allocation),
+    )
     TestRun.LOGGER.info(f"Adding rule {new_ioclass} to config file {ioclass_config_path}")
-
-    output = TestRun.executor.run(f'echo "{new_ioclass}" >> {ioclass_config_path}')
-    if output.exit_code != 0:
-        raise Exception(
-            "Failed to append ioclass to config file. "
-            + f"stdout: {output.stdout} \n stderr :{output.stderr}"
-        )
+    IoClassConfig.get_config(ioclass_config_path).add(new_ioclass).write()
 
 
 def get_ioclass(ioclass_id: int, ioclass_config_path: str = default_config_file_path):
     TestRun.LOGGER.info(f"Retrieving rule no. {ioclass_id} from config file {ioclass_config_path}")
-    output = TestRun.executor.run(f"cat {ioclass_config_path}")
-    if output.exit_code != 0:
-        raise Exception(
-            "Failed to read ioclass config file. "
-            + f"stdout: {output.stdout} \n stderr :{output.stderr}"
-        )
-
-    ioclass_config = output.stdout.splitlines()
-
-    for ioclass in ioclass_config:
-        if int(ioclass.split(",")[0]) == ioclass_id:
-            return ioclass
+    ioclass = IoClassConfig.get_config(ioclass_config_path).get(ioclass_id)
+    return str(ioclass) if ioclass else None
 
 
 def remove_ioclass(ioclass_id: int, ioclass_config_path: str = default_config_file_path):
     TestRun.LOGGER.info(f"Removing rule no.{ioclass_id} from config file {ioclass_config_path}")
-    output = TestRun.executor.run(f"cat {ioclass_config_path}")
-    if output.exit_code != 0:
-        raise Exception(
-            "Failed to read ioclass config file. "
-            + f"stdout: {output.stdout} \n stderr :{output.stderr}"
-        )
-
-    old_ioclass_config = output.stdout.splitlines()
-    config_header = old_ioclass_config[0]
-
-    # First line in valid config file is always a header, not a rule - it is
-    # already extracted above
-    new_ioclass_config = [x for x in old_ioclass_config[1:] if int(x.split(",")[0]) != ioclass_id]
-
-    new_ioclass_config.insert(0, config_header)
-
-    if len(new_ioclass_config) == len(old_ioclass_config):
-        raise Exception(
-            f"Failed to remove ioclass {ioclass_id} from config file {ioclass_config_path}"
-        )
-
-    new_ioclass_config_str = "\n".join(new_ioclass_config)
-    output = TestRun.executor.run(f'echo "{new_ioclass_config_str}" > {ioclass_config_path}')
-    if output.exit_code != 0:
-        raise Exception(
-            "Failed to save new ioclass config. "
-            + f"stdout: {output.stdout} \n stderr :{output.stderr}"
-        )
+    IoClassConfig.get_config(ioclass_config_path).remove(ioclass_id).write()
@@ -5,16 +5,91 @@
 #
 
 import re
-from datetime import timedelta
+import socket
+from datetime import datetime, timedelta
 
 import paramiko
 
 from core.test_run import TestRun
 from test_tools.common.wait import wait
+from type_def.size import Size, Unit
 
 
-def check_progress_bar(command: str, progress_bar_expected: bool = True):
+class FlushProgressRecorder:
+    """
+    Timestamps every progress update read from casadm output. Knowing the amount of dirty data
+    at flush start, the recorded progress can be turned into a flush throughput curve.
+    """
+
+    def __init__(self, dirty_data: Size, stall_threshold: timedelta = timedelta(seconds=10)):
+        self.dirty_data = dirty_data
+        self.stall_threshold = stall_threshold
+        self.start_time = None
+        self.end_time = None
+        self.records = []
+
+    def start(self):
+        self.start_time = datetime.now()
+
+    def record(self, percentage: float):
+        now = datetime.now()
+        if self.start_time is None:
+            self.start_time = now
+        if not self.records or self.records[-1][1] != percentage:
+            self.records.append((now, percentage))
+
+    def finish(self):
+        self.end_time = datetime.now()
+
+    @property
+    def duration(self) -> timedelta:
+        end_time = self.end_time if self.end_time else self.records[-1][0]
+        return end_time - self.start_time
+
+    def get_throughput_curve(self) -> list:
+        """Returns list of [seconds since flush start, throughput in MiB/s] pairs"""
+        dirty_mib = self.dirty_data.get_value(Unit.MebiByte)
+        curve = []
+        previous_time, previous_percentage = self.start_time, 0.0
+        for timestamp, percentage in self.records:
+            interval = (timestamp - previous_time).total_seconds()
+            if interval > 0:
+                flushed_mib = dirty_mib * (percentage - previous_percentage) / 100
+                curve.append(
+                    [(timestamp - self.start_time).total_seconds(), flushed_mib / interval]
+                )
+            previous_time, previous_percentage = timestamp, percentage
+        return curve
+
+    def get_average_throughput(self) -> float:
+        """Returns average flush throughput in MiB/s"""
+        duration = self.duration.total_seconds()
+        if duration == 0:
+            return 0.0
+        return self.dirty_data.get_value(Unit.MebiByte) / duration
+
+    def get_stalls(self) -> list:
+        """Returns list of [seconds since flush start, stall duration in seconds] pairs"""
+        timestamps = [self.start_time] + [timestamp for timestamp, _ in self.records]
+        if self.end_time:
+            timestamps.append(self.end_time)
+        return [
+            [(previous - self.start_time).total_seconds(), (current - previous).total_seconds()]
+            for previous, current in zip(timestamps, timestamps[1:])
+            if current - previous > self.stall_threshold
+        ]
+
+
+def check_progress_bar(
+    command: str,
+    progress_bar_expected: bool = True,
+    recorder: FlushProgressRecorder = None,
+    timeout: timedelta = None,
+):
     TestRun.LOGGER.info(f"Check progress for command: {command}")
+    deadline = datetime.now() + timeout if timeout else None
+    if recorder:
+        recorder.start()
     try:
         stdin, stdout, stderr = TestRun.executor.ssh.exec_command(command, get_pty=True)
     except paramiko.SSHException as e:
@@ -30,9 +105,17 @@ def check_progress_bar(command: str, progress_bar_expected: bool = True):
         if not progress_bar_expected:
             TestRun.fail("Progress bar appear when output was redirected to a file.")
 
+    if timeout:
+        stdout.channel.settimeout(timeout.total_seconds())
+
     percentage = 0
     while True:
-        output = stdout.channel.recv(1024).decode("utf-8")
+        if deadline and datetime.now() > deadline:
+            TestRun.fail(f"Progress did not complete in {timeout}.")
+        try:
+            output = stdout.channel.recv(1024).decode("utf-8")
+        except socket.timeout:
+            TestRun.fail(f"Progress did not complete in {timeout}.")
         search = re.search(r"\d+.\d+", output)
         last_percentage = percentage
         if search:
@@ -44,8 +127,12 @@ def check_progress_bar(command: str, progress_bar_expected: bool = True):
                 TestRun.fail(f"Progress must be greater than 0%. Actual: {percentage}%.")
             elif percentage > 100:
                 TestRun.fail(f"Progress cannot be greater than 100%. Actual: {percentage}%.")
+            if recorder:
+                recorder.record(percentage)
         elif (stdout.channel.exit_status_ready() or not output) and last_percentage > 0:
             TestRun.LOGGER.info("Progress complete.")
+            if recorder:
+                recorder.finish()
             break
         elif stdout.channel.exit_status_ready() and last_percentage == 0:
             TestRun.fail("Process has exited but progress doesn't complete.")
@@ -4,16 +4,22 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 
-import csv
+import json
+import time
 
-from datetime import timedelta
+from collections import namedtuple
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import List
 from api.cas import casadm
 from api.cas.casadm_params import StatsFilter
+from api.cas.cli import print_statistics_cmd
 from connection.utils.output import CmdException
+from core.test_run import TestRun
 from type_def.size import Size, Unit
 
+StatsSnapshot = namedtuple("StatsSnapshot", ["timestamp", "stats"])
+
 
 class UnitType(Enum):
     requests = "[Requests]"
@@ -28,6 +34,11 @@ class UnitType(Enum):
     def __str__(self):
         return self.value
 
+    @property
+    def key(self):
+        """Key of value in this unit in casadm json output, e.g. "4KiB Blocks"."""
+        return self.value[1:-1]
+
 
 class OperationType(Enum):
     read = "Read"
@@ -43,8 +54,10 @@ class CacheStats:
         cache_id: int,
         filter: List[StatsFilter] = None,
         percentage_val: bool = False,
+        stats_dict: dict = None,
     ):
-        stats_dict = get_stats_dict(filter=filter, cache_id=cache_id)
+        if stats_dict is None:
+            stats_dict = get_stats_dict(filter=filter, cache_id=cache_id)
 
         for section in _get_section_filters(filter):
             match section:
@@ -84,8 +97,10 @@ class CoreStats:
         core_id: int,
         filter: List[StatsFilter] = None,
         percentage_val: bool = False,
+        stats_dict: dict = None,
     ):
-        stats_dict = get_stats_dict(filter=filter, cache_id=cache_id, core_id=core_id)
+        if stats_dict is None:
+            stats_dict = get_stats_dict(filter=filter, cache_id=cache_id, core_id=core_id)
 
         for section in _get_section_filters(filter):
             match section:
@@ -179,44 +194,31 @@ class CacheIoClassStats(CoreIoClassStats):
 
 class CacheConfigStats:
     def __init__(self, stats_dict):
-        self.cache_id = int(stats_dict["Cache Id"])
+        self.cache_id = stats_dict.pop("cache_id")
         self.cache_size = parse_value(
-            value=stats_dict["Cache Size [4KiB Blocks]"], unit_type=UnitType.block_4k
-        )
-        self.cache_dev = stats_dict["Cache Device"]
-        self.exp_obj = stats_dict["Exported Object"]
-        self.core_dev = int(stats_dict["Core Devices"])
-        self.inactive_core_devices = int(stats_dict["Inactive Core Devices"])
-        self.write_policy = stats_dict["Write Policy"]
-        self.cleaning_policy = stats_dict["Cleaning Policy"]
-        self.promotion_policy = stats_dict["Promotion Policy"]
+            value=stats_dict.pop("cache_size")[UnitType.block_4k.key],
+            unit_type=UnitType.block_4k,
+        )
+        self.cache_dev = stats_dict.pop("cache_device")
+        self.exp_obj = stats_dict.pop("exported_object")
+        self.core_dev = stats_dict.pop("core_devices")
+        self.inactive_core_devices = stats_dict.pop("inactive_core_devices")
+        self.write_policy = stats_dict.pop("write_policy")
+        self.cleaning_policy = stats_dict.pop("cleaning_policy")
+        self.promotion_policy = stats_dict.pop("promotion_policy")
         self.cache_line_size = parse_value(
-            value=stats_dict["Cache line size [KiB]"], unit_type=UnitType.kibibyte
+            value=stats_dict.pop("cache_line_size")[UnitType.kibibyte.key],
+            unit_type=UnitType.kibibyte,
         )
-        footprint_prefix = "Metadata Memory Footprint "
-        footprint_key = next(k for k in stats_dict if k.startswith(footprint_prefix))
+        # Footprint is printed in the most suitable unit, e.g. {"MiB": 120.5}
+        (footprint_unit, footprint), = stats_dict.pop("metadata_memory_footprint").items()
         self.metadata_memory_footprint = parse_value(
-            value=stats_dict[footprint_key],
-            unit_type=UnitType(footprint_key[len(footprint_prefix) :]),
-        )
-        self.dirty_for = parse_value(value=stats_dict["Dirty for [s]"], unit_type=UnitType.seconds)
-        self.status = stats_dict["Status"]
-
-        del stats_dict["Cache Id"]
-        del stats_dict["Cache Size [4KiB Blocks]"]
-        del stats_dict["Cache Size [GiB]"]
-        del stats_dict["Cache Device"]
-        del stats_dict["Exported Object"]
-        del stats_dict["Core Devices"]
-        del stats_dict["Inactive Core Devices"]
-        del stats_dict["Write Policy"]
-        del stats_dict["Cleaning Policy"]
-        del stats_dict["Promotion Policy"]
-        del stats_dict["Cache line size [KiB]"]
-        del stats_dict[footprint_key]
-        del stats_dict["Dirty for [s]"]
-        del stats_dict["Dirty for"]
-        del stats_dict["Status"]
+            value=footprint, unit_type=UnitType(f"[{footprint_unit}]")
+        )
+        self.dirty_for = parse_value(
+            value=stats_dict.pop("dirty_for")[UnitType.seconds.key], unit_type=UnitType.seconds
+        )
+        self.status = stats_dict.pop("status")
 
     def __str__(self):
         return (
@@ -261,29 +263,22 @@ class CacheConfigStats:
 
 class CoreConfigStats:
     def __init__(self, stats_dict):
-        self.core_id = int(stats_dict["Core Id"])
-        self.core_dev = stats_dict["Core Device"]
-        self.exp_obj = stats_dict["Exported Object"]
+        self.core_id = stats_dict.pop("core_id")
+        self.core_dev = stats_dict.pop("core_device")
+        self.exp_obj = stats_dict.pop("exported_object")
         self.core_size = parse_value(
-            value=stats_dict["Core Size [4KiB Blocks]"], unit_type=UnitType.block_4k
+            value=stats_dict.pop("core_size")[UnitType.block_4k.key],
+            unit_type=UnitType.block_4k,
         )
-        self.dirty_for = parse_value(value=stats_dict["Dirty for [s]"], unit_type=UnitType.seconds)
-        self.status = stats_dict["Status"]
+        self.dirty_for = parse_value(
+            value=stats_dict.pop("dirty_for")[UnitType.seconds.key], unit_type=UnitType.seconds
+        )
+        self.status = stats_dict.pop("status")
         self.seq_cutoff_threshold = parse_value(
-            value=stats_dict["Seq cutoff threshold [KiB]"], unit_type=UnitType.kibibyte
+            value=stats_dict.pop("seq_cutoff_threshold")[UnitType.kibibyte.key],
+            unit_type=UnitType.kibibyte,
         )
-        self.seq_cutoff_policy = stats_dict["Seq cutoff policy"]
-
-        del stats_dict["Core Id"]
-        del stats_dict["Core Device"]
-        del stats_dict["Exported Object"]
-        del stats_dict["Core Size [4KiB Blocks]"]
-        del stats_dict["Core Size [GiB]"]
-        del stats_dict["Dirty for [s]"]
-        del stats_dict["Dirty for"]
-        del stats_dict["Status"]
-        del stats_dict["Seq cutoff threshold [KiB]"]
-        del stats_dict["Seq cutoff policy"]
+        self.seq_cutoff_policy = stats_dict.pop("seq_cutoff_policy")
 
     def __str__(self):
         return (
@@ -318,15 +313,10 @@ class CoreConfigStats:
 
 class IoClassConfigStats:
     def __init__(self, stats_dict):
-        self.io_class_id = stats_dict["IO class ID"]
-        self.io_class_name = stats_dict["IO class name"]
-        self.eviction_priority = stats_dict["Eviction priority"]
-        self.max_size = stats_dict["Max size"]
-
-        del stats_dict["IO class ID"]
-        del stats_dict["IO class name"]
-        del stats_dict["Eviction priority"]
-        del stats_dict["Max size"]
+        self.io_class_id = stats_dict.pop("io_class_id")
+        self.io_class_name = stats_dict.pop("io_class_name")
+        self.eviction_priority = stats_dict.pop("eviction_priority")
+        self.max_size = stats_dict.pop("max_size")
 
     def __str__(self):
         return (
@@ -354,34 +344,17 @@ class IoClassConfigStats:
 class UsageStats:
     def __init__(self, stats_dict, percentage_val):
         unit = UnitType.percentage if percentage_val else UnitType.block_4k
-        self.occupancy = parse_value(value=stats_dict[f"Occupancy {unit}"], unit_type=unit)
-        self.free = parse_value(value=stats_dict[f"Free {unit}"], unit_type=unit)
-        self.clean = parse_value(value=stats_dict[f"Clean {unit}"], unit_type=unit)
-        self.dirty = parse_value(value=stats_dict[f"Dirty {unit}"], unit_type=unit)
-        if f"Inactive Occupancy {unit}" in stats_dict:
-            self.inactive_occupancy = parse_value(
-                value=stats_dict[f"Inactive Occupancy {unit}"], unit_type=unit
-            )
-        if f"Inactive Clean {unit}" in stats_dict:
-            self.inactive_clean = parse_value(
-                value=stats_dict[f"Inactive Clean {unit}"], unit_type=unit
-            )
-        if f"Inactive Dirty {unit}" in stats_dict:
-            self.inactive_dirty = parse_value(
-                value=stats_dict[f"Inactive Dirty {unit}"], unit_type=unit
-            )
-
-        for unit in [UnitType.percentage, UnitType.block_4k]:
-            del stats_dict[f"Occupancy {unit}"]
-            del stats_dict[f"Free {unit}"]
-            del stats_dict[f"Clean {unit}"]
-            del stats_dict[f"Dirty {unit}"]
-            if f"Inactive Dirty {unit}" in stats_dict:
-                del stats_dict[f"Inactive Occupancy {unit}"]
-            if f"Inactive Clean {unit}" in stats_dict:
-                del stats_dict[f"Inactive Clean {unit}"]
-            if f"Inactive Dirty {unit}" in stats_dict:
-                del stats_dict[f"Inactive Dirty {unit}"]
+        section = "usage_statistics"
+        self.occupancy = _pop_stat(stats_dict, section, "occupancy", unit)
+        self.free = _pop_stat(stats_dict, section, "free", unit)
+        self.clean = _pop_stat(stats_dict, section, "clean", unit)
+        self.dirty = _pop_stat(stats_dict, section, "dirty", unit)
+        # Inactive usage is printed only for caches with inactive cores
+        section = "inactive_usage_statistics"
+        if section in stats_dict:
+            self.inactive_occupancy = _pop_stat(stats_dict, section, "inactive_occupancy", unit)
+            self.inactive_clean = _pop_stat(stats_dict, section, "inactive_clean", unit)
+            self.inactive_dirty = _pop_stat(stats_dict, section, "inactive_dirty", unit)
 
     def __str__(self):
         return (
@@ -415,14 +388,10 @@ class UsageStats:
 class IoClassUsageStats:
     def __init__(self, stats_dict, percentage_val):
         unit = UnitType.percentage if percentage_val else UnitType.block_4k
-        self.occupancy = parse_value(value=stats_dict[f"Occupancy {unit}"], unit_type=unit)
-        self.clean = parse_value(value=stats_dict[f"Clean {unit}"], unit_type=unit)
-        self.dirty = parse_value(value=stats_dict[f"Dirty {unit}"], unit_type=unit)
-
-        for unit in [UnitType.percentage, UnitType.block_4k]:
-            del stats_dict[f"Occupancy {unit}"]
-            del stats_dict[f"Clean {unit}"]
-            del stats_dict[f"Dirty {unit}"]
+        section = "usage_statistics"
+        self.occupancy = _pop_stat(stats_dict, section, "occupancy", unit)
+        self.clean = _pop_stat(stats_dict, section, "clean", unit)
+        self.dirty = _pop_stat(stats_dict, section, "dirty", unit)
 
     def __str__(self):
         return (
@@ -454,6 +423,7 @@ class IoClassUsageStats:
 class RequestStats:
     def __init__(self, stats_dict, percentage_val):
         unit = UnitType.percentage if percentage_val else UnitType.requests
+        section = "request_statistics"
         self.read = RequestStatsChunk(
             stats_dict=stats_dict,
             percentage_val=percentage_val,
@@ -464,29 +434,10 @@ class RequestStats:
             percentage_val=percentage_val,
             operation=OperationType.write,
         )
-        self.pass_through_reads = parse_value(
-            value=stats_dict[f"Pass-Through reads {unit}"], unit_type=unit
-        )
-        self.pass_through_writes = parse_value(
-            value=stats_dict[f"Pass-Through writes {unit}"], unit_type=unit
-        )
-        self.requests_serviced = parse_value(
-            value=stats_dict[f"Serviced requests {unit}"], unit_type=unit
-        )
-        self.requests_total = parse_value(
-            value=stats_dict[f"Total requests {unit}"], unit_type=unit
-        )
-
-        for unit in [UnitType.percentage, UnitType.requests]:
-            for operation in [OperationType.read, OperationType.write]:
-                del stats_dict[f"{operation} hits {unit}"]
-                del stats_dict[f"{operation} partial misses {unit}"]
-                del stats_dict[f"{operation} full misses {unit}"]
-                del stats_dict[f"{operation} total {unit}"]
-            del stats_dict[f"Pass-Through reads {unit}"]
-            del stats_dict[f"Pass-Through writes {unit}"]
-            del stats_dict[f"Serviced requests {unit}"]
-            del stats_dict[f"Total requests {unit}"]
+        self.pass_through_reads = _pop_stat(stats_dict, section, "pass_through_reads", unit)
+        self.pass_through_writes = _pop_stat(stats_dict, section, "pass_through_writes", unit)
+        self.requests_serviced = _pop_stat(stats_dict, section, "serviced_requests", unit)
+        self.requests_total = _pop_stat(stats_dict, section, "total_requests", unit)
 
     def __str__(self):
         return (
@@ -518,14 +469,12 @@ class RequestStats:
 class RequestStatsChunk:
     def __init__(self, stats_dict, percentage_val: bool, operation: OperationType):
         unit = UnitType.percentage if percentage_val else UnitType.requests
-        self.hits = parse_value(value=stats_dict[f"{operation} hits {unit}"], unit_type=unit)
-        self.part_misses = parse_value(
-            value=stats_dict[f"{operation} partial misses {unit}"], unit_type=unit
-        )
-        self.full_misses = parse_value(
-            value=stats_dict[f"{operation} full misses {unit}"], unit_type=unit
-        )
-        self.total = parse_value(value=stats_dict[f"{operation} total {unit}"], unit_type=unit)
+        section = "request_statistics"
+        prefix = operation.value.lower()
+        self.hits = _pop_stat(stats_dict, section, f"{prefix}_hits", unit)
+        self.part_misses = _pop_stat(stats_dict, section, f"{prefix}_partial_misses", unit)
+        self.full_misses = _pop_stat(stats_dict, section, f"{prefix}_full_misses", unit)
+        self.total = _pop_stat(stats_dict, section, f"{prefix}_total", unit)
 
     def __str__(self):
         return (
@@ -551,6 +500,8 @@ class RequestStatsChunk:
 
 class BlockStats:
     def __init__(self, stats_dict, percentage_val):
+        # Names of block stats of cache and core are unified in json output, e.g. cache stats
+        # "Reads from core(s)" and core stats "Reads from core" are both "reads_from_core"
         self.core = BasicStatsChunk(
             stats_dict=stats_dict, percentage_val=percentage_val, device="core"
         )
@@ -560,15 +511,9 @@ class BlockStats:
         self.exp_obj = BasicStatsChunk(
             stats_dict=stats_dict,
             percentage_val=percentage_val,
-            device="exported object",
+            device="exported_object",
         )
 
-        for unit in [UnitType.percentage, UnitType.block_4k]:
-            for device in ["core", "cache", "exported object"]:
-                del stats_dict[f"Reads from {device} {unit}"]
-                del stats_dict[f"Writes to {device} {unit}"]
-                del stats_dict[f"Total to/from {device} {unit}"]
-
     def __str__(self):
         return (
             f"Block stats:\n"
@@ -592,19 +537,12 @@ class ErrorStats:
     def __init__(self, stats_dict, percentage_val):
         unit = UnitType.percentage if percentage_val else UnitType.requests
         self.cache = BasicStatsChunkError(
-            stats_dict=stats_dict, percentage_val=percentage_val, device="Cache"
+            stats_dict=stats_dict, percentage_val=percentage_val, device="cache"
         )
         self.core = BasicStatsChunkError(
-            stats_dict=stats_dict, percentage_val=percentage_val, device="Core"
+            stats_dict=stats_dict, percentage_val=percentage_val, device="core"
         )
-        self.total_errors = parse_value(value=stats_dict[f"Total errors {unit}"], unit_type=unit)
-
-        for unit in [UnitType.percentage, UnitType.requests]:
-            for device in ["Core", "Cache"]:
-                del stats_dict[f"{device} read errors {unit}"]
-                del stats_dict[f"{device} write errors {unit}"]
-                del stats_dict[f"{device} total errors {unit}"]
-            del stats_dict[f"Total errors {unit}"]
+        self.total_errors = _pop_stat(stats_dict, "error_statistics", "total_errors", unit)
 
     def __str__(self):
         return (
@@ -630,9 +568,10 @@ class ErrorStats:
 class BasicStatsChunk:
     def __init__(self, stats_dict: dict, percentage_val: bool, device: str):
         unit = UnitType.percentage if percentage_val else UnitType.block_4k
-        self.reads = parse_value(value=stats_dict[f"Reads from {device} {unit}"], unit_type=unit)
-        self.writes = parse_value(value=stats_dict[f"Writes to {device} {unit}"], unit_type=unit)
-        self.total = parse_value(value=stats_dict[f"Total to/from {device} {unit}"], unit_type=unit)
+        section = "block_statistics"
+        self.reads = _pop_stat(stats_dict, section, f"reads_from_{device}", unit)
+        self.writes = _pop_stat(stats_dict, section, f"writes_to_{device}", unit)
+        self.total = _pop_stat(stats_dict, section, f"total_to_from_{device}", unit)
 
     def __str__(self):
         return f"Reads: {self.reads}\nWrites: {self.writes}\nTotal: {self.total}\n"
@@ -651,9 +590,10 @@ class BasicStatsChunk:
 class BasicStatsChunkError:
     def __init__(self, stats_dict: dict, percentage_val: bool, device: str):
         unit = UnitType.percentage if percentage_val else UnitType.requests
-        self.reads = parse_value(value=stats_dict[f"{device} read errors {unit}"], unit_type=unit)
-        self.writes = parse_value(value=stats_dict[f"{device} write errors {unit}"], unit_type=unit)
-        self.total = parse_value(value=stats_dict[f"{device} total errors {unit}"], unit_type=unit)
+        section = "error_statistics"
+        self.reads = _pop_stat(stats_dict, section, f"{device}_read_errors", unit)
+        self.writes = _pop_stat(stats_dict, section, f"{device}_write_errors", unit)
+        self.total = _pop_stat(stats_dict, section, f"{device}_total_errors", unit)
 
     def __str__(self):
         return f"Reads: {self.reads}\nWrites: {self.writes}\nTotal: {self.total}\n"
@@ -669,13 +609,39 @@ class BasicStatsChunkError:
         return iter([getattr(self, stats_item) for stats_item in self.__dict__])
 
 
-def get_stat_value(stat_dict: dict, key: str):
-    idx = key.index("[")
-    unit = UnitType(key[idx:])
-    return parse_value(stat_dict[key], unit)
+def get_stat_values(stats_dict: dict, percentage_val: bool = False) -> dict:
+    """
+    Returns values of all table stats (usage, request, block and error) from casadm json
+    output, by stat name, e.g. {"reads_from_core": Size(...), "read_hits": 180, ...}.
+    """
+    values = {}
+    for section in stats_dict.values():
+        if not isinstance(section, dict) or not all(
+            isinstance(stat, dict) for stat in section.values()
+        ):
+            continue
+        for name, stat in section.items():
+            unit = next(
+                UnitType(f"[{key}]")
+                for key in stat
+                if (key == UnitType.percentage.key) == percentage_val
+            )
+            values[name] = parse_value(stat[unit.key], unit)
+    return values
+
 
+def _pop_stat(stats_dict: dict, section: str, name: str, unit: UnitType):
+    """Removes stat from its section, so stats left unparsed can be found."""
+    stats = stats_dict[section]
+    value = parse_value(stats.pop(name)[unit.key], unit)
+    if not stats:
+        del stats_dict[section]
+    return value
 
-def parse_value(value: str, unit_type: UnitType) -> int | float | Size | timedelta | str:
+
+def parse_value(
+    value: int | float | str, unit_type: UnitType
+) -> int | float | Size | timedelta | str:
     match unit_type:
         case UnitType.requests:
             stat_unit = int(value)
@@ -717,19 +683,209 @@ def get_stats_dict(
     cache_id: int,
     core_id: int = None,
     io_class_id: int = None,
-):
-    csv_stats = casadm.print_statistics(
+) -> dict:
+    """Returns statistics decoded from casadm json output, with stats nested by section."""
+    output = casadm.print_statistics(
         cache_id=cache_id,
         core_id=core_id,
         io_class_id=io_class_id,
         filter=filter,
-        output_format=casadm.OutputFormat.csv,
-    ).stdout.splitlines()
-    stat_keys, stat_values = csv.reader(csv_stats)
-    # Unify names in block stats for core and cache to easier compare
-    # cache vs core stats using unified key
-    # cache stats: Reads from core(s)
-    # core stats: Reads from core
-    stat_keys = [x.replace("(s)", "") for x in stat_keys]
-    stats_dict = dict(zip(stat_keys, stat_values))
-    return stats_dict
+        output_format=casadm.OutputFormat.json,
+    )
+    return json.loads(output.stdout)[0]
+
+
+def _parse_cores_statistics(
+    records: list, cache_id: int, filter: List[StatsFilter], percentage_val: bool
+) -> dict:
+    cores_stats = {}
+    for stats_dict in records:
+        # Core id is part of configuration stats, otherwise it is printed on its own
+        if StatsFilter.conf in _get_section_filters(filter):
+            core_id = stats_dict["core_id"]
+        else:
+            core_id = stats_dict.pop("core_id")
+        cores_stats[core_id] = CoreStats(cache_id, core_id, filter, percentage_val, stats_dict)
+    return cores_stats
+
+
+def get_cores_statistics(
+    cache_id: int,
+    filter: List[StatsFilter] = None,
+    percentage_val: bool = False,
+) -> dict:
+    """
+    Returns {core id: CoreStats} of all cores of cache, retrieved by casadm
+    with a single statistics call to kernel.
+    """
+    output = casadm.print_statistics(
+        cache_id=cache_id,
+        filter=filter,
+        output_format=casadm.OutputFormat.json,
+        all_cores=True,
+    )
+    return _parse_cores_statistics(json.loads(output.stdout), cache_id, filter, percentage_val)
+
+
+def stream_statistics(
+    cache_id: int,
+    core_id: int = None,
+    interval: timedelta = timedelta(seconds=1),
+    count: int = None,
+    filter: List[StatsFilter] = None,
+    percentage_val: bool = False,
+    all_cores: bool = False,
+):
+    """
+    Yields StatsSnapshot of cache or core statistics every interval. Statistics are printed
+    on DUT by a single casadm process (casadm -P --interval), which is stopped after count
+    snapshots or when generator is closed. With all_cores, snapshot stats are
+    {core id: CoreStats} of all cores of cache.
+    """
+    command = print_statistics_cmd(
+        cache_id=str(cache_id),
+        core_id=str(core_id) if core_id is not None else "" if all_cores else None,
+        filter=",".join(f.name for f in filter) if filter else None,
+        output_format=casadm.OutputFormat.json.name,
+        by_id_path=False,
+        interval=str(max(int(interval.total_seconds()), 1)),
+        count=str(count) if count else None,
+    )
+    output = TestRun.executor.run("mktemp -t cas_stats.XXXXXX")
+    if output.exit_code != 0:
+        raise CmdException("Failed to create statistics output file.", output)
+    output_path = output.stdout.strip()
+    output = TestRun.executor.run(
+        f"nohup {command} > {output_path} 2> {output_path}.err & echo $!"
+    )
+    if output.exit_code != 0:
+        raise CmdException("Failed to start statistics in interval mode.", output)
+    pid = output.stdout.strip()
+
+    lines_read = 0
+    snapshots = 0
+    try:
+        while count is None or snapshots < count:
+            # Process state is checked first, so all its output is read before it ends
+            output = TestRun.executor.run(
+                f"kill -0 {pid} 2>/dev/null && echo running || echo stopped; "
+                f"head -n $(wc -l < {output_path}) {output_path} | tail -n +{lines_read + 1}"
+            )
+            state, *lines = output.stdout.splitlines()
+            lines_read += len(lines)
+            # Every snapshot is a separate json document in a single line
+            for line in lines:
+                records = json.loads(line)
+                # All records of a snapshot have the same timestamp
+                timestamp = datetime.fromtimestamp(records[0]["timestamp"]["s"])
+                for stats_dict in records:
+                    stats_dict.pop("timestamp")
+                if all_cores:
+                    stats = _parse_cores_statistics(records, cache_id, filter, percentage_val)
+                elif core_id is None:
+                    stats = CacheStats(cache_id, filter, percentage_val, records[0])
+                else:
+                    stats = CoreStats(cache_id, core_id, filter, percentage_val, records[0])
+                snapshots += 1
+                yield StatsSnapshot(timestamp, stats)
+                if count is not None and snapshots >= count:
+                    return
+            if state == "stopped":
+                output = TestRun.executor.run(f"cat {output_path}.err")
+                if output.stdout.strip():
+                    raise CmdException("Statistics in interval mode failed.", output)
+                return
+            if not lines:
+                time.sleep(interval.total_seconds())
+    finally:
+        TestRun.executor.run(f"kill {pid} 2>/dev/null; rm -f {output_path} {output_path}.err")
+
+
+LATENCY_HISTOGRAMS_PARAM_PATH = "/sys/module/cas_cache/parameters/latency_histograms"
+
+LatencyBucket = namedtuple("LatencyBucket", ["lower", "upper", "count"])
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of request latencies of core exported object, accounted by CAS
+    from request submission until its completion. Buckets are at most 25% wide,
+    percentiles are interpolated linearly within bucket.
+    """
+
+    def __init__(self, buckets: List[LatencyBucket]):
+        self.buckets = buckets
+
+    @classmethod
+    def parse(cls, output: str):
+        """Parses '<lower [us]> <upper [us]> <count>' lines of non-empty buckets."""
+        buckets = []
+        for line in output.splitlines():
+            lower, upper, count = (int(value) for value in line.split())
+            buckets.append(
+                LatencyBucket(
+                    timedelta(microseconds=lower), timedelta(microseconds=upper), count
+                )
+            )
+        return cls(buckets)
+
+    @property
+    def count(self) -> int:
+        return sum(bucket.count for bucket in self.buckets)
+
+    def percentile(self, percentile: float) -> timedelta:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Invalid percentile: {percentile}")
+        if not self.count:
+            raise ValueError("Can't get percentile of empty latency histogram.")
+        rank = self.count * percentile / 100
+        for bucket in self.buckets:
+            if rank <= bucket.count:
+                return bucket.lower + (bucket.upper - bucket.lower) * (rank / bucket.count)
+            rank -= bucket.count
+        return self.buckets[-1].upper
+
+    def __sub__(self, other):
+        """Histogram of requests accounted after other one was read."""
+        other_counts = {bucket.lower: bucket.count for bucket in other.buckets}
+        buckets = [
+            bucket._replace(count=bucket.count - other_counts.get(bucket.lower, 0))
+            for bucket in self.buckets
+        ]
+        return LatencyHistogram([bucket for bucket in buckets if bucket.count])
+
+    def __str__(self):
+        if not self.count:
+            return "Requests: 0"
+        return (
+            f"Requests: {self.count}, "
+            + ", ".join(
+                f"p{percentile}: {self.percentile(percentile) / timedelta(microseconds=1):.0f} us"
+                for percentile in [50, 90, 99, 99.9]
+            )
+        )
+
+
+def set_latency_histograms(enabled: bool):
+    """Switches accounting of latencies of all core exported objects."""
+    output = TestRun.executor.run(f"echo {int(enabled)} > {LATENCY_HISTOGRAMS_PARAM_PATH}")
+    if output.exit_code != 0:
+        raise CmdException("Failed to switch latency histograms.", output)
+
+
+def get_latency_histograms(cache_id: int, core_id: int) -> dict:
+    """Returns {OperationType: LatencyHistogram} of core exported object."""
+    histograms = {}
+    for operation in OperationType:
+        path = f"/sys/block/cas{cache_id}-{core_id}/latency/{operation.name}"
+        output = TestRun.executor.run(f"cat {path}")
+        if output.exit_code != 0:
+            raise CmdException(f"Failed to read latency histogram {path}.", output)
+        histograms[operation] = LatencyHistogram.parse(output.stdout)
+    return histograms
+
+
+def reset_latency_histograms(cache_id: int, core_id: int):
+    output = TestRun.executor.run(f"echo 1 > /sys/block/cas{cache_id}-{core_id}/latency/reset")
+    if output.exit_code != 0:
+        raise CmdException("Failed to reset latency histograms.", output)
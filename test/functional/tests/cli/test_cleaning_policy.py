@@ -5,7 +5,7 @@
 #
 
 import pytest
-import time
+from datetime import timedelta
 
 from core.test_run_utils import TestRun
 from type_def.size import Size, Unit
@@ -15,6 +15,7 @@ from test_tools.fio.fio import Fio
 from test_tools.fio.fio_param import ReadWrite, IoEngine
 from api.cas import casadm
 from api.cas.cache_config import CacheMode, CleaningPolicy
+from api.cas.cas_wait import dirty_at_most, wait_for
 from test_tools.udev import Udev
 
 
@@ -72,14 +73,7 @@ def test_cleaning_policy_change():
 
     with TestRun.step("Change cleaning policy"):
         cache.set_cleaning_policy(CleaningPolicy.acp)
-        t_end = time.time() + wait_time
-        while time.time() < t_end:
-            time.sleep(1)
-            if cache.get_dirty_blocks() == Size.zero():
-                TestRun.LOGGER.info(
-                    f"Cache flushed after {round(time.time() - (t_end - wait_time), 2)} seconds."
-                )
-                break
+        wait_for(dirty_at_most(cache.cache_id), timedelta(seconds=wait_time))
 
     with TestRun.step("Check if cache contains dirty data"):
         if cache.get_dirty_blocks() != Size.zero():
@@ -418,8 +418,7 @@ def test_activate_neg_cache_line_size():
                                           cache_line_size=active_cls)
 
     with TestRun.step("Get metadata size"):
-        dmesg_out = TestRun.executor.run_expect_success("dmesg").stdout
-        md_size = dmesg.get_metadata_size_on_device(dmesg_out)
+        md_size = dmesg.get_metadata_size_on_device(cache_id=cache_id)
 
     with TestRun.step("Dump the metadata of the cache"):
         dump_file_path = "/tmp/test_activate_corrupted.dump"
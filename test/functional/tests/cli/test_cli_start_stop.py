@@ -10,8 +10,10 @@ import pytest
 
 from api.cas import casadm, casadm_parser, cli_messages
 from api.cas.cli import start_cmd
+from connection.utils.output import CmdException
 from core.test_run import TestRun
 from storage_devices.disk import DiskType, DiskTypeSet, DiskTypeLowerThan
+from test_tools.fs_tools import Filesystem
 from type_def.size import Unit, Size
 
 CACHE_ID_RANGE = (1, 16384)
@@ -234,3 +236,58 @@ def test_cli_load_and_force(shortcut):
         if output.exit_code == 0:
             TestRun.fail("Loading cache with 'force' option should fail.")
         cli_messages.check_stderr_msg(output, cli_messages.load_and_force)
+
+
+@pytest.mark.require_disk("cache", DiskTypeSet([DiskType.optane, DiskType.nand]))
+@pytest.mark.require_disk("core", DiskTypeLowerThan("cache"))
+def test_cli_stop_all_caches_partial_failure():
+    """
+    title: Test stopping all caches when one of them can't be stopped
+    description: |
+        Stop all caches in one batch while exported object of the first cache is mounted
+        and check if caches stopped before the failure are removed from the list of caches
+        tracked by test framework.
+    pass_criteria:
+      - Stopping all caches fails
+      - The cache with mounted exported object is still running and tracked
+      - The other cache is stopped and no longer tracked
+    """
+    mount_point = "/mnt/cas"
+
+    with TestRun.step("Prepare devices."):
+        cache_device = TestRun.disks['cache']
+        cache_device.create_partitions([Size(500, Unit.MebiByte)] * 2)
+        core_device = TestRun.disks['core']
+        core_device.create_partitions([Size(1, Unit.GibiByte)])
+
+    with TestRun.step("Start two caches and add core to the first one."):
+        first_cache = casadm.start_cache(cache_device.partitions[0], cache_id=1, force=True)
+        second_cache = casadm.start_cache(cache_device.partitions[1], cache_id=2, force=True)
+        core = first_cache.add_core(core_device.partitions[0])
+
+    with TestRun.step("Create filesystem on exported object and mount it."):
+        core.create_filesystem(Filesystem.ext4)
+        core.mount(mount_point)
+
+    with TestRun.step("Try to stop all caches."):
+        try:
+            casadm.stop_all_caches()
+            TestRun.fail("Stopping all caches should fail.")
+        except CmdException:
+            TestRun.LOGGER.info("Stopping all caches failed as expected.")
+
+    with TestRun.step("Check running and tracked caches."):
+        running_cache_ids = [cache.cache_id for cache in casadm_parser.get_caches()]
+        tracked_cache_ids = [cache.cache_id for cache in TestRun.dut.cache_list]
+        if running_cache_ids != [first_cache.cache_id]:
+            TestRun.fail(f"Only cache {first_cache.cache_id} should be running, "
+                         f"running caches: {running_cache_ids}")
+        if tracked_cache_ids != running_cache_ids:
+            TestRun.fail(f"Tracked caches {tracked_cache_ids} don't match running caches "
+                         f"{running_cache_ids}, cache {second_cache.cache_id} was stopped.")
+        if first_cache.cache_id not in [core.cache_id for core in TestRun.dut.core_list]:
+            TestRun.fail("Core of running cache should still be tracked.")
+
+    with TestRun.step("Unmount exported object and stop all caches."):
+        core.unmount()
+        casadm.stop_all_caches()
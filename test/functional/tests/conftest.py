@@ -35,6 +35,11 @@ from test_utils.common.singleton import Singleton
 from storage_devices.lvm import Lvm, LvmConfiguration
 from storage_devices.disk import Disk
 from storage_devices.drbd import Drbd
+from utils.disk_layout import DiskLayoutCache
+from utils.dut_cleanup import DutCleanup
+from utils.dut_scheduler import DutScheduler, DutSchedulerWorker
+
+disk_layout_cache = DiskLayoutCache()
 
 
 def pytest_addoption(parser):
@@ -46,10 +51,46 @@ def pytest_addoption(parser):
         default=f"{os.path.join(os.path.dirname(__file__), '../results')}",
     )
     parser.addoption("--fuzzy-iter-count", action="store")
+    parser.addoption(
+        "--step-by-step-cleanup",
+        action="store_true",
+        default=False,
+        help="Clean up DUT before and after test step by step instead of with a single script"
+        " (for debugging cleanup failures)",
+    )
+    parser.addoption(
+        "--parallel-duts",
+        action="store_true",
+        default=False,
+        help="Distribute tests among all DUTs given with --dut-config, running one worker"
+        " process per DUT",
+    )
+    parser.addoption(
+        "--test-durations",
+        action="store",
+        help="JSON file with test durations used by --parallel-duts for balancing"
+        " (default: test_durations.json in log path)",
+    )
+    parser.addoption(
+        "--scheduled-tests",
+        action="store",
+        help="File with node IDs of tests to run, used by --parallel-duts workers",
+    )
+    parser.addoption(
+        "--no-partitions-reuse",
+        action="store_true",
+        default=False,
+        help="Always re-create partitions on test disks, even if the disk already has"
+        " the partition layout requested by test",
+    )
 
 
 def pytest_configure(config):
     TestRun.configure(config)
+    if config.getoption("--scheduled-tests"):
+        config.pluginmanager.register(DutSchedulerWorker(config), "dut_scheduler_worker")
+    elif config.getoption("--parallel-duts"):
+        config.pluginmanager.register(DutScheduler(config), "dut_scheduler")
 
 
 def pytest_generate_tests(metafunc):
@@ -147,69 +188,27 @@ def pytest_runtest_setup(item):
 
 def base_prepare(item):
     with TestRun.LOGGER.step("Cleanup before test"):
-        TestRun.executor.run("pkill --signal=SIGKILL fsck")
-        Udev.enable()
-        kill_all_io(graceful=False)
-        DeviceMapper.remove_all()
-
-        if installer.check_if_installed():
-            try:
+        if item.config.getoption("--step-by-step-cleanup"):
+            __base_prepare_step_by_step()
+        else:
+            test_name = item.name.split("[")[0]
+            expected_layouts = (
+                {}
+                if item.config.getoption("--no-partitions-reuse")
+                else disk_layout_cache.get_expected_layouts(test_name, TestRun.disks)
+            )
+            cleanup = DutCleanup(
+                disks=TestRun.disks.values(),
+                remove_paths=[opencas_drop_in_directory],
+                expected_layouts=expected_layouts,
+            ).run()
+            cleanup.check()
+            disk_layout_cache.install(test_name, TestRun.disks, cleanup.get_kept_layouts())
+            LvmConfiguration.remove_filters_from_config()
+            if cleanup.cas_installed:
                 from api.cas.init_config import InitConfig
 
                 InitConfig.create_default_init_config()
-                unmount_cas_devices()
-                casadm.stop_all_caches()
-                casadm.remove_all_detached_cores()
-            except Exception:
-                pass  # TODO: Reboot DUT if test is executed remotely
-
-        remove(str(opencas_drop_in_directory), recursive=True, ignore_errors=True)
-
-        from storage_devices.drbd import Drbd
-
-        if Drbd.is_installed():
-            __drbd_cleanup()
-
-        lvms = Lvm.discover()
-        if lvms:
-            Lvm.remove_all()
-        LvmConfiguration.remove_filters_from_config()
-
-        raids = Raid.discover()
-        if len(TestRun.disks):
-            test_run_disk_ids = {dev.device_id for dev in TestRun.disks.values()}
-            for raid in raids:
-                # stop only those RAIDs, which are comprised of test disks
-                if filter(lambda dev: dev.device_id in test_run_disk_ids, raid.array_devices):
-                    raid.remove_partitions()
-                    raid.unmount()
-                    raid.stop()
-                    for device in raid.array_devices:
-                        Mdadm.zero_superblock(posixpath.join("/dev", device.get_device_id()))
-                        Udev.settle()
-
-        RamDisk.remove_all()
-
-        if check_if_directory_exists(path=TestRun.TEST_RUN_DATA_PATH):
-            remove(
-                path=posixpath.join(TestRun.TEST_RUN_DATA_PATH, "*"),
-                force=True,
-                recursive=True,
-            )
-        else:
-            create_directory(path=TestRun.TEST_RUN_DATA_PATH)
-
-        for disk in TestRun.disks.values():
-            disk_serial = Disk.get_disk_serial_number(disk.path)
-            if disk.serial_number and disk.serial_number != disk_serial:
-                raise Exception(
-                    f"Serial for {disk.path} doesn't match the one from the config."
-                    f"Serial from config {disk.serial_number}, actual serial {disk_serial}"
-                )
-            disk.remove_partitions()
-            disk.unmount()
-            Mdadm.zero_superblock(posixpath.join("/dev", disk.get_device_id()))
-            create_partition_table(disk, PartitionTable.gpt)
 
         TestRun.usr.already_updated = True
         TestRun.LOGGER.add_build_info(f"Commit hash:")
@@ -218,6 +217,72 @@ def base_prepare(item):
         TestRun.LOGGER.add_build_info(f"{git.get_current_commit_message()}")
 
 
+def __base_prepare_step_by_step():
+    TestRun.executor.run("pkill --signal=SIGKILL fsck")
+    Udev.enable()
+    kill_all_io(graceful=False)
+    DeviceMapper.remove_all()
+
+    if installer.check_if_installed():
+        try:
+            from api.cas.init_config import InitConfig
+
+            InitConfig.create_default_init_config()
+            unmount_cas_devices()
+            casadm.stop_all_caches()
+            casadm.remove_all_detached_cores()
+        except Exception:
+            pass  # TODO: Reboot DUT if test is executed remotely
+
+    remove(str(opencas_drop_in_directory), recursive=True, ignore_errors=True)
+
+    from storage_devices.drbd import Drbd
+
+    if Drbd.is_installed():
+        __drbd_cleanup()
+
+    lvms = Lvm.discover()
+    if lvms:
+        Lvm.remove_all()
+    LvmConfiguration.remove_filters_from_config()
+
+    raids = Raid.discover()
+    if len(TestRun.disks):
+        test_run_disk_ids = {dev.device_id for dev in TestRun.disks.values()}
+        for raid in raids:
+            # stop only those RAIDs, which are comprised of test disks
+            if filter(lambda dev: dev.device_id in test_run_disk_ids, raid.array_devices):
+                raid.remove_partitions()
+                raid.unmount()
+                raid.stop()
+                for device in raid.array_devices:
+                    Mdadm.zero_superblock(posixpath.join("/dev", device.get_device_id()))
+                    Udev.settle()
+
+    RamDisk.remove_all()
+
+    if check_if_directory_exists(path=TestRun.TEST_RUN_DATA_PATH):
+        remove(
+            path=posixpath.join(TestRun.TEST_RUN_DATA_PATH, "*"),
+            force=True,
+            recursive=True,
+        )
+    else:
+        create_directory(path=TestRun.TEST_RUN_DATA_PATH)
+
+    for disk in TestRun.disks.values():
+        disk_serial = Disk.get_disk_serial_number(disk.path)
+        if disk.serial_number and disk.serial_number != disk_serial:
+            raise Exception(
+                f"Serial for {disk.path} doesn't match the one from the config."
+                f"Serial from config {disk.serial_number}, actual serial {disk_serial}"
+            )
+        disk.remove_partitions()
+        disk.unmount()
+        Mdadm.zero_superblock(posixpath.join("/dev", disk.get_device_id()))
+        create_partition_table(disk, PartitionTable.gpt)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     res = (yield).get_result()
@@ -232,7 +297,7 @@ def update_initramfs_before_and_after_test():
 
 
 @pytest.hookimpl(trylast=True)
-def pytest_runtest_teardown():
+def pytest_runtest_teardown(item):
     """
     This method is executed always in the end of each test, even if it fails or raises exception in
     prepare stage.
@@ -244,41 +309,18 @@ def pytest_runtest_teardown():
             if TestRun.executor:
                 if not TestRun.executor.is_active():
                     TestRun.executor.wait_for_connection()
-                Udev.enable()
-                kill_all_io(graceful=False)
-                unmount_cas_devices()
-
-                if installer.check_if_installed():
-                    casadm.remove_all_detached_cores()
-                    casadm.stop_all_caches()
-                    from api.cas.init_config import InitConfig
-
-                    InitConfig.create_default_init_config()
-
-                from storage_devices.drbd import Drbd
-
-                if installer.check_if_installed() and Drbd.is_installed():
-                    try:
-                        casadm.stop_all_caches()
-                    finally:
-                        __drbd_cleanup()
-                elif Drbd.is_installed():
-                    Drbd.down_all()
-
-                lvms = Lvm.discover()
-                if lvms:
-                    Lvm.remove_all()
-                LvmConfiguration.remove_filters_from_config()
-
-                DeviceMapper.remove_all()
-                RamDisk.remove_all()
-
-                if check_if_directory_exists(path=TestRun.TEST_RUN_DATA_PATH):
-                    remove(
-                        path=posixpath.join(TestRun.TEST_RUN_DATA_PATH, "*"),
-                        force=True,
-                        recursive=True,
-                    )
+                if item.config.getoption("--step-by-step-cleanup"):
+                    __teardown_step_by_step()
+                else:
+                    cleanup = DutCleanup(disks=TestRun.disks.values(), prepare_disks=False).run()
+                    LvmConfiguration.remove_filters_from_config()
+                    if cleanup.cas_installed:
+                        TestRun.dut.cache_list = []
+                        TestRun.dut.core_list = []
+                        from api.cas.init_config import InitConfig
+
+                        InitConfig.create_default_init_config()
+                    cleanup.check()
 
         except Exception as ex:
             TestRun.LOGGER.warning(
@@ -303,6 +345,44 @@ def pytest_runtest_teardown():
     TestRun.teardown()
 
 
+def __teardown_step_by_step():
+    Udev.enable()
+    kill_all_io(graceful=False)
+    unmount_cas_devices()
+
+    if installer.check_if_installed():
+        casadm.remove_all_detached_cores()
+        casadm.stop_all_caches()
+        from api.cas.init_config import InitConfig
+
+        InitConfig.create_default_init_config()
+
+    from storage_devices.drbd import Drbd
+
+    if installer.check_if_installed() and Drbd.is_installed():
+        try:
+            casadm.stop_all_caches()
+        finally:
+            __drbd_cleanup()
+    elif Drbd.is_installed():
+        Drbd.down_all()
+
+    lvms = Lvm.discover()
+    if lvms:
+        Lvm.remove_all()
+    LvmConfiguration.remove_filters_from_config()
+
+    DeviceMapper.remove_all()
+    RamDisk.remove_all()
+
+    if check_if_directory_exists(path=TestRun.TEST_RUN_DATA_PATH):
+        remove(
+            path=posixpath.join(TestRun.TEST_RUN_DATA_PATH, "*"),
+            force=True,
+            recursive=True,
+        )
+
+
 def unmount_cas_devices():
     output = TestRun.executor.run("cat /proc/mounts | grep cas")
     # If exit code is '1' but stdout is empty, there is no mounted cas devices
@@ -10,19 +10,18 @@ import itertools
 import re
 import pytest
 
-from datetime import timedelta
-
 from api.cas import casadm
 from api.cas.cache_config import CacheMode
 from api.cas.ioclass_config import IoClass
 from core.test_run import TestRun
 from test_tools.fs_tools import Filesystem, create_directory, check_if_directory_exists, \
-    read_file, crc32sum
+    read_file
 from test_tools.fio.fio import Fio
 from test_tools.fio.fio_param import ReadWrite, IoEngine, VerifyMethod
 from storage_devices.disk import DiskType, DiskTypeSet, DiskTypeLowerThan
 from test_tools.os_tools import sync
 from type_def.size import Unit, Size
+from utils.chunk_checksums import ChunkChecksums, format_mismatches
 
 template_config_path = "/etc/opencas/ioclass-config.csv"
 
@@ -146,23 +145,32 @@ def test_data_integrity_5d_with_io_classification(filesystems):
         for core in cores:
             core.unmount()
 
-    with TestRun.step("Calculate crc32 for each core"):
-        core_crc32s = [crc32sum(core.path, timeout=timedelta(hours=4)) for core in cores]
+    with TestRun.step("Calculate chunk checksums for each core"):
+        cache_line_sizes = [cache.get_cache_line_size() for cache in caches]
+        core_checksums = [
+            ChunkChecksums.compute(core.path, cache_line_size=cache_line_size)
+            for core, cache_line_size in zip(cores, cache_line_sizes)
+        ]
 
     with TestRun.step("Stop caches"):
         for cache in caches:
             cache.stop()
 
-    with TestRun.step("Calculate crc32 for each core"):
-        dev_crc32s = [crc32sum(dev.path, timeout=timedelta(hours=4)) for dev in core_devices]
+    with TestRun.step("Calculate chunk checksums for each core device"):
+        dev_checksums = [
+            ChunkChecksums.compute(dev.path, cache_line_size=cache_line_size)
+            for dev, cache_line_size in zip(core_devices, cache_line_sizes)
+        ]
 
-    with TestRun.step("Compare crc32 sums for cores and core devices"):
-        for core_crc32, dev_crc32, mode, fs in zip(
-                core_crc32s, dev_crc32s, cache_modes, filesystems
+    with TestRun.step("Compare checksums for cores and core devices"):
+        for core_checksum, dev_checksum, mode, fs in zip(
+                core_checksums, dev_checksums, cache_modes, filesystems
         ):
-            if core_crc32 != dev_crc32:
-                TestRun.fail("Crc32 sums of core and core device do not match! "
-                             f"Cache mode: {mode} Filesystem: {fs}")
+            mismatches = core_checksum.get_mismatches(dev_checksum)
+            if mismatches:
+                TestRun.fail("Checksums of core and core device do not match! "
+                             f"Cache mode: {mode} Filesystem: {fs} "
+                             f"Mismatching LBA ranges: {format_mismatches(mismatches)}")
 
 
 @pytest.mark.os_dependent
@@ -233,18 +241,27 @@ def test_data_integrity_5d():
     with TestRun.step("Run test workload with data verification"):
         fio_run.run(fio_timeout=runtime + datetime.timedelta(hours=2))
 
-    with TestRun.step("Calculate crc32 for each core"):
-        core_crc32s = [crc32sum(core.path, timeout=timedelta(hours=4)) for core in cores]
+    with TestRun.step("Calculate chunk checksums for each core"):
+        cache_line_sizes = [cache.get_cache_line_size() for cache in caches]
+        core_checksums = [
+            ChunkChecksums.compute(core.path, cache_line_size=cache_line_size)
+            for core, cache_line_size in zip(cores, cache_line_sizes)
+        ]
 
     with TestRun.step("Stop caches"):
         for cache in caches:
             cache.stop()
 
-    with TestRun.step("Calculate crc32 for each core"):
-        dev_crc32s = [crc32sum(dev.path, timeout=timedelta(hours=4)) for dev in core_devices]
+    with TestRun.step("Calculate chunk checksums for each core device"):
+        dev_checksums = [
+            ChunkChecksums.compute(dev.path, cache_line_size=cache_line_size)
+            for dev, cache_line_size in zip(core_devices, cache_line_sizes)
+        ]
 
-    with TestRun.step("Compare crc32 sums for cores and core devices"):
-        for core_crc32, dev_crc32, mode in zip(core_crc32s, dev_crc32s, cache_modes):
-            if core_crc32 != dev_crc32:
-                TestRun.fail("Crc32 sums of core and core device do not match! "
-                             f"Cache mode: {mode}")
+    with TestRun.step("Compare checksums for cores and core devices"):
+        for core_checksum, dev_checksum, mode in zip(core_checksums, dev_checksums, cache_modes):
+            mismatches = core_checksum.get_mismatches(dev_checksum)
+            if mismatches:
+                TestRun.fail("Checksums of core and core device do not match! "
+                             f"Cache mode: {mode} "
+                             f"Mismatching LBA ranges: {format_mismatches(mismatches)}")
@@ -23,6 +23,7 @@ from connection.utils.asynchronous import start_async_func
 from test_utils.filesystem.directory import Directory
 from connection.utils.output import CmdException
 from type_def.size import Unit, Size
+from utils.chunk_checksums import ChunkChecksums
 
 ram_disk, tmp_dir, fio_seed = None, None, None
 num_jobs = 8
@@ -290,10 +291,9 @@ def prepare_base_fio():
 
 
 def read_device_md5s(path):
-    result = TestRun.executor.run_expect_success(
-        f"for i in 0 `seq {total_workset_blocks - 1}`; do dd if={path} bs={block_size.value} "
-        "count=1 skip=$i iflag=direct 2> /dev/null | md5sum; done | cut -d ' ' -f 1"
-    ).stdout.splitlines()
+    result = ChunkChecksums.compute(
+        path, chunk_size=block_size, size=block_size * total_workset_blocks
+    ).checksums
     return split_per_job(result)
 
 
@@ -104,8 +104,7 @@ def test_cache_activation_time(prefill):
                                      f"occupancy={stats.usage_stats.occupancy}%")
 
     with TestRun.step("Get metadata size"):
-        dmesg_out = TestRun.executor.run_expect_success("dmesg").stdout
-        md_size = dmesg.get_metadata_size_on_device(dmesg_out)
+        md_size = dmesg.get_metadata_size_on_device(cache_id=cache.cache_id)
 
     with TestRun.step("Stop the cache without flushing."):
         cache.stop(no_data_flush=True)
@@ -11,7 +11,7 @@ from datetime import timedelta
 
 from api.cas import casadm, casadm_parser, cli
 from api.cas.cache_config import CacheMode, CleaningPolicy, CacheModeTrait
-from api.cas.casadm_parser import wait_for_flushing
+from api.cas.casadm_parser import wait_for_flushing, wait_for_flushing_progress
 from api.cas.cli import attach_cache_cmd
 from connection.utils.output import CmdException
 from core.test_run import TestRun
@@ -113,12 +113,7 @@ def test_interrupt_core_flush(cache_mode: CacheMode, filesystem: Filesystem):
 
         with TestRun.step("Interrupt core flushing"):
             wait_for_flushing(cache=cache, core=core)
-            percentage = casadm_parser.get_flushing_progress(
-                cache_id=cache.cache_id, core_id=core.core_id
-            )
-
-            while percentage < 50:
-                percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
+            wait_for_flushing_progress(cache, core, 50)
 
             TestRun.executor.kill_process(pid=flush_pid)
 
@@ -230,9 +225,7 @@ def test_interrupt_cache_flush(cache_mode: CacheMode, filesystem: Filesystem):
 
         with TestRun.step("Interrupt cache flushing"):
             wait_for_flushing(cache, core)
-            percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
-            while percentage < 20:
-                percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
+            wait_for_flushing_progress(cache, core, 20)
             TestRun.executor.kill_process(pid=flush_pid)
 
         with TestRun.step("Check number of dirty data on exported object after interruption"):
@@ -341,9 +334,7 @@ def test_interrupt_core_remove(cache_mode, filesystem):
 
         with TestRun.step("Interrupt core removing"):
             wait_for_flushing(cache, core)
-            percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
-            while percentage < 50:
-                percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
+            wait_for_flushing_progress(cache, core, 50)
             TestRun.executor.run(f"kill -s SIGINT {flush_pid}")
 
         with TestRun.step(
@@ -464,9 +455,7 @@ def test_interrupt_cache_mode_switch_parametrized(cache_mode, stop_percentage):
 
         with TestRun.step("Kill flush process during cache flush operation"):
             wait_for_flushing(cache, core)
-            percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
-            while percentage < stop_percentage:
-                percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
+            wait_for_flushing_progress(cache, core, stop_percentage)
             TestRun.executor.kill_process(flush_pid)
 
         with TestRun.step("Check number of dirty data on exported object after interruption"):
@@ -583,9 +572,7 @@ def test_interrupt_cache_stop(cache_mode, filesystem):
 
         with TestRun.step("Interrupt cache stopping"):
             wait_for_flushing(cache, core)
-            percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
-            while percentage < 50:
-                percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
+            wait_for_flushing_progress(cache, core, 50)
 
             TestRun.executor.kill_process(pid=flush_pid)
 
@@ -731,11 +718,7 @@ def test_detach_interrupt_cache_flush(filesystem, cache_mode):
 
     with TestRun.step("Interrupt cache flushing by cache detach"):
         wait_for_flushing(cache, core)
-        percentage = casadm_parser.get_flushing_progress(cache.cache_id, core.core_id)
-        while percentage < 50:
-            percentage = casadm_parser.get_flushing_progress(
-                cache.cache_id, core.core_id
-            )
+        wait_for_flushing_progress(cache, core, 50)
 
     with TestRun.step("Detach cache"):
         try:
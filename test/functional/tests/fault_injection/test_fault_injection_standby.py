@@ -47,8 +47,7 @@ def test_activate_corrupted():
         cache_id = 1
         cls = CacheLineSize.LINE_32KiB
         md_dump = prepare_md_dump(cache_device, core_device, cls, cache_id)
-        dmesg_out = TestRun.executor.run_expect_success("dmesg").stdout
-        superblock_size = get_md_section_size("Super block config", dmesg_out)
+        superblock_size = get_md_section_size("Super block config", cache_id=cache_id)
 
     with TestRun.step("Prepare standby instance"):
         cache = casadm.standby_init(
@@ -105,8 +104,7 @@ def test_load_corrupted():
         cache_id = 1
         cls = CacheLineSize.LINE_32KiB
         md_dump = prepare_md_dump(cache_device, core_device, cls, cache_id)
-        dmesg_out = TestRun.executor.run_expect_success("dmesg").stdout
-        superblock_size = get_md_section_size("Super block config", dmesg_out)
+        superblock_size = get_md_section_size("Super block config", cache_id=cache_id)
 
     with TestRun.step(f"Corrupt {block_size} on the offset {offset*block_size}"):
         corrupted_md = prepare_corrupted_md(md_dump, offset, block_size)
@@ -151,8 +149,7 @@ def test_activate_corrupted_after_dump():
         cache_id = 1
         cls = CacheLineSize.LINE_32KiB
         md_dump = prepare_md_dump(cache_device, core_device, cls, cache_id)
-        dmesg_out = TestRun.executor.run_expect_success("dmesg").stdout
-        superblock_size = get_md_section_size("Super block config", dmesg_out)
+        superblock_size = get_md_section_size("Super block config", cache_id=cache_id)
 
     with TestRun.step("Prepare standby instance"):
         cache = casadm.standby_init(
@@ -201,8 +198,7 @@ def prepare_md_dump(cache_device, core_device, cls, cache_id):
         cache.add_core(core_device)
 
     with TestRun.step("Get metadata size"):
-        dmesg_out = TestRun.executor.run_expect_success("dmesg").stdout
-        md_size = dmesg.get_metadata_size_on_device(dmesg_out)
+        md_size = dmesg.get_metadata_size_on_device(cache_id=cache_id)
 
     with TestRun.step("Dump the metadata of the cache"):
         dump_file_path = "/tmp/test_activate_corrupted.dump"
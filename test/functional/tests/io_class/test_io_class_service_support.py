@@ -14,7 +14,7 @@ from api.cas.casadm_params import StatsFilter
 from api.cas.casadm_parser import get_caches, get_cores
 from api.cas.init_config import InitConfig
 from api.cas.ioclass_config import IoClass, remove_ioclass_config, create_ioclass_config, \
-    add_ioclass
+    add_ioclass, write_ioclass_config
 from core.test_run_utils import TestRun
 from storage_devices.disk import DiskTypeSet, DiskType, DiskTypeLowerThan
 from test_tools.fs_tools import Filesystem, copy, read_file
@@ -167,6 +167,7 @@ def prepare_and_load_io_class_config(cache, metadata_not_cached=False):
             add_default_rule=True, ioclass_config_path=ioclass_config_path
         )
         add_ioclass(1, "metadata&done", 1, "0.00", ioclass_config_path)
+        write_ioclass_config(ioclass_config_path)
     else:
         copy(template_config_path, ioclass_config_path)
 
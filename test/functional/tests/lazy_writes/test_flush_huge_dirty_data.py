@@ -10,7 +10,9 @@ from datetime import timedelta
 
 from api.cas import casadm
 from api.cas.cache_config import CacheMode, CacheModeTrait, CleaningPolicy, SeqCutOffPolicy
+from api.cas.casadm_parser import get_caches
 from api.cas.cli import stop_cmd
+from api.cas.progress_bar import check_progress_bar, FlushProgressRecorder
 from core.test_run import TestRun
 from storage_devices.device import Device
 from storage_devices.disk import DiskType, DiskTypeLowerThan, DiskTypeSet
@@ -140,6 +142,7 @@ def test_flush_over_640_gibibytes_raw_device(cache_mode):
           Flush cache when amount of dirty data in cache exceeds 640 GiB.
         pass_criteria:
           - Flushing completes successfully without any errors.
+          - Flush progress never stalls for more than a minute.
     """
     with TestRun.step("Prepare devices for cache and core."):
         cache_dev = TestRun.disks['cache']
@@ -177,14 +180,28 @@ def test_flush_over_640_gibibytes_raw_device(cache_mode):
 
     with TestRun.step(f"Check if dirty data exceeded {file_size * 0.98} GiB."):
         minimum_4KiB_blocks = int((file_size * 0.98).get_value(Unit.Blocks4096))
-        if int(cache.get_statistics().usage_stats.dirty) < minimum_4KiB_blocks:
+        dirty_data = cache.get_statistics().usage_stats.dirty
+        if int(dirty_data) < minimum_4KiB_blocks:
             TestRun.fail("There is not enough dirty data in the cache!")
 
-    with TestRun.step("Stop cache with flush."):
+    with TestRun.step("Stop cache with flush and record flush progress."):
         # this operation could take few hours, depending on core disk
-        output = TestRun.executor.run(stop_cmd(str(cache.cache_id)), timedelta(hours=12))
-        if output.exit_code != 0:
-            TestRun.fail(f"Stopping cache with flush failed!\n{output.stderr}")
+        recorder = FlushProgressRecorder(dirty_data, stall_threshold=timedelta(minutes=1))
+        check_progress_bar(
+            stop_cmd(str(cache.cache_id)), recorder=recorder, timeout=timedelta(hours=12)
+        )
+        if get_caches():
+            TestRun.fail("Stopping cache with flush failed!")
+
+    with TestRun.step("Check if flush progress never stalled for more than a minute."):
+        TestRun.LOGGER.info(
+            f"Flushed {dirty_data} in {recorder.duration}, "
+            f"average throughput: {recorder.get_average_throughput():.2f} MiB/s"
+        )
+        for start, duration in recorder.get_stalls():
+            TestRun.LOGGER.error(
+                f"No flush progress for {duration:.0f}s, {start:.0f}s after flush start."
+            )
 
 
 def check_disk_size(device: Device):
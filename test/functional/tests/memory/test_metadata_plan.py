@@ -0,0 +1,57 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import pytest
+
+from api.cas import casadm, casctl
+from api.cas.cache_config import CacheLineSize
+from core.test_run import TestRun
+from storage_devices.disk import DiskType, DiskTypeSet, DiskTypeLowerThan
+from type_def.size import Size, Unit
+
+cores_count = 4
+cache_size = Size(50, Unit.GibiByte)
+percentage_tolerance = 10
+
+
+@pytest.mark.parametrizex("cache_line_size", CacheLineSize)
+@pytest.mark.require_disk("cache", DiskTypeSet([DiskType.optane, DiskType.nand]))
+@pytest.mark.require_disk("core", DiskTypeLowerThan("cache"))
+def test_metadata_plan(cache_line_size):
+    """
+    title: Metadata footprint estimate accuracy
+    description: |
+      Compare metadata size estimated with 'casctl plan' for cache with added cores with
+      metadata memory footprint reported in cache statistics, metadata size on device and
+      metadata sections sizes printed to kernel log and memory footprint of cas_cache module.
+    pass_criteria:
+      - Metadata memory footprint and metadata size on device estimates are within tolerance
+      - Metadata sections sizes estimates are within tolerance
+      - Memory footprint estimate is within tolerance
+    """
+    with TestRun.step("Prepare cache and core devices"):
+        cache_disk = TestRun.disks["cache"]
+        cache_disk.create_partitions([cache_size])
+        cache_dev = cache_disk.partitions[0]
+
+        core_disk = TestRun.disks["core"]
+        core_disk.create_partitions([Size(1, Unit.GibiByte)] * cores_count)
+        core_devices = core_disk.partitions
+
+    with TestRun.step("Start cache and add cores"):
+        cache = casadm.start_cache(cache_dev, cache_line_size=cache_line_size, force=True)
+        for core_dev in core_devices:
+            cache.add_core(core_dev)
+
+    with TestRun.step("Compare metadata footprint estimate with reported values"):
+        for name, (estimated, reported) in casctl.compare_metadata_plan(cache).items():
+            message = f"{name}: estimated {estimated}, reported {reported}"
+            estimated_bytes = estimated.get_value(Unit.Byte)
+            reported_bytes = reported.get_value(Unit.Byte)
+            difference = abs(estimated_bytes - reported_bytes) / max(reported_bytes, 1) * 100
+            if difference > percentage_tolerance:
+                TestRun.LOGGER.error(message)
+            else:
+                TestRun.LOGGER.info(message)
@@ -18,6 +18,7 @@ from api.cas.cache_config import (
     FlushParametersAcp,
 )
 from api.cas.casadm_parser import get_caches, get_inactive_cores, get_detached_cores
+from api.cas.cli import remove_detached_cmd, remove_inactive_cmd
 from api.cas.cli_messages import (
     start_cache_with_existing_metadata,
     check_stderr_msg,
@@ -243,13 +244,16 @@ def stop_cache(
 
     cache_to_stop = random.choice(cache_list)
     inactive_cores = casadm_parser.get_inactive_cores(cache_id=cache_to_stop.cache_id)
-    for core in inactive_cores:
-        casadm_parser.get_inactive_cores(cache_id=cache_to_stop.cache_id)
-        cache_to_stop.remove_inactive_core(core_id=core.core_id)
-
     detached_cores = casadm_parser.get_detached_cores(cache_id=cache_to_stop.cache_id)
-    for core in detached_cores:
-        casadm.remove_detached(core_device=core)
+    with casadm.batch() as commands:
+        for core in inactive_cores:
+            commands.add(
+                remove_inactive_cmd(
+                    cache_id=str(cache_to_stop.cache_id), core_id=str(core.core_id)
+                )
+            )
+        for core in detached_cores:
+            commands.add(remove_detached_cmd(core_device=core.path))
 
     active_cores = cache_to_stop.get_cores()
     available_core_devices.extend(
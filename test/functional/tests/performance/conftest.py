@@ -3,12 +3,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 import os
 import json
 import pytest
 
 from utils.performance import PerfContainer, ConfigParameter, BuildTypes
+from utils.perf_results import PerfResultsStore, format_comparison
+from utils.raw_baseline import RawBaselineRegistry
+from utils.cpu_profiler import CpuProfiler, PROFILE_METHODS
 from core.test_run import TestRun
 from api.cas.casadm_parser import get_casadm_version
 
@@ -36,12 +39,93 @@ def perf_collector(request):
 
     perf_log_path = os.path.join(TestRun.LOGGER.base_dir, "perf.json")
 
+    result = container.to_serializable_dict()
     with open(perf_log_path, "w") as dump_file:
-        json.dump(container.to_serializable_dict(), dump_file, indent=4)
+        json.dump(result, dump_file, indent=4)
+
+    perf_db_path = request.config.getoption("--perf-db")
+    if perf_db_path:
+        store_perf_result(
+            result,
+            perf_db_path,
+            request.config.getoption("--build-type"),
+            request.config.getoption("--perf-tolerance"),
+            request.config.getoption("--perf-stddev-factor"),
+        )
+
+
+@pytest.fixture()
+def cpu_profiler(request, perf_collector):
+    # Profile is inserted into perf_collector, which is dumped after this fixture finishes
+    return CpuProfiler(request.config.getoption("--cpu-profile"), perf_collector)
+
+
+@pytest.fixture(scope="session")
+def raw_baseline(request):
+    return RawBaselineRegistry(
+        request.config.getoption("--raw-baseline-path"),
+        timedelta(hours=request.config.getoption("--raw-baseline-max-age")),
+    )
+
+
+def store_perf_result(
+    result: dict, perf_db_path: str, build_type: str, tolerance: float, stddev_factor: float
+):
+    with PerfResultsStore(perf_db_path) as store:
+        comparison = store.compare(result, tolerance=tolerance, stddev_factor=stddev_factor)
+        if comparison:
+            TestRun.LOGGER.info(
+                f"Comparison with master baseline:\n{format_comparison(comparison)}"
+            )
+        regressions = [item.metric for item in comparison if item.regression]
+        if regressions and build_type == "other":
+            TestRun.LOGGER.warning(f"Performance regression: {', '.join(regressions)}")
+        elif regressions:
+            TestRun.LOGGER.error(f"Performance regression: {', '.join(regressions)}")
+        if regressions:
+            # Regressing results would shift baseline towards the regression
+            TestRun.LOGGER.info("Results with regression are not stored in the database")
+            return
+        store.ingest(result)
 
 
 def pytest_addoption(parser):
     parser.addoption("--build-type", choices=BuildTypes, default="other")
+    parser.addoption(
+        "--perf-db",
+        default=None,
+        help="SQLite database to store performance results in and compare them against",
+    )
+    parser.addoption(
+        "--perf-tolerance",
+        type=float,
+        default=0.05,
+        help="Relative change of metric against baseline mean reported as regression",
+    )
+    parser.addoption(
+        "--perf-stddev-factor",
+        type=float,
+        default=3.0,
+        help="Number of baseline standard deviations metric has to change by to be reported"
+        " as regression",
+    )
+    parser.addoption(
+        "--cpu-profile",
+        choices=PROFILE_METHODS,
+        default=None,
+        help="Profile DUT CPU usage during measured workload with given method",
+    )
+    parser.addoption(
+        "--raw-baseline-path",
+        default=None,
+        help="JSON file to keep raw device results in between sessions",
+    )
+    parser.addoption(
+        "--raw-baseline-max-age",
+        type=float,
+        default=24,
+        help="Maximum age of reused raw device results [h]",
+    )
 
 
 def pytest_configure(config):
@@ -31,7 +31,9 @@ from utils.performance import WorkloadParameter
 @pytest.mark.parametrize("queue_depth", [1, 4, 16, 64, 256])
 @pytest.mark.parametrize("numjobs", [1, 4, 16, 64, 256])
 @pytest.mark.parametrize("cache_line_size", CacheLineSize)
-def test_4k_100p_hit_reads_wt(queue_depth, numjobs, cache_line_size, perf_collector, request):
+def test_4k_100p_hit_reads_wt(
+    queue_depth, numjobs, cache_line_size, perf_collector, cpu_profiler, request
+):
     """
     title: Test CAS performance in 100% Cache Hit scenario
     description: |
@@ -95,7 +97,8 @@ def test_4k_100p_hit_reads_wt(queue_depth, numjobs, cache_line_size, perf_collec
 
     with TestRun.step("Run workload on the exported object"):
         fio_cfg = fio_cfg.target(core)
-        cache_results = fio_cfg.run()[0]
+        with perf_collector.capture_cas_stats(cache), cpu_profiler.profile():
+            cache_results = fio_cfg.run()[0]
 
     perf_collector.insert_workload_param(numjobs, WorkloadParameter.NUM_JOBS)
     perf_collector.insert_workload_param(queue_depth, WorkloadParameter.QUEUE_DEPTH)
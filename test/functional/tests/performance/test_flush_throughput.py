@@ -0,0 +1,95 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from datetime import timedelta
+
+import pytest
+
+from api.cas import casadm
+from api.cas.cache_config import CacheLineSize, CacheMode, CleaningPolicy, SeqCutOffPolicy
+from api.cas.cli import flush_cache_cmd
+from api.cas.progress_bar import check_progress_bar, FlushProgressRecorder
+from core.test_run import TestRun
+from storage_devices.disk import DiskTypeSet, DiskTypeLowerThan, DiskType
+from test_tools.fio.fio import Fio
+from test_tools.fio.fio_param import IoEngine, ReadWrite
+from test_tools.udev import Udev
+from type_def.size import Size, Unit
+
+dirty_data_size = Size(16, Unit.GiB)
+stall_threshold = timedelta(seconds=30)
+
+
+@pytest.mark.os_dependent
+@pytest.mark.performance()
+@pytest.mark.require_disk("cache", DiskTypeSet([DiskType.optane, DiskType.nand]))
+@pytest.mark.require_disk("core", DiskTypeLowerThan("cache"))
+@pytest.mark.parametrize("cache_line_size", CacheLineSize)
+def test_flush_throughput(cache_line_size, perf_collector):
+    """
+    title: Cache flush throughput benchmark
+    description: |
+      Flush cache full of dirty data, record flush progress reported by casadm and store
+      flush throughput curve and stalls in performance results.
+    pass_criteria:
+      - Flush completes and no dirty data is left in cache
+      - There is no flush progress stall longer than 30 seconds
+    """
+    with TestRun.step("Prepare cache and core devices"):
+        cache_device = TestRun.disks["cache"]
+        cache_device.create_partitions([dirty_data_size + Size(1, Unit.GiB)])
+        cache_device = cache_device.partitions[0]
+
+        core_device = TestRun.disks["core"]
+        core_device.create_partitions([dirty_data_size])
+        core_device = core_device.partitions[0]
+
+    with TestRun.step("Start cache in WB mode with NOP cleaning policy and add core"):
+        cache = casadm.start_cache(
+            cache_device, CacheMode.WB, cache_line_size=cache_line_size, force=True
+        )
+        cache.set_cleaning_policy(CleaningPolicy.nop)
+        cache.set_seq_cutoff_policy(SeqCutOffPolicy.never)
+        core = cache.add_core(core_device)
+
+    with TestRun.step("Disable udev"):
+        Udev.disable()
+
+    with TestRun.step("Fill cache with dirty data"):
+        fio = (
+            Fio()
+            .create_command()
+            .target(core)
+            .io_engine(IoEngine.libaio)
+            .read_write(ReadWrite.write)
+            .block_size(Size(1, Unit.MiB))
+            .io_depth(16)
+            .direct()
+            .size(dirty_data_size)
+        )
+        fio.default_run_time = timedelta(hours=1)  # timeout for non-time-based fio
+        fio.run()
+        dirty_data = cache.get_statistics().usage_stats.dirty
+
+    with TestRun.step("Flush cache and record flush progress"):
+        recorder = FlushProgressRecorder(dirty_data, stall_threshold=stall_threshold)
+        check_progress_bar(
+            flush_cache_cmd(str(cache.cache_id)), recorder=recorder, timeout=timedelta(hours=2)
+        )
+
+    with TestRun.step("Check flush result"):
+        if cache.get_statistics().usage_stats.dirty != Size.zero():
+            TestRun.LOGGER.error("Dirty data left in cache after flush.")
+        TestRun.LOGGER.info(
+            f"Flushed {dirty_data} in {recorder.duration}, "
+            f"average throughput: {recorder.get_average_throughput():.2f} MiB/s"
+        )
+        for start, duration in recorder.get_stalls():
+            TestRun.LOGGER.error(
+                f"No flush progress for {duration:.0f}s, {start:.0f}s after flush start."
+            )
+
+    perf_collector.insert_flush_metrics_from_recorder(recorder)
+    perf_collector.insert_config_from_cache(cache)
@@ -0,0 +1,176 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import posixpath
+from datetime import timedelta
+
+import pytest
+
+from api.cas import casadm
+from api.cas.cache_config import CacheMode, CleaningPolicy, SeqCutOffPolicy
+from api.cas.ioclass_config import IoClass, IoClassConfig, MAX_IO_CLASS_ID
+from core.test_run import TestRun
+from storage_devices.disk import DiskTypeSet, DiskTypeLowerThan, DiskType
+from test_tools.fio.fio import Fio
+from test_tools.fio.fio_param import IoEngine, ReadWrite, CpusAllowedPolicy
+from test_tools.fs_tools import Filesystem, create_directory
+from test_tools.os_tools import get_dut_cpu_physical_cores
+from test_tools.udev import Udev
+from type_def.size import Size, Unit
+from utils.performance import ConfigParameter, WorkloadParameter
+
+mountpoint = "/mnt/cas"
+runtime = timedelta(seconds=60)
+ramp_time = timedelta(seconds=10)
+base_file_size = Size(32, Unit.MiB)
+# Inode-based rules of class N match only the file of class N, so classifier resolves
+# dentry of every request. Names contain zero-padded class ids, so name of one class is
+# never a prefix of name of another one (as "prefix1" would be of "prefix10"). IO is
+# buffered, because pages of direct IO are not mapped to any inode. Other rules never
+# match. There is no "done", so every rule is evaluated for every request.
+rule_types = {
+    "lba": lambda class_id: "lba:gt:18446744073709551614",
+    "request_size": lambda class_id: "request_size:lt:512",
+    "io_direction": lambda class_id: "io_direction:read",
+    "pid": lambda class_id: "pid:eq:0",
+    "process_name": lambda class_id: f"process_name:nonexistent_{get_name_id(class_id)}",
+    "metadata": lambda class_id: "metadata",
+    "file_size": lambda class_id: f"file_size:eq:{int(get_file_size(class_id).get_value())}",
+    "directory": lambda class_id: f"directory:{get_rule_directory(class_id)}",
+    "extension": lambda class_id: f"extension:ext{get_name_id(class_id)}",
+    "file_name_prefix": lambda class_id: f"file_name_prefix:prefix{get_name_id(class_id)}",
+    "compound": lambda class_id: (
+        f"request_size:lt:512&extension:ext{get_name_id(class_id)}|metadata"
+    ),
+}
+
+
+@pytest.mark.os_dependent
+@pytest.mark.performance()
+@pytest.mark.require_disk("cache", DiskTypeSet([DiskType.optane, DiskType.nand]))
+@pytest.mark.require_disk("core", DiskTypeLowerThan("cache"))
+@pytest.mark.parametrize("numjobs", [1, 8])
+@pytest.mark.parametrize("io_class_count", [1, 4, 8, 16, MAX_IO_CLASS_ID])
+@pytest.mark.parametrize("rule_type", rule_types.keys())
+def test_io_class_overhead(
+    rule_type, io_class_count, numjobs, perf_collector, cpu_profiler
+):
+    """
+    title: IO classification overhead benchmark
+    description: |
+      Measure 4K synchronous random write hit latency and IOPS on files of filesystem
+      on exported object with configured IO classes and compare them with the same
+      cache instance with only default IO class configured.
+    pass_criteria:
+      - always passes
+    """
+    testing_range = Size(3, Unit.GiB)
+
+    with TestRun.step("Prepare cache and core devices"):
+        cache_device = TestRun.disks["cache"]
+        cache_device.create_partitions([testing_range + Size(1, Unit.GiB)])
+        cache_device = cache_device.partitions[0]
+
+        core_device = TestRun.disks["core"]
+        core_device.create_partitions([testing_range])
+        core_device = core_device.partitions[0]
+
+    with TestRun.step("Configure cache and add core"):
+        cache = casadm.start_cache(cache_device, cache_mode=CacheMode.WB, force=True)
+        cache.set_seq_cutoff_policy(SeqCutOffPolicy.never)
+        cache.set_cleaning_policy(CleaningPolicy.nop)
+        core = cache.add_core(core_device)
+
+    with TestRun.step("Disable udev"):
+        Udev.disable()
+
+    with TestRun.step("Create filesystem on exported object and mount it"):
+        core.create_filesystem(Filesystem.ext4)
+        core.mount(mountpoint)
+
+    with TestRun.step(f"Create {io_class_count} files matching rules of subsequent IO classes"):
+        test_files = []
+        for class_id in range(1, io_class_count + 1):
+            create_directory(get_rule_directory(class_id))
+            test_files.append(get_file_path(class_id))
+            (
+                Fio()
+                .create_command()
+                .file_name(get_file_path(class_id))
+                .io_engine(IoEngine.libaio)
+                .block_size(Size(1, Unit.MiB))
+                .read_write(ReadWrite.write)
+                .size(get_file_size(class_id))
+                .direct()
+                .run()
+            )
+
+    fio_cfg = (
+        Fio()
+        .create_command()
+        .file_name(":".join(test_files))
+        .io_engine(IoEngine.sync)
+        .block_size(Size(4, Unit.KiB))
+        .read_write(ReadWrite.randwrite)
+        .sync()
+        .num_jobs(numjobs)
+        .cpus_allowed(get_dut_cpu_physical_cores())
+        .cpus_allowed_policy(CpusAllowedPolicy.split)
+        .time_based()
+        .ramp_time(ramp_time)
+        .run_time(runtime)
+    )
+
+    with TestRun.step("Load IO class configuration with default IO class only"):
+        IoClassConfig().load(cache.cache_id)
+
+    with TestRun.step("Run baseline workload on the files"):
+        baseline_results = fio_cfg.run()[0]
+
+    with TestRun.step(f"Load IO class configuration with {io_class_count} {rule_type} rules"):
+        ioclass_list = [
+            IoClass(class_id, rule_types[rule_type](class_id), priority=class_id)
+            for class_id in range(1, io_class_count + 1)
+        ]
+        IoClassConfig(ioclass_list).load(cache.cache_id)
+
+    with TestRun.step("Run workload on the files"):
+        with perf_collector.capture_cas_stats(cache), cpu_profiler.profile():
+            results = fio_cfg.run()[0]
+
+    with TestRun.step("Unmount exported object"):
+        core.unmount()
+
+    baseline_latency = baseline_results.job.write.clat_ns.mean
+    latency = results.job.write.clat_ns.mean
+    TestRun.LOGGER.info(
+        f"Average latency: {latency:.0f} ns (baseline {baseline_latency:.0f} ns), "
+        f"IOPS: {results.job.write.iops:.0f} (baseline {baseline_results.job.write.iops:.0f})"
+    )
+
+    perf_collector.insert_workload_param(numjobs, WorkloadParameter.NUM_JOBS)
+    perf_collector.insert_workload_param(1, WorkloadParameter.QUEUE_DEPTH)
+    perf_collector.insert_config_param(io_class_count, ConfigParameter.IO_CLASS_COUNT)
+    perf_collector.insert_config_param(rule_type, ConfigParameter.IO_CLASS_RULE_TYPE)
+    perf_collector.insert_baseline_exp_obj_metrics_from_fio_job(baseline_results)
+    perf_collector.insert_exp_obj_metrics_from_fio_job(results)
+    perf_collector.insert_config_from_cache(cache)
+
+
+def get_name_id(class_id: int):
+    return f"{class_id:0{len(str(MAX_IO_CLASS_ID))}d}"
+
+
+def get_rule_directory(class_id: int):
+    return posixpath.join(mountpoint, f"dir{get_name_id(class_id)}")
+
+
+def get_file_path(class_id: int):
+    name_id = get_name_id(class_id)
+    return posixpath.join(get_rule_directory(class_id), f"prefix{name_id}_file.ext{name_id}")
+
+
+def get_file_size(class_id: int):
+    return base_file_size + Size(class_id, Unit.Blocks4096)
@@ -0,0 +1,137 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from datetime import timedelta
+
+import pytest
+
+from api.cas import casadm
+from api.cas.cache_config import CacheMode, CleaningPolicy, SeqCutOffPolicy
+from api.cas.statistics import OperationType, set_latency_histograms
+from core.test_run import TestRun
+from storage_devices.disk import DiskTypeSet, DiskTypeLowerThan, DiskType
+from test_tools.fio.fio import Fio
+from test_tools.fio.fio_param import IoEngine, ReadWrite, CpusAllowedPolicy
+from test_tools.os_tools import get_dut_cpu_physical_cores
+from test_tools.udev import Udev
+from type_def.size import Size, Unit
+from utils.performance import ConfigParameter, WorkloadParameter
+from tests.performance.test_100p_hits import prefill_cache
+
+runtime = timedelta(seconds=60)
+ramp_time = timedelta(seconds=10)
+# Maximum relative degradation of mean latency and IOPS with histograms enabled
+max_overhead = 0.05
+
+
+@pytest.mark.os_dependent
+@pytest.mark.performance()
+@pytest.mark.require_disk("cache", DiskTypeSet([DiskType.optane, DiskType.nand]))
+@pytest.mark.require_disk("core", DiskTypeLowerThan("cache"))
+@pytest.mark.parametrize("queue_depth, numjobs", [(1, 1), (32, 8)])
+@pytest.mark.parametrize("read_write", [ReadWrite.randread, ReadWrite.randwrite])
+def test_latency_histogram_overhead(
+    read_write, queue_depth, numjobs, perf_collector, cpu_profiler
+):
+    """
+    title: Latency histograms overhead benchmark
+    description: |
+      Measure 4K random hit latency (QD1) and peak IOPS on exported object with latency
+      histograms enabled and compare them with the same workload with histograms disabled.
+    pass_criteria:
+      - Latency histograms account all requests of the workload
+      - Mean completion latency is at most 5% higher than baseline
+      - IOPS are at most 5% lower than baseline
+    """
+    testing_range = Size(3, Unit.GiB)
+    operation = OperationType.read if read_write == ReadWrite.randread else OperationType.write
+
+    with TestRun.step("Prepare cache and core devices"):
+        cache_device = TestRun.disks["cache"]
+        cache_device.create_partitions([testing_range + Size(1, Unit.GiB)])
+        cache_device = cache_device.partitions[0]
+
+        core_device = TestRun.disks["core"]
+        core_device.create_partitions([testing_range])
+        core_device = core_device.partitions[0]
+
+    with TestRun.step("Configure cache and add core"):
+        cache = casadm.start_cache(cache_device, cache_mode=CacheMode.WB, force=True)
+        cache.set_seq_cutoff_policy(SeqCutOffPolicy.never)
+        cache.set_cleaning_policy(CleaningPolicy.nop)
+        core = cache.add_core(core_device)
+
+    with TestRun.step("Disable udev"):
+        Udev.disable()
+
+    with TestRun.step("Prefill cache"):
+        prefill_cache(core)
+
+    fio_cfg = (
+        Fio()
+        .create_command()
+        .target(core)
+        .io_engine(IoEngine.libaio)
+        .block_size(Size(4, Unit.KiB))
+        .read_write(read_write)
+        .io_depth(queue_depth)
+        .num_jobs(numjobs)
+        .cpus_allowed(get_dut_cpu_physical_cores())
+        .cpus_allowed_policy(CpusAllowedPolicy.split)
+        .direct()
+        .time_based()
+        .ramp_time(ramp_time)
+        .run_time(runtime)
+    )
+
+    with TestRun.step("Run baseline workload with latency histograms disabled"):
+        set_latency_histograms(False)
+        baseline_results = fio_cfg.run()[0]
+
+    with TestRun.step("Run workload with latency histograms enabled"):
+        set_latency_histograms(True)
+        core.reset_latency_histograms()
+        try:
+            with perf_collector.capture_cas_stats(cache), cpu_profiler.profile():
+                results = fio_cfg.run()[0]
+            histograms = core.get_latency_histograms()
+        finally:
+            set_latency_histograms(False)
+
+    with TestRun.step("Check if latency histograms account all requests"):
+        # Histograms also account requests issued during fio ramp time
+        fio_job = getattr(results.job, operation.name)
+        histogram = histograms[operation]
+        if histogram.count < fio_job.total_ios:
+            TestRun.LOGGER.error(
+                f"Latency histogram accounted {histogram.count} {operation} requests, "
+                f"fio completed {fio_job.total_ios}"
+            )
+        TestRun.LOGGER.info(f"{operation} latency histogram: {histogram}")
+
+    with TestRun.step(f"Check if latency histograms overhead is below {max_overhead:.0%}"):
+        baseline_job = getattr(baseline_results.job, operation.name)
+        TestRun.LOGGER.info(
+            f"Average latency: {fio_job.clat_ns.mean:.0f} ns "
+            f"(baseline {baseline_job.clat_ns.mean:.0f} ns), "
+            f"IOPS: {fio_job.iops:.0f} (baseline {baseline_job.iops:.0f})"
+        )
+        if fio_job.clat_ns.mean > baseline_job.clat_ns.mean * (1 + max_overhead):
+            TestRun.LOGGER.error(
+                f"Average latency with latency histograms is more than {max_overhead:.0%} "
+                f"higher than baseline"
+            )
+        if fio_job.iops < baseline_job.iops * (1 - max_overhead):
+            TestRun.LOGGER.error(
+                f"IOPS with latency histograms are more than {max_overhead:.0%} "
+                f"lower than baseline"
+            )
+
+    perf_collector.insert_workload_param(numjobs, WorkloadParameter.NUM_JOBS)
+    perf_collector.insert_workload_param(queue_depth, WorkloadParameter.QUEUE_DEPTH)
+    perf_collector.insert_config_param(True, ConfigParameter.LATENCY_HISTOGRAMS)
+    perf_collector.insert_baseline_exp_obj_metrics_from_fio_job(baseline_results)
+    perf_collector.insert_exp_obj_metrics_from_fio_job(results)
+    perf_collector.insert_config_from_cache(cache)
@@ -47,7 +47,7 @@ def fill_cas_cache(target, bs):
 )
 @pytest.mark.parametrizex("queue_depth", [1, 16, 32])
 @pytest.mark.parametrizex("cache_line_size", CacheLineSize)
-def test_performance_read_hit_wt(cache_line_size, block_size, queue_depth):
+def test_performance_read_hit_wt(cache_line_size, block_size, queue_depth, raw_baseline):
     """
     title: Test CAS reads performance for write-through mode.
     description: |
@@ -62,6 +62,7 @@ def test_performance_read_hit_wt(cache_line_size, block_size, queue_depth):
     num_jobs = [int(processors_number / 2), processors_number]
     data_size = Size(20, Unit.GibiByte)
     cache_size = Size(24, Unit.GibiByte)
+    run_time = timedelta(seconds=450)
 
     fio_command = (
         Fio()
@@ -74,7 +75,7 @@ def test_performance_read_hit_wt(cache_line_size, block_size, queue_depth):
         .block_size(block_size)
         .io_depth(queue_depth)
         .file_size(data_size)
-        .run_time(timedelta(seconds=450))
+        .run_time(run_time)
     )
 
     with TestRun.step("Prepare partitions for cache and core"):
@@ -87,12 +88,13 @@ def test_performance_read_hit_wt(cache_line_size, block_size, queue_depth):
         core_part = core_device.partitions[0]
 
     with TestRun.step("Measure read performance (throughput and latency) on raw disk."):
-        fio_command.target(cache_part)
         raw_disk_results = {}
 
         for nj in num_jobs:
             fio_command.num_jobs(nj)
-            raw_disk_results[nj] = fio_command.run().pop()
+            raw_disk_results[nj] = raw_baseline.run(
+                fio_command, cache_device, cache_part, run_time
+            ).pop()
             TestRun.LOGGER.info(str(raw_disk_results[nj]))
 
     with TestRun.step("Start cache and add core device"):
@@ -163,7 +165,7 @@ def test_performance_read_hit_wt(cache_line_size, block_size, queue_depth):
 )
 @pytest.mark.parametrizex("queue_depth", [1, 16, 32])
 @pytest.mark.parametrizex("cache_line_size", CacheLineSize)
-def test_performance_read_hit_wb(cache_line_size, block_size, queue_depth):
+def test_performance_read_hit_wb(cache_line_size, block_size, queue_depth, raw_baseline):
     """
     title: Test CAS read/write hit performance for write-back mode.
     description: |
@@ -177,6 +179,7 @@ def test_performance_read_hit_wb(cache_line_size, block_size, queue_depth):
     num_jobs = [int(processors_number / 2), processors_number]
     data_size = Size(20, Unit.GibiByte)
     cache_size = Size(24, Unit.GibiByte)
+    run_time = timedelta(seconds=450)
 
     fio_command = (
         Fio()
@@ -190,7 +193,7 @@ def test_performance_read_hit_wb(cache_line_size, block_size, queue_depth):
         .block_size(block_size)
         .io_depth(queue_depth)
         .file_size(data_size)
-        .run_time(timedelta(seconds=450))
+        .run_time(run_time)
     )
 
     with TestRun.step("Prepare partitions for cache and core"):
@@ -203,12 +206,13 @@ def test_performance_read_hit_wb(cache_line_size, block_size, queue_depth):
         core_part = core_device.partitions[0]
 
     with TestRun.step("Measure read/write performance (throughput and latency) on raw disk."):
-        fio_command.target(cache_part)
         raw_disk_results = {}
 
         for nj in num_jobs:
             fio_command.num_jobs(nj)
-            raw_disk_results[nj] = fio_command.run().pop()
+            raw_disk_results[nj] = raw_baseline.run(
+                fio_command, cache_device, cache_part, run_time
+            ).pop()
             TestRun.LOGGER.info(str(raw_disk_results[nj]))
 
     with TestRun.step("Start cache and add core device"):
@@ -28,7 +28,7 @@ from type_def.size import Unit, Size
     "block_size", [Size(1, Unit.Blocks4096), Size(8, Unit.Blocks4096)]
 )
 @pytest.mark.parametrizex("queue_depth", [1, 16, 32])
-def test_performance_write_insert_wb(block_size, queue_depth):
+def test_performance_write_insert_wb(block_size, queue_depth, raw_baseline):
     """
     title: Test Open CAS performance for 100% write inserts scenario in write-back mode.
     description: |
@@ -44,6 +44,7 @@ def test_performance_write_insert_wb(block_size, queue_depth):
     data_size = Size(20, Unit.GibiByte)
     cache_size = Size(24, Unit.GibiByte)
     cache_line_size = CacheLineSize.LINE_4KiB
+    run_time = timedelta(seconds=450)
     raw_disk_results = {}
     cas_results = {}
 
@@ -56,7 +57,7 @@ def test_performance_write_insert_wb(block_size, queue_depth):
         .io_engine(IoEngine.libaio)
         .cpus_allowed(get_dut_cpu_physical_cores())
         .cpus_allowed_policy(CpusAllowedPolicy.split)
-        .run_time(timedelta(seconds=450))
+        .run_time(run_time)
         .block_size(block_size)
         .io_depth(queue_depth)
     )
@@ -83,7 +84,9 @@ def test_performance_write_insert_wb(block_size, queue_depth):
                 job.file_size((i + 1) * offset)
                 job.offset(i * offset)
 
-            raw_disk_results[nj] = fio_command.run().pop()
+            raw_disk_results[nj] = raw_baseline.run(
+                fio_command, cache_device, cache_part, run_time
+            ).pop()
             TestRun.LOGGER.info(str(raw_disk_results[nj]))
             fio_command.clear_jobs()
 
@@ -10,14 +10,19 @@ import posixpath
 import yaml
 
 from collections import namedtuple
-from typing import List
+from itertools import islice
+from typing import Callable, Iterable, List, Tuple
 
 from api.cas import casadm
 from api.cas.cache_config import CacheMode, CacheLineSize, KernelParameters, CleaningPolicy
+from connection.utils.output import CmdException, Output
 from core.test_run import TestRun
 from test_tools.fs_tools import Filesystem
 from type_def.size import Size, Unit
 
+# Number of fuzzed commands executed on DUT with a single executor call
+FUZZ_CHUNK_SIZE = 100
+
 
 def get_fuzz_config(config_name: str):
     with open(posixpath.join(os.path.dirname(__file__), f"../../config/{config_name}")) as cfg:
@@ -87,6 +92,80 @@ def run_cmd_and_validate(cmd, value_name: str, is_valid: bool):
     TestRun.LOGGER.info(f"Executed (encoded) command: {encoded_command}")
     output = TestRun.executor.run(encoded_command)
 
+    validate_output(cmd, output, is_valid)
+
+    return output
+
+
+def run_cmds_and_validate(cmds, value_name: str, is_valid: Callable[[bytes], bool]):
+    """
+    Run a chunk of fuzzed commands with a single executor call and validate each of them.
+    Commands are executed sequentially on the DUT and each of them reports its result
+    in a separate line, so results of commands run before a crash are still validated.
+    If the chunk crashes, CmdException with index and text of the failing command is raised.
+    """
+    cmds = list(cmds)
+    for cmd in cmds:
+        TestRun.LOGGER.info(f"{value_name}: {cmd.param}")
+        TestRun.LOGGER.info(f"Command: {cmd.command}")
+
+    output, outputs = _run_chunk_on_dut(cmds)
+    for cmd, cmd_output in zip(cmds, outputs):
+        validate_output(cmd, cmd_output, is_valid(cmd.param))
+
+    if len(outputs) != len(cmds):
+        failed_cmd = cmds[len(outputs)]
+        raise CmdException(
+            f"Chunk of fuzzed commands crashed at command {len(outputs)} "
+            f"({value_name}: {failed_cmd.param}): {failed_cmd.command}",
+            output,
+        )
+
+    return outputs
+
+
+def _run_chunk_on_dut(cmds) -> Tuple[Output, List[Output]]:
+    results_dir = posixpath.join(TestRun.TEST_RUN_DATA_PATH, "fuzzy_chunk")
+    script = [f"mkdir -p {results_dir}"]
+    for index, cmd in enumerate(cmds):
+        encoded_command = base64.b64encode(cmd.command).decode("ascii")
+        script += [
+            f"echo {encoded_command} | base64 --decode | sh "
+            f'>"{results_dir}/out" 2>"{results_dir}/err"',
+            "rc=$?",
+            f'echo "{index} $rc $(base64 -w0 {results_dir}/out) '
+            f'$(base64 -w0 {results_dir}/err)"',
+        ]
+    script += [f"rm -rf {results_dir}"]
+
+    encoded_script = base64.b64encode("\n".join(script).encode("ascii")).decode("ascii")
+    output = TestRun.executor.run(
+        f'bash -c "$(echo {encoded_script} | base64 --decode)" < /dev/null'
+    )
+
+    outputs = []
+    for line in output.stdout.splitlines():
+        fields = line.split(" ")
+        if len(fields) != 4 or fields[0] != str(len(outputs)):
+            continue
+        outputs.append(
+            Output(
+                base64.b64decode(fields[2]).decode("utf-8", errors="ignore").rstrip(),
+                base64.b64decode(fields[3]).decode("utf-8", errors="ignore").rstrip(),
+                int(fields[1]),
+            )
+        )
+
+    return output, outputs
+
+
+def split_into_chunks(cmds: Iterable, chunk_size: int = FUZZ_CHUNK_SIZE):
+    cmds = iter(cmds)
+    while chunk := list(islice(cmds, chunk_size)):
+        yield chunk
+
+
+def validate_output(cmd, output: Output, is_valid: bool):
     if output.exit_code == 0 and not is_valid:
         TestRun.LOGGER.error(
             f"{cmd.param} value is not valid\n"
@@ -101,8 +180,6 @@ def run_cmd_and_validate(cmd, value_name: str, is_valid: bool):
             f"stderr: {output.stderr}"
         )
 
-    return output
-
 
 def get_cmd(command, param):
     FuzzedCommand = namedtuple("Command", ["param", "command"])
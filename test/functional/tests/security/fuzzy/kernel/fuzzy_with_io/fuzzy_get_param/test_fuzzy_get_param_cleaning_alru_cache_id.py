@@ -21,7 +21,8 @@ from test_tools.peach_fuzzer.peach_fuzzer import PeachFuzzer
 from tests.security.fuzzy.kernel.common.common import (
     get_fuzz_config,
     prepare_cas_instance,
-    run_cmd_and_validate,
+    run_cmds_and_validate,
+    split_into_chunks,
 )
 from tests.security.fuzzy.kernel.fuzzy_with_io.common.common import (
     get_basic_workload,
@@ -73,15 +74,16 @@ def test_fuzzy_get_param_cleaning_alru_cache_id(
             command_template=base_cmd, count=TestRun.usr.fuzzy_iter_count
         )
 
-    for index, cmd in TestRun.iteration(
-        enumerate(commands), f"Run command {TestRun.usr.fuzzy_iter_count} times"
+    for index, chunk in TestRun.iteration(
+        enumerate(split_into_chunks(commands)),
+        f"Run command {TestRun.usr.fuzzy_iter_count} times",
     ):
-        with TestRun.step(f"Iteration {index + 1}"):
+        with TestRun.step(f"Chunk {index + 1}"):
             if not TestRun.executor.check_if_process_exists(fio_pid):
                 raise Exception("Fio is not running.")
 
-            run_cmd_and_validate(
-                cmd=cmd,
+            run_cmds_and_validate(
+                cmds=chunk,
                 value_name="Cache id",
-                is_valid=cmd.param in valid_values,
+                is_valid=lambda param: param in valid_values,
             )
@@ -10,7 +10,7 @@ import pytest
 from api.cas import casadm
 from api.cas.cache_config import CacheMode, CleaningPolicy, CacheModeTrait
 from api.cas.casadm import StatsFilter
-from api.cas.statistics import get_stats_dict, get_stat_value, OperationType
+from api.cas.statistics import get_stats_dict, get_stat_values, OperationType
 from core.test_run import TestRun
 from storage_devices.disk import DiskType, DiskTypeSet, DiskTypeLowerThan
 from test_tools.dd import Dd
@@ -88,11 +88,8 @@ def test_block_stats_write_miss(cache_mode: CacheMode):
 
                 # Check cache stats after write operation
                 fail = False
-                for key, value in cache_stats.items():
-                    if key.endswith('[%]'):
-                        continue
-                    stat = get_stat_value(cache_stats, key)
-                    if any(key.startswith(s) for s in expected_zero_stats):
+                for key, stat in get_stat_values(cache_stats).items():
+                    if key in expected_zero_stats:
                         if stat != Size.zero():
                             TestRun.LOGGER.error(f"{key} has non-zero value of {stat}")
                             fail = True
@@ -110,11 +107,8 @@ def test_block_stats_write_miss(cache_mode: CacheMode):
                     )
 
                 # Check per-core stats
-                for key, value in core_stats.items():
-                    if key.endswith('[%]'):
-                        continue
-                    stat = get_stat_value(core_stats, key)
-                    if any(key.startswith(s) for s in expected_zero_stats):
+                for key, stat in get_stat_values(core_stats).items():
+                    if key in expected_zero_stats:
                         if stat != Size.zero():
                             TestRun.LOGGER.error(f"{key} has non-zero value of {stat}")
                             fail = True
@@ -197,11 +191,8 @@ def test_block_stats_read_miss(cache_mode: CacheMode):
 
                 # Check cache stats after read operation
                 fail = False
-                for key, value in cache_stats.items():
-                    if key.endswith('[%]'):
-                        continue
-                    stat = get_stat_value(cache_stats, key)
-                    if any(key.startswith(s) for s in expected_zero_stats):
+                for key, stat in get_stat_values(cache_stats).items():
+                    if key in expected_zero_stats:
                         if stat != Size.zero():
                             TestRun.LOGGER.error(f"{key} has non-zero value of {stat}")
                             fail = True
@@ -219,11 +210,8 @@ def test_block_stats_read_miss(cache_mode: CacheMode):
                     )
 
                 # Check per-core stats
-                for key, value in core_stats.items():
-                    if key.endswith('[%]'):
-                        continue
-                    stat = get_stat_value(core_stats, key)
-                    if any(key.startswith(s) for s in expected_zero_stats):
+                for key, stat in get_stat_values(core_stats).items():
+                    if key in expected_zero_stats:
                         if stat != Size.zero():
                             TestRun.LOGGER.error(f"{key} has non-zero value of {stat}")
                             fail = True
@@ -244,19 +232,19 @@ def test_block_stats_read_miss(cache_mode: CacheMode):
 def get_expected_zero_stats(cache_mode: CacheMode, direction: OperationType):
     traits = CacheMode.get_traits(cache_mode)
 
-    stat_list = ["Reads from cache"]
+    stat_list = ["reads_from_cache"]
     if direction == OperationType.write:
-        stat_list.append("Reads from core")
-        stat_list.append("Reads from exported object")
+        stat_list.append("reads_from_core")
+        stat_list.append("reads_from_exported_object")
     if direction == OperationType.read or CacheModeTrait.LazyWrites in traits:
-        stat_list.append("Writes to core")
+        stat_list.append("writes_to_core")
     if direction == OperationType.read:
-        stat_list.append("Writes to exported object")
+        stat_list.append("writes_to_exported_object")
     if ((direction == OperationType.read and CacheModeTrait.InsertRead not in traits)
             or (direction == OperationType.write and CacheModeTrait.InsertWrite not in traits)):
-        stat_list.append("Writes to cache")
-        stat_list.append("Total to/from cache")
+        stat_list.append("writes_to_cache")
+        stat_list.append("total_to_from_cache")
     if direction == OperationType.write and CacheModeTrait.LazyWrites in traits:
-        stat_list.append("Total to/from core")
+        stat_list.append("total_to_from_core")
 
     return stat_list
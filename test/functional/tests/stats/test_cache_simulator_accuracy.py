@@ -0,0 +1,96 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import posixpath
+
+import pytest
+
+from api.cas import casadm
+from api.cas.cache_config import CacheMode, CleaningPolicy, SeqCutOffPolicy
+from core.test_run import TestRun
+from storage_devices.disk import DiskTypeSet, DiskTypeLowerThan, DiskType
+from test_tools.fio.fio import Fio
+from test_tools.fio.fio_param import IoEngine, ReadWrite
+from test_tools.udev import Udev
+from type_def.size import Size, Unit
+from utils.cache_simulator import CacheSimulator, Trace
+
+cache_size = Size(256, Unit.MebiByte)
+core_size = Size(1, Unit.GibiByte)
+# Maximum relative difference between simulated and measured statistic
+tolerance = 0.05
+
+
+@pytest.mark.parametrizex("cache_mode", [CacheMode.WT, CacheMode.WB])
+@pytest.mark.require_disk("cache", DiskTypeSet([DiskType.optane, DiskType.nand]))
+@pytest.mark.require_disk("core", DiskTypeLowerThan("cache"))
+def test_cache_simulator_accuracy(cache_mode):
+    """
+    title: Cache simulator accuracy
+    description: |
+      Replay trace of workload run on exported object in cache simulator and compare
+      simulated statistics with cache statistics.
+    pass_criteria:
+      - Simulated request and block statistics differ from cache statistics by less than 5%
+    """
+    with TestRun.step("Prepare cache and core devices"):
+        cache_device = TestRun.disks["cache"]
+        cache_device.create_partitions([cache_size])
+        cache_device = cache_device.partitions[0]
+
+        core_device = TestRun.disks["core"]
+        core_device.create_partitions([core_size])
+        core_device = core_device.partitions[0]
+
+    with TestRun.step("Disable udev"):
+        Udev.disable()
+
+    with TestRun.step(f"Start cache in {cache_mode} mode with NOP cleaning policy and add core"):
+        cache = casadm.start_cache(cache_device, cache_mode=cache_mode, force=True)
+        cache.set_cleaning_policy(CleaningPolicy.nop)
+        cache.set_seq_cutoff_policy(SeqCutOffPolicy.never)
+        core = cache.add_core(core_device)
+        cache.reset_counters()
+
+    with TestRun.step("Run random workload larger than cache and record its trace"):
+        iolog_path = posixpath.join(TestRun.TEST_RUN_DATA_PATH, "simulator_iolog")
+        (
+            Fio()
+            .create_command()
+            .target(core)
+            .io_engine(IoEngine.libaio)
+            .read_write(ReadWrite.randrw)
+            .write_percentage(30)
+            .block_size(Size(4, Unit.KibiByte))
+            .io_depth(1)
+            .direct()
+            .io_size(core_size * 2)
+            .set_param("write_iolog", iolog_path)
+            .run()
+        )
+        cache_stats = cache.get_statistics()
+
+    with TestRun.step("Replay trace in cache simulator"):
+        iolog = TestRun.executor.run(f"cat {iolog_path}").stdout
+        simulator = CacheSimulator(
+            cache_size=cache.size,
+            cache_line_size=cache.get_cache_line_size(),
+            cache_mode=cache_mode,
+        )
+        simulator.replay(Trace.parse_fio_iolog(iolog))
+
+    with TestRun.step("Compare simulated statistics with cache statistics"):
+        comparison = simulator.get_stats().compare_with_cache_stats(cache_stats)
+        for name, (simulated, measured) in comparison.items():
+            message = f"{name}: simulated {simulated}, measured {measured}"
+            if measured == 0 or simulated == 0:
+                # Relative difference is meaningless, both values have to be 0
+                accurate = simulated == measured
+            else:
+                accurate = abs(simulated - measured) / measured <= tolerance
+            if accurate:
+                TestRun.LOGGER.info(message)
+            else:
+                TestRun.LOGGER.error(message)
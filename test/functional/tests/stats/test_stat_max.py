@@ -11,7 +11,7 @@ from time import sleep
 from api.cas import casadm
 from api.cas.cache_config import CacheMode, CleaningPolicy
 from api.cas.casadm import StatsFilter
-from api.cas.statistics import get_stats_dict, get_stat_value
+from api.cas.statistics import get_stats_dict, get_stat_values
 from core.test_run import TestRun
 from storage_devices.disk import DiskType, DiskTypeSet, DiskTypeLowerThan
 from test_tools.fio.fio import Fio
@@ -159,16 +159,12 @@ def fio_prepare():
 
 
 def stats_compare(cache_stats, cores_stats, cores_per_cache, fail_message):
+    cache_stats = get_stat_values(cache_stats)
+    cores_stats = [get_stat_values(core_stats) for core_stats in cores_stats]
     for stat_name in cache_stats.keys():
-        if stat_name.startswith("Free ") or stat_name.endswith("[%]"):
+        if stat_name == "free":
             continue
         core_stat_sum = 0
-        try:
-            cache_stats[stat_name] = get_stat_value(cache_stats, stat_name)
-            for j in range(cores_per_cache):
-                cores_stats[j][stat_name] = get_stat_value(cores_stats[j], stat_name)
-        except AttributeError:
-            pass
         for j in range(cores_per_cache):
             core_stat_sum += cores_stats[j][stat_name]
         if core_stat_sum != cache_stats[stat_name]:
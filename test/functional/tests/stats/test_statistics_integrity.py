@@ -11,7 +11,7 @@ from time import sleep
 from api.cas import casadm
 from api.cas.cache_config import CacheMode, CacheModeTrait
 from api.cas.casadm import StatsFilter
-from api.cas.statistics import get_stats_dict, get_stat_value
+from api.cas.statistics import get_stats_dict, get_stat_values
 from core.test_run import TestRun
 from storage_devices.disk import DiskType, DiskTypeSet, DiskTypeLowerThan
 from test_tools.fio.fio import Fio
@@ -134,19 +134,13 @@ def get_stats(stat_filter, cores, cache=None):
         ) for j in range(cores_per_cache)
     ]
     cores_stats_perc = [
-        {k: get_stat_value(cores_stats[j], k) for k in cores_stats[j] if k.endswith("[%]")}
-        for j in range(cores_per_cache)
-    ]
-    cores_stats_values = [
-        {k: get_stat_value(cores_stats[j], k) for k in cores_stats[j] if not k.endswith("[%]")}
-        for j in range(cores_per_cache)
+        get_stat_values(cores_stats[j], percentage_val=True) for j in range(cores_per_cache)
     ]
+    cores_stats_values = [get_stat_values(cores_stats[j]) for j in range(cores_per_cache)]
 
     if cache:
         cache_stats = get_stats_dict(filter=stat_filter, cache_id=cache.cache_id)
-        cache_stats_values = {
-            k: get_stat_value(cache_stats, k) for k in cache_stats if not k.endswith("[%]")
-        }
+        cache_stats_values = get_stat_values(cache_stats)
         return cores_stats_values, cores_stats_perc, cache_stats_values
     else:
         return cores_stats_values, cores_stats_perc
@@ -161,7 +155,7 @@ def check_stats_initial(caches, cores):
                     stat_value = stat_value.value
                 except AttributeError:
                     pass
-                if stat_name.startswith("Free"):
+                if stat_name == "free":
                     if stat_value != caches[i].size.value:
                         TestRun.LOGGER.error(
                             f"For core device {cores[i][j].path} "
@@ -172,7 +166,7 @@ def check_stats_initial(caches, cores):
                         f"For core device {cores[i][j].path} value for "
                         f"'{stat_name}' is {stat_value}, should equal 0\n")
             for stat_name, stat_value in cores_stats_perc[j].items():
-                if stat_name.startswith("Free"):
+                if stat_name == "free":
                     if stat_value != 100:
                         TestRun.LOGGER.error(
                             f"For core device {cores[i][j].path} percentage value "
@@ -222,7 +216,7 @@ def check_stats_sum(caches, cores):
             get_stats(stat_filter=default_stat_filter, cores=cores[i], cache=caches[i])
         )
         for stat_name in cache_stats.keys():
-            if stat_name.startswith("Free"):
+            if stat_name == "free":
                 continue
             core_stat_sum = 0
             try:
@@ -0,0 +1,71 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import pytest
+
+from api.cas import casadm
+from api.cas.cache_config import CacheMode, CleaningPolicy, SeqCutOffPolicy
+from api.cas.statistics import stream_statistics
+from core.test_run import TestRun
+from storage_devices.disk import DiskType, DiskTypeSet, DiskTypeLowerThan
+from test_tools.fio.fio import Fio
+from test_tools.fio.fio_param import IoEngine, ReadWrite
+from type_def.size import Size, Unit
+
+cores_count = 2
+
+
+@pytest.mark.require_disk("cache", DiskTypeSet([DiskType.optane, DiskType.nand]))
+@pytest.mark.require_disk("core", DiskTypeLowerThan("cache"))
+def test_stats_all_cores():
+    """
+    title: Statistics of all cores in single call
+    description: |
+      Run different workloads on two cores and get statistics of all cores of cache
+      with '--core-id' without ID, both once and in interval mode.
+    pass_criteria:
+      - Statistics are returned for all cores of cache
+      - Statistics of every core match statistics of this core printed separately
+    """
+    with TestRun.step("Prepare cache and core devices"):
+        cache_device = TestRun.disks["cache"]
+        cache_device.create_partitions([Size(1, Unit.GibiByte)])
+        core_device = TestRun.disks["core"]
+        core_device.create_partitions([Size(1, Unit.GibiByte)] * cores_count)
+
+    with TestRun.step("Start cache in WT mode and add cores"):
+        cache = casadm.start_cache(cache_device.partitions[0], CacheMode.WT, force=True)
+        cache.set_cleaning_policy(CleaningPolicy.nop)
+        cache.set_seq_cutoff_policy(SeqCutOffPolicy.never)
+        cores = [cache.add_core(part) for part in core_device.partitions]
+
+    with TestRun.step("Run workloads of different size on each core"):
+        for i, core in enumerate(cores):
+            (
+                Fio()
+                .create_command()
+                .target(core)
+                .io_engine(IoEngine.libaio)
+                .read_write(ReadWrite.randrw)
+                .block_size(Size(4, Unit.KibiByte))
+                .direct()
+                .io_size(Size(64 * (i + 1), Unit.MebiByte))
+                .run()
+            )
+
+    with TestRun.step("Get statistics of all cores"):
+        cores_stats = cache.get_cores_statistics()
+        [snapshot] = list(stream_statistics(cache.cache_id, count=1, all_cores=True))
+
+    with TestRun.step("Compare statistics of all cores with statistics of each core"):
+        for name, stats in [("single call", cores_stats), ("interval mode", snapshot.stats)]:
+            if sorted(stats) != sorted(core.core_id for core in cores):
+                TestRun.fail(f"Statistics in {name} returned for cores {sorted(stats)}")
+            for core in cores:
+                if stats[core.core_id] != core.get_statistics():
+                    TestRun.LOGGER.error(
+                        f"Statistics of core {core.core_id} in {name} don't match "
+                        f"statistics printed for this core:\n{stats[core.core_id]}"
+                    )
@@ -0,0 +1,11 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from utils.cache_simulator.cleaning import CleaningSimulator, get_write_rates, tune_cleaning_policy
+from utils.cache_simulator.metadata import CacheMetadata
+from utils.cache_simulator.seq_cutoff import SeqCutoffDetector
+from utils.cache_simulator.seq_cutoff_sweep import SweepResult, sweep_seq_cutoff
+from utils.cache_simulator.simulator import CacheSimulator, Sample, SimulationStats
+from utils.cache_simulator.trace import Trace
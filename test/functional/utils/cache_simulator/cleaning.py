@@ -0,0 +1,255 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import itertools
+import math
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from api.cas.cache_config import (
+    CacheLineSize,
+    CleaningPolicy,
+    FlushParametersAcp,
+    FlushParametersAlru,
+)
+from type_def.size import Size, Unit
+from type_def.time import Time
+
+CleaningResult = namedtuple(
+    "CleaningResult",
+    ["params", "max_dirty_ratio", "mean_dirty_ratio", "core_load", "busy_core_load"],
+)
+
+
+def get_write_rates(cache_stats_samples: list, interval: float) -> list:
+    """
+    Returns write rates in bytes per second between consecutive CacheStats gathered every
+    interval seconds. Writes to exported object are taken, in WB mode all of them become dirty.
+    """
+    writes = [
+        stats.block_stats.exp_obj.writes.get_value(Unit.Byte) for stats in cache_stats_samples
+    ]
+    return [(current - previous) / interval for previous, current in zip(writes, writes[1:])]
+
+
+class CleaningSimulator:
+    """
+    Fluid model of dirty data in WB cache cleaned by ALRU or ACP cleaning policy.
+    Input is a write rate time series, every written byte is assumed to dirty a clean cache
+    line (no rewrites), so the model is pessimistic for workloads with hot data.
+    Dirty data is tracked as a queue of (dirty since, lines) buckets, so ALRU staleness
+    can be honored. When there is no space for new dirty data, lines are flushed on eviction.
+
+    ALRU cleaner wakes up every wake_up_time and cleans only when there was no IO for
+    activity_threshold. Then it flushes up to flush_max_buffers lines older than
+    staleness_time, as fast as core allows, and sleeps wake_up_time.
+    ACP cleaner ignores IO activity, it flushes flush_max_buffers lines per pass and sleeps
+    wake_up_time between passes.
+    """
+
+    def __init__(
+        self,
+        cache_size: Size,
+        core_bandwidth: Size,
+        cache_line_size: CacheLineSize = CacheLineSize.DEFAULT,
+        resolution: float = 0.1,
+    ):
+        self.line_size = cache_line_size.value.get_value(Unit.Byte)
+        self.lines_count = int(cache_size.get_value(Unit.Byte) // self.line_size)
+        # Core bandwidth in cache lines per second
+        self.core_bandwidth = core_bandwidth.get_value(Unit.Byte) / self.line_size
+        self.resolution = resolution
+
+    def simulate(self, policy: CleaningPolicy, params, write_rates: list, interval: float):
+        """
+        Runs simulation of write_rates (bytes per second, one value per interval seconds)
+        with given FlushParametersAlru or FlushParametersAcp and returns CleaningResult.
+        """
+        if policy not in [CleaningPolicy.alru, CleaningPolicy.acp]:
+            raise ValueError(f"Cleaning policy {policy} is not supported")
+
+        if policy == CleaningPolicy.alru:
+            wake_up_time = params.wake_up_time.total_seconds()
+            activity_threshold = params.activity_threshold.total_seconds()
+            staleness_time = params.staleness_time.total_seconds()
+        else:
+            wake_up_time = params.wake_up_time.total_seconds()
+            # ACP cleans regardless of IO activity and data age
+            activity_threshold = 0
+            staleness_time = 0
+            pass_time = params.flush_max_buffers / self.core_bandwidth
+            acp_rate = params.flush_max_buffers / (pass_time + wake_up_time)
+
+        step = min(self.resolution, interval)
+        steps_per_sample = max(1, round(interval / step))
+        step = interval / steps_per_sample
+
+        dirty_buckets = deque()
+        dirty = 0.0
+        cleaned = 0.0
+        busy_cleaned = 0.0
+        busy_time = 0.0
+        dirty_ratio_sum = 0.0
+        max_dirty_ratio = 0.0
+        last_io = -math.inf
+        cleaning = False
+        pass_budget = 0.0
+        next_wake_up = 0.0
+        now = 0.0
+
+        for write_rate in write_rates:
+            new_dirty = write_rate * step / self.line_size
+            for _ in range(steps_per_sample):
+                active = new_dirty > 0
+                if active:
+                    last_io = now
+                    busy_time += step
+
+                # Lines flushed synchronously on eviction when cache is full of dirty data
+                evicted = max(0.0, dirty + new_dirty - self.lines_count)
+                flushed = self._clean(dirty_buckets, evicted, now, 0) if evicted else 0.0
+                dirty -= flushed
+                if new_dirty:
+                    dirty_buckets.append([now, new_dirty])
+                    dirty += new_dirty
+
+                if policy == CleaningPolicy.alru:
+                    idle = now - last_io >= activity_threshold and not active
+                    if cleaning and not idle:
+                        cleaning = False
+                        next_wake_up = now + wake_up_time
+                    elif not cleaning and idle and now >= next_wake_up:
+                        cleaning = True
+                        pass_budget = params.flush_max_buffers
+                    limit = min(self.core_bandwidth * step, pass_budget) if cleaning else 0.0
+                else:
+                    limit = min(self.core_bandwidth, acp_rate) * step
+
+                step_cleaned = (
+                    self._clean(dirty_buckets, limit, now, staleness_time) if limit else 0.0
+                )
+                if cleaning:
+                    pass_budget -= step_cleaned
+                    if step_cleaned == 0 or pass_budget <= 0:
+                        # Nothing stale to clean or pass finished, cleaner goes to sleep
+                        cleaning = False
+                        next_wake_up = now + wake_up_time
+                dirty -= step_cleaned
+                step_cleaned += flushed
+                cleaned += step_cleaned
+                if active:
+                    busy_cleaned += step_cleaned
+
+                dirty_ratio = dirty / self.lines_count
+                dirty_ratio_sum += dirty_ratio
+                max_dirty_ratio = max(max_dirty_ratio, dirty_ratio)
+                now += step
+
+        steps = len(write_rates) * steps_per_sample
+        return CleaningResult(
+            params=params,
+            max_dirty_ratio=max_dirty_ratio,
+            mean_dirty_ratio=dirty_ratio_sum / steps if steps else 0.0,
+            core_load=cleaned / (self.core_bandwidth * now) if now else 0.0,
+            busy_core_load=busy_cleaned / (self.core_bandwidth * busy_time) if busy_time else 0.0,
+        )
+
+    @staticmethod
+    def _clean(dirty_buckets: deque, limit: float, now: float, staleness_time: float) -> float:
+        """Cleans up to limit oldest lines dirty for at least staleness_time."""
+        cleaned = 0.0
+        while dirty_buckets and cleaned < limit:
+            bucket = dirty_buckets[0]
+            if now - bucket[0] < staleness_time:
+                break
+            lines = min(bucket[1], limit - cleaned)
+            bucket[1] -= lines
+            cleaned += lines
+            if bucket[1] <= 0:
+                dirty_buckets.popleft()
+        return cleaned
+
+
+def _get_candidates(value_range: tuple, count: int) -> list:
+    """Returns about count values spread geometrically over inclusive integer range."""
+    low, high = value_range
+    if count == 1 or low == high:
+        return [low]
+    start = max(low, 1)
+    ratio = (high / start) ** (1 / (count - 1))
+    return sorted({low} | {round(start * ratio**i) for i in range(count)})
+
+
+def get_alru_params_grid(count: int = 5) -> list:
+    params_range = FlushParametersAlru.alru_params_range()
+    return [
+        FlushParametersAlru(
+            activity_threshold=Time(milliseconds=activity_threshold),
+            flush_max_buffers=flush_max_buffers,
+            staleness_time=Time(seconds=staleness_time),
+            wake_up_time=Time(seconds=wake_up_time),
+        )
+        for activity_threshold, flush_max_buffers, staleness_time, wake_up_time in (
+            itertools.product(
+                _get_candidates(params_range.activity_threshold, count),
+                _get_candidates(params_range.flush_max_buffers, count),
+                _get_candidates(params_range.staleness_time, count),
+                _get_candidates(params_range.wake_up_time, count),
+            )
+        )
+    ]
+
+
+def get_acp_params_grid(count: int = 5) -> list:
+    params_range = FlushParametersAcp.acp_params_range()
+    return [
+        FlushParametersAcp(
+            flush_max_buffers=flush_max_buffers, wake_up_time=Time(milliseconds=wake_up_time)
+        )
+        for flush_max_buffers, wake_up_time in itertools.product(
+            _get_candidates(params_range.flush_max_buffers, count),
+            _get_candidates(params_range.wake_up_time, count),
+        )
+    ]
+
+
+def tune_cleaning_policy(
+    policy: CleaningPolicy,
+    write_rates: list,
+    interval: float,
+    cache_size: Size,
+    core_bandwidth: Size,
+    dirty_ratio_ceiling: float,
+    cache_line_size: CacheLineSize = CacheLineSize.DEFAULT,
+    params_grid: list = None,
+    processes: int = None,
+) -> list:
+    """
+    Simulates cleaning policy with every parameter set from params_grid (by default
+    spread over alru_params_range() or acp_params_range()) in worker processes.
+    Returns results with max dirty ratio not exceeding dirty_ratio_ceiling, ordered from
+    the least core load while IO is running, then from the least overall core load
+    and the least mean dirty ratio.
+    """
+    if params_grid is None:
+        params_grid = (
+            get_alru_params_grid() if policy == CleaningPolicy.alru else get_acp_params_grid()
+        )
+    simulator = CleaningSimulator(cache_size, core_bandwidth, cache_line_size)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        results = list(
+            executor.map(
+                simulator.simulate,
+                itertools.repeat(policy),
+                params_grid,
+                itertools.repeat(write_rates),
+                itertools.repeat(interval),
+                chunksize=max(1, len(params_grid) // 64),
+            )
+        )
+    return sorted(
+        (result for result in results if result.max_dirty_ratio <= dirty_ratio_ceiling),
+        key=lambda result: (result.busy_core_load, result.core_load, result.mean_dirty_ratio),
+    )
@@ -0,0 +1,154 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from array import array
+
+INVALID = -1
+
+
+class CacheMetadata:
+    """
+    Array-backed cache metadata, laid out like OCF collision table:
+    - hash table of core lines with collisions chained through cache line entries,
+    - per cache line core line number, IO class and dirty flag,
+    - per IO class LRU lists linked through cache line entries,
+    - free cache lines stack.
+    All per line entries are kept in typed arrays, so single cache line costs
+    BYTES_PER_LINE bytes regardless of number of Python objects.
+    """
+
+    BYTES_PER_LINE = 8 + 4 + 4 + 4 + 4 + 1 + 1
+
+    def __init__(self, lines_count: int, io_class_count: int):
+        if lines_count >= 2**31:
+            raise ValueError(f"Too many cache lines: {lines_count}")
+        self.lines_count = lines_count
+        self.hash_head = array("i", [INVALID]) * lines_count
+        self.hash_next = array("i", [INVALID]) * lines_count
+        self.core_line = array("q", [INVALID]) * lines_count
+        self.lru_prev = array("i", [INVALID]) * lines_count
+        self.lru_next = array("i", [INVALID]) * lines_count
+        self.io_class = array("B", [0]) * lines_count
+        self.dirty = bytearray(lines_count)
+
+        self.lru_head = [INVALID] * io_class_count
+        self.lru_tail = [INVALID] * io_class_count
+        self.occupancy = [0] * io_class_count
+        self.dirty_count = [0] * io_class_count
+
+        self.free_lines = array("i", range(lines_count - 1, -1, -1))
+
+    @staticmethod
+    def get_memory_footprint(lines_count: int) -> int:
+        return lines_count * (CacheMetadata.BYTES_PER_LINE + 4)
+
+    @property
+    def free_count(self) -> int:
+        return len(self.free_lines)
+
+    @property
+    def total_occupancy(self) -> int:
+        return self.lines_count - len(self.free_lines)
+
+    @property
+    def total_dirty(self) -> int:
+        return sum(self.dirty_count)
+
+    def _bucket(self, core_line: int) -> int:
+        return core_line % self.lines_count
+
+    def lookup(self, core_line: int) -> int:
+        cache_line = self.hash_head[self._bucket(core_line)]
+        while cache_line != INVALID and self.core_line[cache_line] != core_line:
+            cache_line = self.hash_next[cache_line]
+        return cache_line
+
+    def insert(self, core_line: int, io_class: int) -> int:
+        """Maps core line to free cache line. Caller has to make sure that free line exists."""
+        cache_line = self.free_lines.pop()
+        bucket = self._bucket(core_line)
+        self.core_line[cache_line] = core_line
+        self.hash_next[cache_line] = self.hash_head[bucket]
+        self.hash_head[bucket] = cache_line
+        self.io_class[cache_line] = io_class
+        self.occupancy[io_class] += 1
+        self._lru_append(cache_line)
+        return cache_line
+
+    def remove(self, cache_line: int):
+        bucket = self._bucket(self.core_line[cache_line])
+        if self.hash_head[bucket] == cache_line:
+            self.hash_head[bucket] = self.hash_next[cache_line]
+        else:
+            prev = self.hash_head[bucket]
+            while self.hash_next[prev] != cache_line:
+                prev = self.hash_next[prev]
+            self.hash_next[prev] = self.hash_next[cache_line]
+
+        self._lru_unlink(cache_line)
+        io_class = self.io_class[cache_line]
+        self.occupancy[io_class] -= 1
+        self.set_clean(cache_line)
+        self.core_line[cache_line] = INVALID
+        self.hash_next[cache_line] = INVALID
+        self.free_lines.append(cache_line)
+
+    def touch(self, cache_line: int):
+        """Moves cache line to the most recently used end of its IO class LRU list."""
+        if self.lru_tail[self.io_class[cache_line]] != cache_line:
+            self._lru_unlink(cache_line)
+            self._lru_append(cache_line)
+
+    def move(self, cache_line: int, io_class: int):
+        """Moves cache line to another IO class (reclassification on access)."""
+        old_class = self.io_class[cache_line]
+        if old_class == io_class:
+            return
+        self._lru_unlink(cache_line)
+        self.occupancy[old_class] -= 1
+        self.occupancy[io_class] += 1
+        if self.dirty[cache_line]:
+            self.dirty_count[old_class] -= 1
+            self.dirty_count[io_class] += 1
+        self.io_class[cache_line] = io_class
+        self._lru_append(cache_line)
+
+    def get_lru_victim(self, io_class: int) -> int:
+        return self.lru_head[io_class]
+
+    def set_dirty(self, cache_line: int):
+        if not self.dirty[cache_line]:
+            self.dirty[cache_line] = 1
+            self.dirty_count[self.io_class[cache_line]] += 1
+
+    def set_clean(self, cache_line: int):
+        if self.dirty[cache_line]:
+            self.dirty[cache_line] = 0
+            self.dirty_count[self.io_class[cache_line]] -= 1
+
+    def _lru_append(self, cache_line: int):
+        io_class = self.io_class[cache_line]
+        tail = self.lru_tail[io_class]
+        self.lru_prev[cache_line] = tail
+        self.lru_next[cache_line] = INVALID
+        if tail == INVALID:
+            self.lru_head[io_class] = cache_line
+        else:
+            self.lru_next[tail] = cache_line
+        self.lru_tail[io_class] = cache_line
+
+    def _lru_unlink(self, cache_line: int):
+        io_class = self.io_class[cache_line]
+        prev, next = self.lru_prev[cache_line], self.lru_next[cache_line]
+        if prev == INVALID:
+            self.lru_head[io_class] = next
+        else:
+            self.lru_next[prev] = next
+        if next == INVALID:
+            self.lru_tail[io_class] = prev
+        else:
+            self.lru_prev[next] = prev
+        self.lru_prev[cache_line] = INVALID
+        self.lru_next[cache_line] = INVALID
@@ -0,0 +1,120 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from collections import OrderedDict
+
+from api.cas.cache_config import SeqCutOffParameters, SeqCutOffPolicy
+from type_def.size import Unit
+
+# Limits of streams tracked by OCF for a single core
+SEQ_CUTOFF_MAX_STREAMS = 128
+SEQ_CUTOFF_PERCPU_STREAMS = 64
+# OCF_TO_EVICTION_MIN + OCF_PENDING_EVICTION_LIMIT - 'full' policy activates when number of
+# free cache lines drops below this margin
+SEQ_CUTOFF_FULL_MARGIN = 128 + 512
+
+
+def is_cache_full(free_lines: int, request_lines: int) -> bool:
+    return free_lines <= SEQ_CUTOFF_FULL_MARGIN + request_lines
+
+
+class _Stream:
+    __slots__ = ["bytes", "req_count"]
+
+    def __init__(self, size: int):
+        self.bytes = size
+        self.req_count = 1
+
+
+class StreamTable:
+    """Fixed size set of streams looked up by next expected address, LRU replaced."""
+
+    def __init__(self, max_streams: int):
+        self.max_streams = max_streams
+        # (next address, is_write) -> stream, ordered from least to most recently used
+        self.streams = OrderedDict()
+
+    def find(self, address: int, is_write: bool):
+        return self.streams.get((address, is_write))
+
+    def update(self, address: int, size: int, is_write: bool, insert: bool):
+        stream = self.streams.pop((address, is_write), None)
+        if stream is not None:
+            stream.bytes += size
+            stream.req_count += 1
+        elif insert:
+            if len(self.streams) >= self.max_streams:
+                self.streams.popitem(last=False)
+            stream = _Stream(size)
+        else:
+            return None
+        self.streams[(address + size, is_write)] = stream
+        return stream
+
+    def promote(self, address: int, is_write: bool, stream: _Stream):
+        if len(self.streams) >= self.max_streams:
+            self.streams.popitem(last=False)
+        self.streams[(address, is_write)] = stream
+
+    def remove(self, address: int, is_write: bool):
+        self.streams.pop((address, is_write), None)
+
+
+class SeqCutoffDetector:
+    """
+    Model of OCF multistream sequential cut-off detector for a single core.
+    New streams are tracked in local table and are promoted to global table after
+    promotion_count requests. Request is cut off if it continues a tracked stream and
+    the stream together with the request reaches threshold.
+    Per-CPU local tables are modelled as a single table, so streams submitted from
+    different CPUs are assumed to stay on the same CPU.
+    """
+
+    def __init__(
+        self,
+        params: SeqCutOffParameters = None,
+        max_streams: int = SEQ_CUTOFF_MAX_STREAMS,
+        local_streams: int = SEQ_CUTOFF_PERCPU_STREAMS,
+    ):
+        default_params = SeqCutOffParameters.default_seq_cut_off_params()
+        params = params or default_params
+        self.policy = params.policy or default_params.policy
+        threshold = params.threshold or default_params.threshold
+        self.threshold = int(threshold.get_value(Unit.Byte))
+        self.promotion_count = (
+            params.promotion_count
+            if params.promotion_count is not None
+            else default_params.promotion_count
+        )
+        self.global_streams = StreamTable(max_streams)
+        self.local_streams = StreamTable(local_streams)
+
+    def check(self, address: int, size: int, is_write: bool, cache_full: bool = True) -> bool:
+        """
+        Returns True if request should be serviced in pass-through.
+        cache_full is relevant only for 'full' policy, see is_cache_full().
+        """
+        if self.policy == SeqCutOffPolicy.never:
+            return False
+        if self.policy == SeqCutOffPolicy.full and not cache_full:
+            return False
+
+        for table in [self.local_streams, self.global_streams]:
+            stream = table.find(address, is_write)
+            if stream is not None:
+                return stream.bytes + size >= self.threshold
+        return False
+
+    def update(self, address: int, size: int, is_write: bool):
+        if self.policy == SeqCutOffPolicy.never:
+            return
+
+        if self.global_streams.update(address, size, is_write, insert=False) is not None:
+            return
+
+        stream = self.local_streams.update(address, size, is_write, insert=True)
+        if self.promotion_count != 0 and stream.req_count >= self.promotion_count:
+            self.local_streams.remove(address + size, is_write)
+            self.global_streams.promote(address + size, is_write, stream)
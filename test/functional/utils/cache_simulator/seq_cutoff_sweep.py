@@ -0,0 +1,148 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import argparse
+import itertools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from api.cas.cache_config import CacheLineSize, CacheMode, SeqCutOffParameters, SeqCutOffPolicy
+from type_def.size import Size, Unit
+from utils.cache_simulator.seq_cutoff import SEQ_CUTOFF_MAX_STREAMS
+from utils.cache_simulator.simulator import CacheSimulator
+from utils.cache_simulator.trace import Trace
+
+SweepResult = namedtuple(
+    "SweepResult", ["threshold", "promotion_count", "bypassed_bytes", "hit_ratio"]
+)
+
+# Trace and simulator configuration shared by all tasks of a single worker process
+_worker_context = {}
+
+
+def _init_worker(trace: Trace, simulator_kwargs: dict):
+    _worker_context["trace"] = trace
+    _worker_context["simulator_kwargs"] = simulator_kwargs
+
+
+def _simulate(policy: SeqCutOffPolicy, threshold: Size, promotion_count: int) -> SweepResult:
+    simulator = CacheSimulator(
+        seq_cutoff_params=SeqCutOffParameters(policy, threshold, promotion_count),
+        **_worker_context["simulator_kwargs"],
+    )
+    simulator.replay(_worker_context["trace"])
+    stats = simulator.get_stats()
+    return SweepResult(threshold, promotion_count, stats.seq_cutoff_bytes, stats.hit_ratio)
+
+
+def sweep_seq_cutoff(
+    trace: Trace,
+    cache_size: Size,
+    thresholds: list,
+    promotion_counts: list,
+    policy: SeqCutOffPolicy = SeqCutOffPolicy.full,
+    cache_mode: CacheMode = CacheMode.DEFAULT,
+    cache_line_size: CacheLineSize = CacheLineSize.DEFAULT,
+    max_streams: int = SEQ_CUTOFF_MAX_STREAMS,
+    ioclass_list: list = None,
+    processes: int = None,
+) -> list:
+    """
+    Replays trace in cache simulator for every combination of sequential cut-off threshold
+    and promotion count. Simulations run in separate worker processes (one per CPU
+    if processes is not given), each worker receives the trace only once.
+    Returns list of SweepResult ordered like the grid (thresholds major).
+    """
+    simulator_kwargs = dict(
+        cache_size=cache_size,
+        cache_line_size=cache_line_size,
+        cache_mode=cache_mode,
+        ioclass_list=ioclass_list,
+        seq_cutoff_max_streams=max_streams,
+    )
+    grid = list(itertools.product(thresholds, promotion_counts))
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(trace, simulator_kwargs)
+    ) as executor:
+        futures = [
+            executor.submit(_simulate, policy, threshold, promotion_count)
+            for threshold, promotion_count in grid
+        ]
+        return [future.result() for future in futures]
+
+
+def format_sweep_results(results: list) -> str:
+    lines = [f"{'threshold':>12} {'promotion':>9} {'bypassed':>14} {'hit ratio':>9}"]
+    for result in results:
+        bypassed = Size(result.bypassed_bytes, Unit.Byte)
+        lines.append(
+            f"{int(result.threshold.get_value(Unit.KibiByte)):>8} KiB "
+            f"{result.promotion_count:>9} "
+            f"{bypassed.get_value(Unit.MebiByte):>10.1f} MiB "
+            f"{result.hit_ratio:>9.2%}"
+        )
+    return "\n".join(lines)
+
+
+def get_best_result(results: list) -> SweepResult:
+    """Returns combination with the highest predicted hit ratio, least bypass on tie."""
+    return max(results, key=lambda result: (result.hit_ratio, -result.bypassed_bytes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential cut-off parameters sweep")
+    parser.add_argument("trace", help="blkparse output or fio iolog file")
+    parser.add_argument("--device", help="Replay only requests to this file from fio iolog")
+    parser.add_argument("--cache-size", type=int, required=True, help="Cache size in MiB")
+    parser.add_argument(
+        "--thresholds", type=int, nargs="+", required=True, help="Thresholds in KiB"
+    )
+    parser.add_argument("--promotion-counts", type=int, nargs="+", required=True)
+    parser.add_argument(
+        "--policy",
+        choices=[policy.name for policy in SeqCutOffPolicy],
+        default=SeqCutOffPolicy.full.name,
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=[cache_mode.name for cache_mode in CacheMode],
+        default=CacheMode.DEFAULT.name,
+    )
+    parser.add_argument(
+        "--cache-line-size",
+        type=int,
+        choices=[int(line_size.value.get_value(Unit.KibiByte)) for line_size in CacheLineSize],
+        default=int(CacheLineSize.DEFAULT.value.get_value(Unit.KibiByte)),
+        help="Cache line size in KiB",
+    )
+    parser.add_argument("--max-streams", type=int, default=SEQ_CUTOFF_MAX_STREAMS)
+    parser.add_argument("--processes", type=int, help="Number of worker processes")
+
+    args = parser.parse_args()
+    results = sweep_seq_cutoff(
+        trace=Trace.from_file(args.trace, args.device),
+        cache_size=Size(args.cache_size, Unit.MebiByte),
+        thresholds=[Size(threshold, Unit.KibiByte) for threshold in args.thresholds],
+        promotion_counts=args.promotion_counts,
+        policy=SeqCutOffPolicy[args.policy],
+        cache_mode=CacheMode[args.cache_mode],
+        cache_line_size=next(
+            line_size
+            for line_size in CacheLineSize
+            if line_size.value == Size(args.cache_line_size, Unit.KibiByte)
+        ),
+        max_streams=args.max_streams,
+        processes=args.processes,
+    )
+    print(format_sweep_results(results))
+    best = get_best_result(results)
+    print(
+        f"Best: threshold {int(best.threshold.get_value(Unit.KibiByte))} KiB, "
+        f"promotion count {best.promotion_count}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from array import array
+from collections import namedtuple
+from copy import copy
+
+from api.cas.cache_config import (
+    CacheLineSize,
+    CacheMode,
+    CacheModeTrait,
+    PromotionParametersNhit,
+    PromotionPolicy,
+    SeqCutOffParameters,
+)
+from api.cas.ioclass_config import (
+    DEFAULT_IO_CLASS_ID,
+    DEFAULT_IO_CLASS_PRIORITY,
+    MAX_IO_CLASS_ID,
+    IoClass,
+)
+from type_def.size import Size, Unit
+from utils.cache_simulator.metadata import INVALID, CacheMetadata
+from utils.cache_simulator.seq_cutoff import (
+    SEQ_CUTOFF_MAX_STREAMS,
+    SeqCutoffDetector,
+    is_cache_full,
+)
+from utils.cache_simulator.trace import Trace
+from utils.classifier import Classifier
+
+Sample = namedtuple(
+    "Sample", ["time", "hit_ratio", "occupancy", "dirty", "core_reads", "core_writes"]
+)
+
+
+class SimulationStats:
+    """
+    Counters mirroring casadm statistics. Requests are counted like in RequestStats,
+    traffic is counted in bytes like BlockStats, occupancy and dirty in bytes like UsageStats.
+    """
+
+    def __init__(self):
+        self.read_hits = 0
+        self.read_part_misses = 0
+        self.read_full_misses = 0
+        self.write_hits = 0
+        self.write_part_misses = 0
+        self.write_full_misses = 0
+        self.pass_through_reads = 0
+        self.pass_through_writes = 0
+        # Bytes serviced in pass-through because of sequential cut-off
+        self.seq_cutoff_bytes = 0
+        self.core_reads = 0
+        self.core_writes = 0
+        self.cache_reads = 0
+        self.cache_writes = 0
+        self.exp_obj_reads = 0
+        self.exp_obj_writes = 0
+        self.occupancy = 0
+        self.dirty = 0
+
+    @property
+    def read_total(self):
+        return self.read_hits + self.read_part_misses + self.read_full_misses
+
+    @property
+    def write_total(self):
+        return self.write_hits + self.write_part_misses + self.write_full_misses
+
+    @property
+    def requests_serviced(self):
+        return self.read_total + self.write_total
+
+    @property
+    def requests_total(self):
+        return self.requests_serviced + self.pass_through_reads + self.pass_through_writes
+
+    @property
+    def hit_ratio(self):
+        total = self.requests_total
+        return (self.read_hits + self.write_hits) / total if total else 0.0
+
+    def compare_with_cache_stats(self, cache_stats) -> dict:
+        """
+        Returns {statistic name: (simulated value, measured value)} for CacheStats gathered
+        on DUT (without percentage values) after running the same workload.
+        """
+        def in_bytes(size: Size):
+            return int(size.get_value(Unit.Byte))
+
+        request_stats = cache_stats.request_stats
+        block_stats = cache_stats.block_stats
+        usage_stats = cache_stats.usage_stats
+        return {
+            "read hits": (self.read_hits, request_stats.read.hits),
+            "read partial misses": (self.read_part_misses, request_stats.read.part_misses),
+            "read full misses": (self.read_full_misses, request_stats.read.full_misses),
+            "write hits": (self.write_hits, request_stats.write.hits),
+            "write partial misses": (self.write_part_misses, request_stats.write.part_misses),
+            "write full misses": (self.write_full_misses, request_stats.write.full_misses),
+            "pass-through reads": (self.pass_through_reads, request_stats.pass_through_reads),
+            "pass-through writes": (self.pass_through_writes, request_stats.pass_through_writes),
+            "core reads": (self.core_reads, in_bytes(block_stats.core.reads)),
+            "core writes": (self.core_writes, in_bytes(block_stats.core.writes)),
+            "cache reads": (self.cache_reads, in_bytes(block_stats.cache.reads)),
+            "cache writes": (self.cache_writes, in_bytes(block_stats.cache.writes)),
+            "occupancy": (self.occupancy, in_bytes(usage_stats.occupancy)),
+            "dirty": (self.dirty, in_bytes(usage_stats.dirty)),
+        }
+
+
+class CacheSimulator:
+    """
+    Trace driven model of a single core CAS cache.
+    Models cache mode traits, LRU eviction per IO class with IO class allocation and eviction
+    priority, always/nhit promotion policy and sequential cut-off. Cleaning is not modelled
+    (like with NOP cleaning policy) - dirty lines are flushed only when evicted.
+    """
+
+    def __init__(
+        self,
+        cache_size: Size,
+        cache_line_size: CacheLineSize = CacheLineSize.DEFAULT,
+        cache_mode: CacheMode = CacheMode.DEFAULT,
+        promotion_policy: PromotionPolicy = PromotionPolicy.DEFAULT,
+        promotion_params: PromotionParametersNhit = None,
+        seq_cutoff_params: SeqCutOffParameters = None,
+        ioclass_list: list = None,
+        seq_cutoff_max_streams: int = SEQ_CUTOFF_MAX_STREAMS,
+    ):
+        self.line_size = int(cache_line_size.value.get_value(Unit.Byte))
+        self.lines_count = int(cache_size.get_value(Unit.Byte)) // self.line_size
+        self.traits = CacheMode.get_traits(cache_mode)
+        self.metadata = CacheMetadata(self.lines_count, MAX_IO_CLASS_ID + 1)
+        self.seq_cutoff = SeqCutoffDetector(seq_cutoff_params, seq_cutoff_max_streams)
+        self.stats = SimulationStats()
+
+        self.promotion_policy = promotion_policy
+        promotion_params = promotion_params or PromotionParametersNhit.default_nhit_params()
+        self.nhit_threshold = promotion_params.threshold
+        self.nhit_trigger_lines = self.lines_count * promotion_params.trigger // 100
+        self.nhit_counters = array("H", [0]) * (
+            self.lines_count if promotion_policy == PromotionPolicy.nhit else 0
+        )
+
+        ioclass_list = ioclass_list or []
+        if not any(c.id == DEFAULT_IO_CLASS_ID for c in ioclass_list):
+            ioclass_list = [IoClass.default(), *ioclass_list]
+        self.classifier = Classifier.from_ioclass_list(ioclass_list)
+        self.max_lines = [0] * (MAX_IO_CLASS_ID + 1)
+        priorities = {}
+        for ioclass in ioclass_list:
+            self.max_lines[ioclass.id] = int(float(ioclass.allocation) * self.lines_count)
+            priorities[ioclass.id] = (
+                DEFAULT_IO_CLASS_PRIORITY if ioclass.priority is None else ioclass.priority
+            )
+        # Lines of IO classes with the highest eviction priority value are evicted first
+        self.eviction_order = sorted(priorities, key=lambda c: priorities[c], reverse=True)
+
+    def replay(self, trace: Trace, sample_interval: float = 1.0) -> list:
+        """Replays trace and returns list of samples taken every sample_interval seconds."""
+        io_classes = self.classifier.classify(trace.to_request_batch()).tolist()
+        timestamps = trace.timestamp.tolist()
+        offsets = trace.offset.tolist()
+        sizes = trace.size.tolist()
+        writes = trace.is_write.tolist()
+
+        samples = []
+        start_time = timestamps[0] if timestamps else 0.0
+        next_sample = start_time + sample_interval
+        last_stats = copy(self.stats)
+        for index in range(len(timestamps)):
+            while timestamps[index] >= next_sample:
+                samples.append(self._take_sample(next_sample - start_time, last_stats))
+                last_stats = copy(self.stats)
+                next_sample += sample_interval
+            self.process(offsets[index], sizes[index], writes[index], io_classes[index])
+
+        if timestamps:
+            samples.append(self._take_sample(timestamps[-1] - start_time, last_stats))
+        return samples
+
+    def _take_sample(self, time: float, last_stats: SimulationStats) -> Sample:
+        self._update_usage()
+        requests = self.stats.requests_total - last_stats.requests_total
+        hits = (self.stats.read_hits + self.stats.write_hits) - (
+            last_stats.read_hits + last_stats.write_hits
+        )
+        return Sample(
+            time=time,
+            hit_ratio=hits / requests if requests else 0.0,
+            occupancy=self.stats.occupancy,
+            dirty=self.stats.dirty,
+            core_reads=self.stats.core_reads - last_stats.core_reads,
+            core_writes=self.stats.core_writes - last_stats.core_writes,
+        )
+
+    def _update_usage(self):
+        self.stats.occupancy = self.metadata.total_occupancy * self.line_size
+        self.stats.dirty = self.metadata.total_dirty * self.line_size
+
+    def get_stats(self) -> SimulationStats:
+        self._update_usage()
+        return self.stats
+
+    def process(self, offset: int, size: int, is_write: bool, io_class: int):
+        metadata = self.metadata
+        stats = self.stats
+        first_line = offset // self.line_size
+        core_lines = range(first_line, (offset + size - 1) // self.line_size + 1)
+        cache_lines = [metadata.lookup(core_line) for core_line in core_lines]
+        hits = sum(1 for cache_line in cache_lines if cache_line != INVALID)
+
+        pass_through = (
+            not self.traits & (CacheModeTrait.InsertRead | CacheModeTrait.InsertWrite)
+            or self.max_lines[io_class] == 0
+        )
+        cache_full = is_cache_full(metadata.free_count, len(cache_lines))
+        if not pass_through and self.seq_cutoff.check(offset, size, is_write, cache_full):
+            pass_through = True
+            stats.seq_cutoff_bytes += size
+        self.seq_cutoff.update(offset, size, is_write)
+
+        if is_write:
+            stats.exp_obj_writes += size
+        else:
+            stats.exp_obj_reads += size
+
+        if pass_through:
+            self._pass_through(size, is_write, cache_lines)
+            return
+
+        for cache_line in cache_lines:
+            if cache_line != INVALID:
+                metadata.move(cache_line, io_class)
+                metadata.touch(cache_line)
+
+        if hits == len(cache_lines):
+            self._count_request(is_write, hits, len(cache_lines))
+            if is_write:
+                self._write_hit(size, cache_lines)
+            else:
+                stats.cache_reads += size
+            return
+
+        insert_trait = CacheModeTrait.InsertWrite if is_write else CacheModeTrait.InsertRead
+        if not self.traits & insert_trait or not self._should_promote(core_lines, cache_lines):
+            self._count_request(is_write, hits, len(cache_lines))
+            self._not_inserted(size, is_write, cache_lines)
+            return
+
+        if not self._map(core_lines, cache_lines, io_class):
+            # Mapping failed, request is serviced in pass-through
+            self._pass_through(size, is_write, cache_lines)
+            return
+
+        self._count_request(is_write, hits, len(cache_lines))
+        if is_write:
+            self._write_hit(size, cache_lines)
+        else:
+            stats.core_reads += size
+            stats.cache_writes += size
+
+    def _count_request(self, is_write: bool, hits: int, lines: int):
+        stats = self.stats
+        if hits == lines:
+            if is_write:
+                stats.write_hits += 1
+            else:
+                stats.read_hits += 1
+        elif hits == 0:
+            if is_write:
+                stats.write_full_misses += 1
+            else:
+                stats.read_full_misses += 1
+        else:
+            if is_write:
+                stats.write_part_misses += 1
+            else:
+                stats.read_part_misses += 1
+
+    def _write_hit(self, size: int, cache_lines: list):
+        self.stats.cache_writes += size
+        if self.traits & CacheModeTrait.LazyWrites:
+            for cache_line in cache_lines:
+                self.metadata.set_dirty(cache_line)
+        else:
+            self.stats.core_writes += size
+
+    def _pass_through(self, size: int, is_write: bool, cache_lines: list):
+        if is_write:
+            self.stats.pass_through_writes += 1
+            self.stats.core_writes += size
+            self._invalidate(cache_lines)
+        else:
+            self.stats.pass_through_reads += 1
+            if any(c != INVALID and self.metadata.dirty[c] for c in cache_lines):
+                # Dirty data can be read only from cache
+                self.stats.cache_reads += size
+            else:
+                self.stats.core_reads += size
+
+    def _not_inserted(self, size: int, is_write: bool, cache_lines: list):
+        if is_write:
+            # Write-invalidate, mapped lines would become stale
+            self.stats.core_writes += size
+            self._invalidate(cache_lines)
+        elif any(c != INVALID and self.metadata.dirty[c] for c in cache_lines):
+            self.stats.cache_reads += size
+        else:
+            self.stats.core_reads += size
+
+    def _invalidate(self, cache_lines: list):
+        for cache_line in cache_lines:
+            if cache_line == INVALID:
+                continue
+            if self.metadata.dirty[cache_line]:
+                # Remaining dirty part of cache line has to be cleaned before invalidation
+                self.stats.cache_reads += self.line_size
+                self.stats.core_writes += self.line_size
+            self.metadata.remove(cache_line)
+
+    def _should_promote(self, core_lines: range, cache_lines: list) -> bool:
+        if self.promotion_policy != PromotionPolicy.nhit:
+            return True
+        promote = True
+        for core_line, cache_line in zip(core_lines, cache_lines):
+            if cache_line != INVALID:
+                continue
+            bucket = core_line % len(self.nhit_counters)
+            if self.nhit_counters[bucket] < 0xFFFF:
+                self.nhit_counters[bucket] += 1
+            promote = promote and self.nhit_counters[bucket] >= self.nhit_threshold
+        # nhit is active only after cache occupancy reaches trigger threshold
+        return promote or self.metadata.total_occupancy < self.nhit_trigger_lines
+
+    def _map(self, core_lines: range, cache_lines: list, io_class: int) -> bool:
+        metadata = self.metadata
+        for index, (core_line, cache_line) in enumerate(zip(core_lines, cache_lines)):
+            if cache_line != INVALID:
+                continue
+            if metadata.occupancy[io_class] >= self.max_lines[io_class]:
+                if not self._evict(io_class):
+                    return False
+            elif metadata.free_count == 0 and not self._evict():
+                return False
+            cache_lines[index] = metadata.insert(core_line, io_class)
+            if self.nhit_counters:
+                self.nhit_counters[core_line % len(self.nhit_counters)] = 0
+        return True
+
+    def _evict(self, io_class: int = None) -> bool:
+        metadata = self.metadata
+        if io_class is None:
+            # Classes exceeding their allocation go first, then by eviction priority
+            candidates = [
+                c for c in self.eviction_order if metadata.occupancy[c] > self.max_lines[c]
+            ] + self.eviction_order
+            io_class = next((c for c in candidates if metadata.occupancy[c] > 0), None)
+            if io_class is None:
+                return False
+
+        victim = metadata.get_lru_victim(io_class)
+        if victim == INVALID:
+            return False
+        if metadata.dirty[victim]:
+            self.stats.cache_reads += self.line_size
+            self.stats.core_writes += self.line_size
+        metadata.remove(victim)
+        return True
@@ -0,0 +1,123 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import re
+
+import numpy as np
+
+from utils.classifier import READ, WRITE, RequestBatch
+
+SECTOR_SIZE = 512
+
+# blkparse default output format, e.g.:
+#   8,16   1        1     0.000000000  1234  Q   W 1024 + 8 [fio]
+_blkparse_regex = re.compile(
+    r"^\s*\d+,\d+\s+\d+\s+\d+\s+(?P<time>\d+\.\d+)\s+(?P<pid>\d+)\s+(?P<action>\S+)\s+"
+    r"(?P<rwbs>\S+)\s+(?P<sector>\d+)\s+\+\s+(?P<sectors>\d+)(?:\s+\[(?P<process>.*)\])?"
+)
+
+
+class Trace:
+    """
+    Block trace kept as NumPy columns: timestamp in seconds, offset and size in bytes,
+    write flag, pid and process name of request submitter.
+    """
+
+    def __init__(
+        self, timestamp, offset, size, is_write, pid=None, process_name=None
+    ):
+        self.timestamp = np.asarray(timestamp, dtype=np.float64)
+        self.offset = np.asarray(offset, dtype=np.uint64)
+        self.size = np.asarray(size, dtype=np.uint64)
+        self.is_write = np.asarray(is_write, dtype=bool)
+        count = len(self.timestamp)
+        self.pid = np.zeros(count, np.uint64) if pid is None else np.asarray(pid, np.uint64)
+        self.process_name = (
+            np.full(count, "", dtype=object)
+            if process_name is None
+            else np.asarray(process_name, dtype=object)
+        )
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    @property
+    def duration(self) -> float:
+        return float(self.timestamp[-1] - self.timestamp[0]) if len(self) else 0.0
+
+    def to_request_batch(self) -> RequestBatch:
+        return RequestBatch(
+            len(self),
+            lba=self.offset // SECTOR_SIZE,
+            request_size=self.size,
+            io_direction=np.where(self.is_write, WRITE, READ),
+            pid=self.pid,
+            process_name=self.process_name,
+        )
+
+    @staticmethod
+    def from_file(path: str, device: str = None):
+        with open(path) as trace_file:
+            text = trace_file.read()
+        if text.startswith("fio version"):
+            return Trace.parse_fio_iolog(text, device)
+        return Trace.parse_blkparse(text)
+
+    @staticmethod
+    def parse_fio_iolog(text: str, device: str = None):
+        """
+        Parses fio iolog in version 2 or 3 format. Version 2 logs have no timestamps,
+        requests are assumed to be issued one per microsecond ('wait' entries are honored).
+        If device is given, only requests to this file are taken.
+        """
+        lines = text.splitlines()
+        version = int(lines[0].split()[2])
+        if version not in [2, 3]:
+            raise ValueError(f"Unsupported fio iolog version: {version}")
+
+        timestamp, offset, size, is_write = [], [], [], []
+        current_time = 0.0
+        for line in lines[1:]:
+            fields = line.split()
+            if version == 3:
+                current_time = int(fields.pop(0)) / 1000
+            if len(fields) < 2 or (device and fields[0] != device):
+                continue
+            action = fields[1]
+            if action == "wait" and version == 2:
+                current_time += int(fields[2]) / 1000000
+            if action not in ["read", "write"]:
+                continue
+            if version == 2:
+                current_time += 1 / 1000000
+            timestamp.append(current_time)
+            offset.append(int(fields[2]))
+            size.append(int(fields[3]))
+            is_write.append(action == "write")
+
+        return Trace(timestamp, offset, size, is_write)
+
+    @staticmethod
+    def parse_blkparse(text: str, action: str = "Q"):
+        """
+        Parses blkparse text output. Only records of given action (queued by default)
+        for reads and writes are taken, discards and flushes are skipped.
+        """
+        timestamp, offset, size, is_write, pid, process_name = [], [], [], [], [], []
+        for line in text.splitlines():
+            record = _blkparse_regex.match(line)
+            if not record or record["action"] != action:
+                continue
+            rwbs = record["rwbs"]
+            if "D" in rwbs or not ("R" in rwbs or "W" in rwbs) or int(record["sectors"]) == 0:
+                continue
+            timestamp.append(float(record["time"]))
+            offset.append(int(record["sector"]) * SECTOR_SIZE)
+            size.append(int(record["sectors"]) * SECTOR_SIZE)
+            is_write.append("W" in rwbs)
+            pid.append(int(record["pid"]))
+            process_name.append(record["process"] or "")
+
+        return Trace(timestamp, offset, size, is_write, pid, process_name)
@@ -0,0 +1,169 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import base64
+from collections import namedtuple
+from datetime import timedelta
+
+from api.cas.cache_config import CacheLineSize
+from connection.utils.output import CmdException
+from core.test_run import TestRun
+from type_def.size import Size, Unit
+
+# Multiple of every cache line size, so chunks never split a cache line
+DEFAULT_CHUNK_SIZE = Size(64, Unit.MebiByte)
+SECTOR_SIZE = Size(512, Unit.Byte)
+
+# First and last sector (inclusive) of a range with mismatching data
+LbaRange = namedtuple("LbaRange", ["first", "last"])
+
+_checksums_script = r"""
+set -o pipefail
+if [ -b "$path" ]; then
+    dev_size=$(blockdev --getsize64 "$path")
+else
+    dev_size=$(stat -L -c %s "$path")
+fi || exit 1
+size=${size:-$dev_size}
+[ "$size" -le "$dev_size" ] || { echo "$path is smaller than $size B" >&2; exit 1; }
+jobs=${jobs:-$(nproc)}
+# Big chunks are read in 1MiB requests
+dd_bs=$((chunk % 1048576 == 0 ? 1048576 : chunk))
+
+hash_chunk() {
+    local offset=$(($1 * chunk)) bytes sum
+    bytes=$((size - offset < chunk ? size - offset : chunk))
+    sum=$(
+        dd if="$path" bs=$dd_bs skip=$offset count=$bytes iflag=direct,skip_bytes,count_bytes \
+            2>/dev/null | md5sum | cut -d' ' -f1
+    ) || { echo "Failed to read chunk $1 of $path" >&2; return 1; }
+    echo "$1 $sum"
+}
+export -f hash_chunk
+export path chunk size dd_bs
+
+echo "size=$size"
+count=$(((size + chunk - 1) / chunk))
+[ "$count" -gt 0 ] || exit 0
+checksums=$(seq 0 $((count - 1)) | xargs -P "$jobs" -n 1 bash -c 'hash_chunk "$0"' | sort -n) ||
+    exit 1
+if [ -n "$manifest" ]; then
+    printf "size=%s chunk=%s path=%s\n%s\n" "$size" "$chunk" "$path" "$checksums" > "$manifest" ||
+        exit 1
+fi
+echo "$checksums"
+"""
+
+
+class ChunkChecksums:
+    """
+    md5 checksums of consecutive fixed size chunks of a device or file, computed on DUT
+    by parallel jobs with direct I/O. Comparing checksums of two devices (e.g. core device
+    and exported object) or with a saved manifest gives LBA ranges of mismatching data.
+    """
+
+    def __init__(self, path: str, size: Size, chunk_size: Size, checksums: list):
+        self.path = path
+        self.size = size
+        self.chunk_size = chunk_size
+        self.checksums = checksums
+
+    @classmethod
+    def compute(
+        cls,
+        path: str,
+        chunk_size: Size = DEFAULT_CHUNK_SIZE,
+        cache_line_size: CacheLineSize = None,
+        size: Size = None,
+        jobs: int = None,
+        manifest_path: str = None,
+        timeout: timedelta = timedelta(hours=4),
+    ):
+        """
+        Computes checksums of the first size bytes (whole device or file by default)
+        using jobs parallel readers (number of DUT CPUs by default). If manifest_path
+        is given, checksums are also saved in this file on DUT.
+        For exported objects and core devices, cache_line_size of the cache should be given,
+        so that chunks don't split cache lines.
+        """
+        if int(chunk_size) % int(SECTOR_SIZE) != 0:
+            raise ValueError("Chunk size must be a multiple of sector size.")
+        if cache_line_size and int(chunk_size) % int(cache_line_size.value) != 0:
+            raise ValueError(
+                f"Chunk size must be a multiple of cache line size ({cache_line_size.value})."
+            )
+        header = "\n".join(
+            [
+                f"path='{path}'",
+                f"chunk={int(chunk_size)}",
+                f"size={int(size) if size is not None else ''}",
+                f"jobs={jobs or ''}",
+                f"manifest='{manifest_path or ''}'",
+            ]
+        )
+        script = base64.b64encode((header + _checksums_script).encode("utf-8")).decode("ascii")
+        output = TestRun.executor.run(f"echo {script} | base64 --decode | bash", timeout)
+        if output.exit_code != 0:
+            raise CmdException(f"Failed to compute chunk checksums of {path}.", output)
+        return cls._parse(path, chunk_size, output.stdout)
+
+    @classmethod
+    def load(cls, manifest_path: str):
+        """Loads checksums saved on DUT with compute()."""
+        output = TestRun.executor.run(f"cat {manifest_path}")
+        if output.exit_code != 0:
+            raise CmdException(f"Failed to read checksums manifest {manifest_path}.", output)
+        lines = output.stdout.splitlines()
+        params = dict(param.split("=", 1) for param in lines[0].split(" ", 2))
+        return cls._parse(
+            params["path"], Size(int(params["chunk"]), Unit.Byte), "\n".join(lines[1:]),
+            Size(int(params["size"]), Unit.Byte),
+        )
+
+    @classmethod
+    def _parse(cls, path: str, chunk_size: Size, output: str, size: Size = None):
+        checksums = []
+        for line in output.splitlines():
+            if line.startswith("size="):
+                size = Size(int(line.split("=", 1)[1]), Unit.Byte)
+                continue
+            index, checksum = line.split()
+            if int(index) != len(checksums):
+                raise Exception(f"Missing checksum of chunk {len(checksums)} of {path}.")
+            checksums.append(checksum)
+        if len(checksums) != -(-int(size) // int(chunk_size)):
+            raise Exception(f"Incomplete chunk checksums of {path}.")
+        return cls(path, size, chunk_size, checksums)
+
+    def get_mismatches(self, other) -> list:
+        """
+        Returns list of LbaRange with data differing from other checksums. Adjacent
+        mismatching chunks are merged, data beyond the end of the smaller device differs.
+        """
+        if int(self.chunk_size) != int(other.chunk_size):
+            raise ValueError("Can't compare checksums of chunks of different size.")
+        chunk_sectors = int(self.chunk_size) // int(SECTOR_SIZE)
+        end_sector = max(int(self.size), int(other.size)) // int(SECTOR_SIZE)
+        chunks = max(len(self.checksums), len(other.checksums))
+
+        mismatches = []
+        for index in range(chunks):
+            if (
+                index < len(self.checksums)
+                and index < len(other.checksums)
+                and self.checksums[index] == other.checksums[index]
+            ):
+                continue
+            first = index * chunk_sectors
+            last = min(first + chunk_sectors, end_sector) - 1
+            if mismatches and mismatches[-1].last + 1 == first:
+                mismatches[-1] = LbaRange(mismatches[-1].first, last)
+            else:
+                mismatches.append(LbaRange(first, last))
+        return mismatches
+
+
+def format_mismatches(mismatches: list) -> str:
+    return ", ".join(f"{lba_range.first}-{lba_range.last}" for lba_range in mismatches)
@@ -0,0 +1,8 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from utils.classifier.classifier import Classifier, Rule
+from utils.classifier.conditions import LogicalOperator, NumericOperator, parse_rule
+from utils.classifier.request_batch import READ, WRITE, RequestBatch
@@ -0,0 +1,122 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from collections import Counter
+
+import numpy as np
+
+from utils.classifier.conditions import LogicalOperator, parse_rule
+from utils.classifier.request_batch import RequestBatch
+
+DEFAULT_IO_CLASS_ID = 0
+# OCF_IO_CLASS_NAME_MAX
+MAX_RULE_LEN = 1024
+# Number of requests processed at once, small enough for masks to stay in CPU cache
+CHUNK_SIZE = 64 * 1024
+
+
+class Rule:
+    def __init__(self, part_id: int, rule: str, wlth_support: bool = True):
+        if len(rule) >= MAX_RULE_LEN:
+            raise ValueError("IO class name not null terminated")
+        self.part_id = part_id
+        self.rule = rule
+        self.conditions = parse_rule(rule, wlth_support)
+
+    def __str__(self):
+        return f"{self.part_id},{self.rule}"
+
+    def process(
+        self,
+        requests: RequestBatch,
+        part_ids: np.ndarray,
+        active: np.ndarray,
+        results_cache: dict = None,
+    ):
+        """
+        Evaluates rule the same way as cas_cls_process_rule() does, for all active requests
+        at once. Returns (yes, stop) masks.
+        results_cache holds results of conditions shared with other rules.
+        """
+        yes = np.zeros(len(requests), dtype=bool)
+        stop = np.zeros(len(requests), dtype=bool)
+        # Requests for which evaluation of this rule is not finished yet
+        pending = active.copy()
+
+        for condition in self.conditions:
+            if condition.logical_op == LogicalOperator.logical_and:
+                pending &= yes
+            if not pending.any():
+                break
+
+            if results_cache is not None and str(condition) in results_cache:
+                result = results_cache[str(condition)]
+                if result is None:
+                    result = condition.test(requests, part_ids)
+                    results_cache[str(condition)] = result
+            else:
+                result = condition.test(requests, part_ids)
+
+            if condition.logical_op == LogicalOperator.logical_and:
+                # pending requests have yes set, so it is enough to clear not matching ones
+                np.logical_and(yes, np.logical_or(result, ~pending), out=yes)
+            else:
+                np.logical_or(yes, np.logical_and(result, pending), out=yes)
+
+            if condition.stop:
+                stop |= pending
+                break
+
+        return yes, stop
+
+
+class Classifier:
+    """
+    Offline equivalent of cas_cls_classify(). Rules are processed in ascending IO class id
+    order, class of the last matching rule is assigned unless 'done' condition stops
+    processing. Requests not matching any rule are assigned to the default IO class.
+    """
+
+    def __init__(self, rules: dict, wlth_support: bool = True):
+        # Rule for IO class 0 and empty rules are never created by kernel
+        self.rules = [
+            Rule(part_id, rule, wlth_support)
+            for part_id, rule in sorted(rules.items())
+            if part_id != DEFAULT_IO_CLASS_ID and rule
+        ]
+        conditions_count = Counter(
+            str(c) for rule in self.rules for c in rule.conditions if c.cacheable
+        )
+        self.shared_conditions = [c for c, count in conditions_count.items() if count > 1]
+
+    @staticmethod
+    def from_ioclass_list(ioclass_list: [], wlth_support: bool = True):
+        return Classifier({c.id: c.rule for c in ioclass_list}, wlth_support)
+
+    def classify(self, requests: RequestBatch) -> np.ndarray:
+        part_ids = np.full(len(requests), DEFAULT_IO_CLASS_ID, dtype=np.uint16)
+        for start in range(0, len(requests), CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, len(requests))
+            part_ids[start:stop] = self._classify_chunk(requests.get_chunk(start, stop))
+        return part_ids
+
+    def _classify_chunk(self, requests: RequestBatch) -> np.ndarray:
+        part_ids = np.full(len(requests), DEFAULT_IO_CLASS_ID, dtype=np.uint16)
+        active = np.ones(len(requests), dtype=bool)
+        results_cache = dict.fromkeys(self.shared_conditions)
+
+        for rule in self.rules:
+            yes, stop = rule.process(requests, part_ids, active, results_cache)
+            part_ids[yes] = rule.part_id
+            active &= ~stop
+            if not active.any():
+                break
+
+        return part_ids
+
+    def get_class_distribution(self, requests: RequestBatch) -> dict:
+        """Returns number of requests assigned to every IO class which got any request."""
+        part_ids, counts = np.unique(self.classify(requests), return_counts=True)
+        return {int(part_id): int(count) for part_id, count in zip(part_ids, counts)}
@@ -0,0 +1,312 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import operator
+import posixpath
+import re
+from enum import Enum
+
+import numpy as np
+
+from utils.classifier.request_batch import READ, WRITE, RequestBatch
+
+MAX_STRING_SPECIFIER_LEN = 256
+# TASK_COMM_LEN - 1, longer process names are truncated by kernel
+MAX_PROCESS_NAME_LEN = 15
+CORE_ID_MIN = 0
+CORE_ID_MAX = 4095
+_U64_MAX = 2**64 - 1
+
+
+class LogicalOperator(Enum):
+    logical_and = "&"
+    logical_or = "|"
+
+
+class NumericOperator(Enum):
+    eq = operator.eq
+    ne = operator.ne
+    lt = operator.lt
+    gt = operator.gt
+    le = operator.le
+    ge = operator.ge
+
+
+class UnknownConditionError(ValueError):
+    pass
+
+
+class Condition:
+    """
+    Single condition of classification rule, e.g. file_size:le:4096.
+    logical_op is applied between this condition and evaluation of previous conditions.
+    """
+
+    token = None
+    stop = False
+    # Result depends only on request, not on IO class assigned by previous rules
+    cacheable = True
+
+    def __init__(self, operand: str = None, logical_op=LogicalOperator.logical_or):
+        self.operand = operand
+        self.logical_op = logical_op
+
+    def __str__(self):
+        return self.token if self.operand is None else f"{self.token}:{self.operand}"
+
+    def __repr__(self):
+        return f"{self.logical_op.value}{self}"
+
+    def test(self, requests: RequestBatch, part_ids: np.ndarray) -> np.ndarray:
+        raise NotImplementedError()
+
+
+class GenericCondition(Condition):
+    def __init__(self, operand: str = None, logical_op=LogicalOperator.logical_or):
+        if operand is not None:
+            raise ValueError("Unexpected operand in condition")
+        super().__init__(operand, logical_op)
+
+
+class NumericCondition(Condition):
+    def __init__(self, operand: str = None, logical_op=LogicalOperator.logical_or):
+        super().__init__(operand, logical_op)
+        if not operand:
+            raise ValueError("Missing numeric condition operand")
+        self.numeric_op = NumericOperator.eq
+        op_name, sep, value = operand.partition(":")
+        if sep:
+            if op_name not in NumericOperator.__members__:
+                raise ValueError("Invalid numeric operator")
+            self.numeric_op = NumericOperator[op_name]
+        else:
+            value = op_name
+        # Same format as accepted by kstrtou64()
+        if not re.fullmatch(r"\+?[0-9]+\n?", value) or int(value) > _U64_MAX:
+            raise ValueError("Invalid numeric operand")
+        self.value = int(value)
+
+    def compare(self, values: np.ndarray) -> np.ndarray:
+        if values.dtype == np.int64:
+            # Operand doesn't fit into int64, so it is greater than every value in column
+            if self.value > np.iinfo(np.int64).max:
+                return self.numeric_op.value(np.zeros(len(values)), 1)
+            return self.numeric_op.value(values, np.int64(self.value))
+        return self.numeric_op.value(values, np.uint64(self.value))
+
+
+class StringCondition(Condition):
+    def __init__(self, operand: str = None, logical_op=LogicalOperator.logical_or):
+        super().__init__(operand, logical_op)
+        if operand is None:
+            raise ValueError("Missing string specifier")
+        if len(operand) == 0:
+            raise ValueError("String specifier is empty")
+        if len(operand) >= MAX_STRING_SPECIFIER_LEN:
+            raise ValueError("String specifier is too long")
+
+
+class Done(GenericCondition):
+    token = "done"
+    stop = True
+
+    def test(self, requests, part_ids):
+        return np.ones(len(requests), dtype=bool)
+
+
+class Metadata(GenericCondition):
+    token = "metadata"
+
+    def test(self, requests, part_ids):
+        return requests.metadata & ~requests.direct
+
+
+class Direct(GenericCondition):
+    token = "direct"
+
+    def test(self, requests, part_ids):
+        return requests.direct.copy()
+
+
+class IoClass(NumericCondition):
+    token = "io_class"
+    cacheable = False
+
+    def test(self, requests, part_ids):
+        return self.compare(part_ids.astype(np.uint64))
+
+
+class FileSize(NumericCondition):
+    token = "file_size"
+
+    def test(self, requests, part_ids):
+        return (requests.file_size >= 0) & self.compare(requests.file_size)
+
+
+class Directory(Condition):
+    token = "directory"
+
+    def __init__(self, operand: str = None, logical_op=LogicalOperator.logical_or):
+        super().__init__(operand, logical_op)
+        if not operand:
+            raise ValueError("Missing directory specifier")
+        # Kernel resolves directory to inode, symbolic links can't be followed offline
+        self.directory = posixpath.normpath(operand)
+
+    def _is_in_directory(self, path: str) -> bool:
+        if not path:
+            return False
+        if self.directory == "/":
+            return True
+        return path == self.directory or path.startswith(self.directory + "/")
+
+    def test(self, requests, part_ids):
+        return requests.map_unique("path", self._is_in_directory)
+
+
+class CoreId(NumericCondition):
+    token = "core_id"
+
+    def __init__(self, operand: str = None, logical_op=LogicalOperator.logical_or):
+        super().__init__(operand, logical_op)
+        if not CORE_ID_MIN <= self.value <= CORE_ID_MAX:
+            raise ValueError(f"Core id have to be within <{CORE_ID_MIN}-{CORE_ID_MAX}> range")
+
+    def test(self, requests, part_ids):
+        return self.compare(requests.core_id)
+
+
+class Extension(StringCondition):
+    token = "extension"
+
+    def _has_extension(self, path: str) -> bool:
+        name = RequestBatch.file_name(path)
+        return "." in name and name.rsplit(".", 1)[1] == self.operand
+
+    def test(self, requests, part_ids):
+        return requests.map_unique("path", self._has_extension)
+
+
+class FileNamePrefix(StringCondition):
+    token = "file_name_prefix"
+
+    def _has_prefix(self, path: str) -> bool:
+        return bool(path) and RequestBatch.file_name(path).startswith(self.operand)
+
+    def test(self, requests, part_ids):
+        return requests.map_unique("path", self._has_prefix)
+
+
+class Lba(NumericCondition):
+    token = "lba"
+
+    def test(self, requests, part_ids):
+        return self.compare(requests.lba)
+
+
+class Pid(NumericCondition):
+    token = "pid"
+
+    def test(self, requests, part_ids):
+        return self.compare(requests.pid)
+
+
+class ProcessName(StringCondition):
+    token = "process_name"
+
+    def test(self, requests, part_ids):
+        return requests.map_unique(
+            "process_name", lambda name: name[:MAX_PROCESS_NAME_LEN] == self.operand
+        )
+
+
+class FileOffset(NumericCondition):
+    token = "file_offset"
+
+    def test(self, requests, part_ids):
+        return (requests.file_offset >= 0) & self.compare(requests.file_offset)
+
+
+class RequestSize(NumericCondition):
+    token = "request_size"
+
+    def test(self, requests, part_ids):
+        return self.compare(requests.request_size)
+
+
+class IoDirection(Condition):
+    token = "io_direction"
+
+    def __init__(self, operand: str = None, logical_op=LogicalOperator.logical_or):
+        super().__init__(operand, logical_op)
+        if operand is None:
+            raise ValueError("Missing IO direction specifier")
+        if operand not in ["read", "write"]:
+            raise ValueError(
+                f"Invalid IO direction specifier '{operand}' "
+                f"allowed specifiers: 'read', 'write'"
+            )
+        self.direction = READ if operand == "read" else WRITE
+
+    def test(self, requests, part_ids):
+        return requests.io_direction == self.direction
+
+
+class WriteLifetimeHint(NumericCondition):
+    token = "wlth"
+
+    def test(self, requests, part_ids):
+        return self.compare(requests.write_hint)
+
+
+# Same order as _handlers array in classifier.c
+handlers = {
+    handler.token: handler
+    for handler in [
+        Done,
+        Metadata,
+        Direct,
+        IoClass,
+        FileSize,
+        Directory,
+        CoreId,
+        Extension,
+        FileNamePrefix,
+        Lba,
+        Pid,
+        ProcessName,
+        FileOffset,
+        RequestSize,
+        IoDirection,
+        WriteLifetimeHint,
+    ]
+}
+
+
+def parse_rule(rule: str, wlth_support: bool = True) -> list:
+    """
+    Parses rule the same way as _cas_cls_parse_conditions() does.
+    Returns list of conditions, raises UnknownConditionError for unknown condition token
+    and ValueError for invalid syntax.
+    """
+    conditions = []
+    logical_op = LogicalOperator.logical_or
+    position = 0
+    while position < len(rule):
+        # Condition ends with first '&' or '|', operand starts after first ':'
+        match = re.compile(r"[^:&|]*(?::[^&|]*)?").match(rule, position)
+        token, sep, operand = match.group().partition(":")
+        position = match.end()
+
+        handler = handlers.get(token)
+        if handler is None or (handler is WriteLifetimeHint and not wlth_support):
+            raise UnknownConditionError(f"Cannot find handler for condition {token}")
+        conditions.append(handler(operand if sep else None, logical_op))
+
+        if position < len(rule):
+            logical_op = LogicalOperator(rule[position])
+            position += 1
+
+    return conditions
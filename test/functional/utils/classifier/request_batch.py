@@ -0,0 +1,121 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import posixpath
+
+import numpy as np
+
+READ = 0
+WRITE = 1
+
+_numeric_columns = {
+    "lba": np.uint64,
+    "request_size": np.uint64,
+    "io_direction": np.uint64,
+    "pid": np.uint64,
+    "core_id": np.uint64,
+    "write_hint": np.uint64,
+    # Negative value means that request does not target regular file
+    "file_size": np.int64,
+    "file_offset": np.int64,
+}
+_bool_columns = ["metadata", "direct"]
+# Empty path means that there is no inode associated with request
+_string_columns = ["path", "process_name"]
+
+
+class RequestBatch:
+    """
+    Column-oriented set of synthetic request descriptors.
+    Every column is a NumPy array with one entry per request (bio). Columns which are not
+    given are filled with values of request without page or inode (e.g. raw block device IO).
+
+    lba is given in sectors and request_size in bytes, like bio fields used by classifier.
+    path is the full path of the file targeted by the request. Requests targeting directory
+    inodes or block device page cache should have empty path and metadata set.
+    """
+
+    def __init__(self, count: int = None, **columns):
+        unknown = set(columns) - set(_numeric_columns) - set(_bool_columns) - set(_string_columns)
+        if unknown:
+            raise ValueError(f"Unknown request columns: {sorted(unknown)}")
+        if count is None:
+            if not columns:
+                raise ValueError("Either requests count or at least one column is required")
+            count = len(next(iter(columns.values())))
+
+        self.count = count
+        for name, dtype in _numeric_columns.items():
+            self._set_column(name, columns.get(name), dtype)
+        for name in _bool_columns:
+            self._set_column(name, columns.get(name), bool)
+        for name in _string_columns:
+            self._set_column(name, columns.get(name), object)
+        self._unique_cache = {}
+
+    @staticmethod
+    def _get_default(name: str):
+        if name in _string_columns:
+            return ""
+        if name in _bool_columns:
+            return False
+        return -1 if _numeric_columns[name] == np.int64 else 0
+
+    def _set_column(self, name, values, dtype):
+        if values is None:
+            column = np.full(self.count, RequestBatch._get_default(name), dtype=dtype)
+        else:
+            column = np.asarray(values, dtype=dtype)
+            if column.shape != (self.count,):
+                raise ValueError(
+                    f"Column {name} has {column.size} entries, expected {self.count}"
+                )
+        setattr(self, name, column)
+
+    @staticmethod
+    def from_records(records: list):
+        """Creates batch from list of dicts with column values of single request."""
+        columns = {}
+        for index, record in enumerate(records):
+            for name, value in record.items():
+                columns.setdefault(name, [None] * len(records))[index] = value
+        for name, values in columns.items():
+            if name in _numeric_columns or name in _bool_columns or name in _string_columns:
+                default = RequestBatch._get_default(name)
+                columns[name] = [default if v is None else v for v in values]
+        return RequestBatch(len(records), **columns)
+
+    def __len__(self):
+        return self.count
+
+    def get_chunk(self, start: int, stop: int):
+        """Returns batch sharing memory with given range of requests of this batch."""
+        columns = {
+            name: getattr(self, name)[start:stop]
+            for name in [*_numeric_columns, *_bool_columns, *_string_columns]
+        }
+        chunk = RequestBatch(len(columns["lba"]), **columns)
+        for column in _string_columns:
+            values, inverse = self.unique(column)
+            chunk._unique_cache[column] = (values, inverse[start:stop])
+        return chunk
+
+    def unique(self, column: str):
+        """
+        Returns unique values of string column and indices reconstructing the column.
+        String conditions are evaluated once per unique value, not once per request.
+        """
+        if column not in self._unique_cache:
+            values, inverse = np.unique(getattr(self, column).astype(str), return_inverse=True)
+            self._unique_cache[column] = (values, inverse)
+        return self._unique_cache[column]
+
+    def map_unique(self, column: str, function) -> np.ndarray:
+        values, inverse = self.unique(column)
+        return np.fromiter((function(v) for v in values), dtype=bool, count=len(values))[inverse]
+
+    @staticmethod
+    def file_name(path: str) -> str:
+        return posixpath.basename(path)
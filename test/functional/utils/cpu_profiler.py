@@ -0,0 +1,169 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import os
+from collections import Counter
+from contextlib import contextmanager
+
+from connection.utils.output import CmdException
+from core.test_run import TestRun
+from utils.performance import CpuProfileMetric
+
+PROFILE_METHODS = ["perf", "procstat"]
+# Number of the most consuming functions and threads kept in perf.json
+TOP_ENTRIES = 50
+# Only threads matching this pattern are sampled with procstat method
+KTHREAD_PATTERN = "^cas_"
+
+_perf_data_path = "/tmp/cas_cpu_profile.data"
+
+# Folds 'perf script -F comm,ip,sym' output into 'thread;outermost;...;innermost count' lines
+_fold_awk = (
+    "awk '"
+    "function flush() { if (comm != \"\") { s = comm; "
+    "for (i = n; i >= 1; i--) s = s \";\" frames[i]; count[s]++ } comm = \"\"; n = 0 } "
+    "/^[^ \\t]/ { flush(); comm = $1; next } "
+    "/^[ \\t]/ { frames[++n] = $2; next } "
+    "/^$/ { flush() } "
+    "END { flush(); for (s in count) print s, count[s] }'"
+)
+
+# Prints '<thread name> <utime + stime>' for matching threads, then 'total <cpu jiffies>'
+_procstat_cmd = (
+    "for stat in /proc/[0-9]*/stat; do cat $stat 2>/dev/null; done | "
+    "awk '{{ name = $2; gsub(/[()]/, \"\", name); "
+    "if (name ~ /{pattern}/) print name, $14 + $15 }}'; "
+    "awk '/^cpu / {{ total = 0; for (i = 2; i <= NF; i++) total += $i; print \"total\", total }}' "
+    "/proc/stat"
+)
+
+
+def get_function_shares(folded: Counter) -> dict:
+    """Share of samples in which function was on top of the stack (self time)."""
+    total = sum(folded.values())
+    functions = Counter()
+    for stack, count in folded.items():
+        functions[stack.rsplit(";", 1)[-1]] += count
+    return {name: count / total for name, count in functions.most_common(TOP_ENTRIES)}
+
+
+def get_thread_shares(folded: Counter) -> dict:
+    total = sum(folded.values())
+    threads = Counter()
+    for stack, count in folded.items():
+        threads[stack.split(";", 1)[0]] += count
+    return {name: count / total for name, count in threads.most_common(TOP_ENTRIES)}
+
+
+class CpuProfiler:
+    """
+    Samples CPU usage on DUT while workload runs and inserts the profile into PerfContainer.
+    'perf' method records system wide call stacks with 'perf record -g' and folds them
+    on DUT. 'procstat' method only reads CPU time of CAS kernel threads from /proc.
+    With method None profiling is disabled and profile() does nothing.
+    """
+
+    def __init__(self, method: str, perf_container, frequency: int = 99):
+        if method not in PROFILE_METHODS + [None]:
+            raise ValueError(f"Unknown CPU profiling method: {method}")
+        self.method = method
+        self.perf_container = perf_container
+        self.frequency = frequency
+        self.folded = None
+
+    @contextmanager
+    def profile(self):
+        if not self.method:
+            yield
+            return
+
+        method = self.method
+        if method == "perf" and TestRun.executor.run("command -v perf").exit_code != 0:
+            TestRun.LOGGER.warning("perf not found on DUT, profiling with /proc stat instead")
+            method = "procstat"
+
+        if method == "perf":
+            pid = self._start_perf()
+            try:
+                yield
+            finally:
+                self.folded = self._stop_perf(pid)
+        else:
+            before = self._read_procstat()
+            yield
+            self.folded = self._get_procstat_delta(before, self._read_procstat())
+
+        self._insert_profile(method)
+
+    def _start_perf(self) -> str:
+        output = TestRun.executor.run(
+            f"nohup perf record -a -g -F {self.frequency} -o {_perf_data_path} "
+            f"> /dev/null 2>&1 & echo $!"
+        )
+        if output.exit_code != 0:
+            raise CmdException("Failed to start perf record.", output)
+        return output.stdout.strip()
+
+    def _stop_perf(self, pid: str) -> Counter:
+        TestRun.executor.run(
+            f"kill -INT {pid}; while kill -0 {pid} 2>/dev/null; do sleep 1; done"
+        )
+        output = TestRun.executor.run(
+            f"perf script -i {_perf_data_path} -F comm,ip,sym 2>/dev/null | {_fold_awk}; "
+            f"rm -f {_perf_data_path}"
+        )
+        if output.exit_code != 0:
+            raise CmdException("Failed to fold perf samples.", output)
+        folded = Counter()
+        for line in output.stdout.splitlines():
+            stack, _, count = line.rpartition(" ")
+            if stack:
+                folded[stack] += int(count)
+        return folded
+
+    @staticmethod
+    def _read_procstat() -> dict:
+        output = TestRun.executor.run(_procstat_cmd.format(pattern=KTHREAD_PATTERN))
+        if output.exit_code != 0:
+            raise CmdException("Failed to read CPU time of kernel threads.", output)
+        times = Counter()
+        for line in output.stdout.splitlines():
+            name, ticks = line.split()
+            times[name] += int(ticks)
+        return times
+
+    @staticmethod
+    def _get_procstat_delta(before: Counter, after: Counter) -> Counter:
+        # Idle time is included in total, so shares are relative to whole DUT CPU time
+        total = after["total"] - before["total"]
+        folded = Counter()
+        for name, ticks in after.items():
+            if name != "total" and ticks - before[name] > 0:
+                folded[name] = ticks - before[name]
+        folded["other"] = max(total - sum(folded.values()), 0)
+        return folded
+
+    def _insert_profile(self, method: str):
+        if not self.folded:
+            TestRun.LOGGER.warning("No CPU samples collected")
+            return
+
+        folded_path = os.path.join(TestRun.LOGGER.base_dir, "cpu_profile.folded")
+        with open(folded_path, "w") as folded_file:
+            for stack, count in self.folded.most_common():
+                folded_file.write(f"{stack} {count}\n")
+
+        self.perf_container.insert_cpu_profile(method, CpuProfileMetric.METHOD)
+        self.perf_container.insert_cpu_profile(
+            sum(self.folded.values()), CpuProfileMetric.SAMPLES
+        )
+        self.perf_container.insert_cpu_profile(
+            get_thread_shares(self.folded), CpuProfileMetric.THREAD_SHARES
+        )
+        if method == "perf":
+            self.perf_container.insert_cpu_profile(
+                get_function_shares(self.folded), CpuProfileMetric.FUNCTION_SHARES
+            )
+        self.perf_container.insert_cpu_profile(folded_path, CpuProfileMetric.FOLDED_STACKS_PATH)
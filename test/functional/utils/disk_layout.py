@@ -0,0 +1,143 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import hashlib
+import json
+
+from connection.utils.output import CmdException
+from core.test_run import TestRun
+from storage_devices.partition import Partition
+from test_tools.disk_tools import PartitionTable, PartitionType
+from type_def.size import Size, Unit
+
+# Area at the beginning of every kept partition zeroed to clear CAS metadata
+METADATA_ZERO_SIZE = Size(8, Unit.MebiByte)
+
+# Prints partition table type and then '<number> <begin> <end>' of every partition
+_layout_cmd = (
+    "parted -m -s {device} unit B print 2>/dev/null | "
+    "awk -F: 'NR == 2 {{print $6}} NR > 2 {{print $1, $2, $3}}'"
+)
+
+
+def get_layout_cmd(device: str) -> str:
+    return _layout_cmd.format(device=device)
+
+
+def get_requested_fingerprint(sizes: list, partition_table_type: PartitionTable) -> str:
+    layout = [partition_table_type.name, [int(size.get_value(Unit.Byte)) for size in sizes]]
+    return hashlib.sha256(json.dumps(layout).encode()).hexdigest()
+
+
+def get_layout_fingerprint(layout: str) -> str:
+    return hashlib.sha256(layout.strip().encode()).hexdigest()
+
+
+def read_layout(disk) -> str:
+    output = TestRun.executor.run(get_layout_cmd(disk.path))
+    if output.exit_code != 0:
+        raise CmdException(f"Failed to read partition layout of {disk.path}.", output)
+    return output.stdout.strip()
+
+
+class DiskLayout:
+    def __init__(self, requested: str, fingerprint: str, layout: str):
+        self.requested = requested
+        self.fingerprint = fingerprint
+        self.layout = layout
+        # Set when partitions were kept by cleanup and CAS metadata on them zeroed
+        self.cleared = False
+
+
+class DiskLayoutCache:
+    """
+    Partition layouts created on test disks during test session, used to skip
+    re-partitioning of disks which already have layout requested by a test.
+
+    Every layout is identified by fingerprint of partition table type and partition sizes
+    requested in create_partitions() and fingerprint of layout read from disk after it was
+    created. Test requesting a layout is remembered, so before its next run (e.g. with other
+    parameters) cleanup can keep partitions of a disk which still has the same layout
+    and only zero CAS metadata on them. create_partitions() then reuses these partitions
+    if the same layout is requested again, otherwise disk is partitioned as usual.
+    """
+
+    def __init__(self):
+        self.layouts = {}
+        self.requested_layouts = {}
+
+    @staticmethod
+    def _get_key(disk):
+        return TestRun.dut.ip, disk.path
+
+    def get_expected_layouts(self, test_name: str, disks: dict) -> dict:
+        """
+        Returns {disk path: layout fingerprint} of disks which have the layout requested
+        by the previous run of test, if the disk wasn't re-partitioned since.
+        """
+        expected = {}
+        for disk_name, disk in disks.items():
+            layout = self.layouts.get(self._get_key(disk))
+            requested = self.requested_layouts.get((test_name, disk_name))
+            if layout and requested == layout.requested:
+                expected[disk.path] = layout.fingerprint
+        return expected
+
+    def install(self, test_name: str, disks: dict, kept_paths: list):
+        """Wraps create_partitions() of disks prepared for test, after cleanup finished."""
+        for disk_name, disk in disks.items():
+            key = self._get_key(disk)
+            if disk.path in kept_paths:
+                self.layouts[key].cleared = True
+            else:
+                self.layouts.pop(key, None)
+            self.requested_layouts.pop((test_name, disk_name), None)
+            disk.create_partitions = self._get_create_partitions(test_name, disk_name, disk)
+
+    def _get_create_partitions(self, test_name: str, disk_name: str, disk):
+        def create_partitions(sizes: list, partition_table_type=PartitionTable.gpt):
+            requested = get_requested_fingerprint(sizes, partition_table_type)
+            # Only the first layout requested by test is kept for its next run
+            self.requested_layouts.setdefault((test_name, disk_name), requested)
+
+            key = self._get_key(disk)
+            layout = self.layouts.get(key)
+            if (
+                layout
+                and layout.cleared
+                and layout.requested == requested
+                and not disk.partitions
+            ):
+                TestRun.LOGGER.info(f"Reusing partitions of {disk.path}")
+                self._reuse_partitions(disk, layout, partition_table_type)
+                layout.cleared = False
+                return
+
+            type(disk).create_partitions(disk, sizes, partition_table_type)
+            self.layouts.pop(key, None)
+            # Layouts with extended partition are always created from scratch
+            if partition_table_type == PartitionTable.msdos and len(sizes) > 4:
+                return
+            layout_text = read_layout(disk)
+            self.layouts[key] = DiskLayout(
+                requested, get_layout_fingerprint(layout_text), layout_text
+            )
+
+        return create_partitions
+
+    @staticmethod
+    def _reuse_partitions(disk, layout: DiskLayout, partition_table_type: PartitionTable):
+        disk.partition_table = partition_table_type
+        for line in layout.layout.splitlines()[1:]:
+            number, begin, end = line.split()
+            disk.partitions.append(
+                Partition(
+                    disk,
+                    PartitionType.primary,
+                    int(number),
+                    Size(int(begin.rstrip("B")), Unit.Byte),
+                    Size(int(end.rstrip("B")), Unit.Byte),
+                )
+            )
@@ -0,0 +1,379 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import base64
+import json
+import shlex
+from collections import namedtuple
+
+from connection.utils.output import CmdException
+from core.test_run import TestRun
+from test_tools.disk_tools import PartitionTable
+from type_def.size import Unit
+from utils.disk_layout import METADATA_ZERO_SIZE, get_layout_cmd
+
+CleanupStep = namedtuple("CleanupStep", ["name", "exit_code", "error"])
+DiskCleanup = namedtuple(
+    "DiskCleanup", ["path", "serial", "serial_matches", "layout_kept", "steps"]
+)
+
+# Shell functions of cleanup steps. Every step is idempotent - when there is nothing
+# to clean up it succeeds, so the script can be run on DUT in any state.
+_steps_script = r"""
+json_str() {
+    printf '"%s"' "$(printf '%s' "$1" | sed 's/\\/\\\\/g; s/"/\\"/g')"
+}
+
+run_step() {
+    local steps=$1 name=$2 rc
+    shift 2
+    "$@" >/dev/null 2>"$steps.err"
+    rc=$?
+    printf '{"name": "%s", "exit_code": %d, "error": "%s"}\n' \
+        "$name" "$rc" "$(base64 -w0 "$steps.err")" >> "$steps"
+    rm -f "$steps.err"
+}
+
+kill_fsck() {
+    pkill --signal=SIGKILL fsck
+    return 0
+}
+
+udev_enable() {
+    udevadm control --start-exec-queue
+}
+
+kill_io() {
+    killall -q --signal KILL dd fio blktrace
+    pkill --signal=SIGKILL -f "[v]dbench"
+    for i in $(seq 10); do
+        pgrep -x "dd|fio" >/dev/null || return 0
+        sleep 1
+    done
+    echo "Failed to stop IO processes: $(pgrep -lx 'dd|fio' | xargs)" >&2
+    return 1
+}
+
+drbd_down() {
+    command -v drbdadm >/dev/null || return 0
+    if ls /etc/drbd.d/*.res >/dev/null 2>&1; then
+        drbdadm down all || return
+    fi
+    rm -f /etc/drbd.d/*.res
+}
+
+unmount_cas() {
+    grep "^/dev/cas" /proc/mounts | awk '{print $2}' | sort -r | xargs -r -n1 umount
+}
+
+device_mapper() {
+    # Devices in use (e.g. system LVM volumes) are left in place
+    command -v dmsetup >/dev/null && dmsetup remove_all
+    return 0
+}
+
+stop_cas() {
+    local rc=0
+    [ "$cas_installed" = true ] || return 0
+    # Reversed order resolves multilevel cache stop problem
+    casadm -L -o csv | awk -F, '$1 == "cache" {print $2}' | tac |
+        xargs -r -n1 casadm -T -n -i || rc=$?
+    # With all caches stopped only cores from core pool are listed
+    casadm -L -o csv | awk -F, '$1 == "core" {print $3}' |
+        xargs -r -n1 casadm --remove-detached -d || rc=$?
+    return $rc
+}
+
+remove_paths() {
+    rm -rf "${remove_paths[@]}" && mkdir -p "$data_path" && rm -rf "$data_path"/*
+}
+
+is_test_device() {
+    # Device is a CAS, ramdisk or DRBD device, or it is on top of one of test disks
+    local name
+    case $(basename "$(readlink -f "$1")") in
+        cas*|ram*|drbd*) return 0 ;;
+    esac
+    for name in $(lsblk -nslo NAME "$1" 2>/dev/null); do
+        [[ " ${test_disks[*]} " == *" $name "* ]] && return 0
+    done
+    return 1
+}
+
+remove_lvm() {
+    local vg pv lv vg_pvs rc=0
+    command -v vgs >/dev/null || return 0
+    for vg in $(vgs --noheadings -o vg_name); do
+        for pv in $(pvs --noheadings -o pv_name -S vg_name="$vg"); do
+            is_test_device "$pv" && break
+            pv=
+        done
+        [ -n "$pv" ] || continue
+        for lv in $(lvs --noheadings -o lv_path "$vg"); do
+            findmnt -rno TARGET -S "$lv" | xargs -r -n1 umount
+        done
+        vg_pvs=$(pvs --noheadings -o pv_name -S vg_name="$vg")
+        vgremove -ff -y "$vg" && pvremove -ff -y $vg_pvs || rc=$?
+    done
+    for pv in $(pvs --noheadings -o pv_name -S vg_name=""); do
+        is_test_device "$pv" && { pvremove -ff -y "$pv" || rc=$?; }
+    done
+    return $rc
+}
+
+stop_raids() {
+    local md member members name rc=0
+    for md in /sys/block/md*; do
+        [ -e "$md" ] || continue
+        members=$(ls "$md/slaves")
+        for member in $members; do
+            is_test_device "/dev/$member" && break
+            member=
+        done
+        [ -n "$member" ] || continue
+        md=/dev/$(basename "$md")
+        for name in $(lsblk -lnpo NAME "$md"); do
+            findmnt -rno TARGET -S "$name"
+        done | sort -r | xargs -r -n1 umount
+        mdadm --stop "$md" || { rc=$?; continue; }
+        for member in $members; do
+            mdadm --zero-superblock --force "/dev/$member" || rc=$?
+        done
+    done
+    return $rc
+}
+
+remove_ramdisks() {
+    grep -q "^brd " /proc/modules || return 0
+    grep "^/dev/ram" /proc/mounts | awk '{print $2}' | xargs -r -n1 umount
+    modprobe -r brd
+}
+
+unmount_disk() {
+    for name in $(lsblk -lnpo NAME "$1"); do
+        findmnt -rno TARGET -S "$name"
+    done | sort -r | xargs -r -n1 umount
+}
+
+zero_superblocks() {
+    local name
+    command -v mdadm >/dev/null || return 0
+    # Partitions are zeroed too, so superblocks don't come back with the same layout
+    for name in $(lsblk -lnpo NAME "$1"); do
+        mdadm --examine "$name" >/dev/null 2>&1 || continue
+        mdadm --zero-superblock --force "$name" || return
+    done
+}
+
+remove_partitions() {
+    local name
+    for name in $(lsblk -lnpo NAME,TYPE "$1" | awk '$2 == "part" {print $1}'); do
+        wipefs --all --force "$name" || return
+    done
+    wipefs --all --force "$1"
+}
+
+create_gpt() {
+    parted --script "$1" mklabel gpt
+}
+
+zero_metadata() {
+    local name
+    for name in $(lsblk -lnpo NAME,TYPE "$1" | awk '$2 == "part" {print $1}'); do
+        wipefs --all --force "$name" || return
+        dd if=/dev/zero of="$name" bs=1M count="$metadata_zero_mib" oflag=direct || return
+    done
+}
+
+cleanup_disk() {
+    local path=$1 expected_serial=$2 expected_layout=$3 report=$4
+    local dev serial serial_matches=true layout_kept=false
+    dev=$(readlink -f "$path")
+    serial=$(lsblk -ndo SERIAL "$dev" 2>/dev/null | xargs)
+    : > "$report.steps"
+    if [ -n "$expected_serial" ] && [ "$expected_serial" != "$serial" ]; then
+        # Never wipe a disk which is not the one from DUT config
+        serial_matches=false
+    else
+        run_step "$report.steps" unmount unmount_disk "$dev"
+        run_step "$report.steps" zero_superblock zero_superblocks "$dev"
+        if [ -n "$expected_layout" ] && [ "$(layout_fingerprint "$dev")" = "$expected_layout" ]
+        then
+            layout_kept=true
+            run_step "$report.steps" zero_metadata zero_metadata "$dev"
+        else
+            run_step "$report.steps" remove_partitions remove_partitions "$dev"
+            run_step "$report.steps" partition_table create_gpt "$dev"
+        fi
+    fi
+    printf '{"path": %s, "serial": %s, "serial_matches": %s, "layout_kept": %s, "steps": [%s]}\n' \
+        "$(json_str "$path")" "$(json_str "$serial")" "$serial_matches" "$layout_kept" \
+        "$(paste -sd, "$report.steps")" > "$report"
+    rm -f "$report.steps"
+}
+"""
+
+
+class DutCleanup:
+    """
+    Cleans up DUT before and after test with a single script instead of one executor call
+    per step. Steps are the same as in step by step cleanup in tests/conftest.py: killing
+    IO, removing DRBD, CAS, device mapper, LVM, RAID and ramdisk devices created on test
+    disks, removing given paths and - with prepare_disks set - checking disk serial
+    numbers and re-creating empty GPT on every disk. Disks are processed in parallel.
+    Disks given in expected_layouts ({disk path: layout fingerprint}) which still have
+    that layout keep their partitions, only CAS metadata and signatures on them are zeroed.
+    Script prints JSON report, which is parsed into steps results.
+    """
+
+    def __init__(
+        self,
+        disks=(),
+        remove_paths=(),
+        data_path=None,
+        prepare_disks=True,
+        expected_layouts: dict = None,
+    ):
+        self.disks = list(disks)
+        self.expected_layouts = expected_layouts or {}
+        self.remove_paths = [str(path) for path in remove_paths]
+        self.data_path = data_path or TestRun.TEST_RUN_DATA_PATH
+        self.prepare_disks = prepare_disks
+        self.cas_installed = False
+        self.steps = []
+        self.disk_results = []
+
+    def build_script(self) -> str:
+        layout_device = '"$1"'
+        lines = [
+            _steps_script,
+            "report_dir=$(mktemp -d)",
+            "steps=$report_dir/steps",
+            f"data_path={shlex.quote(self.data_path)}",
+            f"remove_paths=({' '.join(shlex.quote(path) for path in self.remove_paths)})",
+            "test_disks=("
+            + " ".join(
+                f"$(basename $(readlink -f {shlex.quote(disk.path)}))" for disk in self.disks
+            )
+            + ")",
+            f"metadata_zero_mib={int(METADATA_ZERO_SIZE.get_value(Unit.MebiByte))}",
+            "layout_fingerprint() {",
+            f"    printf '%s' \"$({get_layout_cmd(layout_device)})\" | sha256sum | cut -d' ' -f1",
+            "}",
+            "cas_installed=false",
+            "command -v casadm >/dev/null && grep -q '^cas_cache ' /proc/modules "
+            "&& cas_installed=true",
+            ": > $steps",
+            "run_step $steps kill_fsck kill_fsck",
+            "run_step $steps udev_enable udev_enable",
+            "run_step $steps kill_io kill_io",
+            "run_step $steps unmount_cas unmount_cas",
+            "run_step $steps device_mapper device_mapper",
+            # CAS stacked on DRBD has to be stopped before DRBD goes down and DRBD stacked
+            # on CAS keeps it from stopping, so CAS is stopped again with DRBD down
+            "stop_cas >/dev/null 2>&1",
+            "run_step $steps drbd_down drbd_down",
+            "run_step $steps stop_cas stop_cas",
+            "run_step $steps remove_paths remove_paths",
+            "run_step $steps remove_lvm remove_lvm",
+            "run_step $steps stop_raids stop_raids",
+            "run_step $steps remove_ramdisks remove_ramdisks",
+        ]
+        if self.prepare_disks:
+            for index, disk in enumerate(self.disks):
+                lines.append(
+                    f"cleanup_disk {shlex.quote(disk.path)} "
+                    f"{shlex.quote(disk.serial_number or '')} "
+                    f"{shlex.quote(self.expected_layouts.get(disk.path, ''))} "
+                    f"$report_dir/disk_{index} &"
+                )
+            lines.append("wait")
+            lines.append("run_step $steps udev_settle udevadm settle")
+        lines.append(
+            'echo "{\\"cas_installed\\": $cas_installed, '
+            '\\"steps\\": [$(paste -sd, $steps)], '
+            '\\"disks\\": [$(cat $report_dir/disk_* 2>/dev/null | paste -sd,)]}"'
+        )
+        lines.append("rm -rf $report_dir")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _parse_steps(steps: list) -> list:
+        return [
+            CleanupStep(
+                step["name"],
+                step["exit_code"],
+                base64.b64decode(step["error"]).decode("utf-8", errors="ignore").rstrip(),
+            )
+            for step in steps
+        ]
+
+    def run(self):
+        encoded_script = base64.b64encode(self.build_script().encode("utf-8")).decode("ascii")
+        # Script is passed as argument, so its commands don't read the rest of it from stdin
+        output = TestRun.executor.run(
+            f'bash -c "$(echo {encoded_script} | base64 --decode)" < /dev/null'
+        )
+        try:
+            report = json.loads(output.stdout.strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            raise CmdException("DUT cleanup script didn't return valid report.", output)
+
+        self.cas_installed = report["cas_installed"]
+        self.steps = self._parse_steps(report["steps"])
+        self.disk_results = [
+            DiskCleanup(
+                disk["path"],
+                disk["serial"],
+                disk["serial_matches"],
+                disk["layout_kept"],
+                self._parse_steps(disk["steps"]),
+            )
+            for disk in report["disks"]
+        ]
+        return self
+
+    def get_failed_steps(self) -> list:
+        failed = [step for step in self.steps if step.exit_code != 0]
+        for disk in self.disk_results:
+            failed.extend(
+                step._replace(name=f"{disk.path}: {step.name}")
+                for step in disk.steps
+                if step.exit_code != 0
+            )
+        return failed
+
+    def check(self):
+        """
+        Raises exception if any disk serial number doesn't match the one from DUT config,
+        or any step failed. Otherwise updates disks state as step by step cleanup does.
+        """
+        for disk in self.disk_results:
+            if not disk.serial_matches:
+                expected = next(d.serial_number for d in self.disks if d.path == disk.path)
+                raise Exception(
+                    f"Serial for {disk.path} doesn't match the one from the config."
+                    f"Serial from config {expected}, actual serial {disk.serial}"
+                )
+
+        failed_steps = self.get_failed_steps()
+        if failed_steps:
+            raise Exception(
+                "DUT cleanup failed:\n"
+                + "\n".join(
+                    f"{step.name} (exit code {step.exit_code}): {step.error}"
+                    for step in failed_steps
+                )
+            )
+
+        if self.prepare_disks:
+            kept_paths = self.get_kept_layouts()
+            for disk in self.disks:
+                disk.partitions.clear()
+                if disk.path not in kept_paths:
+                    disk.partition_table = PartitionTable.gpt
+
+    def get_kept_layouts(self) -> list:
+        return [disk.path for disk in self.disk_results if disk.layout_kept]
@@ -0,0 +1,261 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import pytest
+import yaml
+
+from storage_devices.disk import DiskType
+
+# Duration assumed for tests which were never run before
+DEFAULT_TEST_DURATION = 300
+
+# Options of controller session which are set separately for every worker
+_worker_options = ["--dut-config", "--log-path", "--test-durations", "--scheduled-tests"]
+_worker_flags = ["--parallel-duts"]
+
+
+def get_disk_requirements(item) -> list:
+    """Returns [(disk name, type set json)] with disk type sets before relative ones."""
+    requirements = [
+        (marker.args[0], json.loads(marker.args[1].json()))
+        for marker in item.iter_markers(name="require_disk")
+    ]
+    return sorted(requirements, key=lambda requirement: requirement[1]["type"] != "set")
+
+
+def satisfies_requirements(requirements: list, disk_types: list) -> bool:
+    """Checks if requirements can be met by distinct disks of given DiskTypes."""
+
+    def assign(index, used, chosen):
+        if index == len(requirements):
+            return True
+        name, type_set = requirements[index]
+        for disk_index, disk_type in enumerate(disk_types):
+            if disk_index in used:
+                continue
+            if type_set["type"] == "set":
+                matches = disk_type.name in type_set["values"]
+            else:
+                other = chosen.get(type_set["args"][0])
+                matches = other is not None and disk_type < other
+            if matches and assign(index + 1, used | {disk_index}, {**chosen, name: disk_type}):
+                return True
+        return False
+
+    return assign(0, frozenset(), {})
+
+
+def get_required_duts(item) -> int:
+    multidut = next(item.iter_markers(name="multidut"), None)
+    return multidut.args[0] if multidut is not None else 1
+
+
+def strip_worker_options(args: list) -> list:
+    stripped = []
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+        elif arg in _worker_flags:
+            continue
+        elif arg in _worker_options:
+            skip_value = True
+        elif not any(arg.startswith(f"{option}=") for option in _worker_options):
+            stripped.append(arg)
+    return stripped
+
+
+class Worker:
+    def __init__(self, dut_configs: list, disk_types: list):
+        self.dut_configs = dut_configs
+        self.disk_types = disk_types
+        self.name = "+".join(
+            os.path.splitext(os.path.basename(path))[0] for path in dut_configs
+        )
+        self.tests = []
+        self.load = 0.0
+        self.exit_code = None
+        self.duration = None
+
+    def accepts(self, requirements: list) -> bool:
+        return all(satisfies_requirements(requirements, types) for types in self.disk_types)
+
+
+class DutScheduler:
+    """
+    Runs collected tests in parallel on a pool of DUTs given with --dut-config, one worker
+    pytest process per DUT. Tests requiring N DUTs (multidut marker) are run after single DUT
+    tests, on disjoint groups of N DUTs. Tests are assigned longest first (by durations
+    of previous runs) to the least loaded worker whose DUTs meet test disk requirements.
+    Worker logs are stored in per DUT directories of a common log path, together with
+    the schedule and test durations used for balancing next runs.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.log_path = config.getoption("--log-path")
+        self.durations_path = config.getoption("--test-durations") or os.path.join(
+            self.log_path, "test_durations.json"
+        )
+        self.durations = {}
+        if os.path.exists(self.durations_path):
+            with open(self.durations_path) as durations_file:
+                self.durations = json.load(durations_file)
+        self.dut_configs = config.getoption("--dut-config")
+        self.disk_types = {}
+        for path in self.dut_configs:
+            with open(path) as dut_config_file:
+                dut_config = yaml.safe_load(dut_config_file)
+            self.disk_types[path] = [
+                DiskType[disk["type"]] for disk in dut_config.get("disks", [])
+            ]
+
+    def get_duration(self, nodeid: str) -> float:
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return (
+            statistics.median(self.durations.values())
+            if self.durations
+            else DEFAULT_TEST_DURATION
+        )
+
+    def schedule(self, items: list, required_duts: int) -> list:
+        groups = [
+            self.dut_configs[index: index + required_duts]
+            for index in range(0, len(self.dut_configs) - required_duts + 1, required_duts)
+        ]
+        workers = [Worker(group, [self.disk_types[path] for path in group]) for group in groups]
+        for item in sorted(items, key=lambda item: -self.get_duration(item.nodeid)):
+            requirements = get_disk_requirements(item)
+            candidates = [worker for worker in workers if worker.accepts(requirements)]
+            # Test which can't run anywhere goes to any worker, where it is skipped
+            worker = min(candidates or workers, key=lambda worker: worker.load)
+            worker.tests.append(item.nodeid)
+            worker.load += self.get_duration(item.nodeid)
+        return [worker for worker in workers if worker.tests]
+
+    def run_workers(self, workers: list, phase_path: str):
+        args = strip_worker_options(list(self.config.invocation_params.args))
+        processes = []
+        for worker in workers:
+            worker_path = os.path.join(phase_path, worker.name)
+            os.makedirs(worker_path, exist_ok=True)
+            tests_path = os.path.join(worker_path, "scheduled_tests.txt")
+            with open(tests_path, "w") as tests_file:
+                tests_file.write("\n".join(worker.tests))
+            command = [sys.executable, "-m", "pytest", *args]
+            for path in worker.dut_configs:
+                command += ["--dut-config", path]
+            command += ["--log-path", worker_path, "--scheduled-tests", tests_path]
+            with open(os.path.join(worker_path, "pytest.log"), "w") as output:
+                processes.append(
+                    (
+                        worker,
+                        time.time(),
+                        subprocess.Popen(
+                            command,
+                            cwd=self.config.invocation_params.dir,
+                            stdout=output,
+                            stderr=subprocess.STDOUT,
+                        ),
+                    )
+                )
+            print(
+                f"DUT scheduler: {worker.name} runs {len(worker.tests)} tests, "
+                f"estimated {worker.load / 60:.0f} min"
+            )
+
+        while processes:
+            for worker, start, process in list(processes):
+                if process.poll() is None:
+                    continue
+                processes.remove((worker, start, process))
+                worker.exit_code = process.returncode
+                worker.duration = time.time() - start
+                print(
+                    f"DUT scheduler: {worker.name} finished in {worker.duration / 60:.0f} min, "
+                    f"exit code {worker.exit_code}"
+                )
+                durations_path = os.path.join(phase_path, worker.name, "test_durations.json")
+                if os.path.exists(durations_path):
+                    with open(durations_path) as durations_file:
+                        self.durations.update(json.load(durations_file))
+            time.sleep(1)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.config.option.collectonly:
+            return None
+
+        items_by_duts = defaultdict(list)
+        for item in session.items:
+            items_by_duts[get_required_duts(item)].append(item)
+
+        schedule = {}
+        failed_workers = 0
+        for required_duts, items in sorted(items_by_duts.items()):
+            if required_duts > len(self.dut_configs):
+                print(
+                    f"DUT scheduler: {len(items)} tests require {required_duts} DUTs, "
+                    f"only {len(self.dut_configs)} DUT configs provided"
+                )
+                failed_workers += 1
+                continue
+            workers = self.schedule(items, required_duts)
+            self.run_workers(workers, os.path.join(self.log_path, f"{required_duts}_dut"))
+            for worker in workers:
+                schedule[worker.name] = {
+                    "dut_configs": worker.dut_configs,
+                    "tests": worker.tests,
+                    "exit_code": worker.exit_code,
+                    "duration": worker.duration,
+                }
+                # pytest exit code 5 means that all tests were deselected or skipped
+                if worker.exit_code not in [
+                    pytest.ExitCode.OK,
+                    pytest.ExitCode.NO_TESTS_COLLECTED,
+                ]:
+                    failed_workers += 1
+
+        with open(os.path.join(self.log_path, "schedule.json"), "w") as schedule_file:
+            json.dump(schedule, schedule_file, indent=2)
+        os.makedirs(os.path.dirname(os.path.abspath(self.durations_path)), exist_ok=True)
+        with open(self.durations_path, "w") as durations_file:
+            json.dump(self.durations, durations_file, indent=2)
+
+        session.testsfailed += failed_workers
+        return True
+
+
+class DutSchedulerWorker:
+    """Runs only tests scheduled for this worker and records their durations."""
+
+    def __init__(self, config):
+        self.log_path = config.getoption("--log-path")
+        with open(config.getoption("--scheduled-tests")) as tests_file:
+            self.scheduled_tests = set(tests_file.read().splitlines())
+        self.durations = defaultdict(float)
+
+    def pytest_collection_modifyitems(self, config, items):
+        selected = [item for item in items if item.nodeid in self.scheduled_tests]
+        config.hook.pytest_deselected(
+            items=[item for item in items if item.nodeid not in self.scheduled_tests]
+        )
+        items[:] = selected
+
+    def pytest_runtest_logreport(self, report):
+        self.durations[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        with open(os.path.join(self.log_path, "test_durations.json"), "w") as durations_file:
+            json.dump(self.durations, durations_file, indent=2)
@@ -0,0 +1,298 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+from collections import namedtuple
+
+from utils.performance import ConfigParameter, FlushMetric
+
+# Configuration parameters which aren't part of the key identifying comparable results
+_run_info_params = [
+    ConfigParameter.TEST_NAME,
+    ConfigParameter.CAS_VERSION,
+    ConfigParameter.DUT,
+    ConfigParameter.BUILD_TYPE,
+    ConfigParameter.CACHE_TYPE,
+    ConfigParameter.CORE_TYPE,
+    ConfigParameter.TIMESTAMP,
+]
+
+_schema = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    test_name TEXT NOT NULL,
+    config_key TEXT NOT NULL,
+    cache_type TEXT,
+    core_type TEXT,
+    cas_version TEXT,
+    build_type TEXT,
+    dut TEXT,
+    timestamp TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_key ON runs(test_name, config_key, cache_type, core_type);
+CREATE INDEX IF NOT EXISTS metrics_run ON metrics(run_id);
+"""
+
+MetricComparison = namedtuple(
+    "MetricComparison", ["metric", "value", "mean", "stddev", "samples", "change", "regression"]
+)
+
+
+def lower_is_better(metric: str) -> bool:
+    """Latencies and flush duration are better when lower, other metrics when higher."""
+    name = metric.split(".")[1]
+    return "CLAT" in name or name == str(FlushMetric.DURATION_S)
+
+
+def get_config_key(result: dict) -> str:
+    """
+    Returns key of comparable results - cache configuration, workload parameters and all
+    other test specific configuration parameters, without run information like CAS version.
+    """
+    run_info = {str(param) for param in _run_info_params}
+    config = {
+        name: value
+        for name, value in result.items()
+        if name not in run_info and not isinstance(value, dict)
+    }
+    for name in [str(ConfigParameter.CACHE_CONFIG), "workload_params"]:
+        if name in result:
+            config[name] = result[name]
+    return json.dumps(config, sort_keys=True)
+
+
+def get_metrics(result: dict) -> dict:
+    """Flattens numeric metrics of serialized PerfContainer, e.g. 'exp_obj_io.read_IOPS'."""
+    def flatten(prefix, values):
+        for name, value in values.items():
+            name = f"{prefix}.{name}"
+            if isinstance(value, dict):
+                yield from flatten(name, value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield name, float(value)
+
+    metrics = {}
+    for group, values in result.items():
+        # CAS statistics and CPU profile explain results, they aren't compared themselves
+        if isinstance(values, dict) and group not in [
+            str(ConfigParameter.CACHE_CONFIG),
+            "workload_params",
+            "cas_stats",
+            "cpu_profile",
+        ]:
+            metrics.update(flatten(group, values))
+    return metrics
+
+
+class PerfResultsStore:
+    """SQLite database of results gathered by perf_collector (PerfContainer dictionaries)."""
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_schema)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def ingest(self, result: dict) -> int:
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (test_name, config_key, cache_type, core_type, cas_version, "
+                "build_type, dut, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result[str(ConfigParameter.TEST_NAME)],
+                    get_config_key(result),
+                    result.get(str(ConfigParameter.CACHE_TYPE)),
+                    result.get(str(ConfigParameter.CORE_TYPE)),
+                    result.get(str(ConfigParameter.CAS_VERSION)),
+                    result.get(str(ConfigParameter.BUILD_TYPE)),
+                    result.get(str(ConfigParameter.DUT)),
+                    result.get(str(ConfigParameter.TIMESTAMP)),
+                ),
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO metrics (run_id, name, value) VALUES (?, ?, ?)",
+                [(run_id, name, value) for name, value in get_metrics(result).items()],
+            )
+        return run_id
+
+    def ingest_file(self, path: str) -> int:
+        with open(path) as perf_file:
+            return self.ingest(json.load(perf_file))
+
+    def get_history(self, result: dict, metric: str, build_type: str = None, limit: int = None):
+        """
+        Returns [(timestamp, CAS version, value)] of the given metric for runs comparable
+        with result, from the oldest to the newest.
+        """
+        query = (
+            "SELECT runs.timestamp, runs.cas_version, metrics.value FROM runs "
+            "JOIN metrics ON metrics.run_id = runs.id "
+            "WHERE runs.test_name = ? AND runs.config_key = ? AND runs.cache_type IS ? "
+            "AND runs.core_type IS ? AND metrics.name = ?"
+        )
+        args = [
+            result[str(ConfigParameter.TEST_NAME)],
+            get_config_key(result),
+            result.get(str(ConfigParameter.CACHE_TYPE)),
+            result.get(str(ConfigParameter.CORE_TYPE)),
+            metric,
+        ]
+        if build_type:
+            query += " AND runs.build_type = ?"
+            args.append(build_type)
+        query += " ORDER BY runs.timestamp DESC, runs.id DESC"
+        if limit:
+            query += " LIMIT ?"
+            args.append(limit)
+        return list(reversed(self.connection.execute(query, args).fetchall()))
+
+    def compare(
+        self,
+        result: dict,
+        baseline_build_type: str = "master",
+        window: int = 10,
+        tolerance: float = 0.05,
+        stddev_factor: float = 3.0,
+        min_samples: int = 3,
+    ) -> list:
+        """
+        Compares every metric of result with baseline - mean and standard deviation of the
+        last window comparable runs of baseline build type. Metric is a regression if it is
+        worse than baseline mean by more than both tolerance (relative) and stddev_factor
+        standard deviations. Metrics with less than min_samples baseline runs are skipped.
+        """
+        comparison = []
+        for metric, value in get_metrics(result).items():
+            history = self.get_history(result, metric, baseline_build_type, window)
+            if len(history) < min_samples:
+                continue
+            values = [sample_value for _, _, sample_value in history]
+            mean = statistics.mean(values)
+            stddev = statistics.stdev(values)
+            change = (value - mean) / mean if mean else 0.0
+            worse_by = -change if not lower_is_better(metric) else change
+            regression = worse_by > tolerance and abs(value - mean) > stddev_factor * stddev
+            comparison.append(
+                MetricComparison(metric, value, mean, stddev, len(values), change, regression)
+            )
+        return comparison
+
+    def get_keys(self, test_name: str = None) -> list:
+        """Returns list of (test name, config key, cache type, core type) stored in database."""
+        query = "SELECT DISTINCT test_name, config_key, cache_type, core_type FROM runs"
+        args = []
+        if test_name:
+            query += " WHERE test_name = ?"
+            args.append(test_name)
+        return self.connection.execute(query + " ORDER BY test_name, config_key", args).fetchall()
+
+    def get_runs(self, key: tuple, build_type: str = None, limit: int = None) -> list:
+        """Returns [(run id, timestamp, CAS version, {metric: value})] from the oldest."""
+        query = (
+            "SELECT id, timestamp, cas_version FROM runs WHERE test_name = ? AND config_key = ? "
+            "AND cache_type IS ? AND core_type IS ?"
+        )
+        args = list(key)
+        if build_type:
+            query += " AND build_type = ?"
+            args.append(build_type)
+        query += " ORDER BY timestamp DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            args.append(limit)
+        runs = []
+        for run_id, timestamp, cas_version in reversed(
+            self.connection.execute(query, args).fetchall()
+        ):
+            metrics = dict(
+                self.connection.execute(
+                    "SELECT name, value FROM metrics WHERE run_id = ?", (run_id,)
+                ).fetchall()
+            )
+            runs.append((run_id, timestamp, cas_version, metrics))
+        return runs
+
+
+def format_comparison(comparison: list) -> str:
+    lines = [f"{'metric':<48} {'value':>14} {'baseline':>14} {'stddev':>12} {'change':>8}"]
+    for item in comparison:
+        lines.append(
+            f"{item.metric:<48} {item.value:>14.1f} {item.mean:>14.1f} {item.stddev:>12.1f} "
+            f"{item.change:>+8.1%}{'  REGRESSION' if item.regression else ''}"
+        )
+    return "\n".join(lines)
+
+
+def format_trend(store: PerfResultsStore, key: tuple, build_type: str = None, limit: int = None):
+    """Returns trend table per metric (one row per run) for the given results key."""
+    runs = store.get_runs(key, build_type, limit)
+    test_name, config_key, cache_type, core_type = key
+    lines = [f"{test_name} cache: {cache_type} core: {core_type}", f"  config: {config_key}"]
+    metric_names = sorted({name for _, _, _, metrics in runs for name in metrics})
+    for metric in metric_names:
+        values = [metrics[metric] for _, _, _, metrics in runs if metric in metrics]
+        stddev = statistics.stdev(values) if len(values) > 1 else 0.0
+        lines.append(f"  {metric}: mean {statistics.mean(values):.1f} stddev {stddev:.1f}")
+        previous = None
+        for _, timestamp, cas_version, metrics in runs:
+            if metric not in metrics:
+                continue
+            value = metrics[metric]
+            change = f"{(value - previous) / previous:+.1%}" if previous else ""
+            lines.append(f"    {timestamp:<28} {cas_version or '':<24} {value:>14.1f} {change:>8}")
+            previous = value
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Performance results store")
+    parser.add_argument("--db", required=True, help="Path to SQLite database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_ingest = subparsers.add_parser("ingest", help="Ingest perf.json files")
+    parser_ingest.add_argument(
+        "paths", nargs="+", help="perf.json files or log directories to search for them"
+    )
+
+    parser_report = subparsers.add_parser("report", help="Print per metric trend tables")
+    parser_report.add_argument("--test", help="Report only given test")
+    parser_report.add_argument("--build-type", help="Report only runs of given build type")
+    parser_report.add_argument("--last", type=int, help="Report only last N runs")
+
+    args = parser.parse_args()
+    with PerfResultsStore(args.db) as store:
+        if args.command == "ingest":
+            for path in args.paths:
+                if os.path.isfile(path):
+                    store.ingest_file(path)
+                    continue
+                for directory, _, files in os.walk(path):
+                    if "perf.json" in files:
+                        store.ingest_file(os.path.join(directory, "perf.json"))
+        else:
+            for key in store.get_keys(args.test):
+                print(format_trend(store, key, args.build_type, args.last))
+                print()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 #
 
+from contextlib import contextmanager
 from enum import Enum
 from types import MethodType
 from datetime import datetime
 
 from schema import Schema, Use, And, SchemaError, Or
 
+from type_def.size import Unit
+
 
 class ValidatableParameter(Enum):
     """
@@ -68,6 +71,45 @@ class IOMetric(ValidatableParameter):
     read_CLAT_PERCENTILES = Schema({Use(PercentileMetric): Use(int)})
     write_CLAT_PERCENTILES = Schema({Use(PercentileMetric): Use(int)})
 
+
+class FlushMetric(ValidatableParameter):
+    DIRTY_DATA_MiB = Schema(Use(float))
+    DURATION_S = Schema(Use(float))
+    AVG_THROUGHPUT_MiBps = Schema(Use(float))
+    # List of [seconds since flush start, throughput in MiB/s] pairs
+    THROUGHPUT_CURVE = Schema([[Use(float)]])
+    # List of [seconds since flush start, stall duration in seconds] pairs
+    STALLS = Schema([[Use(float)]])
+
+
+class CasMetric(ValidatableParameter):
+    """CAS statistics gathered during workload - differences between snapshots unless final"""
+
+    READ_HIT_RATIO = Schema(And(Use(float), lambda ratio: 0 <= ratio <= 1))
+    WRITE_HIT_RATIO = Schema(And(Use(float), lambda ratio: 0 <= ratio <= 1))
+    READ_REQUESTS = Schema(And(Use(int), lambda count: count >= 0))
+    WRITE_REQUESTS = Schema(And(Use(int), lambda count: count >= 0))
+    PASS_THROUGH_READS = Schema(And(Use(int), lambda count: count >= 0))
+    PASS_THROUGH_WRITES = Schema(And(Use(int), lambda count: count >= 0))
+    CORE_READS_MiB = Schema(Use(float))
+    CORE_WRITES_MiB = Schema(Use(float))
+    CACHE_READS_MiB = Schema(Use(float))
+    CACHE_WRITES_MiB = Schema(Use(float))
+    FINAL_OCCUPANCY_MiB = Schema(Use(float))
+    FINAL_DIRTY_MiB = Schema(Use(float))
+    OCCUPANCY_DELTA_MiB = Schema(Use(float))
+    DIRTY_DELTA_MiB = Schema(Use(float))
+
+
+class CpuProfileMetric(ValidatableParameter):
+    METHOD = Schema(Or("perf", "procstat"))
+    SAMPLES = Schema(Use(int))
+    # Share of all samples per thread name and per function on top of the stack
+    THREAD_SHARES = Schema({Use(str): Use(float)})
+    FUNCTION_SHARES = Schema({Use(str): Use(float)})
+    FOLDED_STACKS_PATH = Schema(Use(str))
+
+
 BuildTypes = ["master", "pr", "other"]
 
 class ConfigParameter(ValidatableParameter):
@@ -81,6 +123,9 @@ class ConfigParameter(ValidatableParameter):
     CACHE_TYPE = Schema(Use(str))
     CORE_TYPE = Schema(Use(str))
     TIMESTAMP = Schema(And(datetime, Use(str)))
+    IO_CLASS_COUNT = Schema(Use(int))
+    IO_CLASS_RULE_TYPE = Schema(Use(str))
+    LATENCY_HISTOGRAMS = Schema(Use(bool))
 
 
 class WorkloadParameter(ValidatableParameter):
@@ -119,6 +164,8 @@ class MetricContainer:
                     pass
                 elif isinstance(v, float):
                     pass
+                elif isinstance(v, list):
+                    pass
                 else:
                     v = str(v)
 
@@ -138,6 +185,14 @@ class PerfContainer:
         self.cache_metrics = MetricContainer(IOMetric)
         self.core_metrics = MetricContainer(IOMetric)
         self.exp_obj_metrics = MetricContainer(IOMetric)
+        # Exported object metrics for reference configuration of the same cache instance
+        self.baseline_exp_obj_metrics = MetricContainer(IOMetric)
+
+        self.flush_metrics = MetricContainer(FlushMetric)
+
+        self.cas_metrics = MetricContainer(CasMetric)
+
+        self.cpu_profile = MetricContainer(CpuProfileMetric)
 
     def insert_config_param(self, param, kind: ConfigParameter):
         self.conf_params.insert_metric(param, kind)
@@ -191,6 +246,95 @@ class PerfContainer:
     def insert_exp_obj_metrics_from_fio_job(self, fio_results):
         self._insert_metrics_from_fio(self.exp_obj_metrics, fio_results)
 
+    def insert_baseline_exp_obj_metric(self, metric, kind: IOMetric):
+        self.baseline_exp_obj_metrics.insert_metric(metric, kind)
+
+    def insert_baseline_exp_obj_metrics_from_fio_job(self, fio_results):
+        self._insert_metrics_from_fio(self.baseline_exp_obj_metrics, fio_results)
+
+    def insert_flush_metric(self, metric, kind: FlushMetric):
+        self.flush_metrics.insert_metric(metric, kind)
+
+    def insert_flush_metrics_from_recorder(self, recorder):
+        self.insert_flush_metric(
+            recorder.dirty_data.get_value(Unit.MebiByte), FlushMetric.DIRTY_DATA_MiB
+        )
+        self.insert_flush_metric(recorder.duration.total_seconds(), FlushMetric.DURATION_S)
+        self.insert_flush_metric(
+            recorder.get_average_throughput(), FlushMetric.AVG_THROUGHPUT_MiBps
+        )
+        self.insert_flush_metric(recorder.get_throughput_curve(), FlushMetric.THROUGHPUT_CURVE)
+        self.insert_flush_metric(recorder.get_stalls(), FlushMetric.STALLS)
+
+    def insert_cas_metric(self, metric, kind: CasMetric):
+        self.cas_metrics.insert_metric(metric, kind)
+
+    def insert_cas_metrics_from_stats(self, stats_before, stats_after):
+        """Takes CacheStats or CoreStats gathered before and after workload"""
+
+        def delta(get_value):
+            return get_value(stats_after) - get_value(stats_before)
+
+        def delta_mib(get_size):
+            return delta(lambda stats: get_size(stats).get_value(Unit.MebiByte))
+
+        for operation, hit_ratio_kind, requests_kind in [
+            ("read", CasMetric.READ_HIT_RATIO, CasMetric.READ_REQUESTS),
+            ("write", CasMetric.WRITE_HIT_RATIO, CasMetric.WRITE_REQUESTS),
+        ]:
+            hits = delta(lambda stats: getattr(stats.request_stats, operation).hits)
+            total = delta(lambda stats: getattr(stats.request_stats, operation).total)
+            self.insert_cas_metric(hits / total if total else 0, hit_ratio_kind)
+            self.insert_cas_metric(total, requests_kind)
+
+        self.insert_cas_metric(
+            delta(lambda stats: stats.request_stats.pass_through_reads),
+            CasMetric.PASS_THROUGH_READS,
+        )
+        self.insert_cas_metric(
+            delta(lambda stats: stats.request_stats.pass_through_writes),
+            CasMetric.PASS_THROUGH_WRITES,
+        )
+        self.insert_cas_metric(
+            delta_mib(lambda stats: stats.block_stats.core.reads), CasMetric.CORE_READS_MiB
+        )
+        self.insert_cas_metric(
+            delta_mib(lambda stats: stats.block_stats.core.writes), CasMetric.CORE_WRITES_MiB
+        )
+        self.insert_cas_metric(
+            delta_mib(lambda stats: stats.block_stats.cache.reads), CasMetric.CACHE_READS_MiB
+        )
+        self.insert_cas_metric(
+            delta_mib(lambda stats: stats.block_stats.cache.writes), CasMetric.CACHE_WRITES_MiB
+        )
+
+        self.insert_cas_metric(
+            stats_after.usage_stats.occupancy.get_value(Unit.MebiByte),
+            CasMetric.FINAL_OCCUPANCY_MiB,
+        )
+        self.insert_cas_metric(
+            stats_after.usage_stats.dirty.get_value(Unit.MebiByte), CasMetric.FINAL_DIRTY_MiB
+        )
+        self.insert_cas_metric(
+            delta_mib(lambda stats: stats.usage_stats.occupancy), CasMetric.OCCUPANCY_DELTA_MiB
+        )
+        self.insert_cas_metric(
+            delta_mib(lambda stats: stats.usage_stats.dirty), CasMetric.DIRTY_DELTA_MiB
+        )
+
+    def insert_cpu_profile(self, metric, kind: CpuProfileMetric):
+        self.cpu_profile.insert_metric(metric, kind)
+
+    @contextmanager
+    def capture_cas_stats(self, device):
+        """
+        Inserts CAS metrics from statistics of cache or core gathered before and after
+        workload run inside 'with' block
+        """
+        stats_before = device.get_statistics()
+        yield
+        self.insert_cas_metrics_from_stats(stats_before, device.get_statistics())
+
     @property
     def is_empty(self):
         return (
@@ -199,6 +343,10 @@ class PerfContainer:
             and self.cache_metrics.is_empty
             and self.core_metrics.is_empty
             and self.exp_obj_metrics.is_empty
+            and self.baseline_exp_obj_metrics.is_empty
+            and self.flush_metrics.is_empty
+            and self.cas_metrics.is_empty
+            and self.cpu_profile.is_empty
         )
 
     def to_serializable_dict(self):
@@ -212,5 +360,13 @@ class PerfContainer:
             ret["core_io"] = self.core_metrics.to_serializable_dict()
         if not self.exp_obj_metrics.is_empty:
             ret["exp_obj_io"] = self.exp_obj_metrics.to_serializable_dict()
+        if not self.baseline_exp_obj_metrics.is_empty:
+            ret["baseline_exp_obj_io"] = self.baseline_exp_obj_metrics.to_serializable_dict()
+        if not self.flush_metrics.is_empty:
+            ret["flush"] = self.flush_metrics.to_serializable_dict()
+        if not self.cas_metrics.is_empty:
+            ret["cas_stats"] = self.cas_metrics.to_serializable_dict()
+        if not self.cpu_profile.is_empty:
+            ret["cpu_profile"] = self.cpu_profile.to_serializable_dict()
 
         return ret
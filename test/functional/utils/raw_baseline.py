@@ -0,0 +1,131 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from core.test_run import TestRun
+from test_tools.fio.fio_result import FioResult
+from type_def.size import Unit
+
+# Maximum relative difference of IOPS between stored baseline and sanity run
+SANITY_TOLERANCE = 0.1
+
+
+def _to_dict(obj):
+    if isinstance(obj, SimpleNamespace):
+        return {name: _to_dict(value) for name, value in vars(obj).items()}
+    if isinstance(obj, list):
+        return [_to_dict(value) for value in obj]
+    return obj
+
+
+def _to_results(data: dict) -> list:
+    data = json.loads(json.dumps(data), object_hook=lambda d: SimpleNamespace(**d))
+    return [FioResult(data, job) for job in data.jobs]
+
+
+def _get_iops(results: list) -> float:
+    return sum(result.read_iops() + result.write_iops() for result in results)
+
+
+def get_disk_firmware(disk) -> str:
+    output = TestRun.executor.run(
+        f"dev=$(basename $(readlink -f {disk.path})); "
+        f"cat /sys/block/$dev/device/firmware_rev /sys/block/$dev/device/rev 2>/dev/null"
+    )
+    return output.stdout.strip() or "unknown"
+
+
+class RawBaselineRegistry:
+    """
+    Results of fio runs on raw devices reused between tests. Results are keyed by disk serial
+    number and firmware, size of the tested device (partition) and full fio command.
+    Stored results older than max_age are measured again, younger ones are re-validated with
+    a short sanity run first. If path is given, results are kept in JSON file on test
+    controller, so they survive between test sessions.
+    """
+
+    def __init__(self, path: str = None, max_age: timedelta = timedelta(days=1)):
+        self.path = path
+        self.max_age = max_age
+        self.baselines = {}
+        if path and os.path.exists(path):
+            with open(path) as registry_file:
+                self.baselines = json.load(registry_file)
+
+    def _save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as registry_file:
+            json.dump(self.baselines, registry_file, indent=2)
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def get_key(fio_command, disk, device) -> str:
+        description = {
+            "serial": disk.serial_number,
+            "firmware": get_disk_firmware(disk),
+            "device_size": int(device.size.get_value(Unit.Byte)),
+            "fio": str(fio_command),
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def run(
+        self,
+        fio_command,
+        disk,
+        device,
+        run_time: timedelta,
+        sanity_run_time: timedelta = timedelta(seconds=30),
+    ) -> list:
+        """
+        Returns results of fio_command run on device (partition of disk) for given run time,
+        reusing stored results if they are still valid.
+        """
+        fio_command.target(device).run_time(run_time)
+        key = self.get_key(fio_command, disk, device)
+        baseline = self.baselines.get(key)
+
+        if baseline is not None:
+            age = datetime.now() - datetime.fromisoformat(baseline["timestamp"])
+            results = _to_results(baseline["results"])
+            if age <= self.max_age and self._sanity_check(
+                fio_command, results, run_time, sanity_run_time
+            ):
+                TestRun.LOGGER.info(f"Reusing raw device results measured {age} ago")
+                return results
+
+        results = fio_command.run()
+        self.baselines[key] = {
+            "timestamp": datetime.now().isoformat(),
+            "results": _to_dict(results[0].result),
+        }
+        self._save()
+        return results
+
+    @staticmethod
+    def _sanity_check(fio_command, results, run_time, sanity_run_time) -> bool:
+        fio_command.run_time(sanity_run_time)
+        try:
+            sanity_results = fio_command.run()
+        finally:
+            fio_command.run_time(run_time)
+
+        stored_iops = _get_iops(results)
+        sanity_iops = _get_iops(sanity_results)
+        difference = abs(sanity_iops - stored_iops) / stored_iops if stored_iops else 1
+        if difference > SANITY_TOLERANCE:
+            TestRun.LOGGER.info(
+                f"Stored raw device results are outdated (IOPS {stored_iops:.0f}, "
+                f"sanity run {sanity_iops:.0f}), measuring again"
+            )
+            return False
+        return True
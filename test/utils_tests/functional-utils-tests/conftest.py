@@ -0,0 +1,17 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import os
+import sys
+
+functional_tests_path = os.path.join(os.path.dirname(__file__), "..", "..", "functional")
+
+
+def pytest_configure(config):
+    sys.path.append(functional_tests_path)
+    sys.path.append(os.path.join(functional_tests_path, "test-framework"))
+    # Same import order as in functional tests conftest, other api.cas modules import
+    # statistics partially initialized otherwise
+    import api.cas.casadm  # noqa: F401
@@ -0,0 +1,208 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import pytest
+from unittest.mock import patch
+
+from utils.classifier import READ, WRITE, Classifier, RequestBatch
+from utils.classifier.conditions import UnknownConditionError
+
+file_request = {"path": "/mnt/dir/file.txt", "file_size": 4096, "file_offset": 0}
+
+
+def classify(rules: dict, records: list) -> list:
+    return Classifier(rules).classify(RequestBatch.from_records(records)).tolist()
+
+
+@pytest.mark.parametrize(
+    "rule,request_desc,match",
+    [
+        ("metadata", {"metadata": True}, True),
+        ("metadata", {"metadata": True, "direct": True}, False),
+        ("metadata", file_request, False),
+        ("direct", {"direct": True}, True),
+        ("direct", {}, False),
+        ("file_size:le:4096", file_request, True),
+        ("file_size:lt:4096", file_request, False),
+        ("file_size:ge:0", {}, False),
+        ("directory:/mnt/dir", file_request, True),
+        ("directory:/mnt/dir/", file_request, True),
+        ("directory:/mnt/dir", {"path": "/mnt/dir"}, True),
+        ("directory:/mnt/di", file_request, False),
+        ("directory:/mnt/dir", {"path": "/mnt/dir2/file.txt"}, False),
+        ("directory:/", file_request, True),
+        ("directory:/", {}, False),
+        ("core_id:eq:1", {"core_id": 1}, True),
+        ("core_id:eq:1", {"core_id": 2}, False),
+        ("extension:txt", file_request, True),
+        ("extension:tx", file_request, False),
+        ("extension:txt", {"path": "/mnt/dir.txt/file"}, False),
+        ("extension:txt", {"path": "/mnt/dir/file.tar.txt"}, True),
+        ("file_name_prefix:fi", file_request, True),
+        ("file_name_prefix:di", file_request, False),
+        ("file_name_prefix:fi", {}, False),
+        ("lba:ge:100", {"lba": 100}, True),
+        ("lba:ge:100", {"lba": 99}, False),
+        ("lba:100", {"lba": 100}, True),
+        ("pid:eq:10", {"pid": 10}, True),
+        ("pid:ne:10", {"pid": 10}, False),
+        ("process_name:fio", {"process_name": "fio"}, True),
+        ("process_name:fio", {"process_name": "fio_worker"}, False),
+        ("process_name:abcdefghijklmno", {"process_name": "abcdefghijklmnopqr"}, True),
+        ("file_offset:lt:4096", file_request, True),
+        ("file_offset:ge:4096", file_request, False),
+        ("file_offset:ge:0", {}, False),
+        ("request_size:gt:512", {"request_size": 4096}, True),
+        ("request_size:gt:512", {"request_size": 512}, False),
+        ("io_direction:write", {"io_direction": WRITE}, True),
+        ("io_direction:read", {"io_direction": WRITE}, False),
+        ("io_direction:read", {"io_direction": READ}, True),
+        ("wlth:eq:2", {"write_hint": 2}, True),
+        ("wlth:eq:2", {"write_hint": 3}, False),
+        ("io_class:0", {}, True),
+        ("io_class:1", {}, False),
+    ],
+)
+def test_condition(rule, request_desc, match):
+    """
+    Check if single condition rule matches request the same way as its kernel handler
+    """
+
+    assert classify({1: rule}, [request_desc]) == [1 if match else 0]
+
+
+@pytest.mark.parametrize(
+    "operator,matching_values",
+    [
+        ("eq", [512]),
+        ("ne", [0, 4096]),
+        ("lt", [0]),
+        ("gt", [4096]),
+        ("le", [0, 512]),
+        ("ge", [512, 4096]),
+    ],
+)
+def test_numeric_operator(operator, matching_values):
+    """
+    Check if numeric operators compare request value with operand
+    """
+
+    values = [0, 512, 4096]
+
+    part_ids = classify(
+        {1: f"request_size:{operator}:512"}, [{"request_size": value} for value in values]
+    )
+
+    assert part_ids == [1 if value in matching_values else 0 for value in values]
+
+
+@pytest.mark.parametrize(
+    "rule,request_desc,match",
+    [
+        ("lba:eq:1&request_size:eq:512", {"lba": 1, "request_size": 512}, True),
+        ("lba:eq:1&request_size:eq:512", {"lba": 1, "request_size": 4096}, False),
+        ("lba:eq:1|request_size:eq:512", {"lba": 2, "request_size": 512}, True),
+        ("lba:eq:1|request_size:eq:512", {"lba": 2, "request_size": 4096}, False),
+        # Conditions are evaluated left to right, '&' has no precedence over '|'
+        ("lba:eq:1|lba:eq:2&request_size:eq:512", {"lba": 1, "request_size": 4096}, False),
+        # Evaluation stops at '&' if previous conditions don't match, even before '|'
+        ("lba:eq:1&lba:eq:2|request_size:eq:512", {"lba": 3, "request_size": 512}, False),
+        ("lba:eq:1&lba:eq:2|request_size:eq:512", {"lba": 1, "request_size": 512}, True),
+    ],
+)
+def test_logical_operators(rule, request_desc, match):
+    """
+    Check if '&' and '|' combine conditions the same way as cas_cls_process_rule() does
+    """
+
+    assert classify({1: rule}, [request_desc]) == [1 if match else 0]
+
+
+@pytest.mark.parametrize(
+    "rules,request_desc,part_id",
+    [
+        # Requests not matching any rule are assigned to default IO class
+        ({1: "lba:gt:0", 2: "lba:gt:10"}, {"lba": 0}, 0),
+        # Rule of default IO class is never created
+        ({0: "lba:ge:0"}, {"lba": 0}, 0),
+        # Last matching rule wins
+        ({1: "lba:ge:0", 2: "lba:ge:0", 3: "lba:gt:0"}, {"lba": 0}, 2),
+        # Rules are processed in ascending IO class id order, not in insertion order
+        ({2: "lba:ge:0", 1: "lba:ge:0"}, {"lba": 0}, 2),
+        # Matching rule with 'done' stops processing
+        ({1: "lba:ge:0&done", 2: "lba:ge:0"}, {"lba": 0}, 1),
+        ({1: "lba:ge:0|done", 2: "lba:ge:0"}, {"lba": 0}, 1),
+        # 'done' of rule not matching request doesn't stop processing
+        ({1: "lba:gt:0&done", 2: "lba:ge:0"}, {"lba": 0}, 2),
+        ({1: "lba:gt:0&done", 2: "lba:gt:10"}, {"lba": 0}, 0),
+        # 'done' after last matching rule keeps its class
+        ({1: "lba:ge:0", 2: "lba:gt:0&done"}, {"lba": 0}, 1),
+        # io_class condition sees class assigned by previous rules
+        ({1: "lba:ge:0", 2: "io_class:1"}, {"lba": 0}, 2),
+        ({1: "lba:gt:0", 2: "io_class:1"}, {"lba": 0}, 0),
+        ({1: "io_class:0", 2: "io_class:0"}, {"lba": 0}, 1),
+    ],
+)
+def test_priority_resolution(rules, request_desc, part_id):
+    """
+    Check if IO class is resolved the same way as cas_cls_classify() does
+    """
+
+    assert classify(rules, [request_desc]) == [part_id]
+
+
+@pytest.mark.parametrize(
+    "rule,exception",
+    [
+        ("unknown:1", UnknownConditionError),
+        ("lba:gt:0&unknown", UnknownConditionError),
+        ("metadata:1", ValueError),
+        ("done:1", ValueError),
+        ("lba", ValueError),
+        ("lba:gt:-1", ValueError),
+        ("lba:gt:18446744073709551616", ValueError),
+        ("lba:between:1", ValueError),
+        ("extension:", ValueError),
+        ("extension:" + "a" * 256, ValueError),
+        ("io_direction:trim", ValueError),
+        ("core_id:4096", ValueError),
+        ("directory", ValueError),
+        # Rule longer than IO class name limit
+        ("lba:gt:" + "0" * 1024, ValueError),
+    ],
+)
+def test_invalid_rule(rule, exception):
+    """
+    Check if invalid rules are rejected like by _cas_cls_parse_conditions()
+    """
+
+    with pytest.raises(exception):
+        Classifier({1: rule})
+
+
+def test_wlth_not_supported():
+    """
+    Check if wlth condition is unknown when kernel doesn't support write life time hints
+    """
+
+    with pytest.raises(UnknownConditionError):
+        Classifier({1: "wlth:eq:2"}, wlth_support=False)
+
+
+def test_classify_in_chunks():
+    """
+    Check if classification split into chunks gives the same result as single chunk
+    and if class distribution counts requests of every class
+    """
+
+    requests = RequestBatch(10, lba=list(range(10)), request_size=[512, 4096] * 5)
+    classifier = Classifier({1: "lba:lt:5", 2: "request_size:eq:4096&done", 3: "lba:ge:8"})
+
+    with patch("utils.classifier.classifier.CHUNK_SIZE", 3):
+        chunked = classifier.classify(requests).tolist()
+
+    assert chunked == classifier.classify(requests).tolist()
+    assert chunked == [1, 2, 1, 2, 1, 2, 0, 2, 3, 2]
+    assert classifier.get_class_distribution(requests) == {0: 1, 1: 3, 2: 5, 3: 1}
@@ -0,0 +1,47 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from api.cas.cache_config import CleaningPolicy, FlushParametersAlru
+from type_def.size import Size, Unit
+from type_def.time import Time
+from utils.cache_simulator.cleaning import CleaningSimulator
+
+cache_size = Size(1, Unit.GibiByte)
+core_bandwidth = Size(100, Unit.MebiByte)
+interval = 1.0
+# Single second of writes followed by idle time
+write_rates = [Size(40, Unit.MebiByte).get_value(Unit.Byte)] + [0] * 20
+
+
+def test_cleaning_simulator_alru_flush_max_buffers():
+    """
+    Check if ALRU cleaning per wake-up is limited by flush_max_buffers, so small
+    flush_max_buffers results in lower core load and higher mean dirty ratio
+    """
+
+    simulator = CleaningSimulator(cache_size, core_bandwidth)
+    line_bandwidth = core_bandwidth.get_value(Unit.Byte) / simulator.line_size
+    duration = len(write_rates) * interval
+    wake_up_time = Time(seconds=1)
+
+    small, large = [
+        simulator.simulate(
+            CleaningPolicy.alru,
+            FlushParametersAlru(
+                activity_threshold=Time(milliseconds=100),
+                flush_max_buffers=flush_max_buffers,
+                staleness_time=Time(seconds=1),
+                wake_up_time=wake_up_time,
+            ),
+            write_rates,
+            interval,
+        )
+        for flush_max_buffers in [100, 10000]
+    ]
+
+    cleaned = small.core_load * line_bandwidth * duration
+    assert cleaned <= 100 * (duration / wake_up_time.total_seconds() + 1)
+    assert small.core_load < large.core_load
+    assert small.mean_dirty_ratio > large.mean_dirty_ratio
@@ -0,0 +1,63 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import pytest
+from datetime import timedelta
+
+from api.cas.statistics import LatencyHistogram
+
+# '<lower [us]> <upper [us]> <count>' lines as printed by /sys/block/casX-Y/latency/*
+histogram_output = "0 1 10\n8 10 20\n10 12 30\n12 14 40\n"
+previous_histogram_output = "8 10 5\n12 14 40\n"
+
+
+def test_latency_histogram_parse():
+    """
+    Check if all buckets of histogram are parsed
+    """
+
+    histogram = LatencyHistogram.parse(histogram_output)
+
+    assert len(histogram.buckets) == 4
+    assert histogram.count == 100
+
+
+@pytest.mark.parametrize("percentile,expected", [(0, 0), (10, 1), (20, 9), (60, 12), (100, 14)])
+def test_latency_histogram_percentile(percentile, expected):
+    """
+    Check if percentiles are interpolated linearly within bucket
+    """
+
+    histogram = LatencyHistogram.parse(histogram_output)
+
+    assert histogram.percentile(percentile) == timedelta(microseconds=expected)
+
+
+@pytest.mark.parametrize(
+    "percentile,histogram",
+    [(101, LatencyHistogram.parse(histogram_output)), (50, LatencyHistogram([]))],
+)
+def test_latency_histogram_invalid_percentile(percentile, histogram):
+    """
+    Check if getting percentile out of range or of empty histogram fails
+    """
+
+    with pytest.raises(ValueError):
+        histogram.percentile(percentile)
+
+
+def test_latency_histogram_difference():
+    """
+    Check if difference of histograms contains only requests accounted in between
+    """
+
+    difference = LatencyHistogram.parse(histogram_output) - LatencyHistogram.parse(
+        previous_histogram_output
+    )
+
+    assert [(bucket.lower, bucket.upper, bucket.count) for bucket in difference.buckets] == [
+        (timedelta(microseconds=lower), timedelta(microseconds=upper), count)
+        for lower, upper, count in [(0, 1, 10), (8, 10, 15), (10, 12, 30)]
+    ]
@@ -0,0 +1,179 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+import pytest
+
+from utils.perf_results import PerfResultsStore, lower_is_better
+from utils.performance import ConfigParameter
+
+iops = "exp_obj_io.read_IOPS"
+latency = "exp_obj_io.read_CLAT_AVG"
+
+
+def get_result(day: int, iops_value: float, latency_value: float, **params) -> dict:
+    result = {
+        str(ConfigParameter.TEST_NAME): "test_perf",
+        str(ConfigParameter.CAS_VERSION): f"v{day}",
+        str(ConfigParameter.BUILD_TYPE): "master",
+        str(ConfigParameter.CACHE_TYPE): "nand",
+        str(ConfigParameter.CORE_TYPE): "hdd",
+        str(ConfigParameter.TIMESTAMP): f"2026-01-{day:02d} 00:00:00",
+        "workload_params": {"NUM_JOBS": 1},
+        "exp_obj_io": {"read_IOPS": iops_value, "read_CLAT_AVG": latency_value},
+    }
+    result.update({str(param): value for param, value in params.items()})
+    return result
+
+
+@pytest.fixture()
+def store():
+    with PerfResultsStore(":memory:") as store:
+        for day, iops_value in enumerate([990, 1000, 1010], start=1):
+            store.ingest(get_result(day, iops_value, 100))
+        yield store
+
+
+def get_comparison(store, result, **kwargs) -> dict:
+    return {item.metric: item for item in store.compare(result, **kwargs)}
+
+
+def test_compare_baseline():
+    """
+    Check if metric is compared with mean and standard deviation of baseline runs
+    """
+
+    with PerfResultsStore(":memory:") as store:
+        for day, iops_value in enumerate([800, 1000, 1200], start=1):
+            store.ingest(get_result(day, iops_value, 100))
+
+        comparison = get_comparison(store, get_result(4, 1100, 100))
+
+    assert comparison[iops].mean == 1000
+    assert comparison[iops].stddev == 200
+    assert comparison[iops].samples == 3
+    assert comparison[iops].change == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize(
+    "iops_value,latency_value,regressions",
+    [
+        (1000, 100, []),
+        # Within tolerance
+        (960, 104, []),
+        (1100, 100, []),
+        (900, 100, [iops]),
+        # Lower latency is an improvement, higher one is a regression
+        (1000, 80, []),
+        (1000, 120, [latency]),
+        (900, 120, [iops, latency]),
+    ],
+)
+def test_compare_regression(store, iops_value, latency_value, regressions):
+    """
+    Check if metric worse than baseline by more than tolerance is a regression
+    """
+
+    comparison = get_comparison(store, get_result(4, iops_value, latency_value))
+
+    assert sorted(metric for metric, item in comparison.items() if item.regression) == sorted(
+        regressions
+    )
+
+
+@pytest.mark.parametrize(
+    "tolerance,stddev_factor,regression",
+    [(0.05, 3.0, False), (0.2, 0.1, False), (0.05, 0.1, True)],
+)
+def test_compare_tolerance_and_stddev(tolerance, stddev_factor, regression):
+    """
+    Check if regression has to exceed both relative tolerance and standard deviations
+    """
+
+    with PerfResultsStore(":memory:") as store:
+        for day, iops_value in enumerate([800, 1000, 1200], start=1):
+            store.ingest(get_result(day, iops_value, 100))
+
+        comparison = get_comparison(
+            store,
+            get_result(4, 900, 100),
+            tolerance=tolerance,
+            stddev_factor=stddev_factor,
+        )
+
+    assert comparison[iops].regression == regression
+
+
+def test_compare_min_samples(store):
+    """
+    Check if metrics with not enough baseline runs are not compared
+    """
+
+    assert get_comparison(store, get_result(4, 500, 100), min_samples=4) == {}
+    assert get_comparison(store, get_result(4, 500, 100), min_samples=3) != {}
+
+
+def test_compare_window(store):
+    """
+    Check if only the last window baseline runs are taken
+    """
+
+    store.ingest(get_result(4, 2000, 100))
+
+    comparison = get_comparison(store, get_result(5, 1500, 100), window=2, min_samples=2)
+
+    assert comparison[iops].samples == 2
+    assert comparison[iops].mean == 1505
+
+
+def test_compare_baseline_build_type(store):
+    """
+    Check if only runs of baseline build type are taken
+    """
+
+    store.ingest(get_result(4, 100, 100, BUILD_TYPE="pr"))
+
+    comparison = get_comparison(store, get_result(5, 1000, 100))
+
+    assert comparison[iops].samples == 3
+    assert comparison[iops].mean == 1000
+    assert get_comparison(store, get_result(5, 1000, 100), baseline_build_type="pr") == {}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"CACHE_TYPE": "optane"},
+        {"IO_CLASS_COUNT": 4},
+        {"workload_params": {"NUM_JOBS": 8}},
+    ],
+)
+def test_compare_different_config(store, params):
+    """
+    Check if results of different configuration are not compared
+    """
+
+    result = get_result(4, 500, 100)
+    result.update(params)
+
+    assert get_comparison(store, result) == {}
+
+
+@pytest.mark.parametrize(
+    "metric,lower",
+    [
+        ("exp_obj_io.read_IOPS", False),
+        ("exp_obj_io.write_BW", False),
+        ("exp_obj_io.write_CLAT_AVG", True),
+        ("exp_obj_io.read_CLAT_PERCENTILES.p99", True),
+        ("flush.DURATION_S", True),
+        ("flush.AVG_THROUGHPUT_MiBps", False),
+    ],
+)
+def test_lower_is_better(metric, lower):
+    """
+    Check if only latencies and flush duration are better when lower
+    """
+
+    assert lower_is_better(metric) == lower
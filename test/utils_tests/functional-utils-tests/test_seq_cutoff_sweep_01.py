@@ -0,0 +1,132 @@
+#
+# Copyright(c) 2026 Huawei Technologies Co., Ltd.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+
+from unittest.mock import patch
+
+from api.cas.cache_config import SeqCutOffPolicy
+from type_def.size import Size, Unit
+from utils.cache_simulator.seq_cutoff_sweep import (
+    format_sweep_results,
+    get_best_result,
+    main,
+    sweep_seq_cutoff,
+)
+from utils.cache_simulator.trace import Trace
+
+stream_size = 8 * 2**20
+request_size = 128 * 2**10
+
+
+def get_trace_text():
+    """
+    fio iolog with sequential write of 8 MiB stream followed by sequential read of it
+    """
+    lines = ["fio version 3 iolog", "0 /dev/sdb add", "0 /dev/sdb open"]
+    for action in ["write", "read"]:
+        for offset in range(0, stream_size, request_size):
+            lines.append(f"{len(lines)} /dev/sdb {action} {offset} {request_size}")
+    return "\n".join(lines) + "\n"
+
+
+def test_sweep_seq_cutoff():
+    """
+    Check if stream longer than threshold bypasses cache and is missed when read back
+    and if sweep results are ordered like the grid
+    """
+
+    results = sweep_seq_cutoff(
+        trace=Trace.parse_fio_iolog(get_trace_text()),
+        cache_size=Size(64, Unit.MebiByte),
+        thresholds=[Size(1, Unit.MebiByte), Size(16, Unit.MebiByte)],
+        promotion_counts=[1, 8],
+        policy=SeqCutOffPolicy.always,
+        processes=2,
+    )
+
+    assert [
+        (int(result.threshold.get_value(Unit.MebiByte)), result.promotion_count)
+        for result in results
+    ] == [(1, 1), (1, 8), (16, 1), (16, 8)]
+    for short, long in [(results[0], results[2]), (results[1], results[3])]:
+        assert short.bypassed_bytes > 0
+        assert long.bypassed_bytes == 0
+        assert short.hit_ratio < long.hit_ratio
+
+
+def test_sweep_seq_cutoff_never():
+    """
+    Check if nothing bypasses cache with sequential cut-off policy never
+    """
+
+    results = sweep_seq_cutoff(
+        trace=Trace.parse_fio_iolog(get_trace_text()),
+        cache_size=Size(64, Unit.MebiByte),
+        thresholds=[Size(1, Unit.MebiByte)],
+        promotion_counts=[1],
+        policy=SeqCutOffPolicy.never,
+        processes=1,
+    )
+
+    assert [result.bypassed_bytes for result in results] == [0]
+
+
+def test_get_best_result():
+    """
+    Check if best result has the highest hit ratio and the least bypass on tie
+    """
+
+    results = sweep_seq_cutoff(
+        trace=Trace.parse_fio_iolog(get_trace_text()),
+        cache_size=Size(64, Unit.MebiByte),
+        thresholds=[Size(1, Unit.MebiByte), Size(16, Unit.MebiByte), Size(32, Unit.MebiByte)],
+        promotion_counts=[1],
+        policy=SeqCutOffPolicy.always,
+        processes=1,
+    )
+    tied = results[2]._replace(bypassed_bytes=1)
+
+    assert get_best_result(results) is results[1]
+    assert get_best_result([tied, results[1]]) is results[1]
+
+
+def test_format_sweep_results():
+    """
+    Check if every sweep result is printed in separate row after header
+    """
+
+    results = sweep_seq_cutoff(
+        trace=Trace.parse_fio_iolog(get_trace_text()),
+        cache_size=Size(64, Unit.MebiByte),
+        thresholds=[Size(1, Unit.MebiByte), Size(16, Unit.MebiByte)],
+        promotion_counts=[1],
+        processes=1,
+    )
+
+    lines = format_sweep_results(results).splitlines()
+
+    assert len(lines) == 3
+    assert lines[0].split() == ["threshold", "promotion", "bypassed", "hit", "ratio"]
+    assert lines[1].split()[:3] == ["1024", "KiB", "1"]
+    assert lines[2].split()[:3] == ["16384", "KiB", "1"]
+
+
+def test_main(tmp_path, capsys):
+    """
+    Check if sweep tool replays trace file and prints results with the best combination
+    """
+
+    trace_path = tmp_path / "trace.log"
+    trace_path.write_text(get_trace_text())
+    argv = (
+        f"seq_cutoff_sweep.py {trace_path} --cache-size 64 --thresholds 1024 16384 "
+        f"--promotion-counts 1 --policy always --cache-line-size 8 --processes 1"
+    ).split()
+
+    with patch("sys.argv", argv):
+        main()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 4
+    assert lines[-1] == "Best: threshold 16384 KiB, promotion count 1"
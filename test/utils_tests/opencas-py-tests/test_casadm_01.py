@@ -6,8 +6,9 @@
 import pytest
 import subprocess
 import unittest.mock as mock
+from io import StringIO
 
-from opencas import casadm
+from opencas import casadm, get_caches_list, stream_stats
 from helpers import get_process_mock
 
 
@@ -55,3 +56,107 @@ def test_get_version_02(mock_run):
     mock_run.return_value = get_process_mock(4, "successes", "errors")
     with pytest.raises(casadm.CasadmError):
         casadm.get_version()
+
+
+@mock.patch("subprocess.run")
+def test_get_caches_list_01(mock_run):
+    mock_run.return_value = get_process_mock(
+        0,
+        '{"core_pools":[{"id":null,"disk":null,"status":null,"write_policy":null,'
+        '"device":null,"cores":[{"id":null,"disk":"/dev/sdc","status":"Detached",'
+        '"write_policy":null,"device":null}]}],'
+        '"caches":[{"id":1,"disk":"/dev/sdb","status":"Running","write_policy":"wt",'
+        '"device":null,"cores":[{"id":1,"disk":"/dev/sdd","status":"Active",'
+        '"write_policy":null,"device":"/dev/cas1-1"}]},'
+        '{"id":2,"disk":"/dev/sde","status":"Running","write_policy":"wb","device":null}]}\n',
+        "",
+    )
+
+    devices = get_caches_list()
+
+    assert [(dev["type"], dev["id"], dev["disk"]) for dev in devices] == [
+        ("core pool", None, None),
+        ("core", None, "/dev/sdc"),
+        ("cache", 1, "/dev/sdb"),
+        ("core", 1, "/dev/sdd"),
+        ("cache", 2, "/dev/sde"),
+    ]
+    assert devices[3]["device"] == "/dev/cas1-1"
+
+
+@mock.patch("subprocess.Popen")
+def test_stream_stats_01(mock_popen):
+    process = get_process_mock(
+        0,
+        StringIO(
+            '[{"timestamp":{"s":1.0},"dirty_for":{"s":10}}]\n'
+            '[{"timestamp":{"s":2.0},"dirty_for":{"s":5}}]\n'
+        ),
+        "",
+    )
+    process.wait.return_value = 0
+    mock_popen.return_value = process
+
+    stats = list(stream_stats(1, core_id=2, count=2))
+
+    assert stats == [
+        {"timestamp": {"s": 1.0}, "dirty_for": {"s": 10}},
+        {"timestamp": {"s": 2.0}, "dirty_for": {"s": 5}},
+    ]
+    mock_popen.assert_called_once_with(
+        [casadm.casadm_path, "--stats", "--cache-id", "1", "--core-id", "2",
+         "--interval", "1", "--count", "2", "--output-format", "json"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=mock.ANY,
+    )
+
+
+@mock.patch("subprocess.Popen")
+def test_stream_stats_all_cores(mock_popen):
+    process = get_process_mock(
+        0,
+        StringIO(
+            '[{"timestamp":{"s":1.0},"core_id":1,"dirty_for":{"s":10}},'
+            '{"timestamp":{"s":1.0},"core_id":2,"dirty_for":{"s":0}}]\n'
+        ),
+        "",
+    )
+    process.wait.return_value = 0
+    mock_popen.return_value = process
+
+    stats = list(stream_stats(1, count=1, all_cores=True))
+
+    assert [record["core_id"] for record in stats] == [1, 2]
+    mock_popen.assert_called_once_with(
+        [casadm.casadm_path, "--stats", "--cache-id", "1", "--core-id",
+         "--interval", "1", "--count", "1", "--output-format", "json"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=mock.ANY,
+    )
+
+
+@mock.patch("subprocess.Popen")
+def test_stream_stats_02(mock_popen):
+    process = get_process_mock(1, StringIO(""), StringIO("Cache Id 1 not running"))
+    process.wait.return_value = 1
+    mock_popen.return_value = process
+
+    with pytest.raises(casadm.CasadmError):
+        list(stream_stats(1))
+
+
+@mock.patch("subprocess.Popen")
+def test_stream_stats_closed(mock_popen):
+    process = get_process_mock(
+        0, StringIO('[{"dirty_for":{"s":10}}]\n[{"dirty_for":{"s":5}}]\n'), ""
+    )
+    process.poll.return_value = None
+    mock_popen.return_value = process
+
+    stats = stream_stats(1)
+    assert next(stats) == {"dirty_for": {"s": 10}}
+    stats.close()
+
+    process.terminate.assert_called_once()
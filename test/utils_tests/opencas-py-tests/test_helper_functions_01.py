@@ -1015,3 +1015,64 @@ def test_start_cache(mock_run, load, force, failover):
         assert "--cache-id" not in casadm_call
         assert "--cache-mode" not in casadm_call
         assert "--cache-line-size" not in casadm_call
+
+
+@pytest.mark.parametrize("cache_line_size", [4, 8, 16, 32, 64])
+def test_metadata_plan_fits_cache_device(cache_line_size):
+    """
+    Check if estimated metadata together with cache lines fits on cache device
+    """
+    cache_size = 50 * 2**30
+    plan = opencas.metadata_plan(cache_size, cache_line_size, cores_count=16)
+
+    used = plan.metadata_size_on_device + plan.cache_lines * cache_line_size * 1024
+    assert used <= cache_size
+    # One more line would need another page in each per line segment at most
+    max_slack = (
+        cache_line_size * 1024
+        + len(opencas.metadata_plan.line_segments) * opencas.metadata_plan.page_size
+    )
+    assert cache_size - used < max_slack
+    assert plan.metadata_size_on_device == sum(plan.sections.values())
+    assert plan.memory_footprint > plan.metadata_memory_footprint
+
+
+@pytest.mark.parametrize("cache_line_size", [4, 8, 16, 32, 64])
+def test_metadata_plan_memory_footprint(cache_line_size):
+    """
+    Check if memory footprint follows OCF formula: 250 MiB + 68 B and 2 B per 4 KiB of
+    cache line for every cache line, regardless of number of cores
+    """
+    plans = [
+        opencas.metadata_plan(50 * 2**30, cache_line_size, cores_count=cores)
+        for cores in [1, 16]
+    ]
+
+    per_line = 68 + 2 * cache_line_size * 1024 // 4096
+    for plan in plans:
+        assert plan.memory_footprint == 250 * 2**20 + plan.cache_lines * per_line
+    assert plans[0].memory_footprint == plans[1].memory_footprint
+
+
+def test_metadata_plan_scales_with_cache_line_size():
+    """
+    Check if metadata size decreases with bigger cache lines
+    """
+    plans = [opencas.metadata_plan(100 * 2**30, size) for size in [4, 8, 16, 32, 64]]
+
+    sizes = [plan.metadata_size_on_device for plan in plans]
+    assert sizes == sorted(sizes, reverse=True)
+
+
+def test_metadata_plan_invalid_params():
+    """
+    Check if invalid cache line size and too small cache device are rejected
+    """
+    with pytest.raises(ValueError):
+        opencas.metadata_plan(2**30, 12)
+
+    with pytest.raises(ValueError):
+        opencas.metadata_plan(1024 * 1024, 4)
+
+    with pytest.raises(ValueError):
+        opencas.metadata_plan(2**30, 4, cores_count=4097)
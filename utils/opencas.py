@@ -5,10 +5,12 @@
 
 import subprocess
 import csv
+import json
 import re
 import os
 import stat
 import time
+import types
 
 # Casadm functionality
 
@@ -47,10 +49,26 @@ class casadm:
     def list_caches(cls):
         cmd = [cls.casadm_path,
                '--list-caches',
-               '--output-format', 'csv',
+               '--output-format', 'json',
                '--by-id-path']
         return cls.run_cmd(cmd)
 
+    @classmethod
+    def stats_interval(cls, cache_id, core_id=None, interval=1, count=None, all_cores=False):
+        cmd = [cls.casadm_path,
+               '--stats',
+               '--cache-id', str(cache_id)]
+        if core_id is not None:
+            cmd += ['--core-id', str(core_id)]
+        elif all_cores:
+            cmd += ['--core-id']
+        cmd += ['--interval', str(interval)]
+        if count:
+            cmd += ['--count', str(count)]
+        cmd += ['--output-format', 'json']
+        return subprocess.Popen(cmd, universal_newlines=True, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+
     @classmethod
     def check_cache_device(cls, device):
         cmd = [cls.casadm_path,
@@ -638,8 +656,39 @@ def is_core_added(core_config):
 
 
 def get_caches_list():
+    """
+    Returns flat list of devices in casadm list order: each core pool and cache
+    is followed by its cores
+    """
     result = casadm.list_caches()
-    return list(csv.DictReader(result.stdout.split('\n')))
+    devices = json.loads(result.stdout)
+    dev_list = []
+    for dev_type, key in [('core pool', 'core_pools'), ('cache', 'caches')]:
+        for dev in devices.get(key, []):
+            cores = dev.pop('cores', [])
+            dev_list.append(dict(dev, type=dev_type))
+            dev_list += [dict(core, type='core') for core in cores]
+    return dev_list
+
+
+def stream_stats(cache_id, core_id=None, interval=1, count=None, all_cores=False):
+    """
+    Yields dicts with statistics printed by single casadm process every interval
+    seconds, until count samples are printed or generator is closed. With all_cores
+    every sample consists of records of all cores, each with its core_id
+    """
+    process = casadm.stats_interval(cache_id, core_id, interval, count, all_cores)
+    try:
+        # Every record is printed as separate json document in single line
+        for line in process.stdout:
+            yield from json.loads(line)
+        if process.wait() != 0:
+            raise casadm.CasadmError(types.SimpleNamespace(
+                exit_code=process.returncode, stdout='', stderr=process.stderr.read()))
+    finally:
+        if process.poll() is None:
+            process.terminate()
+            process.wait()
 
 
 def check_cache_device(device):
@@ -890,3 +939,127 @@ def wait_for_startup(timeout=300, interval=5):
         time.sleep(interval)
 
     return not_initialized
+
+
+# Metadata footprint planning
+
+class metadata_plan(object):
+    """
+    Estimate of cache metadata size for given cache device size, cache line size and number
+    of cores. Layout follows OCF metadata segments - each segment is an array of fixed size
+    elements packed into 4 KiB pages (elements never cross page boundary). Per cache line
+    elements together with runtime data take 68 B plus valid and dirty bit for each sector
+    of cache line, and cache instance takes about 250 MiB of memory regardless of its size,
+    which is the formula used by OCF (and by test_memory_metadata_consumption). Compare
+    sections with "<section> size" entries printed to kernel log on cache start to verify
+    the estimate for given OCF version.
+    """
+    page_size = 4096
+    sector_size = 512
+    core_max = 4096
+    io_class_max = 33
+    # Memory used by cache instance regardless of number of cache lines. Metadata of cores
+    # is allocated for core_max cores, so it doesn't depend on number of added cores.
+    fixed_memory_footprint = 250 * 1024 * 1024
+    # Per cache line memory used only at runtime (cache line locks)
+    runtime_line_footprint = 8
+
+    # name: (element size in bytes, number of elements) for fixed size segments
+    fixed_segments = [
+        ('Super block config', 8192, 1),
+        ('Super block runtime', 128, 1),
+        ('Reserved', 4096, 1),
+        ('Part config', 64, io_class_max),
+        ('Part runtime', 64, io_class_max),
+        ('Core config', 512, core_max),
+        ('Core runtime', 128, core_max),
+        ('Core UUID', 4096, core_max),
+    ]
+    # name: element size in bytes for segments with element per cache line, together with
+    # runtime_line_footprint they take 68 B per cache line
+    line_segments = [
+        ('Cleaning', 16),
+        ('LRU list', 12),
+        ('Collision', 16),
+        ('List info', 12),
+        ('Hash', 4),
+    ]
+
+    def __init__(self, cache_size, cache_line_size, cores_count=1):
+        """cache_size in bytes, cache_line_size in KiB (like casadm --cache-line-size)"""
+        if cache_line_size not in [4, 8, 16, 32, 64]:
+            raise ValueError('Invalid cache line size: {}'.format(cache_line_size))
+        if not 0 <= cores_count <= self.core_max:
+            raise ValueError('Invalid number of cores: {}'.format(cores_count))
+        self.cache_size = cache_size
+        self.cache_line_size = cache_line_size * 1024
+        self.cores_count = cores_count
+        self.cache_lines = self._get_cache_lines()
+        self.sections = self._get_sections(self.cache_lines)
+
+    @property
+    def status_size(self):
+        # Valid and dirty bit for each sector of cache line are kept in collision entry
+        return -(-2 * self.cache_line_size // self.sector_size // 8)
+
+    @classmethod
+    def _segment_size(cls, element_size, elements):
+        per_page = max(1, cls.page_size // element_size)
+        pages = -(-elements // per_page)
+        return pages * max(cls.page_size, -(-element_size // cls.page_size) * cls.page_size)
+
+    def _get_sections(self, cache_lines):
+        sections = {}
+        for name, element_size, elements in self.fixed_segments:
+            sections[name] = self._segment_size(element_size, elements)
+        for name, element_size in self.line_segments:
+            if name == 'Collision':
+                element_size += self.status_size
+            sections[name] = self._segment_size(element_size, cache_lines)
+        return sections
+
+    def _get_cache_lines(self):
+        # Metadata is placed at the beginning of cache device, the rest is split into lines.
+        # Find the biggest number of lines which fits on device together with its metadata.
+        low, high = 0, self.cache_size // self.cache_line_size
+        while low < high:
+            cache_lines = (low + high + 1) // 2
+            metadata_size = sum(self._get_sections(cache_lines).values())
+            if metadata_size + cache_lines * self.cache_line_size <= self.cache_size:
+                low = cache_lines
+            else:
+                high = cache_lines - 1
+        if low == 0:
+            raise ValueError('Cache device is too small to hold metadata')
+        return low
+
+    @property
+    def metadata_size_on_device(self):
+        return sum(self.sections.values())
+
+    @property
+    def metadata_memory_footprint(self):
+        return (self.metadata_size_on_device
+                + self.cache_lines * self.runtime_line_footprint)
+
+    @property
+    def memory_footprint(self):
+        line_footprint = (sum(size for _, size in self.line_segments)
+                          + self.status_size + self.runtime_line_footprint)
+        return self.fixed_memory_footprint + self.cache_lines * line_footprint
+
+    def to_dict(self):
+        result = {
+            'cache lines': self.cache_lines,
+            'metadata size on device': self.metadata_size_on_device,
+            'metadata memory footprint': self.metadata_memory_footprint,
+            'memory footprint': self.memory_footprint,
+        }
+        for name, size in self.sections.items():
+            result['{} size'.format(name)] = size
+        return result
+
+
+def get_device_size(device):
+    with open(device, 'rb') as dev:
+        return dev.seek(0, os.SEEK_END)